@@ -0,0 +1,65 @@
+"""
+Benchmark cleaning user input into XHTML, and making its plain text.
+
+Compares :func:`mediacore.lib.helpers.clean_xhtml` running the
+BeautifulSoup based Cleaner, followed by the old way of making the plain
+text, with :class:`mediacore.lib.sanitizer.Sanitizer`, both with a cold
+cache and with every input cached already.
+
+Usage, from the root of the MediaCore install::
+
+    python benchmarks/sanitizer.py [rounds]
+
+The inputs are the samples in ``mediacore/tests/sanitizer_corpus.txt``.
+"""
+import sys
+import time
+
+from mediacore.lib import helpers
+from mediacore.lib.sanitizer import Sanitizer
+from mediacore.tests.test_sanitizer import load_corpus
+
+def old_plain(xhtml):
+    return helpers.strip_xhtml(helpers.line_break_xhtml(
+        helpers.line_break_xhtml(xhtml)), True)
+
+def bench_cleaner(corpus, rounds):
+    start = time.time()
+    for i in xrange(rounds):
+        for string in corpus:
+            old_plain(helpers.clean_xhtml(string,
+                _cleaner_settings=helpers.cleaner_settings))
+    return time.time() - start
+
+def bench_sanitizer(corpus, rounds, cached):
+    sanitizer = Sanitizer(helpers.valid_tags, helpers.valid_attrs,
+                          helpers.elem_map, cache_size=len(corpus) * 2)
+    if cached:
+        for string in corpus:
+            sanitizer.clean(string)
+    start = time.time()
+    for i in xrange(rounds):
+        if not cached:
+            sanitizer._cache.clear()
+            sanitizer._plain_cache.clear()
+        for string in corpus:
+            xhtml = sanitizer.clean(string)
+            if sanitizer.cached_plain_text(xhtml) is None:
+                old_plain(xhtml)
+    return time.time() - start
+
+def main(rounds=20):
+    corpus = load_corpus()
+    old = bench_cleaner(corpus, rounds)
+    cold = bench_sanitizer(corpus, rounds, False)
+    warm = bench_sanitizer(corpus, rounds, True)
+
+    n = len(corpus) * rounds
+    print '%d rounds of %d inputs' % (rounds, len(corpus))
+    print '  cleaner:          %8.3fs %8.1fus/input' % (old, old / n * 1e6)
+    print '  sanitizer, cold:  %8.3fs %8.1fus/input' % (cold, cold / n * 1e6)
+    print '  sanitizer, warm:  %8.3fs %8.1fus/input' % (warm, warm / n * 1e6)
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(args and int(args[0]) or 20)
@@ -0,0 +1,87 @@
+"""
+Benchmark making slugs from a set of media titles in many languages.
+
+Times :func:`mediacore.model.slugify`, which transliterates the titles with
+:func:`mediacore.lib.unidecode.unidecode`, and compares unidecode with
+transliterating one character at a time from the same tables, as it used
+to.
+
+Usage, from the root of the MediaCore install::
+
+    python benchmarks/slugify.py [rounds]
+
+"""
+import sys
+import time
+
+from mediacore.lib import unidecode
+from mediacore.model import slugify
+
+TITLES = [
+    u'Introduction to Python programming',
+    u'Weekly news roundup: episode 42',
+    u'Caf\xe9 au lait et cr\xe8me br\xfbl\xe9e',
+    u'\xdcber die Sch\xf6nheit der Mathematik',
+    u'A\xf1o nuevo en la ciudad de M\xe9xico',
+    u'\u0141\xf3d\u017a i Krak\xf3w: podr\xf3\u017c po Polsce',
+    u'\u010ce\u0161tina pro za\u010d\xe1te\u010dn\xedky',
+    u'\u041c\u043e\u0441\u043a\u0432\u0430 \u2014 \u0441\u0442\u043e\u043b\u0438\u0446\u0430 \u0420\u043e\u0441\u0441\u0438\u0438',
+    u'\u041a\u0440\u0430\u0442\u043a\u0430\u044f \u0438\u0441\u0442\u043e\u0440\u0438\u044f \u0432\u0440\u0435\u043c\u0435\u043d\u0438',
+    u'\u0391\u03b8\u03ae\u03bd\u03b1 \u03ba\u03b1\u03b9 \u03b7 \u03b1\u03c1\u03c7\u03b1\u03af\u03b1 \u03b9\u03c3\u03c4\u03bf\u03c1\u03af\u03b1',
+    u'\u5317\u4eac\u6b22\u8fce\u4f60',
+    u'\u6771\u4eac\u306e\u591c\u666f\u3068\u5bcc\u58eb\u5c71',
+    u'\uc11c\uc6b8\uc758 \ubd04',
+    u'\u0645\u0631\u062d\u0628\u0627 \u0628\u0627\u0644\u0639\u0627\u0644\u0645',
+    u'\u05e9\u05dc\u05d5\u05dd \u05e2\u05d5\u05dc\u05dd',
+    u'Ti\u1ebfng Vi\u1ec7t cho ng\u01b0\u1eddi m\u1edbi b\u1eaft \u0111\u1ea7u',
+    u'T\xfcrk\xe7e \xf6\u011frenmek \xe7ok kolay',
+    u'\u0939\u093f\u0928\u094d\u0926\u0940 \u092e\u0947\u0902 \u0938\u092e\u093e\u091a\u093e\u0930',
+    u'\xcdsland og F\xe6reyjar',
+    u'Live from the &quot;Big Apple&quot; &amp; more',
+]
+
+_blocks = {}
+
+def char_by_char(string):
+    """Transliterate the way unidecode used to, a character at a time."""
+    result = []
+    for char in string:
+        code = ord(char)
+        if code < 0x80:
+            result.append(char)
+            continue
+        block = _blocks.get(code >> 8, None)
+        if block is None:
+            block = _blocks[code >> 8] = unidecode._tables.block(code >> 8)
+        result.append(block[code & 0xff])
+    return ''.join(result)
+
+def bench(func, titles, rounds):
+    start = time.time()
+    for i in xrange(rounds):
+        for title in titles:
+            func(title)
+    return time.time() - start
+
+def main(rounds=2000):
+    ascii_titles = [title for title in TITLES
+                    if unidecode.unidecode(title) == title]
+    # Load every table that's used before timing
+    for title in TITLES:
+        slugify(title)
+
+    n = len(TITLES) * rounds
+    print '%d rounds of %d titles, %d of them ASCII' \
+        % (rounds, len(TITLES), len(ascii_titles))
+    for name, func, titles in [
+            ('slugify', slugify, TITLES),
+            ('slugify, ASCII only', slugify, ascii_titles),
+            ('unidecode', unidecode.unidecode, TITLES),
+            ('char by char', char_by_char, TITLES)]:
+        elapsed = bench(func, titles, rounds)
+        print '  %-20s %8.3fs %8.1fus/title' \
+            % (name + ':', elapsed, elapsed / (len(titles) * rounds) * 1e6)
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(args and int(args[0]) or 2000)
@@ -0,0 +1,84 @@
+"""
+Benchmark thumbnail generation over a directory of sample images.
+
+Compares resizing every thumb size from the fully decoded source, one
+after the other (the old behaviour of save_thumb), with
+:class:`mediacore.lib.thumbnails.ThumbPipeline` making the same thumbs
+serially and with a pool of processes.
+
+Usage, from the root of the MediaCore install::
+
+    python benchmarks/thumbnails.py image_dir [processes]
+
+Large JPEGs, like photos straight from a camera, benefit the most from
+the pipeline, since they can be decoded at a fraction of their size.
+"""
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from PIL import Image
+
+from mediacore.lib.thumbnails import ThumbPipeline, resize_thumb
+
+# The media thumb sizes from mediacore/config/environment.py
+SIZES = {
+    's': (128,  72),
+    'm': (160,  90),
+    'l': (560, 315),
+}
+
+def sample_images(image_dir):
+    paths = []
+    for ext in ('jpg', 'jpeg', 'png', 'gif'):
+        paths += glob.glob(os.path.join(image_dir, '*.' + ext))
+        paths += glob.glob(os.path.join(image_dir, '*.' + ext.upper()))
+    return sorted(paths)
+
+def bench_serial(paths, dest_dir):
+    start = time.time()
+    for i, path in enumerate(paths):
+        img = Image.open(path)
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        for key, xy in SIZES.iteritems():
+            thumb_path = os.path.join(dest_dir, '%d%s.jpg' % (i, key))
+            resize_thumb(img, xy).save(thumb_path)
+    return time.time() - start
+
+def bench_pipeline(paths, dest_dir, processes):
+    pipeline = ThumbPipeline(processes=processes)
+    items = [(path, dest_dir, i, SIZES) for i, path in enumerate(paths)]
+    start = time.time()
+    pipeline.generate_many(items)
+    return time.time() - start
+
+def main(image_dir, processes=4):
+    paths = sample_images(image_dir)
+    if not paths:
+        print 'No images found in %s' % image_dir
+        return
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        old = bench_serial(paths, tmp_dir)
+        serial = bench_pipeline(paths, tmp_dir, 1)
+        pooled = bench_pipeline(paths, tmp_dir, processes)
+
+        n = len(paths)
+        print '%d images, %d thumb sizes each' % (n, len(SIZES))
+        print '  full decode, serial: %8.3fs %8.1f images/s' % (old, n / old)
+        print '  pipeline, serial:    %8.3fs %8.1f images/s' % (serial, n / serial)
+        print '  pipeline, %2d procs:  %8.3fs %8.1f images/s' \
+            % (processes, pooled, n / pooled)
+    finally:
+        shutil.rmtree(tmp_dir)
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    if not args:
+        print __doc__
+        sys.exit(1)
+    main(args[0], len(args) > 1 and int(args[1]) or 4)
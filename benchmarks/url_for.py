@@ -0,0 +1,75 @@
+"""
+Benchmark generating the links of a 50 item media listing.
+
+Compares :func:`mediacore.lib.helpers.url_for` with its cache cleared
+before each listing, which costs the same as every call did before URLs
+were cached, with the cache warm from earlier requests for the listing.
+
+Usage, from the root of the MediaCore install::
+
+    python benchmarks/url_for.py [number_of_listings]
+
+Each listing links to every item and its thumb, the pager and the
+latest/popular/featured tabs, as media/index.html does.
+"""
+import os
+import sys
+import time
+
+import pylons
+from routes.util import URLGenerator
+from webob import Request
+
+from mediacore.config.routing import make_map
+from mediacore.lib import helpers
+
+ITEMS = 50
+
+def setup():
+    """Route a request for the second page of the media listing."""
+    root = os.path.dirname(os.path.dirname(os.path.abspath(helpers.__file__)))
+    mapper = make_map({'pylons.paths': {'controllers': os.path.join(root, 'controllers')},
+                       'debug': False})
+    pylons.config.push_process_config({'routes.map': mapper})
+
+    environ = Request.blank('/media?page=2').environ
+    match, route = mapper.routematch(environ=environ)
+    environ['wsgiorg.routing_args'] = ((), match)
+    environ['routes.route'] = route
+    environ['pylons.routes_dict'] = match
+    pylons.url._push_object(URLGenerator(mapper, environ))
+    pylons.request._push_object(Request(environ))
+
+def render_listing(slugs):
+    links = []
+    for slug in slugs:
+        links.append(helpers.url_for(controller='/media', action='view', slug=slug))
+        links.append(helpers.url_for('/images/') + 'media/%ss.jpg' % slug)
+    for page in range(1, 11):
+        links.append(helpers.url_for(page=page))
+    for show in ('latest', 'popular', 'featured'):
+        links.append(helpers.url_for(show=show, q=None))
+    return links
+
+def bench(slugs, n, cached):
+    helpers._url_cache.clear()
+    start = time.time()
+    for i in xrange(n):
+        if not cached:
+            helpers._url_cache.clear()
+        links = render_listing(slugs)
+    return time.time() - start, len(links)
+
+def main(n=200):
+    setup()
+    slugs = [u'benchmark-item-%d' % i for i in range(ITEMS)]
+    uncached, links = bench(slugs, n, False)
+    cached, links = bench(slugs, n, True)
+
+    print '%d listings of %d items, %d links each' % (n, ITEMS, links)
+    print '  uncached: %8.3fs %8.1fus/link' % (uncached, uncached / (n * links) * 1e6)
+    print '  cached:   %8.3fs %8.1fus/link' % (cached, cached / (n * links) * 1e6)
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(args and int(args[0]) or 200)
@@ -0,0 +1,86 @@
+"""
+Benchmark view counting on a single hot media row.
+
+Compares issuing an ``UPDATE media SET views = views + 1`` transaction per
+view (the old behaviour of MediaController.view) with spooling views via
+:class:`mediacore.lib.viewcounter.ViewCounter` and flushing them in batches.
+
+Usage, from the root of the MediaCore install::
+
+    python benchmarks/view_counter.py [sqlalchemy_url] [number_of_views]
+
+The database defaults to a temporary SQLite file. Pointing it at a copy
+of your MySQL database gives more realistic numbers, since every direct
+update there also fires the media_au fulltext trigger.
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine, select
+
+from mediacore.model.meta import Base
+from mediacore.model.media import media
+from mediacore.model.podcasts import podcasts
+from mediacore.lib.viewcounter import ViewCounter
+
+def setup(engine):
+    Base.metadata.create_all(bind=engine, tables=[podcasts, media])
+    engine.execute(media.delete(media.c.slug == 'benchmark-hot-item'))
+    result = engine.execute(media.insert(), type='video',
+        slug='benchmark-hot-item', title=u'Benchmark', author_name=u'Bench',
+        author_email=u'bench@localhost')
+    return result.last_inserted_ids()[0]
+
+def views_of(engine, media_id):
+    return engine.execute(select([media.c.views], media.c.id == media_id)).scalar()
+
+def bench_direct(engine, media_id, n):
+    update = media.update(media.c.id == media_id,
+                          values={'views': media.c.views + 1})
+    start = time.time()
+    for i in xrange(n):
+        conn = engine.connect()
+        trans = conn.begin()
+        conn.execute(update)
+        trans.commit()
+        conn.close()
+    return time.time() - start
+
+def bench_spooled(engine, media_id, n, spool_dir):
+    counter = ViewCounter(os.path.join(spool_dir, 'views.spool'), bind=engine)
+    start = time.time()
+    for i in xrange(n):
+        counter.increment(media_id)
+    counter.flush()
+    return time.time() - start
+
+def main(url=None, n=5000):
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        url = url or 'sqlite:///%s' % os.path.join(tmp_dir, 'bench.db')
+        engine = create_engine(url)
+        media_id = setup(engine)
+
+        before = views_of(engine, media_id)
+        direct = bench_direct(engine, media_id, n)
+        after_direct = views_of(engine, media_id)
+        spooled = bench_spooled(engine, media_id, n, tmp_dir)
+        after_spooled = views_of(engine, media_id)
+
+        assert after_direct - before == n
+        assert after_spooled - after_direct == n
+
+        print '%d views of one media row' % n
+        print '  UPDATE per view: %8.3fs %10.0f views/s' % (direct, n / direct)
+        print '  spooled batches: %8.3fs %10.0f views/s' % (spooled, n / spooled)
+
+        engine.execute(media.delete(media.c.id == media_id))
+    finally:
+        shutil.rmtree(tmp_dir)
+
+if __name__ == '__main__':
+    args = sys.argv[1:]
+    main(args and args[0] or None, len(args) > 1 and int(args[1]) or 5000)
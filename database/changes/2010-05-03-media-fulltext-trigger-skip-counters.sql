@@ -0,0 +1,28 @@
+DELIMITER //
+
+-- After Media is Updated
+-- Copies changes to the corresponding Search row, but only when a searchable
+-- column has actually changed. View/like counter updates no longer rewrite
+-- (and table-lock) the MyISAM media_fulltext table.
+DROP TRIGGER IF EXISTS media_au//
+CREATE TRIGGER media_au
+	AFTER UPDATE ON media FOR EACH ROW
+BEGIN
+	IF NOT (NEW.`id` <=> OLD.`id`
+	    AND NEW.`title` <=> OLD.`title`
+	    AND NEW.`subtitle` <=> OLD.`subtitle`
+	    AND NEW.`description_plain` <=> OLD.`description_plain`
+	    AND NEW.`notes` <=> OLD.`notes`
+	    AND NEW.`author_name` <=> OLD.`author_name`) THEN
+		UPDATE media_fulltext
+			SET `media_id` = NEW.`id`,
+			    `title` = NEW.`title`,
+			    `subtitle` = NEW.`subtitle`,
+			    `description_plain` = NEW.`description_plain`,
+			    `notes` = NEW.`notes`,
+			    `author_name` = NEW.`author_name`
+			WHERE media_id = OLD.id;
+	END IF;
+END;//
+
+DELIMITER ;
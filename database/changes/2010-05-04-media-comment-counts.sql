@@ -0,0 +1,58 @@
+-- Denormalized comment counters for media, replacing the correlated
+-- subqueries that every media listing used to run.
+ALTER TABLE `media`
+	ADD COLUMN `comment_count` int(10) NOT NULL DEFAULT '0' AFTER `popularity_points`,
+	ADD COLUMN `comment_count_published` int(10) NOT NULL DEFAULT '0' AFTER `comment_count`;
+
+UPDATE `media` SET
+	`comment_count` = (SELECT COUNT(*) FROM `comments`
+		WHERE `comments`.`media_id` = `media`.`id`),
+	`comment_count_published` = (SELECT COUNT(*) FROM `comments`
+		WHERE `comments`.`media_id` = `media`.`id` AND `comments`.`publishable` = 1);
+
+DELIMITER //
+
+-- After Comment is Inserted
+-- Increment the comment counters of its Media
+DROP TRIGGER IF EXISTS comments_ai//
+CREATE TRIGGER comments_ai
+	AFTER INSERT ON comments FOR EACH ROW
+BEGIN
+	UPDATE media
+		SET comment_count = comment_count + 1,
+		    comment_count_published = comment_count_published + NEW.publishable
+		WHERE id = NEW.media_id;
+END;//
+
+-- After Comment is Updated
+-- Move the comment between the counters when approved, trashed or moved
+DROP TRIGGER IF EXISTS comments_au//
+CREATE TRIGGER comments_au
+	AFTER UPDATE ON comments FOR EACH ROW
+BEGIN
+	IF NOT (NEW.media_id <=> OLD.media_id
+	    AND NEW.publishable <=> OLD.publishable) THEN
+		UPDATE media
+			SET comment_count = comment_count - 1,
+			    comment_count_published = comment_count_published - OLD.publishable
+			WHERE id = OLD.media_id;
+		UPDATE media
+			SET comment_count = comment_count + 1,
+			    comment_count_published = comment_count_published + NEW.publishable
+			WHERE id = NEW.media_id;
+	END IF;
+END;//
+
+-- After Comment is Deleted
+-- Decrement the comment counters of its Media
+DROP TRIGGER IF EXISTS comments_ad//
+CREATE TRIGGER comments_ad
+	AFTER DELETE ON comments FOR EACH ROW
+BEGIN
+	UPDATE media
+		SET comment_count = comment_count - 1,
+		    comment_count_published = comment_count_published - OLD.publishable
+		WHERE id = OLD.media_id;
+END;//
+
+DELIMITER ;
@@ -0,0 +1,14 @@
+-- Stored counts of published media, replacing the correlated subqueries
+-- that the tag, category and podcast listings used to run. The counts are
+-- filled in by the first request after upgrading, or immediately with:
+--   paster --plugin=MediaCore rebuild-counts deployment.ini
+ALTER TABLE `tags`
+	ADD COLUMN `media_count_published` int(10) NOT NULL DEFAULT '0' AFTER `slug`,
+	ADD KEY `media_count_published` (`media_count_published`);
+
+ALTER TABLE `categories`
+	ADD COLUMN `media_count_published` int(10) NOT NULL DEFAULT '0' AFTER `parent_id`,
+	ADD COLUMN `media_count_published_total` int(10) NOT NULL DEFAULT '0' AFTER `media_count_published`;
+
+ALTER TABLE `podcasts`
+	ADD COLUMN `media_count_published` int(10) NOT NULL DEFAULT '0' AFTER `feedburner_url`;
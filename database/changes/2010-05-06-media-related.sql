@@ -0,0 +1,13 @@
+-- Precomputed related media, replacing the fulltext query that the media
+-- view page ran on every hit. Fill it in after upgrading with:
+--   paster --plugin=MediaCore rebuild-related-media deployment.ini
+CREATE TABLE `media_related` (
+  `media_id` int(10) unsigned NOT NULL,
+  `related_id` int(10) unsigned NOT NULL,
+  `score` float NOT NULL,
+  PRIMARY KEY (`media_id`,`related_id`),
+  KEY `media_related_score` (`media_id`,`score`),
+  KEY `related_id` (`related_id`),
+  CONSTRAINT `media_related_ibfk_1` FOREIGN KEY (`media_id`) REFERENCES `media` (`id`) ON DELETE CASCADE ON UPDATE CASCADE,
+  CONSTRAINT `media_related_ibfk_2` FOREIGN KEY (`related_id`) REFERENCES `media` (`id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
@@ -0,0 +1,19 @@
+-- Background jobs, see mediacore/lib/jobs.py. Start a worker to run them:
+--   paster --plugin=MediaCore run-jobs deployment.ini
+CREATE TABLE `jobs` (
+  `id` int(10) unsigned NOT NULL auto_increment,
+  `name` varchar(50) NOT NULL,
+  `job_key` varchar(255) default NULL,
+  `args` text NOT NULL,
+  `status` varchar(10) NOT NULL default 'queued',
+  `attempts` int(10) unsigned NOT NULL default '0',
+  `max_attempts` int(10) unsigned NOT NULL default '5',
+  `run_after` datetime NOT NULL,
+  `locked_until` datetime default NULL,
+  `last_error` text,
+  `created_on` datetime NOT NULL,
+  `modified_on` datetime NOT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `job_key` (`job_key`),
+  KEY `jobs_status_run_after` (`status`,`run_after`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
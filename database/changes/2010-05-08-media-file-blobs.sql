@@ -0,0 +1,4 @@
+-- Uploaded files are now stored under the SHA-1 of their contents, and
+-- several media files may share one. The index is used to count the
+-- media files still using a stored file before it is deleted.
+ALTER TABLE `media_files` ADD KEY `media_files_file_name` (`file_name`);
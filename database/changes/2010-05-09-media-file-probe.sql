@@ -0,0 +1,10 @@
+-- Details read from each file's headers by mediacore/lib/probe.py, after
+-- upload. Probe existing files with:
+--   paster --plugin=MediaCore probe-media deployment.ini
+ALTER TABLE `media_files`
+  ADD COLUMN `duration` int(10) unsigned default NULL AFTER `size`,
+  ADD COLUMN `bitrate` int(10) unsigned default NULL AFTER `duration`,
+  ADD COLUMN `width` smallint(5) unsigned default NULL AFTER `bitrate`,
+  ADD COLUMN `height` smallint(5) unsigned default NULL AFTER `width`,
+  ADD COLUMN `video_codec` varchar(10) character set ascii default NULL AFTER `height`,
+  ADD COLUMN `audio_codec` varchar(10) character set ascii default NULL AFTER `video_codec`;
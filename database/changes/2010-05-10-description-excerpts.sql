@@ -0,0 +1,7 @@
+-- Excerpts of media and podcast descriptions at the lengths the templates
+-- use, see mediacore/lib/excerpts.py. Fill them in after upgrading with:
+--   paster --plugin=MediaCore rebuild-excerpts deployment.ini
+ALTER TABLE `media`
+  ADD COLUMN `description_excerpts` text AFTER `description_plain`;
+ALTER TABLE `podcasts`
+  ADD COLUMN `description_excerpts` text AFTER `description`;
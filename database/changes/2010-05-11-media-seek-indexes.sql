@@ -0,0 +1,5 @@
+-- Indexes for paging through the media listings by cursor rather than
+-- offset, see SeekOrder in mediacore/lib/paginate.py.
+ALTER TABLE `media`
+  ADD KEY `media_publish_on` (`publish_on`,`id`),
+  ADD KEY `media_popularity_points` (`popularity_points`,`id`);
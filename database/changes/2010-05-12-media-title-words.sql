@@ -0,0 +1,19 @@
+-- Title words and their document counts, so that related media can be
+-- refreshed without reading the whole library. Fill them in after
+-- upgrading with:
+--   paster --plugin=MediaCore rebuild-related-media deployment.ini
+-- media_title_words has no foreign key, as the words of deleted media are
+-- needed to update title_word_counts when the lists are next refreshed.
+CREATE TABLE `media_title_words` (
+  `media_id` int(10) unsigned NOT NULL,
+  `word` varchar(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
+  `count` int(10) unsigned NOT NULL,
+  PRIMARY KEY (`media_id`,`word`),
+  KEY `media_title_words_word` (`word`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+
+CREATE TABLE `title_word_counts` (
+  `word` varchar(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
+  `media_count` int(10) unsigned NOT NULL,
+  PRIMARY KEY (`word`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
@@ -0,0 +1,400 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Paster Commands
+
+Maintenance tasks which are run from the command line against a configured
+MediaCore install, for example::
+
+    paster --plugin=MediaCore rebuild-counts deployment.ini
+
+"""
+import os
+
+import pylons
+import transaction
+from paste.deploy import appconfig
+from paste.script.command import Command
+
+__all__ = ['MediaCoreCommand', 'ProbeMediaCommand', 'RebuildCountsCommand',
+           'RebuildExcerptsCommand', 'RebuildRelatedMediaCommand', 'RebuildSearchIndexCommand',
+           'RebuildThumbsCommand', 'ReclaimThumbsCommand', 'RunJobsCommand',
+           'StoreFTPCommand']
+
+class MediaCoreCommand(Command):
+    """Base class for commands which need the MediaCore environment loaded.
+
+    Subclasses implement :meth:`run`. The config file is loaded, and the
+    transaction is committed if :meth:`run` returns without error.
+    """
+    min_args = 1
+    max_args = 1
+    usage = 'CONFIG_FILE'
+    group_name = 'mediacore'
+
+    parser = Command.standard_parser(verbose=True)
+
+    def command(self):
+        self.load_environment(self.args[0])
+        try:
+            self.run()
+        except:
+            transaction.abort()
+            raise
+        transaction.commit()
+
+    def load_environment(self, config_file):
+        from mediacore.config.environment import load_environment
+        conf = appconfig('config:' + os.path.abspath(config_file))
+        config = load_environment(conf.global_conf, conf.local_conf)
+        pylons.config.push_process_config(config)
+
+
+class CollectBlobsCommand(MediaCoreCommand):
+    """Delete files in the media_dir which no media file refers to.
+
+    Files are only deleted once they're older than the blob grace period,
+    so that uploads of the same contents have had time to commit. The
+    media.collect_blob job does this for each file as it's deleted or
+    moved to FTP storage, but when jobs are run inline, it can't come
+    back to files that are too new. Run this now and then to delete them.
+    """
+    summary = __doc__.splitlines()[0]
+
+    parser = Command.standard_parser(verbose=True)
+    parser.add_option('--dry-run',
+                      action='store_true',
+                      dest='dry_run',
+                      help="Count the files but don't delete them")
+
+    def run(self):
+        import time
+        from mediacore.lib.jobs import RetryLater
+        from mediacore.lib.storage import blob_grace_period
+        from mediacore.lib.tasks import collect_media_blob
+        from mediacore.model import MediaFile
+        from mediacore.model.meta import DBSession
+        media_dir = pylons.config['media_dir']
+        referenced = set([row[0] for row in DBSession.query(MediaFile.file_name)\
+            .filter(MediaFile.file_name != None)\
+            .filter(MediaFile.url == None)\
+            .distinct()])
+        cutoff = time.time() - blob_grace_period
+        count = size = 0
+        for name in os.listdir(media_dir):
+            path = os.path.join(media_dir, name)
+            # Skip the partial uploads dir and files still being written
+            if name.startswith('.') or name in referenced \
+            or not os.path.isfile(path):
+                continue
+            try:
+                if os.path.getmtime(path) > cutoff:
+                    continue
+                file_size = os.path.getsize(path)
+            except OSError:
+                continue
+            if not self.options.dry_run:
+                # This checks the file again, in case it's just been
+                # uploaded again.
+                try:
+                    collect_media_blob(name, 'media')
+                except RetryLater:
+                    continue
+                if os.path.exists(path):
+                    continue
+            count += 1
+            size += file_size
+        if not self.options.dry_run:
+            transaction.commit()
+        if self.verbose:
+            print '%s %d unused files (%d bytes)' \
+                % (self.options.dry_run and 'Found' or 'Deleted', count, size)
+
+
+class ProbeMediaCommand(MediaCoreCommand):
+    """Read the duration and codecs of stored media files from their headers."""
+    summary = __doc__.splitlines()[0]
+
+    parser = Command.standard_parser(verbose=True)
+    parser.add_option('--all',
+                      action='store_true',
+                      dest='all',
+                      help='Probe files that have been probed before too')
+
+    def run(self):
+        from sqlalchemy import sql
+        from mediacore.lib.tasks import probe_media_file
+        from mediacore.model import MediaFile
+        query = MediaFile.query.filter(MediaFile.file_name != None)
+        if not self.options.all:
+            query = query.filter(sql.and_(MediaFile.duration == None,
+                                          MediaFile.video_codec == None,
+                                          MediaFile.audio_codec == None))
+        ids = [row[0] for row in query.values(MediaFile.id)]
+        if self.verbose:
+            print 'Probing %d files' % len(ids)
+        for i, media_file_id in enumerate(ids):
+            probe_media_file(media_file_id)
+            if i % 100 == 99:
+                transaction.commit()
+
+
+class RebuildCountsCommand(MediaCoreCommand):
+    """Recalculate the denormalized counters stored in the database."""
+    summary = __doc__.splitlines()[0]
+
+    def run(self):
+        from mediacore.model.media import rebuild_comment_counts
+        from mediacore.model.counts import published_counts
+        if self.verbose:
+            print 'Rebuilding media comment counts'
+        rebuild_comment_counts()
+        if self.verbose:
+            print 'Rebuilding published media counts'
+        published_counts.refresh()
+
+
+class RebuildExcerptsCommand(MediaCoreCommand):
+    """Store the description excerpts of every media item and podcast."""
+    summary = __doc__.splitlines()[0]
+
+    def run(self):
+        from mediacore.model import media, podcasts
+        if self.verbose:
+            print 'Rebuilding media excerpts'
+        media.rebuild_excerpts()
+        if self.verbose:
+            print 'Rebuilding podcast excerpts'
+        podcasts.rebuild_excerpts()
+
+
+class RebuildSearchIndexCommand(MediaCoreCommand):
+    """Rebuild the media search index of the configured search backend."""
+    summary = __doc__.splitlines()[0]
+
+    def run(self):
+        from mediacore.lib.search import get_backend
+        backend = get_backend()
+        if self.verbose:
+            print 'Rebuilding the search index with %s' % type(backend).__name__
+        backend.rebuild()
+
+
+class RebuildRelatedMediaCommand(MediaCoreCommand):
+    """Recalculate the related media lists of every media item."""
+    summary = __doc__.splitlines()[0]
+
+    def run(self):
+        from mediacore.lib.related import related_media
+        if self.verbose:
+            print 'Rebuilding related media'
+        related_media.rebuild()
+
+
+class RebuildThumbsCommand(MediaCoreCommand):
+    """Remake every thumbnail from the original images that were uploaded."""
+    summary = __doc__.splitlines()[0]
+
+    parser = Command.standard_parser(verbose=True)
+    parser.add_option('--processes',
+                      dest='processes',
+                      type='int',
+                      default=None,
+                      help='Number of processes to use (default: one per CPU)')
+
+    def run(self):
+        import glob
+        import re
+        from mediacore.lib.thumbnails import (ThumbPipeline, multiprocessing,
+            thumb_manifest)
+        processes = self.options.processes
+        if processes is None:
+            processes = multiprocessing and multiprocessing.cpu_count() or 1
+        pipeline = ThumbPipeline.from_config(pylons.config,
+                                             processes=processes)
+        orig_name = re.compile(r'^(\d+)orig\.\w+$')
+        items = []
+        for image_dir, sizes in pylons.config['thumb_sizes'].iteritems():
+            dest_dir = os.path.join(pylons.config['image_dir'], image_dir)
+            for path in sorted(glob.glob(os.path.join(dest_dir, '*orig.*'))):
+                match = orig_name.match(os.path.basename(path))
+                if match:
+                    items.append((path, dest_dir, int(match.group(1)), sizes))
+        if self.verbose:
+            print 'Making thumbs for %d items with %d processes' \
+                % (len(items), processes)
+        pipeline.generate_many(items)
+        thumb_manifest.rebuild()
+
+
+class ReclaimThumbsCommand(MediaCoreCommand):
+    """Delete thumbs which are just copies of the default thumbs."""
+    summary = __doc__.splitlines()[0]
+
+    parser = Command.standard_parser(verbose=True)
+    parser.add_option('--dry-run',
+                      action='store_true',
+                      dest='dry_run',
+                      help="Count the copies but don't delete them")
+
+    def run(self):
+        import re
+        from mediacore.lib.thumbnails import thumb_manifest
+        thumb_name = re.compile(r'^(\d+)([a-z]+)\.jpg$')
+        count = size = 0
+        for image_dir, sizes in pylons.config['thumb_sizes'].iteritems():
+            dir_path = os.path.join(pylons.config['image_dir'], image_dir)
+            defaults = {}
+            for key in sizes:
+                default_file = open(os.path.join(dir_path, 'new%s.jpg' % key), 'rb')
+                try:
+                    defaults[key] = default_file.read()
+                finally:
+                    default_file.close()
+            for name in os.listdir(dir_path):
+                match = thumb_name.match(name)
+                if not match or match.group(2) not in defaults:
+                    continue
+                path = os.path.join(dir_path, name)
+                default = defaults[match.group(2)]
+                if os.path.getsize(path) != len(default):
+                    continue
+                thumb_file = open(path, 'rb')
+                try:
+                    if thumb_file.read() != default:
+                        continue
+                finally:
+                    thumb_file.close()
+                count += 1
+                size += len(default)
+                if not self.options.dry_run:
+                    os.remove(path)
+        if self.verbose:
+            print '%s %d copies of the default thumbs (%d bytes)' \
+                % (self.options.dry_run and 'Found' or 'Deleted', count, size)
+        if not self.options.dry_run:
+            thumb_manifest.rebuild()
+
+
+class RunJobsCommand(MediaCoreCommand):
+    """Run queued background jobs until interrupted."""
+    summary = __doc__.splitlines()[0]
+
+    parser = Command.standard_parser(verbose=True)
+    parser.add_option('--once',
+                      action='store_true',
+                      dest='once',
+                      help='Exit once there are no jobs left to run')
+    parser.add_option('--workers',
+                      dest='workers',
+                      type='int',
+                      default=1,
+                      help='Number of worker processes to start (default 1)')
+
+    def run(self):
+        from mediacore.lib.jobs import JobWorker
+        from mediacore.model.meta import DBSession
+        if self.options.workers < 2:
+            self.work(JobWorker())
+            return
+
+        # Each worker needs its own database connections, so don't share
+        # any that were opened while loading the environment.
+        DBSession.bind.dispose()
+        pids = []
+        for i in range(self.options.workers):
+            pid = os.fork()
+            if pid == 0:
+                try:
+                    self.work(JobWorker())
+                finally:
+                    os._exit(0)
+            pids.append(pid)
+        try:
+            for pid in pids:
+                os.waitpid(pid, 0)
+        except KeyboardInterrupt:
+            pass
+
+    def work(self, worker):
+        if self.verbose:
+            print 'Worker %d is running jobs' % os.getpid()
+        try:
+            count = worker.run(forever=not self.options.once)
+        except KeyboardInterrupt:
+            return
+        if self.verbose:
+            print 'Worker %d ran %d jobs' % (os.getpid(), count)
+
+
+class StoreFTPCommand(MediaCoreCommand):
+    """Copy media files from the media_dir to the FTP server."""
+    summary = __doc__.splitlines()[0]
+
+    parser = Command.standard_parser(verbose=True)
+    parser.add_option('--workers',
+                      dest='workers',
+                      type='int',
+                      default=4,
+                      help='Number of files to send at once (default 4)')
+
+    def run(self):
+        from mediacore.lib.jobs import enqueue
+        from mediacore.lib.storage import (blob_grace_period,
+            get_remote_storage, store_many)
+        from mediacore.model import MediaFile
+        storage = get_remote_storage()
+        if storage is None:
+            print 'FTP storage is not enabled in the settings'
+            return
+        media_dir = pylons.config['media_dir']
+        media_files = MediaFile.query\
+            .filter(MediaFile.file_name != None)\
+            .filter(MediaFile.url == None)\
+            .all()
+        # Media files with the same contents share one stored file
+        shared = {}
+        for media_file in media_files:
+            shared.setdefault(media_file.file_name, []).append(media_file)
+        local = [(file_name, os.path.join(media_dir, file_name))
+                 for file_name in sorted(shared)]
+        local = [(name, path) for name, path in local if os.path.exists(path)]
+        pending = [(name, path) for name, path in local
+                   if not storage.is_current(name, path)]
+        if self.verbose:
+            print 'Sending %d of %d files with %d workers' \
+                % (len(pending), len(local), self.options.workers)
+        results = store_many(storage, pending, self.options.workers)
+
+        stored = []
+        for file_name, path in local:
+            if isinstance(results.get(file_name), Exception):
+                continue
+            if not storage.verify(file_name, os.path.getsize(path), path):
+                print 'Could not verify %s' % file_name
+                continue
+            for media_file in shared[file_name]:
+                media_file.url = storage.url(file_name)
+            stored.append(path)
+        transaction.commit()
+
+        # Only delete the local copies once the new URLs are saved, and
+        # once no upload of the same contents can be about to use them
+        for path in stored:
+            enqueue('media.collect_blob',
+                    delay=blob_grace_period,
+                    file_name=os.path.basename(path))
+        if self.verbose:
+            print 'Moved %d files to the FTP server' % len(stored)
@@ -17,6 +17,7 @@ import os
 import re
 
 from genshi.template import TemplateLoader
+from paste.deploy.converters import asbool
 from pylons.configuration import PylonsConfig
 from sqlalchemy import engine_from_config
 
@@ -25,6 +26,7 @@ import mediacore.lib.helpers
 
 from mediacore.config.routing import make_map
 from mediacore.lib.auth import classifier_for_flash_uploads
+from mediacore.lib.profiler import SQLTimingProxy
 from mediacore.model import User, Group, Permission, init_model
 from mediacore.model.meta import DBSession
 
@@ -60,7 +62,11 @@ def load_environment(global_conf, app_conf):
     )
 
     # Setup the SQLAlchemy database engine
-    engine = engine_from_config(config, 'sqlalchemy.')
+    engine_options = {}
+    if asbool(config.get('profile', 'false')):
+        # Time each SQL statement, see mediacore.lib.profiler
+        engine_options['proxy'] = SQLTimingProxy()
+    engine = engine_from_config(config, 'sqlalchemy.', **engine_options)
     init_model(engine)
 
     # CONFIGURATION OPTIONS HERE (note: all config options will override
@@ -15,6 +15,7 @@
 
 """Pylons middleware initialization"""
 import os
+import re
 
 from beaker.middleware import SessionMiddleware
 from paste.cascade import Cascade
@@ -30,6 +31,7 @@ import tw.api
 
 from mediacore.config.environment import load_environment
 from mediacore.lib.auth import add_auth
+from mediacore.lib.profiler import ProfilerMiddleware
 from mediacore.model.meta import DBSession
 
 def setup_prefix_middleware(app, global_conf, proxy_prefix):
@@ -56,6 +58,36 @@ class DBSessionRemoverMiddleware(object):
         finally:
             self.session.remove()
 
+class VersionedThumbCacheMiddleware(object):
+    """Let clients cache thumbs forever when their URL has a version.
+
+    :func:`mediacore.lib.helpers.thumb_url` adds a ``v`` query string,
+    or uses a content-hashed file name, which changes whenever the thumb
+    does. Other static files are served as usual.
+    """
+    versioned_query = re.compile(r'(^|&)v=')
+    versioned_name = re.compile(r'-[0-9a-f]{10}\.(jpg|webp)$')
+
+    def __init__(self, app, max_age=365 * 86400):
+        self.app = app
+        self.max_age = max_age
+
+    def __call__(self, environ, start_response):
+        path = environ.get('PATH_INFO', '')
+        if not path.startswith('/images/') or not (
+                self.versioned_query.search(environ.get('QUERY_STRING', ''))
+                or self.versioned_name.search(path)):
+            return self.app(environ, start_response)
+
+        def cache_forever(status, headers, exc_info=None):
+            if status.startswith('200'):
+                headers = [(name, value) for name, value in headers
+                           if name.lower() not in ('cache-control', 'expires')]
+                headers.append(('Cache-Control',
+                                'public, max-age=%d' % self.max_age))
+            return start_response(status, headers, exc_info)
+        return self.app(environ, cache_forever)
+
 def make_app(global_conf, full_stack=True, static_files=True, **app_conf):
     """Create a Pylons WSGI application and return it
 
@@ -107,6 +139,10 @@ def make_app(global_conf, full_stack=True, static_files=True, **app_conf):
     app = make_tm(app, transaction_commit_veto)
     app = DBSessionRemoverMiddleware(app, DBSession)
 
+    # Time each request, see mediacore.lib.profiler
+    if asbool(config.get('profile', 'false')):
+        app = ProfilerMiddleware(app, header=asbool(config['debug']))
+
     # If enabled, set up the proxy prefix for routing behind
     # fastcgi and mod_proxy based deployments.
     if (config.get('proxy_prefix', None)):
@@ -131,6 +167,7 @@ def make_app(global_conf, full_stack=True, static_files=True, **app_conf):
     if asbool(static_files):
         # Serve static files
         static_app = StaticURLParser(config['pylons.paths']['static_files'])
+        static_app = VersionedThumbCacheMiddleware(static_app)
         app = Cascade([static_app, app])
 
     app.config = config
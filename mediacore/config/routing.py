@@ -62,6 +62,24 @@ def make_map(config):
         controller='media',
         action='serve',
         requirements={'id': r'\d+'})
+
+    # Resumable chunked uploads, see mediacore.lib.uploads
+    map.connect('/upload/chunked',
+        controller='upload',
+        action='chunked_init',
+        conditions={'method': ['POST']})
+    map.connect('/upload/chunked/{session}/finalize',
+        controller='upload',
+        action='chunked_finalize',
+        conditions={'method': ['POST']})
+    map.connect('/upload/chunked/{session}',
+        controller='upload',
+        action='chunked_append',
+        conditions={'method': ['PUT', 'POST']})
+    map.connect('/upload/chunked/{session}',
+        controller='upload',
+        action='chunked_status',
+        conditions={'method': ['GET', 'HEAD']})
     map.connect('/upload/{action}',
         controller='upload',
         action='index')
@@ -123,6 +141,21 @@ def make_map(config):
         action='edit',
         requirements={'id': r'(\d+|new)'})
 
+    map.connect('/admin/settings/jobs',
+        controller='admin/jobs',
+        action='index')
+    map.connect('/admin/settings/jobs/{id}/{action}',
+        controller='admin/jobs',
+        action='retry',
+        requirements={'id': r'\d+'})
+
+    map.connect('/admin/settings/stats',
+        controller='admin/stats',
+        action='index')
+    map.connect('/admin/settings/stats/{action}',
+        controller='admin/stats',
+        action='index')
+
     map.connect('/admin/comments/{id}/{status}',
         controller='admin/comments',
         action='save_status',
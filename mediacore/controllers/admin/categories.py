@@ -20,7 +20,7 @@ from sqlalchemy import orm, sql
 from mediacore.lib.base import BaseController
 from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
 from mediacore.lib.helpers import redirect, url_for
-from mediacore.model import Category, fetch_row, get_available_slug
+from mediacore.model import Category, fetch_row, flush_with_available_slug, get_available_slug
 from mediacore.model.meta import DBSession
 
 from mediacore.forms.admin.categories import CategoryForm, CategoryRowForm
@@ -113,8 +113,10 @@ class CategoriesController(BaseController):
                 parent_options = unicode(category_form.c['parent_id'].display()),
             )
         else:
-            cat.name = kwargs['name']
             cat.slug = get_available_slug(Category, kwargs['slug'], cat)
+            if cat.id:
+                flush_with_available_slug(cat, kwargs['slug'])
+            cat.name = kwargs['name']
 
             if kwargs['parent_id']:
                 parent = fetch_row(Category, kwargs['parent_id'])
@@ -123,8 +125,7 @@ class CategoriesController(BaseController):
             else:
                 cat.parent = None
 
-            DBSession.add(cat)
-            DBSession.flush()
+            flush_with_available_slug(cat, kwargs['slug'])
 
             data = dict(
                 success = True,
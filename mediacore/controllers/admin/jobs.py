@@ -0,0 +1,89 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from datetime import datetime
+
+from pylons import request
+from repoze.what.predicates import has_permission
+
+from mediacore.lib.base import BaseController
+from mediacore.lib.decorators import expose, expose_xhr, paginate
+from mediacore.lib.helpers import redirect
+from mediacore.model import Job, fetch_row
+from mediacore.model.meta import DBSession
+
+class JobsController(BaseController):
+    """Admin background job actions"""
+    allow_only = has_permission('admin')
+
+    @expose_xhr('admin/jobs/index.html')
+    @paginate('jobs', items_per_page=50)
+    def index(self, page=1, status='dead', **kwargs):
+        """List background jobs with pagination.
+
+        :param page: Page number, defaults to 1.
+        :type page: int
+        :param status: Only list jobs with this status, defaults to
+            ``'dead'`` so that failed jobs can be inspected.
+        :type status: str
+        :rtype: Dict
+        :returns:
+            jobs
+                The list of :class:`~mediacore.model.jobs.Job`
+                instances for this page.
+            status
+                The status being listed.
+
+        """
+        jobs = Job.query\
+            .filter(Job.status == status)\
+            .order_by(Job.modified_on.desc())
+        return dict(jobs=jobs, status=status)
+
+
+    @expose('json')
+    def retry(self, id, **kwargs):
+        """Queue a job to be run again right away, with its attempts reset.
+
+        :param id: Job ID.
+        :type id: ``int``
+        :returns: Redirect back to :meth:`index` after success.
+        """
+        job = fetch_row(Job, id)
+        job.status = 'queued'
+        job.attempts = 0
+        job.locked_until = None
+        job.run_after = datetime.now()
+        DBSession.add(job)
+
+        if request.is_xhr:
+            return dict(success=True)
+        redirect(action='index', id=None)
+
+
+    @expose('json')
+    def delete(self, id, **kwargs):
+        """Discard a job.
+
+        :param id: Job ID.
+        :type id: ``int``
+        :returns: Redirect back to :meth:`index` after successful delete.
+        """
+        job = fetch_row(Job, id)
+        DBSession.delete(job)
+
+        if request.is_xhr:
+            return dict(success=True)
+        redirect(action='index', id=None)
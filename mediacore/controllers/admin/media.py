@@ -30,7 +30,8 @@ from pylons import config, request, response, session, tmpl_context
 from repoze.what.predicates import has_permission
 from sqlalchemy import orm, sql
 
-from mediacore.controllers.upload import _add_new_media_file
+from mediacore.controllers.upload import (_add_new_media_file,
+    _add_uploaded_media_file)
 from mediacore.forms.admin import SearchForm, ThumbForm
 from mediacore.forms.admin.media import AddFileForm, EditFileForm, MediaForm, PodcastFilterForm, UpdateStatusForm
 from mediacore.lib import helpers
@@ -38,7 +39,10 @@ from mediacore.lib.base import BaseController
 from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
 from mediacore.lib.filetypes import external_embedded_containers, guess_media_type, guess_container_format, playable_containers
 from mediacore.lib.helpers import redirect, url_for
-from mediacore.model import Author, Category, Media, MediaFile, Podcast, Tag, fetch_row, get_available_slug
+from mediacore.lib.jobs import enqueue
+from mediacore.lib.thumbnails import thumb_manifest
+from mediacore.lib.uploads import UploadError, chunked_uploads
+from mediacore.model import Author, Category, Media, MediaFile, Podcast, Tag, fetch_row, flush_with_available_slug, get_available_slug
 from mediacore.model.media import create_media_stub
 from mediacore.model.meta import DBSession
 
@@ -84,7 +88,7 @@ class MediaController(BaseController):
                 The :class:`~mediacore.forms.admin.media.PodcastFilterForm` instance.
 
         """
-        media = Media.query.options(orm.undefer('comment_count_published'))
+        media = Media.query
 
         if search:
             media = media.admin_search(search)
@@ -221,12 +225,18 @@ class MediaController(BaseController):
                 # try to issue an UPDATE to set the MediaFile.media_id to None.
                 # The database ON DELETE CASCADE handles everything for us.
                 DBSession.expunge(f)
+            thumb_key = (media._thumb_dir, media.id)
             DBSession.delete(media)
             transaction.commit()
+            thumb_manifest.remove(*thumb_key)
             helpers.delete_files(file_paths, 'media')
             redirect(action='index', id=None)
 
         media.slug = get_available_slug(Media, slug, media)
+        if media.id:
+            # Save the new slug on its own: if it has to be retried, the
+            # rollback would discard any other changes to the existing row.
+            flush_with_available_slug(media, slug)
         media.title = title
         media.author = Author(author_name, author_email)
         media.description = description
@@ -237,18 +247,14 @@ class MediaController(BaseController):
         media.set_categories(categories)
 
         media.update_status()
-        DBSession.add(media)
-        DBSession.flush()
-
-        if id == 'new':
-            helpers.create_default_thumbs_for(media)
+        flush_with_available_slug(media, slug)
 
         redirect(action='edit', id=media.id)
 
 
     @expose('json')
     @validate(add_file_form)
-    def add_file(self, id, file=None, url=None, **kwargs):
+    def add_file(self, id, file=None, url=None, upload_session=None, **kwargs):
         """Save action for the :class:`~mediacore.forms.admin.media.AddFileForm`.
 
         Creates a new :class:`~mediacore.model.media.MediaFile` from the
@@ -261,6 +267,9 @@ class MediaController(BaseController):
         :type file: :class:`cgi.FieldStorage` or ``None``
         :param url: A URL to a recognizable audio or video file
         :type url: :class:`unicode` or ``None``
+        :param upload_session: The session ID of a finished chunked upload,
+            see :mod:`mediacore.lib.uploads`
+        :type upload_session: :class:`unicode` or ``None``
         :rtype: JSON dict
         :returns:
             success
@@ -287,7 +296,14 @@ class MediaController(BaseController):
 
         data = dict(success=False)
 
-        if file is not None:
+        if upload_session:
+            try:
+                upload = chunked_uploads.get(upload_session)
+                media_file = _add_uploaded_media_file(media, upload)
+                data['success'] = True
+            except UploadError, e:
+                data['message'] = str(e)
+        elif file is not None:
             # Create a media object, add it to the video, and store the file permanently.
             media_file = _add_new_media_file(media, file.filename, file.file)
             data['success'] = True
@@ -330,9 +346,6 @@ class MediaController(BaseController):
             DBSession.add(media)
             DBSession.flush()
 
-            if id == 'new':
-                helpers.create_default_thumbs_for(media)
-
             # Render some widgets so the XHTML can be injected into the page
             edit_form_xhtml = unicode(edit_file_form.display(
                 action=url_for(action='edit_file', id=media.id),
@@ -348,6 +361,9 @@ class MediaController(BaseController):
                 edit_form = edit_form_xhtml,
                 status_form = status_form_xhtml,
             ))
+        elif id == 'new':
+            # The stub was saved to reserve its slug, but has no file
+            DBSession.delete(media)
 
         return data
 
@@ -430,26 +446,17 @@ class MediaController(BaseController):
                 important if a new media has just been created.
 
         """
-        if id == 'new':
-            media = create_media_stub()
-        else:
+        if id != 'new':
             media = fetch_row(Media, id)
 
         try:
-            # Create thumbs
+            # Make sure PIL can read it before we keep it
             img = Image.open(thumb.file)
 
             if id == 'new':
-                DBSession.add(media)
-                DBSession.flush()
-
-            # TODO: Allow other formats?
-            for key, xy in config['thumb_sizes'][media._thumb_dir].iteritems():
-                thumb_path = helpers.thumb_path(media, key)
-                thumb_img = helpers.resize_thumb(img, xy)
-                thumb_img.save(thumb_path)
+                media = create_media_stub()
 
-            # Backup the original image just for kicks
+            # Keep the original image to resize from
             backup_type = os.path.splitext(thumb.filename)[1].lower()[1:]
             backup_path = helpers.thumb_path(media, 'orig', ext=backup_type)
             backup_file = open(backup_path, 'w+b')
@@ -458,6 +465,10 @@ class MediaController(BaseController):
             thumb.file.close()
             backup_file.close()
 
+            # TODO: Allow other formats?
+            enqueue('thumbs.resize', image_dir=media._thumb_dir,
+                    item_id=media.id, orig_path=backup_path)
+
             success = True
             message = None
         except IOError:
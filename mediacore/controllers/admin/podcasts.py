@@ -28,7 +28,9 @@ from mediacore.lib import helpers
 from mediacore.lib.base import BaseController
 from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
 from mediacore.lib.helpers import redirect, url_for
-from mediacore.model import Author, AuthorWithIP, Podcast, fetch_row, get_available_slug
+from mediacore.lib.jobs import enqueue
+from mediacore.lib.thumbnails import thumb_manifest
+from mediacore.model import Author, AuthorWithIP, Podcast, fetch_row, flush_with_available_slug, get_available_slug
 from mediacore.model.meta import DBSession
 from mediacore.model.podcasts import create_podcast_stub
 
@@ -143,12 +145,16 @@ class PodcastsController(BaseController):
 
         if delete:
             file_paths = helpers.thumb_paths(podcast)
+            thumb_key = (podcast._thumb_dir, podcast.id)
             DBSession.delete(podcast)
             transaction.commit()
+            thumb_manifest.remove(*thumb_key)
             helpers.delete_files(file_paths, 'podcasts')
             redirect(action='index', id=None)
 
         podcast.slug = get_available_slug(Podcast, slug, podcast)
+        if podcast.id:
+            flush_with_available_slug(podcast, slug)
         podcast.title = title
         podcast.subtitle = subtitle
         podcast.author = Author(author_name, author_email)
@@ -159,11 +165,7 @@ class PodcastsController(BaseController):
         podcast.feedburner_url = details['feedburner_url']
         podcast.explicit = {'yes': True, 'clean': False}.get(details['explicit'], None)
 
-        DBSession.add(podcast)
-        DBSession.flush()
-
-        if id == 'new':
-            helpers.create_default_thumbs_for(podcast)
+        flush_with_available_slug(podcast, slug)
 
         redirect(action='edit', id=podcast.id)
 
@@ -189,26 +191,17 @@ class PodcastsController(BaseController):
                 important if a new podcast has just been created.
 
         """
-        if id == 'new':
-            podcast = create_podcast_stub()
-        else:
+        if id != 'new':
             podcast = fetch_row(Podcast, id)
 
         try:
-            # Create jpeg thumbs
+            # Make sure PIL can read it before we keep it
             img = Image.open(thumb.file)
 
             if id == 'new':
-                DBSession.add(podcast)
-                DBSession.flush()
-
-            # TODO: Allow other formats?
-            for key, xy in config['thumb_sizes'][podcast._thumb_dir].iteritems():
-                thumb_path = helpers.thumb_path(podcast, key)
-                thumb_img = helpers.resize_thumb(img, xy)
-                thumb_img.save(thumb_path)
+                podcast = create_podcast_stub()
 
-            # Backup the original image just for kicks
+            # Keep the original image to resize from
             backup_type = os.path.splitext(thumb.filename)[1].lower()[1:]
             backup_path = helpers.thumb_path(podcast, 'orig', ext=backup_type)
             backup_file = open(backup_path, 'w+b')
@@ -217,6 +210,10 @@ class PodcastsController(BaseController):
             thumb.file.close()
             backup_file.close()
 
+            # TODO: Allow other formats?
+            enqueue('thumbs.resize', image_dir=podcast._thumb_dir,
+                    item_id=podcast.id, orig_path=backup_path)
+
             success = True
             message = None
         except IOError, e:
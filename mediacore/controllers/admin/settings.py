@@ -13,6 +13,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import transaction
 import tw.forms.fields
 
 from pylons import request, response, session, tmpl_context
@@ -25,6 +26,7 @@ from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
 from mediacore.lib.helpers import fetch_setting, redirect, url_for
 from mediacore.model import Media, Setting, fetch_row
 from mediacore.model.meta import DBSession
+from mediacore.model.settings import settings_cache
 
 import logging
 log = logging.getLogger(__name__)
@@ -75,7 +77,13 @@ class SettingsController(BaseController):
         redirect(controller='/admin/categories')
 
     def _update_settings(self, values):
-        """Modify the settings associated with the given dictionary."""
+        """Modify the settings associated with the given dictionary.
+
+        Changes are committed immediately so that the
+        :data:`~mediacore.model.settings.settings_cache` can be invalidated
+        without other processes reloading the old values in the meantime.
+        """
+        changed = False
         for name, value in values.iteritems():
             if value is None:
                 value = u''
@@ -84,7 +92,11 @@ class SettingsController(BaseController):
             if self.settings[name].value != value:
                 self.settings[name].value = value
                 DBSession.add(self.settings[name])
+                changed = True
         DBSession.flush()
+        if changed:
+            transaction.commit()
+            settings_cache.invalidate()
 
     def _display(self, form, **kwargs):
         """Return the template variables for display of the form.
@@ -0,0 +1,62 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+from paste.deploy.converters import asbool
+from pylons import config, request
+from repoze.what.predicates import has_permission
+
+from mediacore.lib.base import BaseController
+from mediacore.lib.decorators import expose, expose_xhr
+from mediacore.lib.helpers import redirect
+from mediacore.lib.profiler import profile_stats
+
+class StatsController(BaseController):
+    """Admin request profiling stats, see :mod:`mediacore.lib.profiler`"""
+    allow_only = has_permission('admin')
+
+    @expose_xhr('admin/stats/index.html')
+    def index(self, **kwargs):
+        """Summarize the request timings of every process by route.
+
+        :rtype: Dict
+        :returns:
+            enabled
+                True if the ``profile`` config option is on.
+            routes
+                A list of dicts of timings, one per route, from
+                :meth:`mediacore.lib.profiler.ProfileStats.summary`.
+            slowest
+                The slowest SQL statements, as
+                ``(seconds, statement, route)`` tuples.
+
+        """
+        enabled = asbool(config.get('profile', 'false'))
+        routes, slowest = [], []
+        if enabled:
+            routes, slowest = profile_stats.summary()
+        return dict(enabled=enabled, routes=routes, slowest=slowest)
+
+
+    @expose('json')
+    def clear(self, **kwargs):
+        """Discard the timings collected so far.
+
+        :returns: Redirect back to :meth:`index` after success.
+        """
+        profile_stats.clear()
+
+        if request.is_xhr:
+            return dict(success=True)
+        redirect(action='index')
@@ -24,7 +24,7 @@ from mediacore.lib import helpers
 from mediacore.lib.base import BaseController
 from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
 from mediacore.lib.helpers import fetch_setting, redirect, url_for
-from mediacore.model import Tag, fetch_row, get_available_slug
+from mediacore.model import Tag, fetch_row, flush_with_available_slug, get_available_slug
 from mediacore.model.meta import DBSession
 
 import logging
@@ -110,10 +110,11 @@ class TagsController(BaseController):
             DBSession.delete(tag)
             data = dict(success=True, id=tag.id)
         else:
-            tag.name = kwargs['name']
             tag.slug = get_available_slug(Tag, kwargs['slug'], tag)
-            DBSession.add(tag)
-            DBSession.flush()
+            if tag.id:
+                flush_with_available_slug(tag, kwargs['slug'])
+            tag.name = kwargs['name']
+            flush_with_available_slug(tag, kwargs['slug'])
             data = dict(
                 success = True,
                 id = tag.id,
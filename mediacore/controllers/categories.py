@@ -16,9 +16,12 @@ from pylons import config, request, response, session, tmpl_context as c
 from sqlalchemy import orm, sql
 
 from mediacore.lib.base import BaseController
-from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
+from mediacore.lib.decorators import (cache_response, expose, expose_xhr,
+    paginate, validate)
 from mediacore.lib.helpers import get_featured_category, redirect, url_for
+from mediacore.lib.paginate import Seekable
 from mediacore.model import Category, Media, Podcast, fetch_row
+from mediacore.model.media import seek_orders
 from mediacore.model.meta import DBSession
 
 import logging
@@ -33,17 +36,16 @@ class CategoriesController(BaseController):
 
     """
 
-    def __init__(self, *args, **kwargs):
-        super(CategoriesController, self).__init__(*args, **kwargs)
+    def _setup_categories(self):
+        """Load the category tree, media counts and current category.
 
+        This is done by each action rather than the constructor so that
+        none of these queries run when a page is served from the cache.
+        """
         c.categories = Category.query.order_by(Category.name).populated_tree()
 
-        counts = dict(DBSession.query(Category.id, Category.media_count_published))
-        c.category_counts = counts.copy()
-        for cat, depth in c.categories.traverse():
-            count = counts[cat.id]
-            for ancestor in cat.ancestors():
-                c.category_counts[ancestor.id] += count
+        c.category_counts = dict((cat.id, cat.media_count_published_total)
+                                 for cat, depth in c.categories.traverse())
 
         category_slug = request.environ['pylons.routes_dict'].get('slug', None)
         if category_slug:
@@ -51,11 +53,12 @@ class CategoriesController(BaseController):
             c.breadcrumb = c.category.ancestors()
             c.breadcrumb.append(c.category)
 
+    @cache_response('categories', 'media', 'comments')
     @expose('categories/index.html')
     def index(self, slug=None, **kwargs):
+        self._setup_categories()
         categories = Category.query.order_by(Category.name).populated_tree()
-        media = Media.query.published()\
-            .options(orm.undefer('comment_count_published'))
+        media = Media.query.published()
 
         if c.category:
             media = media.in_category(c.category)
@@ -80,20 +83,21 @@ class CategoriesController(BaseController):
             popular = popular,
         )
 
+    @cache_response('categories', 'media', 'comments')
     @expose('categories/more.html')
-    @paginate('media', items_per_page=20)
+    @paginate('media', items_per_page=20, count_tags=('media', 'media_status'))
     def more(self, slug, order, page=1, **kwargs):
+        self._setup_categories()
         media = Media.query.published()\
-            .options(orm.undefer('comment_count_published'))\
             .in_category(c.category)
 
         if order == 'latest':
-            media = media.order_by(Media.publish_on.desc())
+            seek_order = seek_orders['latest']
         else:
-            media = media.order_by(Media.popularity_points.desc())
+            seek_order = seek_orders['popular']
 
         return dict(
-            media = media,
+            media = Seekable(media, seek_order),
             order = order,
         )
 
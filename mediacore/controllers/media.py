@@ -20,21 +20,26 @@ import os.path
 from urlparse import urlparse
 
 from pylons import config, request, response, session, tmpl_context
+from pylons.controllers.util import forward
 import webob.exc
 from sqlalchemy import orm, sql
 from formencode import validators
 from paste.deploy.converters import asbool
 from paste.util import mimeparse
-from akismet import Akismet
 
 from mediacore.lib.base import BaseController
-from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
+from mediacore.lib.decorators import (cache_response, expose, expose_xhr,
+    paginate, validate)
 from mediacore.lib.helpers import url_for, redirect, add_transient_message
+from mediacore.lib.paginate import Seekable
 from mediacore.model import (DBSession, fetch_row, get_available_slug,
     Media, MediaFile, Comment, Tag, Category, Author, AuthorWithIP, Podcast)
 from mediacore.lib import helpers, email
+from mediacore.lib.fileserve import MediaFileApp, OffloadFileApp
+from mediacore.lib.jobs import enqueue
+from mediacore.lib.viewcounter import view_counter
+from mediacore.model.media import seek_orders
 from mediacore.forms.comments import PostCommentForm
-from mediacore import __version__ as MEDIACORE_VERSION
 
 import logging
 log = logging.getLogger(__name__)
@@ -46,13 +51,16 @@ class MediaController(BaseController):
     Media actions -- for both regular and podcast media
     """
 
+    @cache_response('media', 'comments', 'categories')
     @expose('media/index.html')
-    @paginate('media', items_per_page=20)
+    @paginate('media', items_per_page=20, count_tags=('media', 'media_status'))
     def index(self, page=1, show='latest', q=None, tag=None, **kwargs):
         """List media with pagination.
 
         The media paginator may be accessed in the template with
         :attr:`c.paginators.media`, see :class:`webhelpers.paginate.Page`.
+        The latest and most popular media are paged through by cursor,
+        see :class:`mediacore.lib.paginate.SeekPage`.
 
         :param page: Page number, defaults to 1.
         :type page: int
@@ -67,14 +75,11 @@ class MediaController(BaseController):
             media
                 The list of :class:`~mediacore.model.media.Media` instances
                 for this page.
-            result_count
-                The total number of media items for this query
             search_query
                 The query the user searched for, if any
 
         """
-        media = Media.query.published()\
-            .options(orm.undefer('comment_count_published'))
+        media = Media.query.published()
 
         media, show = helpers.filter_library_controls(media, show)
 
@@ -83,10 +88,11 @@ class MediaController(BaseController):
         if tag:
             tag = fetch_row(Tag, slug=tag)
             media = media.filter(Media.tags.contains(tag))
+        if not q and show in seek_orders:
+            media = Seekable(media, seek_orders[show])
 
         return dict(
             media = media,
-            result_count = media.count(),
             search_query = q,
             show = show,
             tag = tag,
@@ -120,21 +126,14 @@ class MediaController(BaseController):
 
         """
         media = fetch_row(Media, slug=slug)
-        media.increment_views()
-        DBSession.add(media)
+        view_counter.increment(media.id)
 
         if media.podcast_id is not None:
             # Always view podcast media from a URL that shows the context of the podcast
             if url_for() != url_for(podcast_slug=media.podcast.slug):
                 redirect(podcast_slug=media.podcast.slug)
 
-        if media.fulltext:
-            related = Media.query.published()\
-                .options(orm.undefer('comment_count_published'))\
-                .filter(Media.id != media.id)\
-                .search('>(%s) <(%s)' % (media.title, media.fulltext.tags))[:6]
-        else:
-            related = []
+        related = Media.query.published().related(media)[:6]
 
         return dict(
             media = media,
@@ -175,25 +174,6 @@ class MediaController(BaseController):
         :returns: Redirect to :meth:`view` page for media.
 
         """
-        akismet_key = helpers.fetch_setting('akismet_key')
-        akismet_url = helpers.fetch_setting('akismet_url')
-        if akismet_key:
-            akismet = Akismet(agent='MediaCore/%s' % MEDIACORE_VERSION)
-            akismet.key = akismet_key
-            akismet.blog_url = akismet_url or url_for('/', qualified=True)
-            akismet.verify_key()
-            data = {'comment_author': values['name'].encode('utf-8'),
-                    'user_ip': request.environ.get('REMOTE_ADDR'),
-                    'user_agent': request.environ.get('HTTP_USER_AGENT'),
-                    'referrer': request.environ.get('HTTP_REFERER',  'unknown'),
-                    'HTTP_ACCEPT': request.environ.get('HTTP_ACCEPT')}
-
-            if akismet.comment_check(values['body'].encode('utf-8'), data):
-                title = "Comment Rejected"
-                text = "Your comment appears to be spam and has been rejected."
-                add_transient_message('comment_posted', title, text)
-                redirect(action='view', anchor='top')
-
         media = fetch_row(Media, slug=slug)
 
         c = Comment()
@@ -203,20 +183,50 @@ class MediaController(BaseController):
         c.subject = 'Re: %s' % media.title
         c.body = values['body']
 
+        # Comments are checked for spam in the background. Until then,
+        # they're held back as if they were awaiting review.
+        check_spam = bool(helpers.fetch_setting('akismet_key'))
         require_review = asbool(helpers.fetch_setting('req_comment_approval'))
-        if not require_review:
+        if not require_review and not check_spam:
             c.reviewed = True
             c.publishable = True
 
         media.comments.append(c)
         DBSession.add(media)
-        email.send_comment_notification(media, c)
+        DBSession.flush()
+
+        if check_spam:
+            akismet_url = helpers.fetch_setting('akismet_url')
+            enqueue('comments.check_spam',
+                key='comments.check_spam:%d' % c.id,
+                comment_id=c.id,
+                blog_url=akismet_url or url_for('/', qualified=True),
+                data={'comment_author': values['name'],
+                      'user_ip': request.environ.get('REMOTE_ADDR'),
+                      'user_agent': request.environ.get('HTTP_USER_AGENT'),
+                      'referrer': request.environ.get('HTTP_REFERER',  'unknown'),
+                      'HTTP_ACCEPT': request.environ.get('HTTP_ACCEPT')},
+                publish=not require_review,
+                notify=email.comment_notification(media, c))
+        else:
+            email.send_comment_notification(media, c)
 
-        if require_review:
+        if c.reviewed and not c.publishable:
+            # Akismet was run inline and caught it
+            title = "Comment Rejected"
+            text = "Your comment appears to be spam and has been rejected."
+            add_transient_message('comment_posted', title, text)
+            redirect(action='view', anchor='top')
+        elif require_review:
             title = "Thanks for your comment!"
             text = "We will post it just as soon as a moderator approves it."
             add_transient_message('comment_posted', title, text)
             redirect(action='view', anchor='top')
+        elif not c.publishable:
+            title = "Thanks for your comment!"
+            text = "It will appear as soon as it has passed our spam check."
+            add_transient_message('comment_posted', title, text)
+            redirect(action='view', anchor='top')
         else:
             redirect(action='view', anchor='comment-%s' % c.id)
 
@@ -226,6 +236,16 @@ class MediaController(BaseController):
     def serve(self, id, slug, container, **kwargs):
         """Serve a :class:`~mediacore.model.media.MediaFile` binary.
 
+        The file is streamed from disk in chunks by
+        :class:`~mediacore.lib.fileserve.MediaFileApp`, which also handles
+        ``HEAD``, conditional requests and byte ranges so that players
+        can seek without downloading the whole file.
+
+        If the ``file_serve_method`` config option is set to ``x-sendfile``
+        or ``x-accel-redirect``, delivery is instead handed off to the
+        front-end web server with
+        :class:`~mediacore.lib.fileserve.OffloadFileApp`.
+
         :param id: File ID
         :type id: ``int``
         :param slug: The media :attr:`~mediacore.model.media.Media.slug`
@@ -250,13 +270,28 @@ class MediaController(BaseController):
                 if mimetype == '':
                     raise webob.exc.HTTPNotAcceptable() # 406
 
-                response.headers['Content-Type'] = mimetype
-                response.headers['Content-Disposition'] = \
-                    'attachment;filename="%s"' % file.display_name.encode('utf-8')
-                return open(file.file_path, 'rb').read()
+                file_path = file.file_path
+                if file_path is None or not os.path.isfile(file_path):
+                    raise webob.exc.HTTPNotFound()
+
+                disposition = 'attachment;filename="%s"' \
+                    % file.display_name.encode('utf-8')
+                headers = [('Content-Disposition', disposition)]
+
+                serve_method = config.get('file_serve_method', 'default')
+                if serve_method == 'default':
+                    app = MediaFileApp(file_path, mimetype, file.modified_on,
+                                       headers=headers)
+                else:
+                    app = OffloadFileApp(file_path, mimetype, serve_method,
+                        root_dir=config['media_dir'],
+                        location=config.get('file_serve_accel_location'),
+                        headers=headers)
+                return forward(app)
         else:
             raise webob.exc.HTTPNotFound()
 
+    @cache_response('media', 'comments', 'categories')
     @expose('media/explore.html')
     @paginate('media', items_per_page=20)
     def explore(self, page=1, **kwargs):
@@ -270,8 +305,7 @@ class MediaController(BaseController):
                 Latest media
 
         """
-        media = Media.query.published()\
-            .options(orm.undefer('comment_count_published'))
+        media = Media.query.published()
 
         latest = media.order_by(Media.publish_on.desc())
         popular = media.order_by(Media.popularity_points.desc())
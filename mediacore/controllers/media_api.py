@@ -23,7 +23,9 @@ from mediacore.lib.base import BaseController
 from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
 from mediacore.lib.helpers import url_for
 from mediacore.lib import helpers
+from mediacore.lib.paginate import InvalidCursor, SeekOrder, SeekPage, cached_count
 from mediacore.model import Category, Media, Podcast, Tag, fetch_row, get_available_slug
+from mediacore.model.media import seek_orders
 from mediacore.model.meta import DBSession
 
 import logging
@@ -49,6 +51,16 @@ order_columns = {
     'comment_count': 'comment_count_published %s'
 }
 
+# The orders that can be paged through with a cursor
+cursor_orders = {
+    ('publish_on', 'desc'): seek_orders['latest'],
+    ('publish_on', 'asc'): SeekOrder('oldest', Media.publish_on, Media.id,
+                                     descending=False),
+    ('popularity', 'desc'): seek_orders['popular'],
+    ('popularity', 'asc'): SeekOrder('unpopular', Media.popularity_points,
+                                     Media.id, descending=False),
+}
+
 class MediaApiController(BaseController):
     """
     JSON Media API
@@ -57,7 +69,8 @@ class MediaApiController(BaseController):
     @expose('json')
     def index(self, type=None, podcast=None, tag=None, category=None, search=None,
               max_age=None, min_age=None, order=None, offset=0, limit=10,
-              published_after=None, published_before=None, **kwargs):
+              published_after=None, published_before=None, cursor=None,
+              **kwargs):
         """Query for a list of media.
 
         :param type:
@@ -108,9 +121,16 @@ class MediaApiController(BaseController):
             Where in the complete resultset to start returning results.
             Defaults to 0, the very beginning. This is useful if you've
             already fetched the first 50 results and want to fetch the
-            next 50 and so on.
+            next 50 and so on. Fetching the next results with ``cursor``
+            is quicker, where it's available.
         :type offset: int
 
+        :param cursor:
+            The ``next_cursor`` from the previous results, to fetch the
+            results that follow them. Only available when ordering by
+            publish_on or popularity, without a search.
+        :type cursor: str
+
         :param limit:
             Number of results to return in each query. Defaults to 10.
             The maximum allowed value defaults to 50 and is set via
@@ -123,14 +143,17 @@ class MediaApiController(BaseController):
         :rtype: JSON dict
         :returns:
             count
-                The total number of results that match this query.
+                The total number of results that match this query. This
+                is reused for a few minutes, so it may be slightly out of
+                date.
             media
                 A list of media info objects.
+            next_cursor
+                Pass this as ``cursor`` to fetch the next results, or
+                null if there are none or the order doesn't allow it.
 
         """
-        query = Media.query\
-            .published()\
-            .options(orm.undefer('comment_count_published'))
+        query = Media.query.published()
 
         # Basic filters
         if type:
@@ -187,21 +210,50 @@ class MediaApiController(BaseController):
         query = query.order_by(order)
 
         # Search will supercede the ordering above
+        seek_order = None
         if search:
             query = query.search(search)
+        else:
+            seek_order = cursor_orders.get((order_col, order_dir), None)
+
+        # The total doesn't depend on which of the results are returned
+        count_key = [(k, v) for k, v in request.GET.iteritems()
+                     if k not in ('offset', 'limit', 'cursor')]
+        count_key.sort()
+        count = cached_count(query, ('media_api', count_key))
 
         # Preload podcast slugs so we don't do n+1 queries
         podcast_slugs = dict(DBSession.query(Podcast.id, Podcast.slug))
 
-        # Rudimentary pagination support
         start = int(offset)
-        end = start + min(int(limit), int(config['api_media_max_results']))
+        limit = min(int(limit), int(config['api_media_max_results']))
 
-        media = [self._info(m, podcast_slugs) for m in query[start:end]]
+        if cursor:
+            if seek_order is None:
+                raise APIException, 'Cursors can only be used when ordering by publish_on or popularity, without a search'
+            try:
+                page = SeekPage(query, seek_order, cursor, items_per_page=limit)
+            except InvalidCursor:
+                raise APIException, 'Invalid cursor "%s", it must be a next_cursor given for the same order' % cursor
+            results = page.items
+            next_cursor = page.next_cursor
+        else:
+            # Rudimentary pagination support. Ties are broken by ID so
+            # that a cursor to continue from can be given.
+            if seek_order is not None:
+                query = seek_order.order(query)
+            results = query[start:start + limit + 1]
+            next_cursor = None
+            if seek_order is not None and 0 < limit < len(results):
+                next_cursor = seek_order.cursor(results[limit - 1])
+            results = results[:limit]
+
+        media = [self._info(m, podcast_slugs) for m in results]
 
         return dict(
             media = media,
-            count = query.count()
+            count = count,
+            next_cursor = next_cursor,
         )
 
 
@@ -251,9 +303,7 @@ class MediaApiController(BaseController):
             podcast_slug = DBSession.query(Podcast.slug)\
                 .filter_by(id=media.podcast_id).scalar()
 
-        thumbs = {}
-        for size in config['thumb_sizes'][media._thumb_dir].iterkeys():
-            thumbs[size] = helpers.thumb(media, size, qualified=True)
+        thumbs = helpers.thumbs(media, qualified=True)
 
         return dict(
             id = media.id,
@@ -15,15 +15,21 @@
 
 from paste.util import mimeparse
 from pylons import config, request, response, session, tmpl_context
+from pylons.controllers.util import forward
 from repoze.what.predicates import has_permission
 from sqlalchemy import orm, sql
 import pylons.templating
 
 from mediacore.lib import helpers
 from mediacore.lib.base import BaseController
-from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
+from mediacore.lib.decorators import (cache_response, expose, expose_xhr,
+    paginate, validate)
+from mediacore.lib.feedcache import accepts_gzip, feed_cache
+from mediacore.lib.fileserve import MediaFileApp
 from mediacore.lib.helpers import redirect
+from mediacore.lib.paginate import Seekable
 from mediacore.model import Category, Media, Podcast, fetch_row
+from mediacore.model.media import seek_orders
 from mediacore.model.meta import DBSession
 
 import logging
@@ -53,9 +59,7 @@ class PodcastsController(BaseController):
                 The :class:`~mediacore.model.podcasts.Podcast` instance
 
         """
-        podcasts = Podcast.query\
-            .options(orm.undefer('media_count_published'))\
-            .all()
+        podcasts = Podcast.query.all()
 
         if len(podcasts) == 1:
             redirect(action='view', slug=podcasts[0].slug)
@@ -65,8 +69,9 @@ class PodcastsController(BaseController):
         )
 
 
+    @cache_response('podcasts', 'media', 'comments', 'categories')
     @expose('podcasts/view.html')
-    @paginate('episodes', items_per_page=10)
+    @paginate('episodes', items_per_page=10, count_tags=('media', 'media_status'))
     def view(self, slug, page=1, show='latest', **kwargs):
         """View a podcast and the media that belongs to it.
 
@@ -85,19 +90,19 @@ class PodcastsController(BaseController):
 
         """
         podcast = fetch_row(Podcast, slug=slug)
-        episodes = podcast.media.published()\
-            .options(orm.undefer('comment_count_published'))
+        episodes = podcast.media.published()
 
         episodes, show = helpers.filter_library_controls(episodes, show)
+        if show in seek_orders:
+            episodes = Seekable(episodes, seek_orders[show])
 
         return dict(
             podcast = podcast,
             episodes = episodes,
-            result_count = episodes.count(),
             show = show,
         )
 
-    @expose('podcasts/feed.xml')
+    @expose()
     def feed(self, slug, **kwargs):
         """Serve the feed as RSS 2.0.
 
@@ -106,35 +111,56 @@ class PodcastsController(BaseController):
         does not contain 'feedburner', as described here:
         http://www.google.com/support/feedburner/bin/answer.py?hl=en&answer=78464
 
-        :param feedburner_bypass: If true, the redirect to feedburner is disabled.
-        :rtype: Dict
-        :returns:
-            podcast
-                A :class:`~mediacore.model.podcasts.Podcast` instance.
-            episodes
-                A list of :class:`~mediacore.model.media.Media` instances
-                that belong to the ``podcast``.
+        The rendered feed is stored by :data:`~mediacore.lib.feedcache.feed_cache`
+        and served as a static file, gzipped if the client accepts it,
+        with ``ETag`` and ``Last-Modified`` headers for conditional GETs.
 
-        Renders: :data:`podcasts/feed.xml` XML
+        :param feedburner_bypass: If true, the redirect to feedburner is disabled.
+        :returns: The RSS document, rendered with :data:`podcasts/feed.xml`.
 
         """
         podcast = fetch_row(Podcast, slug=slug)
 
         if (podcast.feedburner_url
-            and not 'feedburner' in request.environ.get('HTTP_USER_AGENT').lower()
+            and not 'feedburner' in request.environ.get('HTTP_USER_AGENT', '').lower()
             and not kwargs.get('feedburner_bypass', False)):
             redirect(podcast.feedburner_url.encode('utf-8'))
 
         # Choose the most appropriate content_type for the client
-        response.content_type = mimeparse.best_match(
+        content_type = mimeparse.best_match(
             ['application/rss+xml', 'application/xml', 'text/xml'],
             request.environ.get('HTTP_ACCEPT', '*/*')
         )
 
-        episodes = podcast.media.published()\
-            .order_by(Media.publish_on.desc())[:25]
+        feed = feed_cache.get(podcast, lambda: _render_feed(podcast))
+        headers = [('Vary', 'Accept-Encoding')]
+        if accepts_gzip(request.environ):
+            headers.append(('Content-Encoding', 'gzip'))
+            app = MediaFileApp(feed.gzip_path, content_type,
+                               headers=headers, etag=feed.gzip_etag)
+        else:
+            app = MediaFileApp(feed.path, content_type,
+                               headers=headers, etag=feed.etag)
+        return forward(app)
+
+
+@expose('podcasts/feed.xml')
+def _render_feed(podcast):
+    """Render the RSS document for the given podcast.
+
+    :rtype: Dict
+    :returns:
+        podcast
+            A :class:`~mediacore.model.podcasts.Podcast` instance.
+        episodes
+            A list of :class:`~mediacore.model.media.Media` instances
+            that belong to the ``podcast``.
 
-        return dict(
-            podcast = podcast,
-            episodes = episodes,
-        )
+    """
+    episodes = podcast.media.published()\
+        .order_by(Media.publish_on.desc())[:25]
+
+    return dict(
+        podcast = podcast,
+        episodes = episodes,
+    )
@@ -13,19 +13,13 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import shutil
 import os
 import simplejson as json
-import ftplib
-import urllib2
-import sha
-import time
 import logging
 import formencode
 from urlparse import urlparse
 from datetime import datetime, timedelta, date
 
-from akismet import Akismet
 from formencode import validators
 from paste.deploy.converters import asbool
 from paste.util import mimeparse
@@ -36,10 +30,13 @@ from mediacore.forms.uploader import UploadForm
 from mediacore.lib import email
 from mediacore.lib.base import BaseController
 from mediacore.lib.decorators import expose, expose_xhr, paginate, validate
-from mediacore.lib.filetypes import external_embedded_containers, guess_container_format, guess_media_type
-from mediacore.lib.helpers import redirect, url_for, create_default_thumbs_for, fetch_setting
-from mediacore.model import (fetch_row, get_available_slug,
-    Media, MediaFile, Comment, Tag, Category, Author, AuthorWithIP, Podcast)
+from mediacore.lib.filetypes import accepted_extensions, external_embedded_containers, guess_container_format, guess_media_type
+from mediacore.lib.helpers import redirect, url_for, fetch_setting
+from mediacore.lib.jobs import enqueue
+from mediacore.lib.storage import blob_grace_period, blob_name, store_blob
+from mediacore.lib.uploads import UploadError, chunked_uploads
+from mediacore.model import (fetch_row, flush_with_available_slug,
+    get_available_slug, Media, MediaFile, Comment, Tag, Category, Author, AuthorWithIP, Podcast)
 from mediacore.model.meta import DBSession
 
 import logging
@@ -140,6 +137,7 @@ class UploadController(BaseController):
                     kwargs['name'], kwargs['email'],
                     kwargs['title'], kwargs['description'],
                     kwargs['tags'], kwargs['file'], kwargs['url'],
+                    kwargs.get('upload_session'),
                 )
                 email.send_media_notification(media_obj)
                 data = dict(
@@ -162,6 +160,7 @@ class UploadController(BaseController):
             kwargs['name'], kwargs['email'],
             kwargs['title'], kwargs['description'],
             kwargs['tags'], kwargs['file'], kwargs['url'],
+            kwargs.get('upload_session'),
         )
         email.send_media_notification(media_obj)
 
@@ -176,7 +175,94 @@ class UploadController(BaseController):
     def failure(self, **kwargs):
         return dict()
 
-    def _save_media_obj(self, name, email, title, description, tags, file, url):
+    @expose('json')
+    def chunked_init(self, filename, size, sha1=None, **kwargs):
+        """Start a resumable chunked upload.
+
+        See :mod:`mediacore.lib.uploads` for the protocol.
+
+        :param filename: The original file name.
+        :param size: The size of the whole file, in bytes.
+        :param sha1: The SHA-1 hex digest of the whole file, if known.
+        :rtype: JSON dict
+        :returns:
+            session
+                The ID to send the chunks to.
+            offset
+                Where to send the first chunk from, always 0.
+            chunk_size
+                The suggested number of bytes to send per request.
+
+        """
+        try:
+            upload = chunked_uploads.create(filename, int(size), sha1,
+                max_size=int(fetch_setting('max_upload_size')),
+                extensions=accepted_extensions())
+        except ValueError:
+            return self._chunked_error(UploadError('Invalid size: %s' % size))
+        except UploadError, e:
+            return self._chunked_error(e)
+        data = upload.info()
+        data['chunk_size'] = chunked_uploads.chunk_size
+        return data
+
+    @expose('json')
+    def chunked_append(self, session, **kwargs):
+        """Append the raw request body to a chunked upload.
+
+        The ``offset`` and optional chunk ``sha1`` are given in the query
+        string, since the body is the chunk itself.
+
+        :rtype: JSON dict
+        :returns: The upload's ``offset`` and whether it is ``complete``.
+            On error, the ``offset`` to resume from and an ``error``.
+        """
+        try:
+            upload = chunked_uploads.get(session)
+            try:
+                offset = int(request.GET.get('offset', 0))
+                length = int(request.environ.get('CONTENT_LENGTH') or 0)
+            except ValueError:
+                raise UploadError('Invalid offset or length', 400, upload.offset)
+            upload.append(offset, request.environ['wsgi.input'], length,
+                          request.GET.get('sha1'))
+        except UploadError, e:
+            return self._chunked_error(e)
+        return upload.info()
+
+    @expose('json')
+    def chunked_status(self, session, **kwargs):
+        """Return the offset to resume a chunked upload from."""
+        try:
+            return chunked_uploads.get(session).info()
+        except UploadError, e:
+            return self._chunked_error(e)
+
+    @expose('json')
+    def chunked_finalize(self, session, **kwargs):
+        """Check that a chunked upload has arrived intact.
+
+        :rtype: JSON dict
+        :returns: The upload's info and the file's ``sha1``.
+        """
+        try:
+            upload = chunked_uploads.get(session)
+            upload.finalize()
+        except UploadError, e:
+            return self._chunked_error(e)
+        data = upload.info()
+        data['sha1'] = upload.sha1
+        return data
+
+    def _chunked_error(self, e):
+        response.status_int = e.status
+        data = dict(error=str(e))
+        if e.offset is not None:
+            data['offset'] = e.offset
+        return data
+
+    def _save_media_obj(self, name, email, title, description, tags, file, url,
+                        upload_session=None):
         # create our media object as a status-less placeholder initially
         media_obj = Media()
         media_obj.author = Author(name, email)
@@ -185,9 +271,18 @@ class UploadController(BaseController):
         media_obj.description = description
         media_obj.notes = fetch_setting('wording_additional_notes')
         media_obj.set_tags(tags)
+        # Save it now, before adding files, in case another upload with the
+        # same title took the slug in the meantime.
+        flush_with_available_slug(media_obj, title)
 
         # Create a media object, add it to the media_obj, and store the file permanently.
-        if file is not None:
+        if upload_session:
+            try:
+                upload = chunked_uploads.get(upload_session)
+                media_file = _add_uploaded_media_file(media_obj, upload)
+            except UploadError, e:
+                raise formencode.Invalid(str(e), None, None)
+        elif file is not None:
             media_file = _add_new_media_file(media_obj, file.filename, file.file)
         else:
             # FIXME: For some reason the media.type isn't ever set to video
@@ -217,129 +312,101 @@ class UploadController(BaseController):
         DBSession.add(media_obj)
         DBSession.flush()
 
-        create_default_thumbs_for(media_obj)
-
         return media_obj
 
 
 # FIXME: The following helper methods should perhaps  be moved to the media controller.
 #        or some other more generic place.
 def _add_new_media_file(media, original_filename, file):
-    # FIXME: I think this will raise a KeyError if the uploaded
-    #        file doesn't have an extension.
-    file_ext = os.path.splitext(original_filename)[1].lower()[1:]
-
-    # set the file paths depending on the file type
-    media_file = MediaFile()
-    media_file.display_name = original_filename
-    media_file.container = guess_container_format(file_ext)
-    media_file.type = guess_media_type(media_file.container)
-
     # Small files are stored in memory and do not have a tmp file w/ fileno
     if hasattr(file, 'fileno'):
-        media_file.size = os.fstat(file.fileno())[6]
+        size = os.fstat(file.fileno())[6]
     else:
         # The file may contain multi-byte characters, so we must seek instead of count chars
         file.seek(0, os.SEEK_END)
-        media_file.size = file.tell()
+        size = file.tell()
         file.seek(0)
 
-    # update media relations
-    media.files.append(media_file)
-
-    # add the media file (and its media, if new) to the database to get IDs
-    DBSession.add(media_file)
-    DBSession.flush()
-
-    # copy the file to its permanent location
-    file_name = '%d_%d_%s.%s' % (media.id, media_file.id, media.slug, file_ext)
-    file_url = _store_media_file(file, file_name)
-    media_file.file_name = file_name
-
-    return media_file
-
-def _store_media_file(file, file_name):
-    """Copy the file to its permanent location and return its URI"""
-    if asbool(fetch_setting('ftp_storage')):
-        # Put the file into our FTP storage, return its URL
-        return _store_media_file_ftp(file, file_name)
-    else:
-        # Store the file locally, return its path relative to the media dir
-        file_path = os.path.join(config['media_dir'], file_name)
-        permanent_file = open(file_path, 'w')
-        shutil.copyfileobj(file, permanent_file)
+    # copy the file to its permanent location, named by its contents
+    try:
+        file_name, digest = store_blob(file, config['media_dir'],
+                                       _file_ext(original_filename))
+    finally:
         file.close()
-        permanent_file.close()
-        return file_name
-
-class FTPUploadException(Exception):
-    pass
-
-def _store_media_file_ftp(file, file_name):
-    """Store the file on the defined FTP server.
 
-    Returns the download url for accessing the resource.
+    media_file = _new_media_file(media, original_filename, size, file_name)
+    _store_media_file_ftp(media_file, digest)
+    return media_file
 
-    Ensures that the file was stored correctly and is accessible
-    via the download url.
+def _add_uploaded_media_file(media, upload):
+    """Add a finished :class:`~mediacore.lib.uploads.ChunkedUpload`.
 
-    Raises an exception on failure (FTP connection errors, I/O errors,
-    integrity errors)
+    The file is already in the media dir, so it's renamed into place, and
+    the hash worked out as it was uploaded is passed on to the FTP job.
     """
-    stor_cmd = 'STOR ' + file_name
-    file_url = fetch_setting('ftp_download_url') + file_name
-
-    # Put the file into our FTP storage
-    FTPSession = ftplib.FTP(fetch_setting('ftp_server'),
-                            fetch_setting('ftp_username'),
-                            fetch_setting('ftp_password'))
-
-    try:
-        FTPSession.cwd(fetch_setting('ftp_upload_directory'))
-        FTPSession.storbinary(stor_cmd, file)
-        _verify_ftp_upload_integrity(file, file_url)
-    except Exception, e:
-        FTPSession.quit()
-        raise e
+    if not upload.complete:
+        upload.finalize()
+    file_name = blob_name(upload.sha1, _file_ext(upload.filename))
+    digest = upload.move_to(os.path.join(config['media_dir'], file_name))
+    media_file = _new_media_file(media, upload.filename, upload.size, file_name)
+    _store_media_file_ftp(media_file, digest)
+    return media_file
 
-    FTPSession.quit()
+def _new_media_file(media, original_filename, size, file_name):
+    """Create a MediaFile for a file stored in the media dir.
 
-    return file_url
+    :param file_name: The name the file is stored under, which may be
+        shared with other media files that have the same contents.
+    :returns: The new :class:`~mediacore.model.media.MediaFile`.
+    """
+    # set the file paths depending on the file type
+    media_file = MediaFile()
+    media_file.display_name = original_filename
+    media_file.container = guess_container_format(_file_ext(original_filename))
+    media_file.type = guess_media_type(media_file.container)
+    media_file.size = size
+    media_file.file_name = file_name
 
+    # update media relations
+    media.files.append(media_file)
 
-def _verify_ftp_upload_integrity(file, file_url):
-    """Download the file, and make sure that it matches the original.
+    # add the media file (and its media, if new) to the database to get IDs
+    DBSession.add(media_file)
+    DBSession.flush()
 
-    Returns True on success, and raises an Exception on failure.
+    # Fill in its duration and codecs from its headers in the background
+    enqueue('media.probe',
+            key='media.probe:%d' % media_file.id,
+            media_file_id=media_file.id)
+    return media_file
 
-    FIXME: Ideally we wouldn't have to download the whole file, we'd have
-           some better way of verifying the integrity of the upload.
-    """
-    file.seek(0)
-    old_hash = sha.new(file.read()).hexdigest()
-    tries = 0
-
-    # Try to download the file. Increase the number of retries, or the
-    # timeout duration, if the server is particularly slow.
-    # eg: Akamai usually takes 3-15 seconds to make an uploaded file
-    #     available over HTTP.
-    while tries < int(fetch_setting('ftp_upload_integrity_retries')):
-        time.sleep(3)
-        tries += 1
-        try:
-            temp_file = urllib2.urlopen(file_url)
-            new_hash = sha.new(temp_file.read()).hexdigest()
-            temp_file.close()
-
-            # If the downloaded file matches, success! Otherwise, we can
-            # be pretty sure that it got corrupted during FTP transfer.
-            if old_hash == new_hash:
-                return True
-            else:
-                raise FTPUploadException(
-                    'Uploaded File and Downloaded File did not match')
-        except urllib2.HTTPError, e:
-            pass
+def _file_ext(original_filename):
+    # FIXME: I think this will raise a KeyError if the uploaded
+    #        file doesn't have an extension.
+    return os.path.splitext(original_filename)[1].lower()[1:]
+
+def _store_media_file_ftp(media_file, digest=None):
+    # If the same file was uploaded before and has been moved to our FTP
+    # storage already, just use that copy.
+    stored = MediaFile.query\
+        .filter(MediaFile.file_name == media_file.file_name)\
+        .filter(MediaFile.url != None)\
+        .filter(MediaFile.id != media_file.id)\
+        .first()
+    if stored is not None:
+        media_file.url = stored.url
+        # The local copy is deleted later if nothing else needs it, as
+        # another upload of the same contents may be about to use it.
+        enqueue('media.collect_blob',
+                delay=blob_grace_period,
+                file_name=media_file.file_name)
+        return
 
-    raise FTPUploadException(
-        'Could not download the file after %d attempts' % max)
+    if asbool(fetch_setting('ftp_storage')):
+        # Copy it to our FTP storage in the background. It's served from
+        # the media_dir until the upload has been verified.
+        enqueue('media.store_ftp',
+                key='media.store_ftp:%d' % media_file.id,
+                media_file_id=media_file.id,
+                file_name=media_file.file_name,
+                digest=digest)
@@ -29,6 +29,10 @@ from repoze.what.plugins.pylonshq import ControllerProtector
 from repoze.what.predicates import Predicate
 
 from mediacore.lib import helpers
+from mediacore.model.counts import published_counts
+
+import logging
+log = logging.getLogger(__name__)
 
 __all__ = ['BareBonesController', 'BaseController']
 
@@ -120,6 +124,12 @@ class BaseController(BareBonesController):
                 # TODO: Add error reporting here.
                 pass
 
+        try:
+            published_counts.ensure_fresh()
+        except Exception, e:
+            # Slightly stale counts are better than a broken page.
+            log.exception('Failed to refresh published media counts: %s', e)
+
         super(BaseController, self).__init__(*args, **kwargs)
 
     def update_external_template(self, tmpl_url, tmpl_name, timeout):
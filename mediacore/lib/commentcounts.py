@@ -0,0 +1,74 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Comment Counts
+
+Each media item stores how many comments it has, and how many of them are
+published, so that listings don't need to count the comments table.
+
+:class:`CommentCountExtension` recalculates the counts of every media item
+whose comments were added, deleted, moved or (un)published during a flush,
+in the same transaction, so it works on any database. The MySQL triggers in
+``setup_triggers.sql`` do the same for plain SQL statements; on other
+databases, run ``paster --plugin=MediaCore rebuild-counts`` after changing
+comments without the ORM.
+
+"""
+from sqlalchemy.orm import attributes
+from sqlalchemy.orm.interfaces import SessionExtension
+
+__all__ = ['CommentCountExtension']
+
+class CommentCountExtension(SessionExtension):
+    """Recalculate the comment counts of media whose comments were saved.
+
+    The counts are recounted rather than incremented, so it doesn't matter
+    whether the triggers have already updated them.
+    """
+
+    #: Comment attributes which the counts depend on.
+    attrs = ('media_id', 'media', 'publishable')
+
+    def after_flush(self, session, flush_context):
+        media_ids = self.changed_media_ids(session)
+        if media_ids:
+            from mediacore.model.media import update_comment_counts
+            update_comment_counts(session, media_ids)
+
+    def changed_media_ids(self, session):
+        """Return the IDs of media whose comments changed in this flush."""
+        from mediacore.model import Comment
+        media_ids = set()
+        for obj in list(session.new) + list(session.deleted):
+            if isinstance(obj, Comment):
+                media_ids.add(obj.media_id)
+        for obj in session.dirty:
+            if not isinstance(obj, Comment):
+                continue
+            changed = False
+            for attr in self.attrs:
+                added, unchanged, deleted = \
+                    attributes.get_history(obj, attr, passive=True)
+                if added or deleted:
+                    changed = True
+                if attr == 'media_id':
+                    media_ids.update(deleted or ())
+                elif attr == 'media':
+                    media_ids.update([m.id for m in deleted or ()
+                                      if m is not None])
+            if changed:
+                media_ids.add(obj.media_id)
+        media_ids.discard(None)
+        return media_ids
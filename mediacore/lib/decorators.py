@@ -24,8 +24,10 @@ from pylons.templating import render_genshi as render
 from pylons.decorators import jsonify
 
 from mediacore.lib.paginate import paginate
+from mediacore.lib.profiler import timed_render
+from mediacore.lib.responsecache import response_cache
 
-__all__ = ['expose', 'expose_xhr', 'paginate', 'validate']
+__all__ = ['cache_response', 'expose', 'expose_xhr', 'paginate', 'validate']
 
 _func_attrs = [
     # Attributes that define useful information or context for functions
@@ -97,7 +99,7 @@ def _expose_wrapper(f, template):
         else:
             tmpl = template
         extra_vars.update(result)
-        return render(tmpl, extra_vars=extra_vars)
+        return timed_render(render, tmpl, extra_vars=extra_vars)
     return wrapped_f
 
 def expose(template='string'):
@@ -163,6 +165,35 @@ def expose_xhr(template_norm='', template_xhr='json'):
         return choose
     return wrap
 
+def cache_response(*tags):
+    """Cache the rendered output of a public controller action.
+
+    This decorator must be placed above :func:`expose`, so that the fully
+    rendered page is stored. See :class:`mediacore.lib.responsecache.ResponseCache`.
+
+    :Usage:
+
+    Example, caching a page until some media or comments are changed::
+
+        class MyController(BaseController):
+
+            @cache_response('media', 'comments')
+            @expose('media/list.html')
+            def sample_action(self, *args):
+                return dict(media=Media.query.published().all())
+
+    :param \*tags: The names of the cache tags the output depends on.
+        One of ``media``, ``categories``, ``podcasts`` or ``comments``.
+        Pages always depend on the ``settings`` tag.
+
+    """
+    def wrap(f):
+        def wrapped_f(*args, **kwargs):
+            return response_cache.get_or_render(tags, lambda: f(*args, **kwargs))
+        _copy_func_attrs(f, wrapped_f)
+        return wrapped_f
+    return wrap
+
 class validate(object):
     """Registers which validators ought to be applied to the following action
 
@@ -20,8 +20,14 @@ Email Helpers
 
     Clean this module up and use genshi text templates.
 
+Notifications are queued as ``email.send`` jobs with :func:`queue`, so
+that a slow or unavailable mail server doesn't hold up the request. See
+:mod:`mediacore.lib.jobs`.
+
 .. autofunc:: send
 
+.. autofunc:: queue
+
 .. autofunc:: send_media_notification
 
 .. autofunc:: send_comment_notification
@@ -33,6 +39,7 @@ Email Helpers
 import smtplib
 
 from mediacore.lib.helpers import line_break_xhtml, strip_xhtml, url_for, fetch_setting
+from mediacore.lib.jobs import enqueue
 
 def parse_email_string(string):
     """Take a comma separated string of emails and return a list."""
@@ -62,6 +69,12 @@ def send(to_addr, from_addr, subject, body):
     server.sendmail(from_addr, to_addr, msg.encode('utf-8'))
     server.quit()
 
+def queue(to_addr, from_addr, subject, body, key=None):
+    """Queue an email to be sent by :func:`send` in the background."""
+    if not isinstance(to_addr, basestring):
+        to_addr = ', '.join(to_addr)
+    enqueue('email.send', key=key, to_addr=to_addr, from_addr=from_addr,
+            subject=subject, body=body)
 
 def send_media_notification(media_obj):
     send_to = fetch_setting('email_media_uploaded')
@@ -70,7 +83,7 @@ def send_media_notification(media_obj):
         return
 
     edit_url = url_for(controller='/admin/media', action='edit',
-                       id=media_obj.id, qualified=True),
+                       id=media_obj.id, qualified=True)
 
     clean_description = strip_xhtml(
             line_break_xhtml(line_break_xhtml(media_obj.description)))
@@ -88,13 +101,23 @@ Description: %s
 """ % (media_obj.type, media_obj.title, media_obj.author.name,
        media_obj.author.email, edit_url, clean_description)
 
-    send(send_to, fetch_setting('email_send_from'), subject, body)
+    queue(send_to, fetch_setting('email_send_from'), subject, body,
+          key='email.media_uploaded:%d' % media_obj.id)
 
 def send_comment_notification(media, comment):
+    message = comment_notification(media, comment)
+    if message:
+        queue(**message)
+
+def comment_notification(media, comment):
+    """Return the :func:`send` arguments to notify admins of a comment.
+
+    :returns: A dict, or ``None`` if comment notifications are disabled.
+    """
     send_to = fetch_setting('email_comment_posted')
     if not send_to:
         # Comment notification emails are disabled!
-        return
+        return None
 
     subject = 'New Comment: %s' % comment.subject
     body = """A new comment has been posted!
@@ -107,7 +130,8 @@ Body: %s
     url_for(controller='/media', action='view', slug=media.slug, qualified=True),
     strip_xhtml(line_break_xhtml(line_break_xhtml(comment.body))))
 
-    send(send_to, fetch_setting('email_send_from'), subject, body)
+    return dict(to_addr=send_to, from_addr=fetch_setting('email_send_from'),
+                subject=subject, body=body)
 
 def send_support_request(email, url, description, get_vars, post_vars):
     send_to = fetch_setting('email_support_requests')
@@ -137,4 +161,4 @@ POST_VARS:
     "\n\n  ".join([x + " :  " + post_vars[x] for x in post_vars])
     )
 
-    send(send_to, fetch_setting('email_send_from'), subject, body)
+    queue(send_to, fetch_setting('email_send_from'), subject, body)
@@ -0,0 +1,210 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Description Excerpts
+
+Listings show the start of each item's description. Cutting it on every
+render meant stripping and reparsing the XHTML with BeautifulSoup, once
+per item on the page.
+
+Instead, when the description of a media item or podcast is saved,
+:func:`make_excerpts` cuts it at each of the lengths the templates use,
+and the results are stored as JSON in the ``description_excerpts``
+column. :func:`get_excerpt` reads them back, and :func:`decoded_excerpts` keeps
+them decoded on the instance for the rest of the request. Other lengths, and rows
+saved before the column existed, are cut on the fly by
+:func:`truncate_plain` or :func:`truncate_xhtml`, neither of which parses
+the markup.
+
+After changing the lengths below, store the new excerpts with::
+
+    paster --plugin=MediaCore rebuild-excerpts deployment.ini
+
+"""
+import re
+
+import simplejson
+from webhelpers import text
+
+__all__ = ['decoded_excerpts', 'get_excerpt', 'make_excerpts', 'plain_lengths',
+           'truncate_plain', 'truncate_xhtml', 'xhtml_lengths']
+
+# The lengths used by the templates, which are stored for every description
+plain_lengths = (60, 90, 120, 135, 155, 249)
+xhtml_lengths = (300,)
+
+_tag = re.compile(r'<(/?)([a-zA-Z][a-zA-Z0-9]*)[^>]*?(/?)>'
+                  r'|<!--.*?-->|<!\[CDATA\[.*?\]\]>', re.S)
+_text_piece = re.compile(r'\s+|&#?\w+;|[^&\s]+|&', re.U)
+_void_tags = dict.fromkeys('br hr img input meta link area base col param'.split())
+_block_tags = dict.fromkeys('p br pre blockquote div h1 h2 h3 h4 h5 h6 hr '
+                            'ul ol li form table tr td tbody thead'.split())
+
+def truncate_plain(string, size):
+    """Truncate plain text to roughly a given size (full words).
+
+    This is :func:`mediacore.lib.helpers.truncate`.
+    """
+    return text.truncate(string, size, whole_word=True)
+
+def truncate_xhtml(string, size, indicator=u'...'):
+    """Truncate XHTML to roughly a given size (full words), closing any
+    tags that are left open.
+
+    Only the text is counted, with each entity counting as one character
+    and a break between block elements as one space, and it's cut the way
+    :func:`truncate_plain` cuts plain text: at the end of the last word
+    that fits, with the indicator added inside the innermost element.
+
+    The markup is tokenized with a regex rather than parsed, so it should
+    be well formed, like the output of
+    :func:`mediacore.lib.helpers.clean_xhtml`. Close tags that don't match
+    an open tag are dropped.
+
+    :param string: XHTML
+    :type string: unicode
+    :param size: Max length
+    :param indicator: Appended where the text is cut
+    :rtype: unicode
+    """
+    if not string or len(string) <= size:
+        # There can't be more text than characters
+        return string or u''
+    short = size - len(indicator)
+    out = []
+    stack = []
+    count = 0           # Characters of text so far
+    in_word = False
+    separate = False    # A block boundary since the last text
+    word_end = None     # The last place a word ended within short
+    hard_cut = None     # Where short characters of text end
+
+    pos = 0
+    length = len(string)
+    while pos < length and count <= size:
+        match = _tag.search(string, pos)
+        if match is None:
+            data_end = length
+        else:
+            data_end = match.start()
+
+        for piece in _text_piece.finditer(string, pos, data_end):
+            piece = piece.group()
+            if separate:
+                separate = False
+                count += 1
+            if piece[0].isspace():
+                if in_word and 1 < count <= short:
+                    word_end = (len(out), tuple(stack))
+                in_word = False
+                piece_len = len(piece)
+            elif piece[0] == u'&' and len(piece) > 1:
+                in_word = True
+                piece_len = 1
+            else:
+                in_word = True
+                piece_len = len(piece)
+            if hard_cut is None and count + piece_len >= short:
+                part = piece[:short - count]
+                if piece_len == 1 and count < short:
+                    part = piece
+                hard_cut = (len(out), tuple(stack), part)
+            out.append(piece)
+            count += piece_len
+            if count > size:
+                break
+
+        if match is None or count > size:
+            break
+        pos = match.end()
+        closing, name, self_closing = match.groups()
+        if name is None:
+            out.append(match.group())
+            continue
+        name = name.lower()
+        if name in _block_tags:
+            if in_word and 1 < count <= short:
+                word_end = (len(out), tuple(stack))
+            in_word = False
+            separate = count > 0
+        if closing:
+            if name in stack:
+                while stack.pop() != name:
+                    pass
+                out.append(match.group())
+        else:
+            out.append(match.group())
+            if not self_closing and name not in _void_tags:
+                stack.append(name)
+
+    if count <= size:
+        return string
+    if word_end is not None:
+        index, open_tags = word_end
+        kept = out[:index]
+    else:
+        index, open_tags, part = hard_cut
+        kept = out[:index]
+        kept.append(part)
+    kept.append(indicator)
+    for name in reversed(open_tags):
+        kept.append(u'</%s>' % name)
+    return u''.join(kept)
+
+def make_excerpts(xhtml, plain):
+    """Return the excerpts of a description to store, as JSON.
+
+    :param xhtml: The description, as XHTML
+    :param plain: The plain text version of the description
+    :rtype: unicode or None
+    """
+    if not xhtml:
+        return None
+    excerpts = {
+        'plain': dict([(str(size), truncate_plain(plain or u'', size))
+                       for size in plain_lengths]),
+        'xhtml': dict([(str(size), truncate_xhtml(xhtml, size))
+                       for size in xhtml_lengths]),
+    }
+    return unicode(simplejson.dumps(excerpts))
+
+def get_excerpt(stored, size, xhtml=False):
+    """Return a stored excerpt, or None if it wasn't stored.
+
+    :param stored: The JSON returned by :func:`make_excerpts`, or the
+        dict it decodes to, as returned by :func:`decoded_excerpts`
+    :param size: Max length
+    :param xhtml: Get the XHTML excerpt instead of the plain text
+    :rtype: unicode or None
+    """
+    if not stored:
+        return None
+    if isinstance(stored, basestring):
+        stored = simplejson.loads(stored)
+    return stored[xhtml and 'xhtml' or 'plain'].get(str(size), None)
+
+def decoded_excerpts(obj):
+    """Return the decoded ``_description_excerpts`` of a media item or
+    podcast, decoding the JSON only once per instance.
+
+    The decoded dict is kept on the instance along with the JSON it came
+    from, so it's decoded again if the description changes.
+    """
+    stored = obj._description_excerpts
+    cached = getattr(obj, '_decoded_excerpts', None)
+    if cached is None or cached[0] is not stored:
+        decoded = stored and simplejson.loads(stored) or None
+        cached = obj._decoded_excerpts = (stored, decoded)
+    return cached[1]
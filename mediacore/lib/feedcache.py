@@ -0,0 +1,183 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Podcast Feed Cache
+
+Podcast clients poll their feeds far more often than the feeds change.
+:class:`FeedCache` keeps each rendered RSS document on disk, alongside a
+gzipped copy, so that most polls are answered by
+:class:`mediacore.lib.fileserve.MediaFileApp` as a static file, usually
+with a ``304 Not Modified``.
+
+A stored feed is rebuilt on the next poll after one of its podcast, media
+or settings rows is saved (see :mod:`mediacore.lib.responsecache`), or
+after a scheduled episode's ``publish_on`` or ``publish_until`` date
+passes. The files are only replaced if the new document differs, so the
+``ETag`` (a hash of the document) and ``Last-Modified`` date of a feed
+stay the same until its content really changes.
+
+"""
+import gzip
+import hashlib
+import os
+import time
+from cStringIO import StringIO
+from datetime import datetime
+
+from pylons import config, request
+
+from mediacore.lib.responsecache import next_publish_boundary, response_cache
+from mediacore.lib.storage import write_atomic
+
+__all__ = ['FeedCache', 'StoredFeed', 'accepts_gzip', 'feed_cache']
+
+class StoredFeed(object):
+    """The files and entity tag of a rendered feed.
+
+    :param path: The RSS document.
+    :param gzip_path: A gzipped copy of the RSS document.
+    :param digest: A hex digest of the RSS document.
+
+    """
+    def __init__(self, path, gzip_path, digest):
+        self.path = path
+        self.gzip_path = gzip_path
+        self.digest = digest
+
+    @property
+    def etag(self):
+        return '"%s"' % self.digest
+
+    @property
+    def gzip_etag(self):
+        return '"%s-gz"' % self.digest
+
+
+class FeedCache(object):
+    """Render podcast feeds only when they may have changed.
+
+    :param feed_dir: Where to store the feeds. Defaults to ``feeds`` in
+        the ``cache_dir`` config directory.
+    :param tag_versions: A :class:`mediacore.lib.responsecache.TagVersions`
+        instance. Defaults to the one used by the response cache.
+    :param max_age: Rebuild stored feeds at least this often, in seconds,
+        in case they were changed by something other than MediaCore.
+
+    """
+    #: The response cache tags which feeds depend on.
+    tags = ('settings', 'podcasts', 'media')
+
+    def __init__(self, feed_dir=None, tag_versions=None, max_age=3600):
+        self._feed_dir = feed_dir
+        self.tag_versions = tag_versions or response_cache.tag_versions
+        self.max_age = max_age
+
+    @property
+    def feed_dir(self):
+        if self._feed_dir is None:
+            self._feed_dir = os.path.join(config['cache_dir'], 'feeds')
+        return self._feed_dir
+
+    def get(self, podcast, render):
+        """Return the current :class:`StoredFeed` for the given podcast.
+
+        Feeds contain fully qualified URLs, so a separate copy is kept for
+        each host name the site is accessed by.
+
+        :param podcast: A :class:`~mediacore.model.podcasts.Podcast`.
+        :param render: A callable which returns the RSS document. It is
+            only called if the stored copy may be out of date.
+        :rtype: :class:`StoredFeed`
+
+        """
+        site = hashlib.md5(request.host_url + request.script_name)
+        base = os.path.join(self.feed_dir,
+                            '%d-%s' % (podcast.id, site.hexdigest()[:8]))
+        path, gzip_path, meta_path = base + '.xml', base + '.xml.gz', base + '.meta'
+
+        now = time.time()
+        versions = '|'.join([self.tag_versions.get(tag) for tag in self.tags])
+        meta = self._read_meta(meta_path)
+        if meta is not None:
+            valid_until, digest, stored_versions = meta
+            if valid_until > now and stored_versions == versions \
+            and os.path.exists(path) and os.path.exists(gzip_path):
+                return StoredFeed(path, gzip_path, digest)
+
+        if not os.path.isdir(self.feed_dir):
+            try:
+                os.makedirs(self.feed_dir)
+            except OSError:
+                if not os.path.isdir(self.feed_dir):
+                    raise
+
+        document = render()
+        if isinstance(document, unicode):
+            document = document.encode('utf-8')
+        digest = hashlib.md5(document).hexdigest()
+
+        if meta is None or meta[1] != digest \
+        or not os.path.exists(path) or not os.path.exists(gzip_path):
+            self._write(path, document)
+            self._write(gzip_path, document, compress=True)
+
+        valid_until = now + self.max_age
+        boundary = next_publish_boundary(datetime.now(), podcast.id)
+        if boundary is not None:
+            valid_until = min(valid_until, time.mktime(boundary.timetuple()))
+        self._write(meta_path, '%f\n%s\n%s' % (valid_until, digest, versions))
+
+        return StoredFeed(path, gzip_path, digest)
+
+    def _read_meta(self, meta_path):
+        try:
+            meta_file = open(meta_path)
+            try:
+                valid_until, digest, versions = meta_file.read().split('\n', 2)
+            finally:
+                meta_file.close()
+            return float(valid_until), digest, versions
+        except (IOError, ValueError):
+            return None
+
+    def _write(self, path, data, compress=False):
+        """Atomically replace the file at ``path`` with the given data."""
+        if compress:
+            buf = StringIO()
+            gzip_file = gzip.GzipFile(os.path.basename(path), 'wb', 9, buf)
+            gzip_file.write(data)
+            gzip_file.close()
+            data = buf.getvalue()
+        write_atomic(path, data)
+
+
+def accepts_gzip(environ):
+    """Return True if the client will accept a gzip encoded response."""
+    for coding in environ.get('HTTP_ACCEPT_ENCODING', '').split(','):
+        params = coding.strip().split(';')
+        if params[0].strip().lower() not in ('gzip', 'x-gzip', '*'):
+            continue
+        for param in params[1:]:
+            name, _, value = param.partition('=')
+            if name.strip() == 'q':
+                try:
+                    return float(value) > 0
+                except ValueError:
+                    return False
+        return True
+    return False
+
+
+feed_cache = FeedCache()
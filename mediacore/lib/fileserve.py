@@ -0,0 +1,374 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+File Delivery
+
+A small WSGI application for streaming media files from disk without
+ever holding the whole file in memory. It understands conditional
+requests (``If-None-Match``, ``If-Modified-Since``), byte ranges
+(``Range`` and ``If-Range``, including multipart/byteranges) and ``HEAD``.
+
+When the server offers ``wsgi.file_wrapper`` (mod_wsgi, for example) it
+is used for complete responses so that the server may use ``sendfile``.
+
+Alternatively, :class:`OffloadFileApp` hands delivery off to the front-end
+web server entirely with an ``X-Sendfile`` (Apache mod_xsendfile, lighttpd)
+or ``X-Accel-Redirect`` (nginx) header, freeing the Python worker as soon
+as the file has been looked up. See the ``file_serve_method`` ini option.
+
+Typical usage from a controller action::
+
+    from pylons.controllers.util import forward
+    app = MediaFileApp(path, 'video/mp4', media_file.modified_on)
+    return forward(app)
+
+"""
+import os
+import random
+import re
+import rfc822
+import time
+from urllib import quote
+
+__all__ = ['MediaFileApp', 'OffloadFileApp', 'accel_redirect_uri',
+           'parse_range_header']
+
+# Read this many bytes at a time when streaming the file ourselves.
+CHUNK_SIZE = 64 * 1024
+
+_range_spec = re.compile(r'^\s*(\d*)\s*-\s*(\d*)\s*$')
+
+def parse_range_header(header, size):
+    """Parse a ``Range`` header value into a list of byte ranges.
+
+    Ranges which cannot be satisfied are dropped. Overlapping or
+    adjacent ranges are left as they are; clients rarely send them and
+    the spec allows us to serve them as given.
+
+    :param header: The raw ``Range`` header, ie. ``bytes=0-499``
+    :type header: str
+    :param size: The total length of the file in bytes
+    :type size: int
+    :returns: A list of ``(first, last)`` byte positions, inclusive.
+        ``None`` is returned if the header is malformed and should be
+        ignored, an empty list if it is valid but cannot be satisfied.
+    :rtype: list or ``None``
+
+    """
+    if not header:
+        return None
+    try:
+        unit, specs = header.split('=', 1)
+    except ValueError:
+        return None
+    if unit.strip().lower() != 'bytes':
+        return None
+
+    ranges = []
+    for spec in specs.split(','):
+        if not spec.strip():
+            continue
+        match = _range_spec.match(spec)
+        if not match:
+            return None
+        first, last = match.groups()
+        if not first and not last:
+            return None
+        if not first:
+            # Suffix range: the final N bytes of the file
+            length = int(last)
+            if length == 0:
+                continue
+            first, last = max(size - length, 0), size - 1
+        else:
+            first = int(first)
+            if last:
+                last = int(last)
+                if last < first:
+                    # Syntactically invalid, so the whole header is ignored
+                    return None
+                last = min(last, size - 1)
+            else:
+                last = size - 1
+        if first >= size:
+            continue
+        ranges.append((first, last))
+    return ranges
+
+def http_date(timestamp):
+    """Format a unix timestamp as an RFC 1123 date for HTTP headers."""
+    return rfc822.formatdate(timestamp)
+
+def parse_http_date(value):
+    """Return a unix timestamp for the given HTTP date, or ``None``."""
+    if not value:
+        return None
+    # Some old clients append '; length=1234' to If-Modified-Since
+    value = value.split(';', 1)[0]
+    parsed = rfc822.parsedate_tz(value)
+    if parsed is None:
+        return None
+    try:
+        return rfc822.mktime_tz(parsed)
+    except (OverflowError, ValueError):
+        return None
+
+def _iter_file(file, first, length, chunk_size=CHUNK_SIZE):
+    """Yield ``length`` bytes of the open ``file`` starting at ``first``."""
+    try:
+        file.seek(first)
+        while length > 0:
+            data = file.read(min(chunk_size, length))
+            if not data:
+                break
+            length -= len(data)
+            yield data
+    finally:
+        file.close()
+
+def _iter_multipart(path, ranges, size, content_type, boundary,
+                    chunk_size=CHUNK_SIZE):
+    """Yield a multipart/byteranges body for the given ranges."""
+    for first, last in ranges:
+        yield '--%s\r\nContent-Type: %s\r\nContent-Range: bytes %d-%d/%d\r\n\r\n' \
+            % (boundary, content_type, first, last, size)
+        for chunk in _iter_file(open(path, 'rb'), first, last - first + 1,
+                                chunk_size):
+            yield chunk
+        yield '\r\n'
+    yield '--%s--\r\n' % boundary
+
+def _multipart_length(ranges, size, content_type, boundary):
+    """Calculate the exact Content-Length of a multipart/byteranges body."""
+    length = 0
+    for first, last in ranges:
+        length += len('--%s\r\nContent-Type: %s\r\nContent-Range: bytes %d-%d/%d\r\n\r\n'
+                      % (boundary, content_type, first, last, size))
+        length += last - first + 1 + 2
+    length += len('--%s--\r\n' % boundary)
+    return length
+
+
+class MediaFileApp(object):
+    """Serve a single file from disk with range and conditional GET support.
+
+    :param path: Absolute path to the file on disk
+    :param content_type: The mimetype to serve the file as
+    :param last_modified: When the file content was last changed. This is
+        combined with the file size to generate the ``ETag``. Defaults to
+        the modification time of the file on disk.
+    :type last_modified: :class:`datetime.datetime` or ``None``
+    :param headers: Extra headers to include in every successful or
+        not modified response, ie. ``Content-Disposition`` or ``Vary``.
+    :type headers: list of 2-tuples
+    :param chunk_size: How many bytes to read at a time.
+    :param etag: A quoted entity tag to use instead of the one generated
+        from the modification time and size, ie. a hash of the content.
+
+    """
+    def __init__(self, path, content_type, last_modified=None,
+                 headers=None, chunk_size=CHUNK_SIZE, etag=None):
+        self.path = path
+        self.content_type = content_type
+        self.last_modified = last_modified
+        self.headers = headers or []
+        self.chunk_size = chunk_size
+        self.etag = etag
+
+    def __call__(self, environ, start_response):
+        method = environ.get('REQUEST_METHOD', 'GET').upper()
+        if method not in ('GET', 'HEAD'):
+            start_response('405 Method Not Allowed',
+                           [('Allow', 'GET, HEAD'), ('Content-Length', '0')])
+            return []
+
+        try:
+            stat = os.stat(self.path)
+            file = open(self.path, 'rb')
+        except (IOError, OSError):
+            start_response('404 Not Found', [('Content-Length', '0')])
+            return []
+
+        size = stat.st_size
+        if self.last_modified is not None:
+            mtime = int(time.mktime(self.last_modified.timetuple()))
+        else:
+            mtime = int(stat.st_mtime)
+        etag = self.etag or '"%x-%x"' % (mtime, size)
+
+        headers = [
+            ('ETag', etag),
+            ('Last-Modified', http_date(mtime)),
+            ('Accept-Ranges', 'bytes'),
+        ]
+        headers.extend(self.headers)
+
+        if self._not_modified(environ, etag, mtime):
+            file.close()
+            start_response('304 Not Modified', headers)
+            return []
+
+        ranges = None
+        if self._if_range_matches(environ, etag, mtime):
+            ranges = parse_range_header(environ.get('HTTP_RANGE'), size)
+
+        if ranges is not None and not ranges:
+            file.close()
+            start_response('416 Requested Range Not Satisfiable', [
+                ('Content-Range', 'bytes */%d' % size),
+                ('Content-Length', '0'),
+            ])
+            return []
+
+        head = method == 'HEAD'
+
+        if not ranges:
+            # Serve the complete file
+            headers.append(('Content-Type', self.content_type))
+            headers.append(('Content-Length', str(size)))
+            start_response('200 OK', headers)
+            if head:
+                file.close()
+                return []
+            file_wrapper = environ.get('wsgi.file_wrapper', None)
+            if file_wrapper is not None:
+                return file_wrapper(file, self.chunk_size)
+            return _iter_file(file, 0, size, self.chunk_size)
+
+        if len(ranges) == 1:
+            first, last = ranges[0]
+            length = last - first + 1
+            headers.append(('Content-Type', self.content_type))
+            headers.append(('Content-Range', 'bytes %d-%d/%d' % (first, last, size)))
+            headers.append(('Content-Length', str(length)))
+            start_response('206 Partial Content', headers)
+            if head:
+                file.close()
+                return []
+            return _iter_file(file, first, length, self.chunk_size)
+
+        # Multiple ranges: reply with a multipart/byteranges document
+        file.close()
+        boundary = '%x%x' % (int(time.time()), random.getrandbits(48))
+        headers.append(('Content-Type',
+                        'multipart/byteranges; boundary=%s' % boundary))
+        headers.append(('Content-Length', str(_multipart_length(
+            ranges, size, self.content_type, boundary))))
+        start_response('206 Partial Content', headers)
+        if head:
+            return []
+        return _iter_multipart(self.path, ranges, size, self.content_type,
+                               boundary, self.chunk_size)
+
+    def _not_modified(self, environ, etag, mtime):
+        """Return True if the client's cached copy is still valid."""
+        if_none_match = environ.get('HTTP_IF_NONE_MATCH')
+        if if_none_match:
+            tags = [t.strip() for t in if_none_match.split(',')]
+            return '*' in tags or etag in tags
+        since = parse_http_date(environ.get('HTTP_IF_MODIFIED_SINCE'))
+        return since is not None and mtime <= since
+
+    def _if_range_matches(self, environ, etag, mtime):
+        """Return True unless an ``If-Range`` precondition has failed.
+
+        ``If-Range`` may be either an entity tag or an HTTP date. If the
+        file has changed, the range must be ignored and the whole file sent.
+        """
+        if_range = environ.get('HTTP_IF_RANGE')
+        if not if_range:
+            return True
+        if_range = if_range.strip()
+        if if_range.startswith('"') or if_range.startswith('W/'):
+            return if_range == etag
+        since = parse_http_date(if_range)
+        return since is not None and mtime <= since
+
+
+def accel_redirect_uri(path, root_dir, location):
+    """Map a file path to a URI within an nginx ``internal`` location.
+
+    The location is expected to be an alias for ``root_dir``::
+
+        location /__mediacore_files/ {
+            internal;
+            alias /path/to/mediacore_install/data/media/;
+        }
+
+    >>> accel_redirect_uri('/srv/media/1_2_my file.mp4', '/srv/media', '/__mediacore_files')
+    '/__mediacore_files/1_2_my%20file.mp4'
+
+    :param path: Absolute path to the file on disk
+    :param root_dir: The directory which ``location`` is an alias for
+    :param location: The nginx location URI
+    :rtype: str
+    :raises ValueError: If ``path`` is not inside ``root_dir``.
+
+    """
+    root_dir = os.path.join(os.path.abspath(root_dir), '')
+    path = os.path.abspath(path)
+    if not path.startswith(root_dir):
+        raise ValueError('%s is not within %s' % (path, root_dir))
+    rel_path = path[len(root_dir):].replace(os.sep, '/')
+    return '%s/%s' % (location.rstrip('/'), quote(rel_path))
+
+
+class OffloadFileApp(object):
+    """Delegate the delivery of a file to the front-end web server.
+
+    Instead of a body, the response carries a header telling the server
+    which file to send. The server is then responsible for ranges,
+    conditional requests and so on.
+
+    :param path: Absolute path to the file on disk
+    :param content_type: The mimetype to serve the file as
+    :param method: ``x-sendfile`` or ``x-accel-redirect``
+    :param root_dir: Required for ``x-accel-redirect``. The directory
+        the nginx location is an alias for, ie. ``media_dir``.
+    :param location: Required for ``x-accel-redirect``. The URI of the
+        nginx internal location.
+    :param headers: Extra headers to include in the response,
+        ie. ``Content-Disposition``.
+    :type headers: list of 2-tuples
+    :raises ValueError: If the method is unknown or is missing its options.
+
+    """
+    def __init__(self, path, content_type, method='x-sendfile',
+                 root_dir=None, location=None, headers=None):
+        if method == 'x-accel-redirect':
+            if not root_dir or not location:
+                raise ValueError('x-accel-redirect requires both a root_dir '
+                                 'and an nginx location.')
+            self.header = ('X-Accel-Redirect',
+                           accel_redirect_uri(path, root_dir, location))
+        elif method == 'x-sendfile':
+            self.header = ('X-Sendfile', os.path.abspath(path))
+        else:
+            raise ValueError('Unknown file serve method: %r' % method)
+        self.path = path
+        self.content_type = content_type
+        self.method = method
+        self.headers = headers or []
+
+    def __call__(self, environ, start_response):
+        method = environ.get('REQUEST_METHOD', 'GET').upper()
+        if method not in ('GET', 'HEAD'):
+            start_response('405 Method Not Allowed',
+                           [('Allow', 'GET, HEAD'), ('Content-Length', '0')])
+            return []
+        headers = [('Content-Type', self.content_type), self.header]
+        headers.extend(self.headers)
+        start_response('200 OK', headers)
+        return []
@@ -20,8 +20,9 @@ from pylons import config, request
 __all__ = [
     'accepted_extensions',
     'external_embedded_containers',
-    'guess_container_format'
+    'guess_container_format',
     'guess_media_type',
+    'is_playable',
     'mimetype_lookup',
     'playable_containers',
 ]
@@ -103,6 +104,19 @@ playable_containers = {
     None: (),
 }
 
+# The codecs that Flash can play. Files which have been probed (see
+# mediacore.lib.probe) must only use these to be considered 'encoded'.
+# Files whose codecs are unknown are judged by their container alone.
+flash_supported_codecs = ('h264', 'h264b', 'vp6', 'vp6a', 'h263', 'mp3',
+                          'aac', 'aacl', 'flac', 'nellymoser', 'speex')
+
+# Codecs that are a subset of another, so that support for all profiles
+# of h264, for example, implies support for the baseline profile.
+codec_families = {
+    'h264b': 'h264',
+    'aacl': 'aac',
+}
+
 # The list of file extensions that flash should recognize and be able to play.
 # XXX: not all files with extensions matched here will be considered playable,
 #      as the associated media files may not be considered 'encoded' as per the
@@ -116,10 +130,10 @@ flash_supported_containers = ('mp3', 'mp4', 'm4v', 'm4a', 'flv', 'f4v', 'f4p', '
 # h264b = h264 baseline profile
 # aac = aac all profiles
 # aacl = aac low complexity profile
-# FIXME: While included for future usefuleness, the codecs in the list below
-#        are ignored by the actual logic in pick_media_file_player() below.
-#        If the media file in question has a container type that /might/ hold
-#        a supported codec for the platform, we assume it will work.
+# The codecs are checked by pick_media_file_player() below once a file has
+# been probed. Until then, if the media file in question has a container
+# type that /might/ hold a supported codec for the platform, we assume it
+# will work.
 # XXX: not all container types here will be be considered playable by the
 #      system, as the associated media files will not be marked 'encoded' as
 #      per the playable_containers dict.
@@ -190,8 +204,6 @@ def supported_html5_types():
     """Return the user agent's supported HTML5 video containers and codecs.
     """
     browser, version = parse_user_agent_version()
-    print "browser: "+browser
-    print "version: "+version
     scc = html5_supported_containers_codecs[browser]
     html5_options = []
 
@@ -207,8 +219,9 @@ def guess_container_format(extension):
     :type extension: string
     :rtype: string or None
     """
-    try:
+    if not mimetypes.inited:
         mimetypes.init()
+    try:
         mt = mimetypes.types_map["."+extension]
         cf = container_lookup[mt]
         return cf
@@ -224,16 +237,37 @@ def guess_media_type(container):
         return 'captions'
     return 'video'
 
+def codecs_supported(file, supported):
+    """Return True if the file's probed codecs are all in ``supported``.
+
+    Files that haven't been probed, or whose codecs couldn't be read, are
+    assumed to be supported.
+
+    :param file: A :class:`~mediacore.model.media.MediaFile`.
+    :param supported: A list of codec names.
+    """
+    for codec in (file.video_codec, file.audio_codec):
+        if codec and codec not in supported \
+                and codec_families.get(codec) not in supported:
+            return False
+    return True
+
+def is_playable(file, media_type):
+    """Return True if the file can be played in our Flash players.
+
+    :param file: A :class:`~mediacore.model.media.MediaFile`.
+    :param media_type: The type of the media it belongs to.
+    """
+    return file.container in playable_containers[media_type] \
+        and codecs_supported(file, flash_supported_codecs)
+
 def pick_media_file_player(files):
     """Return the best choice of files to play and which player to use.
 
-    XXX: This method uses the very unsophisticated technique of assuming
-         that if the client is capable of playing the container format, then
-         the client should be able to play the tracks within the container,
-         regardless of the codecs actually used. As such, admins would be
-         well advised to use the lowest-common-denominator for their targeted
-         clients when using files for consumption in an HTML5 player, and
-         to use the standard codecs when encoding for Flash player use.
+    The codecs of each file are checked against what the client supports
+    once the file has been probed (see :mod:`mediacore.lib.probe`). Until
+    then, it's assumed that if the client can play the container format,
+    it can play the tracks within it, regardless of the codecs used.
 
     :param files: :class:`~mediacore.model.media.MediaFile` instances.
     :type files: list
@@ -253,17 +287,18 @@ def pick_media_file_player(files):
             return file, 'embed'
 
     # If possible, return an applicable file and html5 player
-    # Note that this is currently based only on the container type
     if player_type in ['best', 'html5']:
         for container, codecs in supported_html5_types():
             for file in files:
-                if file.container == container:
+                if file.container == container \
+                        and codecs_supported(file, codecs):
                     return file, fetch_setting('html5_player')
 
     # If possible, return an applicable file and flash player
     if player_type in ['best', 'flash']:
         for file in files:
-            if file.container in flash_supported_containers:
+            if file.container in flash_supported_containers \
+                    and codecs_supported(file, flash_supported_codecs):
                 return file, fetch_setting('flash_player')
 
     # No acceptable file/player combination could be found.
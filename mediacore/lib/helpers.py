@@ -24,7 +24,6 @@ import os
 import re
 import shutil
 import time
-from PIL import Image
 from copy import copy
 from datetime import datetime
 from urllib import quote, unquote
@@ -45,12 +44,24 @@ from webob.exc import HTTPNotFound
 
 from mediacore.lib.htmlsanitizer import Cleaner, entities_to_unicode as decode_entities, encode_xhtml_entities as encode_entities
 from mediacore.lib.filetypes import accepted_extensions, pick_media_file_player
+from mediacore.lib.profiler import count_url_for
+from mediacore.lib import excerpts
+from mediacore.lib.sanitizer import Sanitizer
+from mediacore.lib.thumbnails import resize_thumb, thumb_manifest
+
+# URLs already generated by url_for, see _url_cache_key
+_url_cache = {}
+_url_cache_max = 10000
+_url_cache_types = (basestring, int, long, float, bool, type(None))
 
 def url_for(*args, **kwargs):
     """Compose a URL using the route mappings in :mod:`mediacore.config.routes`.
 
     This is a wrapper for :func:`pylons.url`, all arguments are passed.
 
+    Generated URLs are cached, since a listing can easily link to hundreds
+    of them. See :func:`_url_cache_key` for what they depend on.
+
     Using the REPLACE and REPLACE_WITH GET variables, if set,
     this method replaces the first instance of REPLACE in the
     url string. This can be used to proxy an action at a different
@@ -65,6 +76,71 @@ def url_for(*args, **kwargs):
         RewriteRule ^/proxy_url(/.\*){0,1}$ /mycont/actionA$1 [proxy]
 
     """
+    count_url_for()
+    environ = request.environ
+    key = _url_cache_key(args, kwargs, environ)
+    if key is None:
+        url = _generate_url(args, kwargs)
+    else:
+        url = _url_cache.get(key, None)
+        if url is None:
+            url = _generate_url(args, kwargs)
+            if len(_url_cache) >= _url_cache_max:
+                _url_cache.clear()
+            _url_cache[key] = url
+
+    # Make the URL string replacements based on GET vars.
+    if '_REP' in environ.get('QUERY_STRING', ''):
+        repl = request.str_GET.getall('_REP')
+        repl_with = request.str_GET.getall('_RWITH')
+        for i in range(0, min(len(repl), len(repl_with))):
+            url = url.replace(repl[i], repl_with[i], 1)
+
+    return url
+
+def _url_cache_key(args, kwargs, environ):
+    """Return a key for the URL that :func:`url_for` generates for the
+    given arguments in the current request, or None if it can't be cached.
+
+    Named routes and static paths, such as ``'/images/'``, only depend on
+    the SCRIPT_NAME and proxy prefix. Anything else may be filled in from
+    the current route, as :meth:`pylons.url.current` does, so the current
+    route's arguments are part of the key too. Qualified URLs also depend
+    on the host and scheme.
+    """
+    for value in args:
+        if not isinstance(value, _url_cache_types):
+            return None
+    if args and not isinstance(args[0], basestring):
+        # Only a route name or path can come first; let url_for complain
+        return None
+    for value in kwargs.itervalues():
+        if not isinstance(value, _url_cache_types):
+            return None
+
+    context = (environ.get('SCRIPT_NAME', ''), config.get('proxy_prefix', None))
+    if kwargs.get('qualified', False):
+        context += (environ.get('HTTP_HOST', None),
+                    environ.get('SERVER_NAME', None),
+                    environ.get('SERVER_PORT', None),
+                    environ.get('wsgi.url_scheme', None))
+
+    if not args or not (args[0] in config['routes.map']._routenames
+                        or args[0][:1] == '/' or urlparse(args[0])[0]):
+        routes_dict = environ.get('pylons.routes_dict', None) or {}
+        for value in routes_dict.itervalues():
+            if not isinstance(value, _url_cache_types):
+                return None
+        context += tuple(sorted(routes_dict.iteritems()))
+
+    if kwargs:
+        kwargs = tuple(sorted(kwargs.iteritems()))
+    else:
+        kwargs = ()
+    return (args, kwargs, context)
+
+def _generate_url(args, kwargs):
+    """Generate a URL for :func:`url_for`, without using the cache."""
     # Convert unicode to str utf-8 for routes
     def to_utf8(value):
         if isinstance(value, unicode):
@@ -76,11 +152,6 @@ def url_for(*args, **kwargs):
     if kwargs:
         kwargs = dict( (key, to_utf8(val)) for key, val in kwargs.items() )
 
-    print "args:"
-    print args
-    print "kwargs:"
-    print kwargs
-
     # TODO: Rework templates so that we can avoid using .current, and use named
     # routes, as described at http://routes.groovie.org/manual.html#generating-routes-based-on-the-current-url
     # NOTE: pylons.url is a StackedObjectProxy wrapping the routes.url method.
@@ -112,12 +183,6 @@ def url_for(*args, **kwargs):
             path_index = url.index('/', offset)
             url = url[:path_index] + prefix + url[path_index:]
 
-    # Make the URL string replacements based on GET vars.
-    repl = request.str_GET.getall('_REP')
-    repl_with = request.str_GET.getall('_RWITH')
-    for i in range(0, min(len(repl), len(repl_with))):
-        url = url.replace(repl[i], repl_with[i], 1)
-
     return url
 
 def redirect(*args, **kwargs):
@@ -205,12 +270,19 @@ cleaner_settings = dict(
     elem_map = elem_map,
     filters = cleaner_filters
 )
+# Gives the same results as the Cleaner with the above settings, faster
+_sanitizer = Sanitizer(valid_tags, valid_attrs, elem_map)
 
 def clean_xhtml(string, p_wrap=True, _cleaner_settings=None):
     """Convert the given plain text or HTML into valid XHTML.
 
     If there is no markup in the string, apply paragraph formatting.
 
+    The default settings are handled by :class:`mediacore.lib.sanitizer.Sanitizer`,
+    which caches its results. Passing ``_cleaner_settings``, even the
+    default :data:`cleaner_settings`, runs the slower
+    :class:`mediacore.lib.htmlsanitizer.Cleaner` instead.
+
     :param p_wrap: Wrap the output in <p></p> tags?
     :param _cleaner_settings: Constructor kwargs for
         :class:`mediacore.lib.htmlsanitizer.Cleaner`
@@ -223,7 +295,7 @@ def clean_xhtml(string, p_wrap=True, _cleaner_settings=None):
         return u""
 
     if _cleaner_settings is None:
-        _cleaner_settings = cleaner_settings
+        return _sanitizer.clean(string, p_wrap)
 
     # remove carriage return chars; FIXME: is this necessary?
     string = string.replace(u"\r", u"")
@@ -264,6 +336,10 @@ def clean_xhtml(string, p_wrap=True, _cleaner_settings=None):
 def truncate_xhtml(string, size, _strip_xhtml=False, _decode_entities=False):
     """Truncate a XHTML string to roughly a given size (full words).
 
+    By default this is :func:`mediacore.lib.excerpts.truncate_xhtml`, which
+    counts only the text and doesn't parse the markup. The flags use the
+    slower BeautifulSoup based path.
+
     :param string: XHTML
     :type string: unicode
     :param size: Max length
@@ -274,6 +350,9 @@ def truncate_xhtml(string, size, _strip_xhtml=False, _decode_entities=False):
     if not string:
         return u''
 
+    if not _strip_xhtml and not _decode_entities:
+        return excerpts.truncate_xhtml(string, size).strip()
+
     if _strip_xhtml:
         # Insert whitespace after block elements.
         # So they are separated when we strip the xhtml.
@@ -325,6 +404,20 @@ def line_break_xhtml(string):
         string = block_close.sub(u"\\1\n", string).rstrip()
     return string
 
+def xhtml_to_plain(string):
+    """Convert XHTML to plain text, with a line break after each block.
+
+    Entities are converted to unicode. The result for XHTML returned by
+    :func:`clean_xhtml` is usually cached already.
+
+    :type string: unicode
+    :rtype: unicode
+    """
+    plain = _sanitizer.cached_plain_text(string)
+    if plain is None:
+        plain = strip_xhtml(line_break_xhtml(line_break_xhtml(string)), True)
+    return plain
+
 
 def list_acceptable_xhtml():
     return dict(
@@ -362,13 +455,18 @@ def thumb_path(item, size, exists=False, ext='jpg'):
         :mod:`mediacore.config.app_config`
     :type size: str
     :param exists: If enabled, checks to see if the file actually exists.
-        If it doesn't exist, ``None`` is returned.
+        If it doesn't exist, ``None`` is returned. Items which have no
+        thumb of their own, and so use the shared default, return ``None``.
     :type exists: bool
     :param ext: The extension to use, defaults to jpg.
     :type ext: str
     :returns: The absolute system path or ``None``.
     :rtype: str
 
+    This is the path that the item's own thumb is, or would be, saved to.
+    To display a thumb use :func:`thumb_url`, which falls back to the
+    shared default thumb.
+
     """
     if not item:
         return None
@@ -377,8 +475,12 @@ def thumb_path(item, size, exists=False, ext='jpg'):
     image = '%s/%s%s.%s' % (image_dir, item_id, size, ext)
     image_path = os.path.join(config['image_dir'], image)
 
-    if exists and not os.path.isfile(image_path):
-        return None
+    if exists:
+        if ext == 'jpg' and size in config['thumb_sizes'][image_dir]:
+            if not thumb_manifest.has(image_dir, item_id, size):
+                return None
+        elif not os.path.isfile(image_path):
+            return None
     return image_path
 
 def thumb_paths(item, **kwargs):
@@ -409,19 +511,40 @@ def thumb_url(item, size, qualified=False, exists=False):
     :param exists: If enabled, checks to see if the file actually exists.
         If it doesn't exist, ``None`` is returned.
     :type exists: bool
-    :returns: The relative or absolute URL.
+    :returns: The relative or absolute URL. If the item has no thumb of
+        its own, the URL of the shared default thumb.
     :rtype: str
 
+    The URL includes the thumb's version, from the
+    :class:`~mediacore.lib.thumbnails.ThumbManifest`, so it changes
+    whenever the image does.
+
     """
     if not item:
         return None
+    found = _find_thumb(item, size, exists)
+    if found is None:
+        return None
+    image, dimensions = found
+    return url_for('/images/', qualified=qualified) + image
 
+def _find_thumb(item, size, exists=False):
+    """Return the path within /images and the dimensions of a thumb."""
     image_dir, item_id = _normalize_thumb_item(item)
-    image = '%s/%s%s.jpg' % (image_dir, item_id, size)
-
-    if exists and not os.path.isfile(os.path.join(config['image_dir'], image)):
-        return None
-    return url_for('/images/%s' % image, qualified=qualified)
+    item_id, thumb = thumb_manifest.lookup(image_dir, item_id, size)
+    if thumb is None:
+        if exists:
+            return None
+        # Not made yet, so there's no version to go by
+        return ('%s/%s%s.jpg' % (image_dir, item_id, size),
+                config['thumb_sizes'][image_dir][size])
+    name = thumb['files']['jpg']
+    version = thumb.get('version', None)
+    if version and name == '%s%s.jpg' % (item_id, size):
+        # The file name doesn't change, so add the version to the URL.
+        # Manifests written before thumbs were versioned don't have one.
+        name += '?v=' + version
+    return '%s/%s' % (image_dir, name), thumb['size']
 
 class ThumbDict(dict):
     """Dict wrapper with convenient attribute access"""
@@ -454,75 +577,32 @@ def thumb(item, size, qualified=False, exists=False):
     """
     if not item:
         return None
-
-    image_dir, item_id = _normalize_thumb_item(item)
-    url = thumb_url(item, size, qualified, exists)
-
-    if not url:
+    found = _find_thumb(item, size, exists)
+    if found is None:
         return None
-    return ThumbDict(url, config['thumb_sizes'][image_dir][size])
-
-def resize_thumb(img, size, filter=Image.ANTIALIAS):
-    """Resize an image without any stretching by cropping when necessary.
-
-    If the given image has a different aspect ratio than the requested
-    size, the tops or sides will be cropped off before resizing.
-
-    Note that stretching will still occur if the target size is larger
-    than the given image.
-
-    :param img: Any open image
-    :type img: :class:`PIL.Image`
-    :param size: The desired width and height
-    :type size: tuple
-    :param filter: The downsampling filter to use when resizing.
-        Defaults to PIL.Image.ANTIALIAS, the highest possible quality.
-    :returns: A new, resized image instance
-
-    """
-    X, Y, X2, Y2 = 0, 1, 2, 3 # aliases for readability
-
-    src_ratio = float(img.size[X]) / img.size[Y]
-    dst_ratio = float(size[X]) / size[Y]
-
-    if dst_ratio != src_ratio and (img.size[X] >= size[X] and
-                                   img.size[Y] >= size[Y]):
-        crop_size = list(img.size)
-        crop_rect = [0, 0, 0, 0] # X, Y, X2, Y2
+    image, dimensions = found
+    return ThumbDict(url_for('/images/', qualified=qualified) + image,
+                     dimensions)
 
-        if dst_ratio < src_ratio:
-            crop_size[X] = int(crop_size[Y] * dst_ratio)
-            crop_rect[X] = int(float(img.size[X] - crop_size[X]) / 2)
-        else:
-            crop_size[Y] = int(crop_size[X] / dst_ratio)
-            crop_rect[Y] = int(float(img.size[Y] - crop_size[Y]) / 2)
-
-        crop_rect[X2] = crop_rect[X] + crop_size[X]
-        crop_rect[Y2] = crop_rect[Y] + crop_size[Y]
-
-        img = img.crop(crop_rect)
-
-    return img.resize(size, filter)
-
-def create_default_thumbs_for(item):
-    """Create copies of the default thumbs for the given item.
-
-    This copies the default files (all named with an id of 'new') to
-    use the given item's id. This means there could be lots of duplicate
-    copies of the default thumbs, but at least we can always use the
-    same url when rendering.
+def thumbs(item, qualified=False):
+    """Get the url & dimensions of every size of thumbnail for an item.
 
     :param item: A 2-tuple with a subdir name and an ID. If given a
         ORM mapped class with _thumb_dir and id attributes, the info
         can be extracted automatically.
     :type item: ``tuple`` or mapped class
+    :param qualified: If ``True`` return the full URLs including the domain.
+    :type qualified: bool
+    :returns: A dict of size keys to :class:`ThumbDict` instances.
 
     """
     image_dir, item_id = _normalize_thumb_item(item)
-    for key in config['thumb_sizes'][image_dir].iterkeys():
-        src_file = thumb_path((image_dir, 'new'), key)
-        dst_file = thumb_path(item, key)
-        shutil.copyfile(src_file, dst_file)
+    images_url = url_for('/images/', qualified=qualified)
+    result = {}
+    for size in config['thumb_sizes'][image_dir].iterkeys():
+        image, dimensions = _find_thumb(item, size)
+        result[size] = ThumbDict(images_url + image, dimensions)
+    return result
 
 def append_class_attr(attrs, class_name):
     """Append to the class for any input that Genshi's py:attrs understands.
@@ -609,14 +689,14 @@ def is_admin():
 def fetch_setting(key):
     """Return the value for the setting key.
 
+    Values are served from the in-memory
+    :data:`mediacore.model.settings.settings_cache`, so calling this
+    repeatedly does not hit the database.
+
     Raises a SettingNotFound exception if the key does not exist.
     """
-    from mediacore.model import fetch_row, Setting
-    from mediacore.model.settings import SettingNotFound
-    try:
-        return fetch_row(Setting, key=unicode(key)).value
-    except HTTPNotFound:
-        raise SettingNotFound, 'Key not found: %s' % key
+    from mediacore.model.settings import settings_cache
+    return settings_cache.get(unicode(key))
 
 def gravatar_from_email(email, size):
     """Return the URL for a gravatar image matching the povided email address.
@@ -658,6 +738,36 @@ def delete_files(paths, subdir=None):
         will be created.
     :type subdir: str or ``None``
 
+    Files in the media dir may be shared by several media files with the
+    same contents, including ones being uploaded right now whose requests
+    haven't committed yet. So rather than being deleted here, they're
+    handed to a ``media.collect_blob`` job, which deletes them once no
+    :class:`~mediacore.model.media.MediaFile` has referred to them for
+    a while, see :func:`mediacore.lib.tasks.collect_media_blob`. Call this
+    after committing the deletion.
+
+    """
+    from mediacore.lib.jobs import enqueue
+    from mediacore.lib.storage import blob_grace_period
+    media_dir = os.path.abspath(config['media_dir'])
+    others = []
+    for path in paths:
+        if not path:
+            continue
+        if os.path.dirname(os.path.abspath(path)) == media_dir:
+            enqueue('media.collect_blob',
+                    delay=blob_grace_period,
+                    file_name=os.path.basename(path),
+                    subdir=subdir)
+        else:
+            others.append(path)
+    discard_files(others, subdir)
+
+def discard_files(paths, subdir=None):
+    """Move the given files to the 'deleted' folder, or delete them, now.
+
+    See :func:`delete_files` for the parameters. Unlike it, this doesn't
+    check whether media dir files are still in use.
     """
     deleted_dir = config.get('deleted_files_dir', None)
     if deleted_dir and subdir:
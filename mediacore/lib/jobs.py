@@ -0,0 +1,290 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Background Jobs
+
+Sending email, checking comments with Akismet, copying uploads to FTP
+storage and resizing thumbnails are all slow and may fail for reasons
+beyond our control, so requests hand them off with :func:`enqueue`
+instead of doing them inline::
+
+    enqueue('email.send', to_addr=to, from_addr=sender,
+            subject=subject, body=body)
+
+Jobs are rows in the ``jobs`` table (see :mod:`mediacore.model.jobs`),
+added in the same transaction as the request's other changes, so a job is
+only ever run if the request succeeded. They are run by one or more
+worker processes started with::
+
+    paster --plugin=MediaCore run-jobs deployment.ini
+
+Failed jobs are retried with exponential backoff. A job which fails
+``max_attempts`` times is marked dead and listed under Settings >
+Background Jobs in the admin, where it can be retried or discarded.
+
+Handlers are registered with :func:`handler` and must be idempotent: a
+worker that dies after a job's changes were committed but before the job
+was marked done will leave the job to be run again. Their arguments must
+be JSON serializable, so pass IDs rather than objects.
+
+If the ``jobs_inline`` config option is true, which it is unless
+otherwise configured, :func:`enqueue` simply runs the handler there and
+then, as MediaCore always used to.
+
+"""
+import time
+from datetime import datetime, timedelta
+
+import simplejson
+import transaction
+from paste.deploy.converters import asbool
+from pylons import config
+from sqlalchemy import sql
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['JobWorker', 'RetryLater', 'backoff', 'enqueue', 'handler',
+           'handlers', 'runs_inline']
+
+#: Registered handlers, keyed by job name.
+handlers = {}
+
+def handler(name, max_attempts=5):
+    """Register the decorated function as the handler for a job name.
+
+    :param name: The job name, for example ``'email.send'``.
+    :param max_attempts: The default number of times to try the job.
+    """
+    def decorator(func):
+        handlers[name] = (func, max_attempts)
+        return func
+    return decorator
+
+def get_handler(name):
+    """Return the ``(function, max_attempts)`` registered for a job name."""
+    if name not in handlers:
+        # The handlers that ship with MediaCore register themselves on import
+        import mediacore.lib.tasks
+    try:
+        return handlers[name]
+    except KeyError:
+        raise LookupError, 'No handler is registered for %r jobs' % name
+
+
+class RetryLater(Exception):
+    """Raised by a handler to have its job tried again after ``delay``
+    seconds, or after the usual :func:`backoff` if no delay is given."""
+    def __init__(self, message, delay=None):
+        Exception.__init__(self, message)
+        self.delay = delay
+
+
+def backoff(attempts, base=30, limit=3600):
+    """Return the number of seconds to wait before the next attempt.
+
+    :param attempts: How many attempts have been made so far.
+    """
+    return min(limit, base * 2 ** max(attempts - 1, 0))
+
+def runs_inline():
+    """Return True if :func:`enqueue` runs jobs straight away, as set by
+    the ``jobs_inline`` config option."""
+    return asbool(config.get('jobs_inline', True))
+
+def enqueue(name, key=None, delay=0, max_attempts=None, **kwargs):
+    """Queue a job to be run by a worker once the transaction commits.
+
+    :param name: The name of a registered :func:`handler`.
+    :param key: An optional idempotency key. The job is not queued if
+        another job with the same key exists, whatever its status.
+    :param delay: Don't run the job for this many seconds.
+    :param max_attempts: Override the handler's ``max_attempts``.
+    :param \*\*kwargs: The JSON serializable arguments for the handler.
+    :returns: The new :class:`~mediacore.model.jobs.Job`, or ``None`` if
+        there already was one with the given key. In inline mode, the
+        handler's return value.
+    """
+    if runs_inline():
+        return _run_inline(name, max_attempts, kwargs)
+
+    from mediacore.model.meta import DBSession
+    from mediacore.model.jobs import Job
+    if key is not None and Job.query.filter(Job.job_key == key).count():
+        return None
+    job = Job()
+    job.name = name
+    job.job_key = key
+    job.args = kwargs
+    job.max_attempts = max_attempts or get_handler(name)[1]
+    job.run_after = datetime.now() + timedelta(seconds=delay)
+    DBSession.add(job)
+    return job
+
+def _run_inline(name, max_attempts, kwargs):
+    func, default_max_attempts = get_handler(name)
+    max_attempts = max_attempts or default_max_attempts
+    attempts = 0
+    while True:
+        attempts += 1
+        try:
+            return func(**kwargs)
+        except RetryLater, e:
+            if attempts >= max_attempts:
+                raise
+            time.sleep(e.delay or 1)
+
+
+class JobWorker(object):
+    """Claim and run queued jobs.
+
+    Any number of workers may run at once, in any number of processes or
+    on different machines. Each job is claimed with a conditional
+    ``UPDATE`` so that only one worker gets it.
+
+    :param lock_timeout: Consider a running job abandoned after this many
+        seconds, and let another worker claim it.
+    :param poll_interval: Seconds to sleep when there's nothing to do.
+    :param purge_after: Delete finished jobs after this many seconds.
+    :param bind: The engine to claim jobs with. Defaults to the engine
+        the :data:`~mediacore.model.meta.DBSession` is bound to.
+
+    """
+    def __init__(self, lock_timeout=600, poll_interval=5,
+                 purge_after=7 * 86400, bind=None):
+        self.lock_timeout = lock_timeout
+        self.poll_interval = poll_interval
+        self.purge_after = purge_after
+        self.bind = bind
+        self.last_purge = 0
+
+    def _bind(self):
+        if self.bind is None:
+            from mediacore.model.meta import DBSession
+            self.bind = DBSession.bind
+        return self.bind
+
+    def run(self, forever=True):
+        """Run jobs until there are none left, or until interrupted.
+
+        :param forever: If True, wait for new jobs instead of returning.
+        :returns: The number of jobs run.
+        """
+        count = 0
+        while True:
+            if time.time() - self.last_purge > 3600:
+                self.purge()
+            if self.run_one():
+                count += 1
+            elif forever:
+                time.sleep(self.poll_interval)
+            else:
+                return count
+
+    def claim(self):
+        """Claim the next due job.
+
+        :returns: A ``(id, name, args, attempts, max_attempts)`` tuple for
+            the claimed job, or ``None`` if no jobs are due.
+        """
+        from mediacore.model.jobs import jobs
+        now = datetime.now()
+        bind = self._bind()
+        due = bind.execute(sql.select(
+            [jobs.c.id, jobs.c.status, jobs.c.attempts],
+            sql.or_(
+                sql.and_(jobs.c.status == 'queued', jobs.c.run_after <= now),
+                sql.and_(jobs.c.status == 'running', jobs.c.locked_until < now),
+            ),
+            order_by=[jobs.c.run_after],
+            limit=20,
+        )).fetchall()
+        for id, status, attempts in due:
+            # Whoever changes the status or attempts first gets the job
+            result = bind.execute(jobs.update(sql.and_(
+                jobs.c.id == id,
+                jobs.c.status == status,
+                jobs.c.attempts == attempts,
+            ), values={
+                'status': 'running',
+                'attempts': attempts + 1,
+                'locked_until': now + timedelta(seconds=self.lock_timeout),
+            }))
+            if result.rowcount == 1:
+                name, args, max_attempts = bind.execute(sql.select(
+                    [jobs.c.name, jobs.c.args, jobs.c.max_attempts],
+                    jobs.c.id == id)).fetchone()
+                return id, name, simplejson.loads(args), attempts + 1, max_attempts
+        return None
+
+    def run_one(self):
+        """Claim and run a single job.
+
+        :returns: True if a job was run, successfully or not.
+        """
+        from mediacore.model.meta import DBSession
+        claimed = self.claim()
+        if claimed is None:
+            return False
+        id, name, args, attempts, max_attempts = claimed
+        args = dict([(str(k), v) for k, v in args.iteritems()])
+
+        transaction.begin()
+        try:
+            try:
+                func = get_handler(name)[0]
+                func(**args)
+                transaction.commit()
+            except RetryLater, e:
+                transaction.abort()
+                log.info('Job %d (%s) will be retried: %s', id, name, e)
+                self._failed(id, attempts, max_attempts, e, e.delay)
+            except Exception, e:
+                transaction.abort()
+                log.exception('Job %d (%s) failed: %s', id, name, e)
+                self._failed(id, attempts, max_attempts, e)
+            else:
+                self._update(id, status='done', locked_until=None,
+                             last_error=None)
+        finally:
+            DBSession.remove()
+        return True
+
+    def _failed(self, id, attempts, max_attempts, error, delay=None):
+        message = unicode(str(error), 'utf-8', 'replace')
+        if attempts >= max_attempts:
+            log.error('Job %d is dead after %d attempts', id, attempts)
+            self._update(id, status='dead', locked_until=None,
+                         last_error=message)
+        else:
+            if delay is None:
+                delay = backoff(attempts)
+            self._update(id, status='queued', locked_until=None,
+                         last_error=message,
+                         run_after=datetime.now() + timedelta(seconds=delay))
+
+    def _update(self, id, **values):
+        from mediacore.model.jobs import jobs
+        self._bind().execute(jobs.update(jobs.c.id == id, values=values))
+
+    def purge(self):
+        """Delete jobs which finished more than ``purge_after`` seconds ago."""
+        from mediacore.model.jobs import jobs
+        self.last_purge = time.time()
+        cutoff = datetime.now() - timedelta(seconds=self.purge_after)
+        self._bind().execute(jobs.delete(sql.and_(
+            jobs.c.status == 'done',
+            jobs.c.modified_on < cutoff,
+        )))
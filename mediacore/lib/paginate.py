@@ -13,16 +13,29 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
+import base64
+import hashlib
 import inspect
 import functools
+import time
 import warnings
+from datetime import datetime
 
-from pylons import request, tmpl_context
+import simplejson
+from pylons import app_globals, config, request, tmpl_context
+from sqlalchemy import sql, types
 from webhelpers import paginate as _paginate
 from webhelpers.paginate import get_wrapper
 from webob.multidict import MultiDict
 from webhelpers.paginate import Page
 
+from mediacore.lib.responsecache import response_cache
+
+_count_namespace = 'mediacore.counts'
+
+# The range of a signed 64 bit integer, the largest the database may hold
+_max_int = 2 ** 63 - 1
+
 # FIXME: The following class is taken from TG2.0.3. Find a way to replace it.
 # This is not an ideal solution, but avoids the immediate need to rewrite the
 # paginate and CustomPage methods below.
@@ -62,7 +75,8 @@ def partial(*args, **create_time_kwds):
         return func(*args, **kwds)
     return curried_function
 
-def paginate(name, items_per_page=10, use_prefix=False, items_first_page=None):
+def paginate(name, items_per_page=10, use_prefix=False, items_first_page=None,
+             count_tags=None):
     """Paginate a given collection.
 
     Duplicates and extends the functionality of :func:`tg.decorators.paginate` to:
@@ -71,6 +85,10 @@ def paginate(name, items_per_page=10, use_prefix=False, items_first_page=None):
           :mod:`sphinx.ext.autodoc` to read docstring.
         * Support our :class:`CustomPage` extension -- used any time
           ``items_first_page`` is provided.
+        * Page through a :class:`Seekable` collection with a cursor
+          instead of page numbers, see :class:`SeekPage`.
+        * Reuse the total number of items from earlier requests, when
+          ``count_tags`` is provided. See :func:`cached_count`.
 
     This decorator is mainly exposing the functionality
     of :func:`webhelpers.paginate`.
@@ -110,6 +128,9 @@ def paginate(name, items_per_page=10, use_prefix=False, items_first_page=None):
       items_first_page
         the number of items to be rendered on the first page. Defaults to the
         value of ``items_per_page``
+      count_tags
+        the cache tags that the total number of items depends on. If given,
+        the total is only counted again once one of them is invalidated.
 
     """
     prefix = ""
@@ -117,13 +138,15 @@ def paginate(name, items_per_page=10, use_prefix=False, items_first_page=None):
         prefix = name + "_"
     own_parameters = dict(
         page="%spage" % prefix,
-        items_per_page="%sitems_per_page" % prefix
+        items_per_page="%sitems_per_page" % prefix,
+        cursor="%scursor" % prefix,
         )
     #@decorator
     def _d(f):
         @functools.wraps(f)
         def _w(*args, **kwargs):
             page = int(kwargs.pop(own_parameters["page"], 1))
+            cursor = kwargs.pop(own_parameters["cursor"], None)
             real_items_per_page = int(
                     kwargs.pop(
                             own_parameters['items_per_page'],
@@ -155,24 +178,47 @@ def paginate(name, items_per_page=10, use_prefix=False, items_first_page=None):
                         additional_parameters.add(key, value)
 
                 collection = res[name]
-
-                # Use CustomPage if our extra custom arg was provided
-                if items_first_page is not None:
-                    page_class = CustomPage
+                if isinstance(collection, Seekable):
+                    query = collection.query
                 else:
-                    page_class = Page
-
-                page = page_class(
-                    collection,
-                    page,
-                    items_per_page=real_items_per_page,
-                    items_first_page=items_first_page,
-                    **additional_parameters.dict_of_lists()
-                    )
-                # wrap the pager so that it will render
-                # the proper page-parameter
-                page.pager = partial(page.pager,
-                        page_param=own_parameters["page"])
+                    query = collection
+
+                item_count = None
+                if count_tags is not None:
+                    count_key = (request.script_name, request.path_info,
+                                 name, sorted(additional_parameters.items()))
+                    item_count = cached_count(query, count_key, count_tags)
+
+                if isinstance(collection, Seekable):
+                    try:
+                        collection.order.decode(cursor)
+                    except InvalidCursor:
+                        # A stale or mangled link: start from the top
+                        cursor = None
+                    page = SeekPage(query, collection.order, cursor,
+                        items_per_page=real_items_per_page,
+                        item_count=item_count,
+                        cursor_param=own_parameters["cursor"],
+                        **additional_parameters.dict_of_lists())
+                else:
+                    # Use CustomPage if our extra custom arg was provided
+                    if items_first_page is not None:
+                        page_class = CustomPage
+                    else:
+                        page_class = Page
+
+                    page = page_class(
+                        collection,
+                        page,
+                        items_per_page=real_items_per_page,
+                        items_first_page=items_first_page,
+                        item_count=item_count,
+                        **additional_parameters.dict_of_lists()
+                        )
+                    # wrap the pager so that it will render
+                    # the proper page-parameter
+                    page.pager = partial(page.pager,
+                            page_param=own_parameters["page"])
                 res[name] = page
                 # this is a bit strange - it appears
                 # as if c returns an empty
@@ -386,3 +432,259 @@ class CustomPage(Page):
         # This is a subclass of the 'list' type. Initialise the list now.
         list.__init__(self, self.items)
 
+
+
+class InvalidCursor(ValueError):
+    """The cursor wasn't made by the given :class:`SeekOrder`."""
+
+
+class SeekOrder(object):
+    """An order that a query can be paged through by value, rather than by
+    ``LIMIT`` and ``OFFSET``.
+
+    Rows are ordered by a column and then by their ID, which breaks any
+    ties. A page starts just after (or before) the last row seen, so the
+    database can read it straight from an index on those columns, however
+    deep into the results it is. The column must not contain NULLs.
+
+    Positions are passed around as opaque cursors, made by :meth:`cursor`
+    and read by :meth:`decode`. Cursors come from the query string, so
+    their values are checked against the column's type before they're
+    used in a query.
+
+    :param name: A unique name for this order, stored in its cursors.
+    :param column: The ORM attribute to order by.
+    :param id_column: The ORM attribute for the primary key.
+    :param descending: Order from the highest values to the lowest.
+
+    """
+    def __init__(self, name, column, id_column, descending=True):
+        self.name = name
+        self.column = column
+        self.id_column = id_column
+        self.descending = descending
+
+    def order(self, query, backwards=False):
+        """Return the query ordered by this order, or in reverse."""
+        if self.descending != backwards:
+            ordering = (self.column.desc(), self.id_column.desc())
+        else:
+            ordering = (self.column.asc(), self.id_column.asc())
+        return query.order_by(None).order_by(*ordering)
+
+    def seek(self, query, position=None, backwards=False):
+        """Return the query ordered and filtered to start after a position.
+
+        :param position: A ``(value, id)`` pair from :meth:`decode`, or
+            None to start from the beginning.
+        :param backwards: Go back through the rows before ``position``
+            instead, nearest first.
+        """
+        query = self.order(query, backwards)
+        if position is None:
+            return query
+        value, id = position
+        if self.descending != backwards:
+            beyond = sql.or_(self.column < value,
+                             sql.and_(self.column == value,
+                                      self.id_column < id))
+        else:
+            beyond = sql.or_(self.column > value,
+                             sql.and_(self.column == value,
+                                      self.id_column > id))
+        return query.filter(beyond)
+
+    def cursor(self, item, backwards=False):
+        """Return a cursor for the rows after ``item``, or before it."""
+        value = getattr(item, self.column.key)
+        if isinstance(value, datetime):
+            value = list(value.timetuple()[:6]) + [value.microsecond]
+        id = getattr(item, self.id_column.key)
+        data = simplejson.dumps([self.name, backwards, value, id])
+        return base64.urlsafe_b64encode(data).rstrip('=')
+
+    def decode(self, cursor):
+        """Read a cursor made by :meth:`cursor`.
+
+        :returns: ``(backwards, (value, id))``, or ``(False, None)`` if
+            the cursor is empty.
+        :raises InvalidCursor: If the cursor wasn't made by this order, or
+            its values aren't of the right types.
+        """
+        if not cursor:
+            return False, None
+        try:
+            cursor = str(cursor)
+            data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            name, backwards, value, id = simplejson.loads(data)
+            if name != self.name or not isinstance(backwards, bool):
+                raise ValueError(name)
+            value = self._coerce(value)
+            id = _check_int(id)
+        except (TypeError, ValueError, UnicodeError, OverflowError):
+            raise InvalidCursor(cursor)
+        return backwards, (value, id)
+
+    def _coerce(self, value):
+        """Return a value from a cursor as the type of :attr:`column`.
+
+        :raises ValueError: If the column couldn't hold the value.
+        """
+        column_type = self.column.__clause_element__().type
+        if isinstance(column_type, types.DateTime):
+            if not isinstance(value, list) or len(value) != 7:
+                raise ValueError(value)
+            return datetime(*[_check_int(x) for x in value])
+        elif isinstance(column_type, types.Integer):
+            return _check_int(value)
+        elif isinstance(column_type, types.Numeric):
+            if isinstance(value, float):
+                return value
+            return _check_int(value)
+        elif isinstance(column_type, types.String):
+            if not isinstance(value, basestring):
+                raise ValueError(value)
+            return value
+        raise ValueError(value)
+
+
+def _check_int(value):
+    """Return the value if it's an integer the database can hold.
+
+    :raises ValueError: If it's of another type, or too large.
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, long)) \
+    or not -_max_int - 1 <= value <= _max_int:
+        raise ValueError(value)
+    return value
+
+
+class Seekable(object):
+    """A query to be paged through with a :class:`SeekOrder`.
+
+    Return one of these from an action decorated with :func:`paginate`
+    to get a :class:`SeekPage` in place of a numbered page.
+    """
+    def __init__(self, query, order):
+        self.query = query
+        self.order = order
+
+
+class SeekPage(list):
+    """A list of the items on one page of a query, found with a
+    :class:`SeekOrder`.
+
+    Pages are linked to by cursor rather than page number, so there's no
+    way to jump to the middle of the results, but every page is as quick
+    to load as the first.
+
+    Instance attributes:
+
+    items
+        The items on this page
+    items_per_page
+        Maximal number of items displayed on a page
+    item_count
+        The total number of items, if known. This may be an estimate from
+        :func:`cached_count`.
+    page_count
+        The number of pages ``item_count`` makes
+    previous_cursor
+        The cursor for the previous page, or None on the first page
+    next_cursor
+        The cursor for the next page, or None on the last page
+    cursor_param
+        The name of the parameter that the cursor is passed in
+
+    Further keyword arguments are used as link arguments by the pager.
+
+    :param query: The query to page through.
+    :param order: A :class:`SeekOrder`.
+    :param cursor: The cursor for the requested page, or None for the first.
+    :raises InvalidCursor: If the cursor wasn't made by ``order``.
+
+    """
+    def __init__(self, query, order, cursor=None, items_per_page=20,
+                 item_count=None, cursor_param='cursor', **kwargs):
+        self.kwargs = kwargs
+        self.order = order
+        self.items_per_page = items_per_page
+        self.item_count = item_count
+        self.cursor_param = cursor_param
+
+        backwards, position = order.decode(cursor)
+        items, more = self._fetch(query, position, backwards)
+        if backwards and not more:
+            # Fewer than a page is left before the cursor, so show a full
+            # first page rather than a short one.
+            backwards, position = False, None
+            items, more = self._fetch(query, None, False)
+
+        if backwards:
+            items.reverse()
+            has_previous, has_next = more, True
+        else:
+            has_previous, has_next = position is not None, more
+
+        self.items = items
+        self.previous_cursor = None
+        self.next_cursor = None
+        if items and has_previous:
+            self.previous_cursor = order.cursor(items[0], backwards=True)
+        if items and has_next:
+            self.next_cursor = order.cursor(items[-1])
+
+        if item_count is not None:
+            self.page_count = (max(item_count, 1) - 1) / items_per_page + 1
+        elif has_previous or has_next:
+            self.page_count = 2
+        else:
+            self.page_count = 1
+
+        list.__init__(self, self.items)
+
+    def _fetch(self, query, position, backwards):
+        """Return the page of items and whether there are any beyond it."""
+        query = self.order.seek(query, position, backwards)
+        items = list(query[:self.items_per_page + 1])
+        more = len(items) > self.items_per_page
+        return items[:self.items_per_page], more
+
+
+def cached_count(query, key, tags=('media', 'media_status'), expire=None):
+    """Return the number of rows the query returns, counting it only if it
+    hasn't been counted since any of the given cache tags were
+    invalidated.
+
+    Counts are kept in the Beaker cache from
+    :class:`mediacore.lib.app_globals.Globals`, and can be up to
+    ``count_cache_expire`` seconds old (300 by default), since media
+    can be published or unpublished by the passing of time alone.
+
+    :param query: The query to count.
+    :param key: Anything with a stable ``repr`` which identifies the
+        query. The query's own SQL often includes the current time.
+    :param tags: The names of the cache tags the count depends on. See
+        :class:`mediacore.lib.responsecache.ResponseCache`.
+    :param expire: The maximum number of seconds to keep the count.
+    :rtype: int
+
+    """
+    if expire is None:
+        expire = int(config.get('count_cache_expire', 300))
+    versions = [response_cache.tag_versions.get(tag) for tag in tags]
+    key = hashlib.md5(repr(key)).hexdigest()
+    cache = app_globals.cache.get_cache(_count_namespace)
+    now = time.time()
+
+    try:
+        expires, stored_versions, count = cache.get(key)
+    except KeyError:
+        pass
+    else:
+        if expires > now and stored_versions == versions:
+            return count
+
+    count = query.count()
+    cache.put(key, (now + expire, versions, count), expiretime=expire)
+    return count
@@ -0,0 +1,526 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Media File Probing
+
+Read the duration, codecs, bitrate and dimensions of a media file from
+its container headers, without decoding anything or reading the whole
+file. Only the headers are read; the audio and video data are skipped
+with ``seek``, so probing a large file costs a few small reads.
+
+Supported formats:
+
+    MP4 family (mp4, m4v, m4a, mov, 3gp)
+        Walks the atom tree, reading ``mvhd``, ``tkhd``, ``hdlr`` and the
+        first ``stsd`` sample entry of each track. H.264 baseline and AAC
+        LC are reported as ``h264b`` and ``aacl``, matching the codec names
+        in :data:`mediacore.lib.filetypes.html5_supported_containers_codecs`.
+    FLV
+        Reads the ``onMetaData`` script tag and the first audio and video
+        tags, and takes the duration from the timestamp of the last tag.
+    MP3
+        Skips any ID3v2 tag, then reads the first frame header and its
+        Xing, Info or VBRI header, if any.
+    Ogg
+        Reads the Vorbis, Theora or Opus headers from the first pages and
+        takes the duration from the granule position of the last page.
+
+The format is detected from the file's contents, not its extension.
+
+"""
+import os
+import struct
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['ProbeError', 'probe', 'probe_file']
+
+class ProbeError(Exception):
+    pass
+
+def probe(path):
+    """Return what can be learned about a media file from its headers.
+
+    :param path: The path of the file.
+    :rtype: dict or None
+    :returns: None if the format isn't recognized, otherwise a dict with
+        ``container``, ``duration`` in seconds, ``bitrate`` in kbit/s,
+        ``width``, ``height``, ``video_codec`` and ``audio_codec``, any of
+        which may be None if they couldn't be found.
+    :raises ProbeError: If the file is recognized but malformed.
+    """
+    f = open(path, 'rb')
+    try:
+        return probe_file(f, os.path.getsize(path))
+    finally:
+        f.close()
+
+def probe_file(f, size):
+    """Probe an open, seekable file of the given size. See :func:`probe`."""
+    head = f.read(12)
+    f.seek(0)
+    if len(head) >= 8 and head[4:8] in _mp4_top_level:
+        parser = _probe_mp4
+    elif head[:3] == 'FLV':
+        parser = _probe_flv
+    elif head[:4] == 'OggS':
+        parser = _probe_ogg
+    elif head[:3] == 'ID3' or _mp3_header(head[:4]):
+        parser = _probe_mp3
+    else:
+        return None
+    info = dict(container=None, duration=None, bitrate=None, width=None,
+                height=None, video_codec=None, audio_codec=None)
+    try:
+        parser(f, size, info)
+    except (struct.error, IndexError, ValueError, ZeroDivisionError), e:
+        raise ProbeError('Malformed %s headers: %s' % (parser.__name__[7:], e))
+    if info['duration'] and not info['bitrate']:
+        info['bitrate'] = int(size * 8 / info['duration'] / 1000)
+    return info
+
+def _read(f, n):
+    data = f.read(n)
+    if len(data) < n:
+        raise ProbeError('Unexpected end of file')
+    return data
+
+
+# MP4
+
+_mp4_top_level = dict.fromkeys(['ftyp', 'moov', 'mdat', 'free', 'skip',
+                                'wide', 'pnot'])
+_mp4_containers = dict.fromkeys(['moov', 'trak', 'mdia', 'minf', 'stbl'])
+_mp4_video_codecs = {
+    'avc1': 'h264', 'avc3': 'h264', 'hvc1': 'hevc', 'hev1': 'hevc',
+    'mp4v': 'mpeg4', 's263': 'h263', 'jpeg': 'mjpeg',
+}
+_mp4_audio_codecs = {
+    'mp4a': 'aac', '.mp3': 'mp3', 'ac-3': 'ac3', 'samr': 'amr',
+    'alac': 'alac',
+}
+
+def _mp4_boxes(f, start, end):
+    """Yield the type, payload offset and payload size of each box."""
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        size, box_type = struct.unpack('>I4s', _read(f, 8))
+        header = 8
+        if size == 1:
+            size = struct.unpack('>Q', _read(f, 8))[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            raise ProbeError('Invalid %r box size' % box_type)
+        yield box_type, offset + header, size - header
+        offset += size
+
+def _probe_mp4(f, size, info):
+    state = dict(brand=None, tracks=[])
+    _walk_mp4(f, 0, size, state)
+    video = [t for t in state['tracks'] if t.get('handler') == 'vide']
+    audio = [t for t in state['tracks'] if t.get('handler') == 'soun']
+    if video:
+        info['video_codec'] = video[0].get('codec')
+        info['width'] = video[0].get('width')
+        info['height'] = video[0].get('height')
+    if audio:
+        info['audio_codec'] = audio[0].get('codec')
+    if state.get('timescale'):
+        info['duration'] = float(state['duration']) / state['timescale']
+    brand = state['brand']
+    if brand == 'qt  ':
+        info['container'] = 'mov'
+    elif brand and brand.startswith('3g'):
+        info['container'] = '3gp'
+    elif audio and not video:
+        info['container'] = 'm4a'
+    else:
+        info['container'] = 'mp4'
+
+def _walk_mp4(f, start, end, state):
+    for box_type, offset, length in _mp4_boxes(f, start, end):
+        if box_type == 'ftyp':
+            f.seek(offset)
+            state['brand'] = _read(f, 4)
+        elif box_type in _mp4_containers:
+            if box_type == 'trak':
+                state['tracks'].append({})
+            _walk_mp4(f, offset, offset + length, state)
+        elif box_type == 'mvhd':
+            f.seek(offset)
+            if ord(_read(f, 4)[0]) == 1:
+                f.seek(16, 1)
+                state['timescale'], state['duration'] = \
+                    struct.unpack('>IQ', _read(f, 12))
+            else:
+                f.seek(8, 1)
+                state['timescale'], state['duration'] = \
+                    struct.unpack('>II', _read(f, 8))
+        elif box_type == 'tkhd' and state['tracks']:
+            f.seek(offset)
+            version = ord(_read(f, 1))
+            f.seek(offset + (version == 1 and 88 or 76))
+            width, height = struct.unpack('>II', _read(f, 8))
+            state['tracks'][-1]['width'] = width >> 16
+            state['tracks'][-1]['height'] = height >> 16
+        elif box_type == 'hdlr' and state['tracks']:
+            f.seek(offset + 8)
+            state['tracks'][-1]['handler'] = _read(f, 4)
+        elif box_type == 'stsd' and state['tracks']:
+            _read_mp4_stsd(f, offset, state['tracks'][-1])
+
+def _read_mp4_stsd(f, offset, track):
+    try:
+        _read_mp4_sample_entry(f, offset, track)
+    except (ProbeError, IndexError):
+        # Some QuickTime sample entries are laid out differently, but the
+        # format code is all that's really needed
+        pass
+
+def _read_mp4_sample_entry(f, offset, track):
+    f.seek(offset + 8)
+    entry_size, fmt = struct.unpack('>I4s', _read(f, 8))
+    entry_end = offset + 8 + entry_size
+    if fmt in _mp4_video_codecs:
+        track['codec'] = _mp4_video_codecs[fmt]
+        if track['codec'] == 'h264':
+            for box_type, box_offset, length in \
+                    _mp4_boxes(f, offset + 8 + 86, entry_end):
+                if box_type == 'avcC':
+                    f.seek(box_offset + 1)
+                    if ord(_read(f, 1)) == 66:
+                        track['codec'] = 'h264b'
+                    break
+    elif fmt in _mp4_audio_codecs:
+        track['codec'] = _mp4_audio_codecs[fmt]
+        if fmt == 'mp4a':
+            for box_type, box_offset, length in \
+                    _mp4_boxes(f, offset + 8 + 36, entry_end):
+                if box_type == 'esds':
+                    f.seek(box_offset + 4)
+                    track['codec'] = _mp4_esds_codec(_read(f, length - 4)) \
+                        or track['codec']
+                    break
+    else:
+        track['codec'] = fmt.strip().lower()
+
+def _mp4_esds_codec(data):
+    """Return the audio codec named by an MPEG-4 ES descriptor."""
+    pos = 0
+    object_type = None
+    while pos < len(data):
+        tag = ord(data[pos])
+        pos += 1
+        length = 0
+        for i in range(4):
+            byte = ord(data[pos])
+            pos += 1
+            length = (length << 7) | (byte & 0x7f)
+            if not byte & 0x80:
+                break
+        if tag == 0x03:
+            flags = ord(data[pos + 2])
+            pos += 3
+            if flags & 0x80:
+                pos += 2
+            if flags & 0x40:
+                pos += 1 + ord(data[pos])
+            if flags & 0x20:
+                pos += 2
+        elif tag == 0x04:
+            object_type = ord(data[pos])
+            if object_type in (0x69, 0x6b):
+                return 'mp3'
+            pos += 13
+        elif tag == 0x05:
+            if object_type == 0x40 and ord(data[pos]) >> 3 == 2:
+                return 'aacl'
+            return 'aac'
+        else:
+            pos += length
+    return None
+
+
+# FLV
+
+_flv_video_codecs = {2: 'h263', 4: 'vp6', 5: 'vp6a', 7: 'h264'}
+_flv_audio_codecs = {2: 'mp3', 10: 'aac', 11: 'speex', 14: 'mp3',
+                     4: 'nellymoser', 5: 'nellymoser', 6: 'nellymoser'}
+
+def _probe_flv(f, size, info):
+    header = _read(f, 9)
+    flags, data_offset = struct.unpack('>BI', header[4:9])
+    want_video, want_audio = bool(flags & 1), bool(flags & 4)
+    meta = {}
+    offset = data_offset + 4
+    # Read the first few tags for the metadata and codec IDs
+    for i in range(20):
+        if offset + 11 > size or not (want_video or want_audio or not meta):
+            break
+        f.seek(offset)
+        tag = _read(f, 12)
+        tag_type = ord(tag[0]) & 0x1f
+        data_size = struct.unpack('>I', '\0' + tag[1:4])[0]
+        if tag_type == 18 and not meta:
+            f.seek(offset + 11)
+            meta = _amf_metadata(_read(f, data_size))
+        elif tag_type == 9 and want_video:
+            info['video_codec'] = _flv_video_codecs.get(ord(tag[11]) & 0x0f)
+            want_video = False
+        elif tag_type == 8 and want_audio:
+            info['audio_codec'] = _flv_audio_codecs.get(ord(tag[11]) >> 4)
+            want_audio = False
+        offset += 11 + data_size + 4
+
+    info['container'] = 'flv'
+    if meta.get('width'):
+        info['width'] = int(meta['width'])
+    if meta.get('height'):
+        info['height'] = int(meta['height'])
+    if meta.get('videodatarate') or meta.get('audiodatarate'):
+        info['bitrate'] = int(meta.get('videodatarate', 0)
+                              + meta.get('audiodatarate', 0)) or None
+    info['duration'] = _flv_last_timestamp(f, size) or meta.get('duration')
+
+def _flv_last_timestamp(f, size):
+    """Return the timestamp of the last tag, in seconds, or None."""
+    if size < 15:
+        return None
+    f.seek(size - 4)
+    last_size = struct.unpack('>I', _read(f, 4))[0]
+    if not 11 < last_size < size:
+        return None
+    f.seek(size - 4 - last_size)
+    tag = _read(f, 8)
+    if ord(tag[0]) & 0x1f not in (8, 9, 18):
+        return None
+    ms = struct.unpack('>I', tag[7] + tag[4:7])[0]
+    return ms / 1000.0
+
+def _amf_metadata(data):
+    """Parse the AMF0 ``onMetaData`` script tag into a dict."""
+    name, pos = _amf_value(data, 0)
+    if name != 'onMetaData':
+        return {}
+    value, pos = _amf_value(data, pos)
+    if not isinstance(value, dict):
+        return {}
+    return value
+
+def _amf_string(data, pos):
+    length = struct.unpack('>H', data[pos:pos + 2])[0]
+    return data[pos + 2:pos + 2 + length], pos + 2 + length
+
+def _amf_value(data, pos):
+    marker = ord(data[pos])
+    pos += 1
+    if marker == 0:
+        return struct.unpack('>d', data[pos:pos + 8])[0], pos + 8
+    elif marker == 1:
+        return bool(ord(data[pos])), pos + 1
+    elif marker == 2:
+        return _amf_string(data, pos)
+    elif marker in (3, 8):
+        if marker == 8:
+            pos += 4
+        obj = {}
+        while pos + 3 <= len(data):
+            key, pos = _amf_string(data, pos)
+            if not key and ord(data[pos]) == 9:
+                return obj, pos + 1
+            obj[key], pos = _amf_value(data, pos)
+        return obj, pos
+    elif marker == 10:
+        count = struct.unpack('>I', data[pos:pos + 4])[0]
+        pos += 4
+        items = []
+        for i in xrange(count):
+            item, pos = _amf_value(data, pos)
+            items.append(item)
+        return items, pos
+    elif marker == 11:
+        return struct.unpack('>d', data[pos:pos + 8])[0], pos + 10
+    elif marker == 12:
+        length = struct.unpack('>I', data[pos:pos + 4])[0]
+        return data[pos + 4:pos + 4 + length], pos + 4 + length
+    elif marker in (5, 6):
+        return None, pos
+    raise ValueError('Unsupported AMF0 type %d' % marker)
+
+
+# MP3
+
+# Layer III bitrates in kbit/s for MPEG-1, and for MPEG-2 and 2.5
+_mp3_bitrates = {
+    3: (0, 32, 40, 48, 56, 64, 80, 96, 112, 128, 160, 192, 224, 256, 320),
+    2: (0, 8, 16, 24, 32, 40, 48, 56, 64, 80, 96, 112, 128, 144, 160),
+}
+_mp3_sample_rates = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+
+def _mp3_header(data):
+    """Parse a Layer III frame header.
+
+    :returns: A tuple of the MPEG version ID, bitrate in kbit/s, sample
+        rate, samples per frame, frame length and whether it's mono, or
+        None if the bytes aren't a valid header.
+    """
+    if len(data) < 4:
+        return None
+    b0, b1, b2, b3 = struct.unpack('>4B', data[:4])
+    if b0 != 0xff or b1 & 0xe0 != 0xe0:
+        return None
+    version = (b1 >> 3) & 3
+    layer = (b1 >> 1) & 3
+    bitrate_index = b2 >> 4
+    rate_index = (b2 >> 2) & 3
+    if version == 1 or layer != 1 or bitrate_index in (0, 15) \
+            or rate_index == 3:
+        return None
+    bitrate = _mp3_bitrates[version == 3 and 3 or 2][bitrate_index]
+    sample_rate = _mp3_sample_rates[version][rate_index]
+    samples = version == 3 and 1152 or 576
+    length = samples // 8 * bitrate * 1000 // sample_rate + ((b2 >> 1) & 1)
+    return version, bitrate, sample_rate, samples, length, b3 >> 6 == 3
+
+def _probe_mp3(f, size, info):
+    start = 0
+    head = _read(f, 10)
+    if head[:3] == 'ID3':
+        tag_size = 0
+        for byte in head[6:10]:
+            tag_size = (tag_size << 7) | (ord(byte) & 0x7f)
+        start = 10 + tag_size + (ord(head[5]) & 0x10 and 10 or 0)
+
+    # Find the first frame header that's followed by another one
+    f.seek(start)
+    data = f.read(65536)
+    pos = data.find('\xff')
+    header = None
+    while pos != -1 and pos + 4 <= len(data):
+        header = _mp3_header(data[pos:pos + 4])
+        if header is not None:
+            following = pos + header[4]
+            if following + 4 > len(data) \
+                    or _mp3_header(data[following:following + 4]):
+                break
+        header = None
+        pos = data.find('\xff', pos + 1)
+    if header is None:
+        raise ProbeError('No MPEG audio frames found')
+
+    version, bitrate, sample_rate, samples, length, mono = header
+    frame = data[pos:pos + length]
+    if version == 3:
+        side_info = mono and 17 or 32
+    else:
+        side_info = mono and 9 or 17
+    xing = frame[4 + side_info:4 + side_info + 12]
+    frames = None
+    if xing[:4] in ('Xing', 'Info'):
+        flags = struct.unpack('>I', xing[4:8])[0]
+        if flags & 1:
+            frames = struct.unpack('>I', xing[8:12])[0]
+    elif frame[36:40] == 'VBRI':
+        frames = struct.unpack('>I', frame[50:54])[0]
+
+    info['container'] = 'mp3'
+    info['audio_codec'] = 'mp3'
+    audio_size = size - start - pos
+    if frames:
+        info['duration'] = float(frames) * samples / sample_rate
+    else:
+        info['duration'] = audio_size * 8.0 / (bitrate * 1000)
+        info['bitrate'] = bitrate
+
+
+# Ogg
+
+def _ogg_pages(data):
+    """Yield the header type, granule position, serial number and first
+    segment data of each complete page found in a block of data."""
+    pos = data.find('OggS')
+    while pos != -1 and pos + 27 <= len(data):
+        header_type, granule, serial = \
+            struct.unpack('<xBqI', data[pos + 4:pos + 18])
+        segments = ord(data[pos + 26])
+        table = data[pos + 27:pos + 27 + segments]
+        body = pos + 27 + segments
+        body_size = sum([ord(c) for c in table])
+        if len(table) == segments and body + body_size <= len(data):
+            yield header_type, granule, serial, data[body:body + body_size]
+            pos = data.find('OggS', body + body_size)
+        else:
+            pos = data.find('OggS', pos + 4)
+
+def _probe_ogg(f, size, info):
+    streams = {}
+    for header_type, granule, serial, packet in _ogg_pages(f.read(65536)):
+        if not header_type & 2:
+            break
+        if packet[:7] == '\x01vorbis':
+            channels, rate, bitrate = struct.unpack('<BI4xi', packet[11:24])
+            streams[serial] = dict(kind='audio', codec='vorbis', rate=rate)
+            if bitrate > 0:
+                streams[serial]['bitrate'] = bitrate // 1000
+        elif packet[:8] == 'OpusHead':
+            pre_skip = struct.unpack('<H', packet[10:12])[0]
+            streams[serial] = dict(kind='audio', codec='opus', rate=48000,
+                                   skip=pre_skip)
+        elif packet[:7] == '\x80theora':
+            pic_w = struct.unpack('>I', '\0' + packet[14:17])[0]
+            pic_h = struct.unpack('>I', '\0' + packet[17:20])[0]
+            fps_n, fps_d = struct.unpack('>II', packet[22:30])
+            shift = ((ord(packet[40]) & 0x03) << 3) | (ord(packet[41]) >> 5)
+            streams[serial] = dict(kind='video', codec='theora',
+                                   width=pic_w, height=pic_h,
+                                   fps=(fps_n, fps_d), shift=shift)
+        elif packet[:5] == '\x7fFLAC':
+            rate = struct.unpack('>I', packet[27:30] + '\0')[0] >> 12
+            streams[serial] = dict(kind='audio', codec='flac', rate=rate)
+    if not streams:
+        raise ProbeError('No supported Ogg streams found')
+
+    # The last granule position of each stream gives its length
+    f.seek(max(0, size - 65536))
+    for header_type, granule, serial, packet in _ogg_pages(f.read(65536)):
+        if serial in streams and granule > 0:
+            streams[serial]['granule'] = granule
+
+    info['container'] = 'ogg'
+    for stream in streams.itervalues():
+        granule = stream.get('granule')
+        if stream['kind'] == 'video':
+            info['video_codec'] = stream['codec']
+            info['width'] = stream['width']
+            info['height'] = stream['height']
+            if granule and stream['fps'][0] and not info['duration']:
+                shift = stream['shift']
+                frames = (granule >> shift) + (granule & ((1 << shift) - 1))
+                info['duration'] = \
+                    float(frames) * stream['fps'][1] / stream['fps'][0]
+        else:
+            info['audio_codec'] = stream['codec']
+            if granule and stream['rate']:
+                # Audio positions are exact, so they're preferred
+                info['duration'] = \
+                    float(granule - stream.get('skip', 0)) / stream['rate']
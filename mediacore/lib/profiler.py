@@ -0,0 +1,316 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Request Profiling
+
+When the ``profile`` config option is on, :class:`ProfilerMiddleware`
+times each request, and breaks the time down into:
+
+    sql
+        The number of statements run, their total time and the slowest
+        few, recorded by :class:`SQLTimingProxy` on the database engine.
+    render
+        The time spent rendering Genshi templates, recorded by
+        :func:`mediacore.lib.decorators.expose`.
+    url_for
+        The number of calls to :func:`mediacore.lib.helpers.url_for`.
+
+If ``debug`` is on as well, the breakdown is sent with each response in
+an ``X-MediaCore-Profile`` header.
+
+Each process keeps the recent timings of each route in memory, and saves
+them to ``profile`` in the ``cache_dir`` every few seconds. The admin's
+stats page merges the timings of every process and shows percentiles.
+
+The time measured is the time taken to produce the response, so a body
+that's streamed afterwards, like a media file, isn't included.
+
+"""
+import cPickle as pickle
+import math
+import os
+import threading
+import time
+
+from pylons import config
+from sqlalchemy.interfaces import ConnectionProxy
+
+from mediacore.lib.storage import write_atomic
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['ProfileStats', 'ProfilerMiddleware', 'RequestProfile',
+           'SQLTimingProxy', 'count_url_for', 'current', 'profile_stats',
+           'timed_render']
+
+_local = threading.local()
+
+def current():
+    """Return the :class:`RequestProfile` of the current request, or None
+    if it isn't being profiled."""
+    return getattr(_local, 'profile', None)
+
+def count_url_for():
+    """Count a call to :func:`mediacore.lib.helpers.url_for`."""
+    profile = getattr(_local, 'profile', None)
+    if profile is not None:
+        profile.url_for_calls += 1
+
+def timed_render(render, *args, **kwargs):
+    """Call a template render function, and time it if profiling."""
+    profile = getattr(_local, 'profile', None)
+    if profile is None:
+        return render(*args, **kwargs)
+    start = time.time()
+    try:
+        return render(*args, **kwargs)
+    finally:
+        profile.render_time += time.time() - start
+
+
+class RequestProfile(object):
+    """The timings of a single request.
+
+    :param keep_slowest: The number of the slowest SQL statements to keep.
+    """
+    def __init__(self, keep_slowest=5):
+        self.start = time.time()
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.slowest = []
+        self.render_time = 0.0
+        self.url_for_calls = 0
+        self.keep_slowest = keep_slowest
+
+    def add_sql(self, statement, seconds):
+        self.sql_count += 1
+        self.sql_time += seconds
+        if len(self.slowest) < self.keep_slowest \
+                or seconds > self.slowest[-1][0]:
+            self.slowest.append((seconds, statement))
+            self.slowest.sort(reverse=True)
+            del self.slowest[self.keep_slowest:]
+
+    def elapsed(self):
+        return time.time() - self.start
+
+    def header(self):
+        """Return a summary for the ``X-MediaCore-Profile`` header."""
+        return 'total=%.1fms; sql=%d/%.1fms; render=%.1fms; url_for=%d' % (
+            self.elapsed() * 1000, self.sql_count, self.sql_time * 1000,
+            self.render_time * 1000, self.url_for_calls)
+
+
+class SQLTimingProxy(ConnectionProxy):
+    """Time each statement run during a profiled request.
+
+    Pass an instance as the ``proxy`` argument when creating the engine.
+    """
+    def cursor_execute(self, execute, cursor, statement, parameters,
+                       context, executemany):
+        profile = getattr(_local, 'profile', None)
+        if profile is None:
+            return execute(cursor, statement, parameters, context)
+        start = time.time()
+        try:
+            return execute(cursor, statement, parameters, context)
+        finally:
+            profile.add_sql(statement, time.time() - start)
+
+
+class ProfileStats(object):
+    """Collect request timings by route, and summarize them.
+
+    :param stats_dir: The directory each process saves its timings in.
+        Defaults to ``profile`` in the ``cache_dir``.
+    :param max_samples: The number of recent requests to keep per route.
+    :param save_interval: Save at most this often, in seconds.
+    :param keep_slowest: The number of the slowest SQL statements to keep.
+    :param max_age: Delete the timings of processes which haven't saved
+        any for this many seconds, as they've most likely exited.
+
+    """
+    def __init__(self, stats_dir=None, max_samples=1000, save_interval=10.0,
+                 keep_slowest=20, max_age=86400):
+        self._stats_dir = stats_dir
+        self.max_samples = max_samples
+        self.save_interval = save_interval
+        self.keep_slowest = keep_slowest
+        self.max_age = max_age
+        self._routes = {}
+        self._slowest = []
+        self._saved = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stats_dir(self):
+        if self._stats_dir is None:
+            self._stats_dir = os.path.join(config['cache_dir'], 'profile')
+        return self._stats_dir
+
+    def record(self, route, profile):
+        """Add the timings of a finished request."""
+        sample = (profile.elapsed(), profile.sql_count, profile.sql_time,
+                  profile.render_time, profile.url_for_calls)
+        self._lock.acquire()
+        try:
+            samples = self._routes.setdefault(route, [])
+            samples.append(sample)
+            if len(samples) > self.max_samples:
+                del samples[:len(samples) - self.max_samples]
+            if profile.slowest:
+                self._slowest.extend([(seconds, statement, route)
+                    for seconds, statement in profile.slowest])
+                self._slowest.sort(reverse=True)
+                del self._slowest[self.keep_slowest:]
+            due = time.time() - self._saved >= self.save_interval
+        finally:
+            self._lock.release()
+        if due:
+            self.save()
+
+    def save(self):
+        """Save this process's timings for :meth:`summary` to read."""
+        self._lock.acquire()
+        try:
+            self._saved = time.time()
+            data = pickle.dumps((dict([(route, list(samples))
+                for route, samples in self._routes.iteritems()]),
+                list(self._slowest)), pickle.HIGHEST_PROTOCOL)
+        finally:
+            self._lock.release()
+        try:
+            if not os.path.isdir(self.stats_dir):
+                os.makedirs(self.stats_dir)
+            path = os.path.join(self.stats_dir, '%d.pickle' % os.getpid())
+            write_atomic(path, data)
+        except (IOError, OSError), e:
+            log.warn('Could not save profile stats: %s', e)
+
+    def summary(self):
+        """Merge the saved timings of every process and summarize them.
+
+        :returns: A list of dicts, one per route, sorted by total time
+            spent, and a list of the slowest SQL statements as
+            ``(seconds, statement, route)`` tuples.
+        """
+        self.save()
+        routes, slowest = {}, []
+        try:
+            names = os.listdir(self.stats_dir)
+        except OSError:
+            names = []
+        cutoff = time.time() - self.max_age
+        for name in names:
+            if not name.endswith('.pickle'):
+                continue
+            path = os.path.join(self.stats_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    # Left behind by a process that has exited
+                    os.remove(path)
+                    continue
+            except OSError:
+                continue
+            try:
+                f = open(path, 'rb')
+                try:
+                    process_routes, process_slowest = pickle.load(f)
+                finally:
+                    f.close()
+            except (IOError, EOFError, pickle.UnpicklingError):
+                continue
+            for route, samples in process_routes.iteritems():
+                routes.setdefault(route, []).extend(samples)
+            slowest.extend(process_slowest)
+        slowest.sort(reverse=True)
+        summary = [_summarize(route, samples)
+                   for route, samples in routes.iteritems()]
+        summary.sort(key=lambda s: s['total'], reverse=True)
+        return summary, slowest[:self.keep_slowest]
+
+    def clear(self):
+        """Forget the timings of every process."""
+        self._lock.acquire()
+        try:
+            self._routes, self._slowest = {}, []
+        finally:
+            self._lock.release()
+        if os.path.isdir(self.stats_dir):
+            for name in os.listdir(self.stats_dir):
+                try:
+                    os.remove(os.path.join(self.stats_dir, name))
+                except OSError:
+                    pass
+
+profile_stats = ProfileStats()
+
+def _percentile(values, percent):
+    """Return the nearest-rank percentile of a sorted list."""
+    index = int(math.ceil(percent / 100.0 * len(values))) - 1
+    return values[max(0, min(index, len(values) - 1))]
+
+def _summarize(route, samples):
+    n = len(samples)
+    totals = sorted([s[0] for s in samples])
+    return dict(
+        route = route,
+        count = n,
+        total = sum(totals),
+        p50 = _percentile(totals, 50),
+        p90 = _percentile(totals, 90),
+        p99 = _percentile(totals, 99),
+        sql_count = sum([s[1] for s in samples]) / float(n),
+        sql_time = sum([s[2] for s in samples]) / n,
+        render_time = sum([s[3] for s in samples]) / n,
+        url_for_calls = sum([s[4] for s in samples]) / float(n),
+    )
+
+
+class ProfilerMiddleware(object):
+    """Profile each request, see :mod:`mediacore.lib.profiler`.
+
+    :param stats: The :class:`ProfileStats` to record timings in.
+    :param header: Add the ``X-MediaCore-Profile`` header to responses.
+    """
+    def __init__(self, app, stats=None, header=False):
+        self.app = app
+        self.stats = stats or profile_stats
+        self.header = header
+
+    def __call__(self, environ, start_response):
+        profile = RequestProfile()
+        _local.profile = profile
+
+        def profiled_start_response(status, headers, exc_info=None):
+            if self.header:
+                headers = list(headers)
+                headers.append(('X-MediaCore-Profile', profile.header()))
+            return start_response(status, headers, exc_info)
+
+        try:
+            return self.app(environ, profiled_start_response)
+        finally:
+            _local.profile = None
+            self.stats.record(_route(environ), profile)
+
+def _route(environ):
+    routes = environ.get('pylons.routes_dict', None)
+    if not routes:
+        routes = environ.get('wsgiorg.routing_args', (None, {}))[1]
+    if routes and routes.get('controller'):
+        return '%s/%s' % (routes['controller'], routes.get('action'))
+    return 'unrouted'
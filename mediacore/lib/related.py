@@ -0,0 +1,624 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Related Media
+
+Each media item's most similar neighbours are stored in the
+``media_related`` table, so that the media view page can show them with
+one indexed query (see :meth:`mediacore.model.media.MediaQuery.related`).
+
+Two items are similar if they share tags or categories, the rarer the
+better, if they belong to the same podcast, or if their titles and
+subtitles have words in common. The score is symmetric, which lets
+:meth:`RelatedMedia.refresh` keep every item's list up to date after one
+item changes by scoring only that item against the media it has anything
+in common with.
+
+To find those media and score them without reading the whole library,
+the words of each title are kept in the ``media_title_words`` table and
+the number of media using each word in ``title_word_counts``. Tags and
+categories are counted from their indexed ``media_tags`` and
+``media_categories`` rows.
+
+The lists include unpublished media, which is filtered out when they are
+read, so that they don't need recalculating whenever something is
+published. Because rare tags count for more as the library grows, it's
+worth running ``paster rebuild-related-media`` now and then.
+
+"""
+import fcntl
+import math
+import os
+
+from pylons import config
+from sqlalchemy import sql
+from sqlalchemy.orm import attributes
+from sqlalchemy.orm.interfaces import SessionExtension
+
+from mediacore.lib.search import tokenize
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['RelatedMedia', 'RelatedMediaExtension', 'related_media']
+
+#: The longest word stored in ``media_title_words``.
+word_length = 50
+
+# Every media item has a row for this word, which no title contains, so
+# that its count in ``title_word_counts`` is the number of media.
+_counted = ''
+
+class _Features(object):
+    """The attributes of a media item which its similarity is based on."""
+    __slots__ = ('tags', 'categories', 'podcast_id', 'words', 'norm')
+
+    def __init__(self, podcast_id):
+        self.tags = set()
+        self.categories = set()
+        self.podcast_id = podcast_id
+        self.words = {}
+        self.norm = 0.0
+
+
+class _Library(object):
+    """Media features, with inverted maps for finding candidates.
+
+    The features may be of the whole library, or only of some media and of
+    everything they have in common with, in which case the number of media
+    and the number that use each tag, category and word must be given.
+    """
+
+    def __init__(self, features, count=None, tag_counts=None,
+                 category_counts=None, word_counts=None):
+        self.features = features
+        self.by_tag = {}
+        self.by_category = {}
+        self.by_podcast = {}
+        self.by_word = {}
+        for media_id, f in features.iteritems():
+            for tag_id in f.tags:
+                self.by_tag.setdefault(tag_id, set()).add(media_id)
+            for category_id in f.categories:
+                self.by_category.setdefault(category_id, set()).add(media_id)
+            if f.podcast_id is not None:
+                self.by_podcast.setdefault(f.podcast_id, set()).add(media_id)
+            for word in f.words:
+                self.by_word.setdefault(word, set()).add(media_id)
+
+        if count is None:
+            count = len(features)
+        def idf(postings, counts):
+            result = {}
+            for key, ids in postings.iteritems():
+                n = max((counts or {}).get(key, 0), len(ids))
+                result[key] = math.log(1.0 + float(max(count, n)) / n)
+            return result
+        self.tag_idf = idf(self.by_tag, tag_counts)
+        self.category_idf = idf(self.by_category, category_counts)
+        self.word_idf = idf(self.by_word, word_counts)
+
+        # Weight each title by TF-IDF for cosine similarity
+        for f in features.itervalues():
+            for word, tf in f.words.items():
+                f.words[word] = tf * self.word_idf[word]
+            f.norm = math.sqrt(sum([w * w for w in f.words.itervalues()]))
+
+
+class RelatedMedia(object):
+    """Calculate and store the most related media for each media item.
+
+    :param size: How many related items to store for each media item.
+    :param weights: A dict of weights for the ``tags``, ``categories``,
+        ``podcast`` and ``text`` similarity scores.
+    :param bind: The engine to run the updates with. Defaults to the
+        engine the :data:`~mediacore.model.meta.DBSession` is bound to.
+    :param lock_file: Defaults to ``related_media.lock`` in the
+        ``cache_dir`` config directory.
+
+    """
+    default_weights = {'tags': 1.0, 'categories': 0.5, 'podcast': 1.0,
+                       'text': 2.0}
+
+    def __init__(self, size=12, weights=None, bind=None, lock_file=None):
+        self.size = size
+        self.weights = dict(self.default_weights)
+        self.weights.update(weights or {})
+        self.bind = bind
+        self._lock_file = lock_file
+
+    @property
+    def lock_file(self):
+        if self._lock_file is None:
+            self._lock_file = os.path.join(config['cache_dir'],
+                                           'related_media.lock')
+        return self._lock_file
+
+    def scores(self, library, media_id):
+        """Score all media with anything in common with the given item.
+
+        :rtype: dict of related media IDs to their scores
+        """
+        f = library.features[media_id]
+        scores = {}
+        def add(ids, score):
+            for other_id in ids:
+                scores[other_id] = scores.get(other_id, 0.0) + score
+
+        weight = self.weights['tags']
+        for tag_id in f.tags:
+            add(library.by_tag[tag_id], weight * library.tag_idf[tag_id])
+        weight = self.weights['categories']
+        for category_id in f.categories:
+            add(library.by_category[category_id],
+                weight * library.category_idf[category_id])
+        if f.podcast_id is not None:
+            add(library.by_podcast[f.podcast_id], self.weights['podcast'])
+        if f.norm:
+            weight = self.weights['text'] / f.norm
+            for word, tfidf in f.words.iteritems():
+                for other_id in library.by_word[word]:
+                    other = library.features[other_id]
+                    scores[other_id] = scores.get(other_id, 0.0) \
+                        + weight * tfidf * other.words[word] / other.norm
+
+        scores.pop(media_id, None)
+        return scores
+
+    def top(self, scores):
+        """Return the best ``size`` of the given scores as a dict."""
+        best = sorted(scores.iteritems(), key=lambda s: (-s[1], s[0]))
+        return dict(best[:self.size])
+
+    def rebuild(self):
+        """Recalculate the related media of every item."""
+        self._locked(self._rebuild)
+
+    def _rebuild(self):
+        from mediacore.model.media import (media_related, media_title_words,
+            title_word_counts)
+        conn = (self.bind or self._default_bind()).connect()
+        try:
+            trans = conn.begin()
+            try:
+                features = self._load_features(conn)
+                conn.execute(media_title_words.delete())
+                conn.execute(title_word_counts.delete())
+                word_counts = {}
+                for media_id, f in features.iteritems():
+                    for word in f.words.keys() + [_counted]:
+                        word_counts[word] = word_counts.get(word, 0) + 1
+                    self._insert_words(conn, media_id, f.words)
+                if word_counts:
+                    conn.execute(title_word_counts.insert(), [
+                        {'word': word, 'media_count': count}
+                        for word, count in word_counts.iteritems()])
+
+                library = _Library(features)
+                conn.execute(media_related.delete())
+                rows = []
+                for media_id in library.features:
+                    for related_id, score in self.top(
+                            self.scores(library, media_id)).iteritems():
+                        rows.append({'media_id': media_id,
+                                     'related_id': related_id,
+                                     'score': score})
+                if rows:
+                    conn.execute(media_related.insert(), rows)
+                trans.commit()
+            except:
+                trans.rollback()
+                raise
+        finally:
+            conn.close()
+
+    def refresh(self, media_ids, stale_ids=()):
+        """Update the stored lists after the given media have changed.
+
+        Only the changed media and the media that they have anything in
+        common with are scored, and only their lists, and those of media
+        which already list them, are read and rewritten. Refreshes are
+        serialized with a lock file, so that two can't overwrite each
+        other's changes to the same list or word counts.
+
+        :param media_ids: IDs of media that were added, changed or deleted.
+        :param stale_ids: IDs of media whose lists must be recalculated in
+            full, for example because one of their neighbours was deleted.
+        """
+        self._locked(self._refresh, media_ids, stale_ids)
+
+    def _refresh(self, media_ids, stale_ids):
+        from mediacore.model.media import media_related
+        conn = (self.bind or self._default_bind()).connect()
+        try:
+            trans = conn.begin()
+            try:
+                existing = self._update_words(conn, media_ids)
+                media_ids = [id for id in media_ids if id in existing]
+                library = self._load_neighbours(conn,
+                                                set(media_ids) | set(stale_ids))
+                stale = set([id for id in stale_ids
+                             if id in library.features])
+                sources = set(media_ids) | stale
+                scores = dict([(id, self.scores(library, id))
+                               for id in media_ids])
+
+                affected = set(media_ids) | stale
+                for item_scores in scores.itervalues():
+                    affected.update(item_scores)
+                if media_ids:
+                    affected.update([row[0] for row in conn.execute(
+                        sql.select([media_related.c.media_id],
+                                   media_related.c.related_id.in_(media_ids)))])
+                lists = {}
+                if affected:
+                    for media_id, related_id, score in conn.execute(sql.select([
+                            media_related.c.media_id,
+                            media_related.c.related_id, media_related.c.score],
+                            media_related.c.media_id.in_(list(affected)))):
+                        lists.setdefault(media_id, {})[related_id] = score
+
+                changed = set()
+                for media_id in media_ids:
+                    self._refresh_one(lists, media_id, scores[media_id],
+                                      changed, stale)
+                if stale - sources:
+                    # Lists which lost an item need their neighbours too
+                    library = self._load_neighbours(conn, stale)
+                for media_id in stale:
+                    lists[media_id] = self.top(self.scores(library, media_id))
+                    changed.add(media_id)
+                self._write(conn, lists, changed)
+                trans.commit()
+            except:
+                trans.rollback()
+                raise
+        finally:
+            conn.close()
+
+    def _refresh_one(self, lists, media_id, scores, changed, stale):
+        lists[media_id] = self.top(scores)
+        changed.add(media_id)
+        # As scores are symmetric, this item's score against each other
+        # item is all that may have changed in the other item's list.
+        others = set(scores)
+        others.update([other_id for other_id, other in lists.iteritems()
+                       if media_id in other])
+        others.discard(media_id)
+        for other_id in others:
+            other = lists.setdefault(other_id, {})
+            score = scores.get(other_id, 0.0)
+            was_full = len(other) >= self.size
+            old_score = other.pop(media_id, None)
+            if score and (len(other) < self.size or score > min(other.values())):
+                other[media_id] = score
+                if len(other) > self.size:
+                    del other[min(other, key=lambda k: (other[k], -k))]
+            elif old_score is not None and was_full:
+                # It dropped out of a full list; the next best is unknown
+                stale.add(other_id)
+            if old_score != other.get(media_id, None):
+                changed.add(other_id)
+
+    def _locked(self, func, *args):
+        lock_dir = os.path.dirname(self.lock_file)
+        if not os.path.isdir(lock_dir):
+            try:
+                os.makedirs(lock_dir)
+            except OSError:
+                if not os.path.isdir(lock_dir):
+                    raise
+        lock_file = open(self.lock_file, 'w')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                return func(*args)
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+    def _write(self, conn, lists, changed):
+        from mediacore.model.media import media_related
+        if not changed:
+            return
+        changed = list(changed)
+        conn.execute(media_related.delete(
+            media_related.c.media_id.in_(changed)))
+        rows = []
+        for media_id in changed:
+            for related_id, score in lists.get(media_id, {}).iteritems():
+                rows.append({'media_id': media_id, 'related_id': related_id,
+                             'score': score})
+        if rows:
+            conn.execute(media_related.insert(), rows)
+
+    def _load_features(self, conn):
+        """Return the features of every media item, with its title's
+        words counted but not weighted."""
+        from mediacore.model.media import media, media_tags, media_categories
+        features = {}
+        for id, podcast_id, title, subtitle in conn.execute(sql.select([
+                media.c.id, media.c.podcast_id, media.c.title,
+                media.c.subtitle])):
+            f = features[id] = _Features(podcast_id)
+            f.words = _title_words(title, subtitle)
+        for media_id, tag_id in conn.execute(sql.select([
+                media_tags.c.media_id, media_tags.c.tag_id])):
+            if media_id in features:
+                features[media_id].tags.add(tag_id)
+        for media_id, category_id in conn.execute(sql.select([
+                media_categories.c.media_id, media_categories.c.category_id])):
+            if media_id in features:
+                features[media_id].categories.add(category_id)
+        return features
+
+    def _load_neighbours(self, conn, media_ids):
+        """Return a :class:`_Library` of the given media, and of the media
+        with any tag, category, podcast or word in common with them.
+
+        Every query is on an indexed column. The given media are loaded in
+        full, so they can be scored; their neighbours only with what's
+        needed to score them against the given media.
+        """
+        from mediacore.model.media import (media, media_tags,
+            media_categories, media_title_words, title_word_counts)
+        features = {}
+        if media_ids:
+            for id, podcast_id in conn.execute(sql.select(
+                    [media.c.id, media.c.podcast_id],
+                    media.c.id.in_(list(media_ids)))):
+                features[id] = _Features(podcast_id)
+        if not features:
+            return _Library(features)
+        sources = dict(features)
+
+        # Everything the given media have in common with others
+        tag_ids, category_ids, podcast_ids, words = set(), set(), set(), set()
+        for media_id, tag_id in conn.execute(sql.select(
+                [media_tags.c.media_id, media_tags.c.tag_id],
+                media_tags.c.media_id.in_(sources.keys()))):
+            tag_ids.add(tag_id)
+        for media_id, category_id in conn.execute(sql.select(
+                [media_categories.c.media_id, media_categories.c.category_id],
+                media_categories.c.media_id.in_(sources.keys()))):
+            category_ids.add(category_id)
+        for f in sources.itervalues():
+            if f.podcast_id is not None:
+                podcast_ids.add(f.podcast_id)
+        for media_id, word in conn.execute(sql.select(
+                [media_title_words.c.media_id, media_title_words.c.word],
+                sql.and_(media_title_words.c.media_id.in_(sources.keys()),
+                         media_title_words.c.word != _counted))):
+            words.add(word)
+
+        # The media which share them, and the shared tags and categories
+        tags, categories, candidates = [], [], set()
+        if tag_ids:
+            tags = conn.execute(sql.select(
+                [media_tags.c.media_id, media_tags.c.tag_id],
+                media_tags.c.tag_id.in_(list(tag_ids)))).fetchall()
+            candidates.update([row[0] for row in tags])
+        if category_ids:
+            categories = conn.execute(sql.select(
+                [media_categories.c.media_id, media_categories.c.category_id],
+                media_categories.c.category_id.in_(list(category_ids)))
+            ).fetchall()
+            candidates.update([row[0] for row in categories])
+        if words:
+            candidates.update([row[0] for row in conn.execute(sql.select(
+                [media_title_words.c.media_id],
+                media_title_words.c.word.in_(list(words))))])
+        candidates.difference_update(sources)
+        if podcast_ids:
+            for id, podcast_id in conn.execute(sql.select(
+                    [media.c.id, media.c.podcast_id],
+                    media.c.podcast_id.in_(list(podcast_ids)))):
+                if id not in features:
+                    features[id] = _Features(podcast_id)
+                candidates.discard(id)
+        # Words may outlive deleted media until they're refreshed
+        if candidates:
+            for id, podcast_id in conn.execute(sql.select(
+                    [media.c.id, media.c.podcast_id],
+                    media.c.id.in_(list(candidates)))):
+                features[id] = _Features(podcast_id)
+
+        for media_id, tag_id in tags:
+            if media_id in features:
+                features[media_id].tags.add(tag_id)
+        for media_id, category_id in categories:
+            if media_id in features:
+                features[media_id].categories.add(category_id)
+        all_words = set([_counted])
+        for media_id, word, count in conn.execute(sql.select(
+                [media_title_words.c.media_id, media_title_words.c.word,
+                 media_title_words.c.count],
+                sql.and_(media_title_words.c.media_id.in_(features.keys()),
+                         media_title_words.c.word != _counted))):
+            if media_id in features:
+                features[media_id].words[word] = count
+                all_words.add(word)
+        word_counts = dict(list(conn.execute(sql.select(
+            [title_word_counts.c.word, title_word_counts.c.media_count],
+            title_word_counts.c.word.in_(list(all_words))))))
+
+        tag_counts, category_counts = {}, {}
+        for counts, rows in ((tag_counts, tags), (category_counts, categories)):
+            for media_id, key in rows:
+                counts[key] = counts.get(key, 0) + 1
+        return _Library(features, word_counts.pop(_counted, 0), tag_counts,
+                        category_counts, word_counts)
+
+    def _update_words(self, conn, media_ids):
+        """Store the words of the given media's titles, and update the
+        number of media that use each word.
+
+        :returns: The IDs of the given media that still exist.
+        """
+        from mediacore.model.media import (media, media_title_words,
+            title_word_counts)
+        media_ids = list(media_ids)
+        if not media_ids:
+            return set()
+        new = {}
+        for id, title, subtitle in conn.execute(sql.select(
+                [media.c.id, media.c.title, media.c.subtitle],
+                media.c.id.in_(media_ids))):
+            new[id] = _title_words(title, subtitle)
+            new[id][_counted] = 0
+        old = {}
+        for media_id, word, count in conn.execute(sql.select(
+                [media_title_words.c.media_id, media_title_words.c.word,
+                 media_title_words.c.count],
+                media_title_words.c.media_id.in_(media_ids))):
+            old.setdefault(media_id, {})[word] = count
+
+        deltas, changed = {}, []
+        for media_id in media_ids:
+            before, after = old.get(media_id, {}), new.get(media_id, {})
+            if before == after:
+                continue
+            changed.append(media_id)
+            for word in before:
+                if word not in after:
+                    deltas[word] = deltas.get(word, 0) - 1
+            for word in after:
+                if word not in before:
+                    deltas[word] = deltas.get(word, 0) + 1
+        if changed:
+            conn.execute(media_title_words.delete(
+                media_title_words.c.media_id.in_(changed)))
+            for media_id in changed:
+                if media_id in new:
+                    self._insert_words(conn, media_id, new[media_id])
+
+        deltas = dict([(w, d) for w, d in deltas.iteritems() if d])
+        if deltas:
+            counts = dict(list(conn.execute(sql.select(
+                [title_word_counts.c.word, title_word_counts.c.media_count],
+                title_word_counts.c.word.in_(deltas.keys())))))
+            inserts, updates, deletes = [], [], []
+            for word, delta in deltas.iteritems():
+                count = counts.get(word, 0) + delta
+                if count <= 0:
+                    if word in counts:
+                        deletes.append(word)
+                elif word in counts:
+                    updates.append({'w': word, 'media_count': count})
+                else:
+                    inserts.append({'word': word, 'media_count': count})
+            if deletes:
+                conn.execute(title_word_counts.delete(
+                    title_word_counts.c.word.in_(deletes)))
+            if updates:
+                conn.execute(title_word_counts.update(
+                    title_word_counts.c.word == sql.bindparam('w')), updates)
+            if inserts:
+                conn.execute(title_word_counts.insert(), inserts)
+        return set(new)
+
+    def _insert_words(self, conn, media_id, words):
+        from mediacore.model.media import media_title_words
+        rows = [{'media_id': media_id, 'word': word, 'count': count}
+                for word, count in words.iteritems()]
+        if _counted not in words:
+            rows.append({'media_id': media_id, 'word': _counted, 'count': 0})
+        conn.execute(media_title_words.insert(), rows)
+
+    def _default_bind(self):
+        from mediacore.model.meta import DBSession
+        return DBSession.bind
+
+
+def _title_words(title, subtitle):
+    """Count the words in a title and subtitle."""
+    words = {}
+    for word in tokenize(title) + tokenize(subtitle):
+        word = word[:word_length]
+        words[word] = words.get(word, 0) + 1
+    return words
+
+
+class RelatedMediaExtension(SessionExtension):
+    """Refresh the related media lists after media is saved.
+
+    Media is refreshed when it is added or deleted, or when any of the
+    attributes that its similarity is based on are changed. Unless jobs
+    are run inline, this is done by a ``media.refresh_related`` job which
+    is queued in the same transaction as the changes.
+    """
+    _key = '_related_media_ids'
+
+    #: Media attributes which the similarity scores depend on.
+    attrs = ('title', 'subtitle', 'podcast_id', 'podcast', 'tags',
+             'categories')
+
+    def before_flush(self, session, flush_context, instances):
+        # The lists which include deleted media are cascade deleted in the
+        # flush, so note which lists will need topping up beforehand.
+        from mediacore.model import Media
+        from mediacore.model.media import media_related
+        deleted = [obj.id for obj in session.deleted
+                   if isinstance(obj, Media) and obj.id is not None]
+        if deleted:
+            ids, stale = session.__dict__.setdefault(self._key, (set(), set()))
+            rows = session.execute(sql.select([media_related.c.media_id],
+                media_related.c.related_id.in_(deleted)))
+            stale.update([row[0] for row in rows])
+
+    def after_flush(self, session, flush_context):
+        from mediacore.model import Media
+        ids, stale = session.__dict__.setdefault(self._key, (set(), set()))
+        for obj in list(session.new) + list(session.deleted):
+            if isinstance(obj, Media):
+                ids.add(obj.id)
+        for obj in session.dirty:
+            if isinstance(obj, Media) and self._changed(obj):
+                ids.add(obj.id)
+
+    def _changed(self, obj):
+        for attr in self.attrs:
+            added, unchanged, deleted = \
+                attributes.get_history(obj, attr, passive=True)
+            if added or deleted:
+                return True
+        return False
+
+    def before_commit(self, session):
+        from mediacore.lib.jobs import enqueue, runs_inline
+        if runs_inline():
+            return
+        # Flush first, so that every change is noted before queueing the
+        # job, which the commit then flushes along with everything else.
+        session.flush()
+        ids, stale = session.__dict__.pop(self._key, (None, None))
+        if ids or stale:
+            enqueue('media.refresh_related', media_ids=sorted(ids),
+                    stale_ids=sorted(stale))
+
+    def after_commit(self, session):
+        ids, stale = session.__dict__.pop(self._key, (None, None))
+        if ids or stale:
+            try:
+                related_media.refresh(ids, stale)
+            except Exception, e:
+                log.exception('Failed to refresh related media: %s', e)
+
+    def after_rollback(self, session):
+        session.__dict__.pop(self._key, None)
+
+
+related_media = RelatedMedia()
@@ -0,0 +1,337 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Response Caching
+
+The public listing pages only change when something is published, edited
+or commented on, yet each hit re-runs several ordered queries and renders
+a Genshi template. :func:`mediacore.lib.decorators.cache_response` stores
+the rendered output in the Beaker cache from
+:class:`mediacore.lib.app_globals.Globals` instead.
+
+Every cached page depends on one or more *tags*, such as ``media`` or
+``comments``. :class:`ResponseCacheExtension` notes which tags are touched
+whenever a :class:`~mediacore.model.media.Media`, ``Category``, ``Podcast``,
+``Comment`` etc. is flushed, and bumps their versions once the transaction
+commits. A cached page built from an older version of any of its tags is
+never served again. Tag versions are kept in small stamp files in the
+``cache_dir`` so that all processes see each invalidation.
+
+The extension also maintains a ``media_status`` tag, which changes only
+when media is added, removed, (un)published or re-filed, and which
+:mod:`mediacore.model.counts` uses to decide when to recount.
+
+Media whose ``publish_on`` or ``publish_until`` date is still to come
+change the listings without any database write, so cached pages also
+expire no later than the next such date.
+
+"""
+import hashlib
+import os
+import threading
+import time
+from datetime import datetime
+
+from paste.deploy.converters import asbool
+from pylons import app_globals, config, request, response
+from sqlalchemy import sql
+from sqlalchemy.orm import attributes
+from sqlalchemy.orm.interfaces import SessionExtension
+
+from mediacore.lib.storage import write_atomic
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['ResponseCache', 'ResponseCacheExtension', 'TagVersions',
+           'next_publish_boundary', 'response_cache']
+
+class TagVersions(object):
+    """Track the current version of each cache tag across processes.
+
+    A tag's version is an opaque token stored in ``<tag>.stamp`` within
+    ``stamp_dir``. Each process re-reads a tag's stamp at most once per
+    ``check_interval`` seconds.
+
+    :param stamp_dir: Defaults to ``response_tags`` in the ``cache_dir``.
+        If no ``cache_dir`` is configured, versions are only tracked
+        within this process.
+    :param check_interval: Minimum number of seconds between reads.
+
+    """
+    def __init__(self, stamp_dir=None, check_interval=1.0):
+        self._stamp_dir = stamp_dir
+        self.check_interval = check_interval
+        self._versions = {}
+        self._checked = {}
+        self._counter = 0
+        self._lock = threading.Lock()
+
+    @property
+    def stamp_dir(self):
+        if self._stamp_dir is None:
+            cache_dir = config.get('cache_dir', None)
+            if not cache_dir:
+                return None
+            self._stamp_dir = os.path.join(cache_dir, 'response_tags')
+        return self._stamp_dir
+
+    def get(self, tag):
+        """Return the current version token for the given tag."""
+        stamp_dir = self.stamp_dir
+        if stamp_dir is None:
+            return self._versions.get(tag, '')
+        now = time.time()
+        if now - self._checked.get(tag, 0) >= self.check_interval:
+            try:
+                stamp = open(os.path.join(stamp_dir, tag + '.stamp'))
+                try:
+                    self._versions[tag] = stamp.read()
+                finally:
+                    stamp.close()
+            except IOError:
+                self._versions[tag] = ''
+            self._checked[tag] = now
+        return self._versions[tag]
+
+    def invalidate(self, *tags):
+        """Give each of the given tags a new, never before used version."""
+        stamp_dir = self.stamp_dir
+        if stamp_dir is not None and not os.path.isdir(stamp_dir):
+            try:
+                os.makedirs(stamp_dir)
+            except OSError:
+                # Another process may have just created it
+                if not os.path.isdir(stamp_dir):
+                    raise
+        for tag in tags:
+            self._lock.acquire()
+            try:
+                self._counter += 1
+                version = '%d-%d-%f' % (os.getpid(), self._counter, time.time())
+            finally:
+                self._lock.release()
+            self._versions[tag] = version
+            self._checked[tag] = time.time()
+            if stamp_dir is None:
+                continue
+            write_atomic(os.path.join(stamp_dir, tag + '.stamp'), version)
+
+
+class ResponseCache(object):
+    """Store and serve the rendered output of public pages.
+
+    Responses are keyed on the requested URL, its normalized query
+    parameters, and whether or not the user is logged in. Requests from
+    administrators always bypass the cache, so that they see their
+    changes immediately, as do any requests other than GET and HEAD.
+
+    These config options are respected:
+
+        response_cache_enabled
+            Set to false to disable caching altogether.
+        response_cache_expire
+            The maximum number of seconds to keep a page, 300 by default.
+
+    :param tag_versions: A :class:`TagVersions` instance.
+
+    """
+    namespace = 'mediacore.responses'
+
+    #: Tags that every cached page depends on.
+    default_tags = ('settings',)
+
+    def __init__(self, tag_versions=None):
+        self.tag_versions = tag_versions or TagVersions()
+
+    def invalidate(self, *tags):
+        """Discard all cached pages that depend on any of the given tags."""
+        self.tag_versions.invalidate(*tags)
+
+    def cacheable(self):
+        """Return True if the current request may be served from the cache."""
+        if not asbool(config.get('response_cache_enabled', True)):
+            return False
+        if request.method not in ('GET', 'HEAD'):
+            return False
+        from mediacore.lib.helpers import is_admin
+        return not is_admin()
+
+    def key(self):
+        """Return the cache key for the current request."""
+        params = [(k, v) for k, v in request.GET.iteritems() if v]
+        params.sort()
+        identified = 'repoze.who.identity' in request.environ
+        raw = repr((request.host_url, request.script_name, request.path_info,
+                    params, identified, request.is_xhr))
+        return hashlib.md5(raw).hexdigest()
+
+    def get_or_render(self, tags, render):
+        """Return the cached output for this request or else call ``render``.
+
+        :param tags: The tags that the rendered output depends on.
+        :param render: A callable which returns the response body.
+        :returns: The response body.
+
+        """
+        if not self.cacheable():
+            return render()
+
+        tags = tuple(self.default_tags) + tuple(tags)
+        versions = [self.tag_versions.get(tag) for tag in tags]
+        key = self.key()
+        cache = app_globals.cache.get_cache(self.namespace)
+        now = time.time()
+
+        try:
+            expires, stored_versions, content_type, body = cache.get(key)
+        except KeyError:
+            pass
+        else:
+            if expires > now and stored_versions == versions:
+                response.headers['Content-Type'] = content_type
+                return body
+
+        body = render()
+
+        # Only plain, successful responses that are the same for everybody
+        if isinstance(body, basestring) \
+        and response.status_int == 200 \
+        and 'Set-Cookie' not in response.headers:
+            expire = self.expire_time(datetime.now())
+            cache.put(key, (now + expire, versions,
+                            response.headers['Content-Type'], body),
+                      expiretime=expire)
+        return body
+
+    def expire_time(self, now):
+        """Return the number of seconds a page rendered ``now`` may be kept.
+
+        This is ``response_cache_expire``, unless a media item is scheduled
+        to be published or unpublished sooner than that.
+        """
+        expire = int(config.get('response_cache_expire', 300))
+        boundary = next_publish_boundary(now)
+        if boundary is not None:
+            delta = boundary - now
+            seconds = delta.days * 86400 + delta.seconds + 1
+            expire = max(1, min(expire, seconds))
+        return expire
+
+
+def next_publish_boundary(now, podcast_id=None):
+    """Return the next time that a scheduled media item enters or leaves
+    the published listings, or ``None`` if none are scheduled.
+
+    :param now: The current time.
+    :type now: :class:`datetime.datetime`
+    :param podcast_id: Only consider the episodes of this podcast.
+    :rtype: :class:`datetime.datetime` or ``None``
+    """
+    from mediacore.model.meta import DBSession
+    from mediacore.model.media import Media
+
+    query = DBSession.query(
+        sql.func.min(sql.case([(Media.publish_on > now, Media.publish_on)])),
+        sql.func.min(sql.case([(Media.publish_until > now, Media.publish_until)])),
+    ).filter(Media.publishable == True)
+    if podcast_id is not None:
+        query = query.filter(Media.podcast_id == podcast_id)
+    next_on, next_until = query.one()
+
+    boundaries = [b for b in (next_on, next_until) if b is not None]
+    return boundaries and min(boundaries) or None
+
+
+class ResponseCacheExtension(SessionExtension):
+    """Invalidate cached responses when the objects they show are saved.
+
+    The tags touched by each flush are collected until the transaction is
+    committed, then invalidated. Invalidating any earlier would let
+    another request cache a page built from the old, still visible, rows.
+    """
+    _model_tags = None
+
+    def _tags_for(self, obj):
+        if self._model_tags is None:
+            from mediacore.model import (Media, MediaFile, Tag, Category,
+                Podcast, Comment, Setting)
+            ResponseCacheExtension._model_tags = [
+                (Media, 'media'),
+                (MediaFile, 'media'),
+                (Tag, 'media'),
+                (Category, 'categories'),
+                (Podcast, 'podcasts'),
+                (Comment, 'comments'),
+                (Setting, 'settings'),
+            ]
+        return [tag for cls, tag in self._model_tags if isinstance(obj, cls)]
+
+    #: Media attributes which affect the stored published media counts.
+    media_status_attrs = ('publishable', 'publish_on', 'publish_until',
+                          'podcast_id', 'podcast', 'tags', 'categories')
+
+    def _changes_status(self, obj, dirty=False):
+        """Return True if flushing the given object may change which media is
+        published where, and so the ``media_status`` tag must be invalidated.
+        """
+        from mediacore.model import Media, Category
+        if isinstance(obj, Category):
+            return True
+        if not isinstance(obj, Media):
+            return False
+        if not dirty:
+            return True
+        for attr in self.media_status_attrs:
+            added, unchanged, deleted = \
+                attributes.get_history(obj, attr, passive=True)
+            if added or deleted:
+                return True
+        return False
+
+    def after_flush(self, session, flush_context):
+        # The new, dirty and deleted lists still reflect the pre-flush state
+        pending = session.__dict__.setdefault('_response_cache_tags', set())
+        for obj in session.new:
+            pending.update(self._tags_for(obj))
+            if self._changes_status(obj):
+                pending.add('media_status')
+        for obj in session.deleted:
+            pending.update(self._tags_for(obj))
+            if self._changes_status(obj):
+                pending.add('media_status')
+        for obj in session.dirty:
+            if session.is_modified(obj):
+                pending.update(self._tags_for(obj))
+                if self._changes_status(obj, dirty=True):
+                    pending.add('media_status')
+
+    def after_commit(self, session):
+        pending = session.__dict__.pop('_response_cache_tags', None)
+        if pending:
+            # The data is already committed, so failing here would only
+            # turn the response into an error and stop the extensions
+            # after this one from running.
+            try:
+                response_cache.invalidate(*pending)
+            except Exception:
+                log.exception('Invalidating the cache tags %s failed',
+                              ', '.join(sorted(pending)))
+
+    def after_rollback(self, session):
+        session.__dict__.pop('_response_cache_tags', None)
+
+
+response_cache = ResponseCache()
@@ -0,0 +1,770 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+XHTML Sanitizer
+
+A faster replacement for running :class:`mediacore.lib.htmlsanitizer.Cleaner`
+over user input, used by :func:`mediacore.lib.helpers.clean_xhtml`.
+
+The Cleaner builds a BeautifulSoup tree, then makes a dozen passes over it
+with ``find`` calls that each walk the tree from the top, and
+:func:`~mediacore.lib.helpers.clean_xhtml` does all of this twice because
+renaming tags can leave invalid nesting behind. The plain text version of
+the result is then made by parsing it with BeautifulSoup once more.
+
+:class:`Sanitizer` gives the same output with none of that:
+
+    1. The input is tokenized once, and the tokens are fed to a tag stack
+       that follows BeautifulSoup's nesting rules, building a light tree.
+    2. The Cleaner's filters are applied to the tree, in the same order,
+       mostly fused into a couple of walks.
+    3. Instead of rendering the tree and parsing it again to fix the
+       nesting, the tree is walked and fed straight back into a fresh tag
+       stack, and the filters are applied again.
+    4. A single walk over the result renders the XHTML and the plain text
+       version that :func:`~mediacore.lib.helpers.xhtml_to_plain` returns.
+
+Results are kept in a cache keyed by the SHA-1 digest of the input, so
+saving a description or comment that hasn't changed costs nothing.
+
+The quirks of the Cleaner are kept on purpose, so that the output is the
+same as before, including the ones that are arguably wrong: for example,
+``rel="nofollow"`` is added to links and then stripped again because it
+isn't a valid attribute. ``mediacore/tests/sanitizer_corpus.txt`` is run
+through both, see :mod:`mediacore.tests.test_sanitizer`.
+
+"""
+import hashlib
+import re
+import sgmllib
+from htmlentitydefs import name2codepoint
+
+from mediacore.lib.htmlsanitizer import (URL_RE,
+    block_elements as default_block_elements,
+    valid_schemes as default_valid_schemes)
+
+__all__ = ['Sanitizer']
+
+# The tag nesting rules of BeautifulSoup.BeautifulSoup
+_self_closing_tags = dict.fromkeys(
+    'br hr input img meta spacer link frame base col'.split())
+_preserve_whitespace_tags = dict.fromkeys('pre textarea'.split())
+_quote_tags = dict.fromkeys('script textarea'.split())
+_nestable_tags = {
+    'ol': [], 'ul': [], 'li': ['ul', 'ol'],
+    'dl': [], 'dd': ['dl'], 'dt': ['dl'],
+    'table': [], 'tr': ['table', 'tbody', 'tfoot', 'thead'],
+    'td': ['tr'], 'th': ['tr'],
+    'thead': ['table'], 'tbody': ['table'], 'tfoot': ['table'],
+}
+for _name in 'span font q object bdo sub sup center'.split() \
+        + 'blockquote div fieldset ins del'.split():
+    _nestable_tags[_name] = []
+_reset_nesting_tags = dict.fromkeys(
+    'blockquote div fieldset ins del noscript address form p pre'.split()
+    + _nestable_tags.keys())
+for _name in 'span font q object bdo sub sup center'.split():
+    del _reset_nesting_tags[_name]
+
+_markup_massage = [
+    (re.compile('(<[^<>]*)/>'), lambda m: m.group(1) + ' />'),
+    (re.compile('<!\s+([^<>]*)>'), lambda m: '<!' + m.group(1) + '>'),
+]
+_xml_entities = {'apos': u"'", 'quot': u'"', 'amp': u'&', 'lt': u'<',
+                 'gt': u'>'}
+_attr_entity = re.compile('&(#\d+|#x[0-9a-fA-F]+|\w+);')
+_bare_ampersand_or_bracket = re.compile(
+    '([<>]|&(?!#\d+;|#x[0-9a-fA-F]+;|\w+;))')
+_attr_escapes = {'<': '&lt;', '>': '&gt;', '&': '&amp;'}
+_ascii_spaces = {9: None, 10: None, 12: None, 13: None, 32: None}
+
+# The whitespace handling of the Cleaner and clean_xhtml
+_any_space = re.compile('\s+', re.M)
+_start_space = re.compile('^\s+')
+_ascii_space_chars = ' \t\n\r\f\v'
+_word_end = re.compile('\W')
+_blank_line = re.compile('\s*\n\s*\n\s*', re.M)
+_block_tags = dict.fromkeys('p br pre blockquote div h1 h2 h3 h4 h5 h6 hr '
+                            'ul ol li form table tr td tbody thead'.split())
+
+
+class _Tag(object):
+    """An element in the tree built by :class:`_TreeBuilder`."""
+    __slots__ = ('name', 'attrs', 'contents', 'self_closing')
+
+    def __init__(self, name, attrs=None, contents=None, self_closing=False):
+        self.name = name
+        self.attrs = attrs or []
+        self.contents = contents or []
+        self.self_closing = self_closing
+
+
+class _Raw(unicode):
+    """Markup to output as it is, such as an empty comment in a ``<pre>``.
+
+    BeautifulSoup leaves empty comments alone, because its ``findAll`` skips
+    them, so unlike other comments they're never escaped into text.
+    """
+
+
+class _TreeBuilder(sgmllib.SGMLParser):
+    """Build a tree of :class:`_Tag` and unicode text nodes.
+
+    This is the parsing half of ``BeautifulSoup.BeautifulSoup``, with
+    entities converted as ``convertEntities=ALL_ENTITIES`` would. Comments,
+    CDATA sections, declarations and processing instructions become text
+    nodes of their source, as the Cleaner's ``clean_whitespace`` filter
+    would turn them into in any case.
+    """
+    def reset(self):
+        sgmllib.SGMLParser.reset(self)
+        self.root = _Tag(u'[document]')
+        self.tag_stack = [self.root]
+        self.current = self.root
+        self.current_data = []
+        self.quote_stack = []
+
+    def build(self, markup):
+        """Parse the markup, and return the root of the tree."""
+        for fix, m in _markup_massage:
+            markup = fix.sub(m, markup)
+        self.reset()
+        # Like BeautifulSoup, don't close(): anything left unparsed at
+        # the end, such as an unterminated tag, is dropped.
+        self.feed(markup)
+        self.end_data()
+        return self.root
+
+    def push_tag(self, tag):
+        self.current.contents.append(tag)
+        self.tag_stack.append(tag)
+        self.current = tag
+
+    def pop_tag(self):
+        self.tag_stack.pop()
+        self.current = self.tag_stack[-1]
+
+    def end_data(self, markup=None):
+        if not self.current_data:
+            return
+        data = u''.join(self.current_data)
+        self.current_data = []
+        if not data.translate(_ascii_spaces):
+            for tag in self.tag_stack:
+                if tag.name in _preserve_whitespace_tags:
+                    break
+            else:
+                if '\n' in data:
+                    data = u'\n'
+                else:
+                    data = u' '
+        if markup is not None:
+            if data:
+                data = markup % data
+            else:
+                data = _Raw(markup % data)
+        self.current.contents.append(data)
+
+    def pop_to_tag(self, name, inclusive=True):
+        stack = self.tag_stack
+        pops = 0
+        for i in range(len(stack) - 1, 0, -1):
+            if name == stack[i].name:
+                pops = len(stack) - i
+                break
+        if not inclusive:
+            pops -= 1
+        for i in range(pops):
+            self.pop_tag()
+
+    def smart_pop(self, name):
+        """Close open tags that can't contain this one, see
+        ``BeautifulSoup.BeautifulStoneSoup._smartPop``."""
+        reset_triggers = _nestable_tags.get(name)
+        nestable = reset_triggers is not None
+        reset_nesting = name in _reset_nesting_tags
+        stack = self.tag_stack
+        for i in range(len(stack) - 1, 0, -1):
+            p = stack[i]
+            if p.name == name and not nestable:
+                self.pop_to_tag(name)
+                return
+            if (reset_triggers is not None and p.name in reset_triggers) \
+                    or (reset_triggers is None and reset_nesting
+                        and p.name in _reset_nesting_tags):
+                self.pop_to_tag(p.name, False)
+                return
+
+    def start_tag(self, name, attrs):
+        if self.quote_stack:
+            # Not a real tag, we're inside a <script> or <textarea>
+            attrs = ''.join([' %s="%s"' % (x, y) for x, y in attrs])
+            self.current_data.append(u'<%s%s>' % (name, attrs))
+            return
+        self.end_data()
+        self_closing = name in _self_closing_tags
+        if not self_closing:
+            self.smart_pop(name)
+        tag = _Tag(name, [(key, _convert_attr(value))
+                          for key, value in attrs], [], self_closing)
+        if self_closing:
+            self.current.contents.append(tag)
+        else:
+            self.push_tag(tag)
+        if name in _quote_tags:
+            self.quote_stack.append(name)
+            self.literal = 1
+
+    def end_tag(self, name):
+        if self.quote_stack and self.quote_stack[-1] != name:
+            self.current_data.append(u'</%s>' % name)
+            return
+        self.end_data()
+        self.pop_to_tag(name)
+        if self.quote_stack and self.quote_stack[-1] == name:
+            self.quote_stack.pop()
+            self.literal = len(self.quote_stack) > 0
+
+    # SGMLParser looks for start_* and end_* methods first, there are none
+    def finish_starttag(self, tag, attrs):
+        self.start_tag(tag, attrs)
+        return -1
+
+    def finish_endtag(self, tag):
+        self.end_tag(tag)
+
+    def handle_data(self, data):
+        self.current_data.append(data)
+
+    def handle_charref(self, ref):
+        self.current_data.append(unichr(int(ref)))
+
+    def handle_entityref(self, ref):
+        if ref in name2codepoint:
+            data = unichr(name2codepoint[ref])
+        elif ref in _xml_entities:
+            data = _xml_entities[ref]
+        else:
+            # An unknown entity, or more likely a stray ampersand
+            data = u'&amp;%s' % ref
+        self.current_data.append(data)
+
+    def _markup(self, data, markup):
+        self.end_data()
+        self.current_data.append(data)
+        self.end_data(markup)
+
+    def handle_comment(self, data):
+        self._markup(data, u'<!--%s-->')
+
+    def handle_decl(self, data):
+        self._markup(data, u'<!%s>')
+
+    def handle_pi(self, data):
+        if data[:3] == 'xml':
+            data = u"xml version='1.0' encoding='utf-8'"
+        self._markup(data.replace('%SOUP-ENCODING%', 'utf-8'), u'<?%s?>')
+
+    def parse_declaration(self, i):
+        if self.rawdata[i:i+9] == '<![CDATA[':
+            k = self.rawdata.find(']]>', i)
+            if k == -1:
+                k = len(self.rawdata)
+            self._markup(self.rawdata[i+9:k], u'<![CDATA[%s]]>')
+            return k + 3
+        try:
+            return sgmllib.SGMLParser.parse_declaration(self, i)
+        except sgmllib.SGMLParseError:
+            # Treat a bogus declaration, and everything after it, as text
+            rest = self.rawdata[i:]
+            self.current_data.append(rest)
+            return i + len(rest)
+
+    def convert_charref(self, name):
+        # Only ASCII character references are converted in attributes
+        try:
+            n = int(name)
+        except ValueError:
+            return
+        if 0 <= n <= 127:
+            return self.convert_codepoint(n)
+
+    def reparse_attr(self, value):
+        """Return an attribute value as it would be after rendering it
+        with BeautifulSoup and parsing it again."""
+        if '"' in value:
+            value = value.replace("'", '&squot;')
+        value = _bare_ampersand_or_bracket.sub(
+            lambda m: _attr_escapes[m.group(0)], value)
+        return self.entity_or_charref.sub(self._convert_ref, value)
+
+    def rebuild(self, root):
+        """Return a new tree, built as if ``root`` had been rendered and
+        parsed again."""
+        self.reset()
+        self._rebuild(root)
+        self.end_data()
+        return self.root
+
+    def _rebuild(self, node):
+        for child in node.contents:
+            if isinstance(child, _Tag):
+                attrs = child.attrs
+                for key, value in attrs:
+                    if '&' in value or '"' in value or '<' in value \
+                            or '>' in value:
+                        attrs = [(key, self.reparse_attr(value))
+                                 for key, value in attrs]
+                        break
+                self.start_tag(child.name, attrs)
+                if not child.self_closing:
+                    self._rebuild(child)
+                    self.end_tag(child.name)
+            elif isinstance(child, _Raw):
+                self.feed(child)
+                self.rawdata = ''
+            else:
+                self.current_data.append(_unescape(child))
+
+def _convert_attr_entity(match):
+    x = match.group(1)
+    if x in name2codepoint:
+        return unichr(name2codepoint[x])
+    elif x in _xml_entities:
+        return _xml_entities[x]
+    elif x[0] == '#':
+        if x[1:2] == 'x':
+            return unichr(int(x[2:], 16))
+        return unichr(int(x[1:]))
+    return u'&%s;' % x
+
+def _convert_attr(value):
+    if '&' in value:
+        return _attr_entity.sub(_convert_attr_entity, value)
+    return value
+
+def _escape(text):
+    return text.replace(u'&', u'&amp;').replace(u'"', u'&quot;')\
+        .replace(u'<', u'&lt;').replace(u'>', u'&gt;')
+
+def _unescape(text):
+    if u'&' not in text:
+        return text
+    return text.replace(u'&gt;', u'>').replace(u'&lt;', u'<')\
+        .replace(u'&quot;', u'"').replace(u'&amp;', u'&')
+
+def _render_attrs(attrs):
+    parts = []
+    for key, value in attrs:
+        fmt = u' %s="%s"'
+        if '"' in value:
+            fmt = u" %s='%s'"
+            value = value.replace("'", '&squot;')
+        value = _bare_ampersand_or_bracket.sub(
+            lambda m: _attr_escapes[m.group(0)], value)
+        parts.append(fmt % (key, value))
+    return u''.join(parts)
+
+# Render tokens
+_OPEN, _CLOSE, _EMPTY, _TEXT, _RAW = range(5)
+
+
+class Sanitizer(object):
+    """Clean up XHTML the way :class:`~mediacore.lib.htmlsanitizer.Cleaner`
+    does with :data:`mediacore.lib.helpers.cleaner_filters`.
+
+    :param valid_tags: The tags to keep, as a dict.
+    :param valid_attrs: The attributes to keep, as a dict.
+    :param elem_map: Tags to rename, and their new names.
+    :param valid_schemes: The URL schemes to allow in links.
+    :param block_elements: The tags that ``<br />`` tags don't wrap into
+        paragraphs.
+    :param cache_size: The number of results to remember.
+
+    """
+    def __init__(self, valid_tags, valid_attrs, elem_map,
+                 valid_schemes=None, block_elements=None, cache_size=1000):
+        self.valid_tags = valid_tags
+        self.valid_attrs = valid_attrs
+        self.elem_map = elem_map
+        if valid_schemes is None:
+            valid_schemes = default_valid_schemes
+        self.valid_schemes = valid_schemes
+        if block_elements is None:
+            block_elements = default_block_elements
+        self.wrap_blocks = dict(block_elements, br=None, p=None)
+        self.cache_size = cache_size
+        self._cache = {}
+        self._plain_cache = {}
+
+    def clean(self, string, p_wrap=True):
+        """Return the given plain text or HTML as valid XHTML.
+
+        This is the same as :func:`mediacore.lib.helpers.clean_xhtml` with
+        the default cleaner settings.
+
+        :param p_wrap: Wrap the output in <p></p> tags if it's only text.
+        :rtype: unicode
+        """
+        if not string or not string.strip():
+            return u''
+        key = (p_wrap, _digest(string))
+        xhtml = self._cache.get(key, None)
+        if xhtml is None:
+            xhtml, plain = self._clean(string, p_wrap)
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = xhtml
+            if plain is not None:
+                if len(self._plain_cache) >= self.cache_size:
+                    self._plain_cache.clear()
+                self._plain_cache[_digest(xhtml)] = plain
+        return xhtml
+
+    def cached_plain_text(self, xhtml):
+        """Return the plain text version of XHTML that :meth:`clean`
+        returned, or None if it isn't cached.
+
+        The plain text is what :func:`mediacore.lib.helpers.xhtml_to_plain`
+        returns: the text with entities decoded, and a line break after
+        each block element.
+        """
+        if not xhtml:
+            return u''
+        return self._plain_cache.get(_digest(xhtml), None)
+
+    def _clean(self, string, p_wrap):
+        string = string.replace(u'\r', u'')
+        string = string.replace(u'\xa0', u' ')
+        string = string.replace(u'&nbsp;', u' ')
+        string = _blank_line.sub(u'<br/>', string)
+
+        builder = _TreeBuilder()
+        root = builder.build(string)
+        self._filter(root)
+        # Renaming tags may have left invalid nesting, so fix it up the
+        # way a second run of the Cleaner would.
+        root = builder.rebuild(root)
+        self._filter(root)
+        for node in root.contents:
+            if isinstance(node, _Tag) or node.strip():
+                return self._render(root, p_wrap)
+        # Nothing but whitespace is left. The Cleaner raises an error here.
+        return u'', u''
+
+    def _filter(self, root):
+        if _find_tag(root, 'br'):
+            self._br_to_p(root)
+        _clean_whitespace(root)
+        self._escape_and_link(root, False)
+        self._strip_tags(root)
+
+    def _br_to_p(self, root):
+        """Wrap the text around <br /> tags in paragraphs, like the
+        Cleaner's ``br_to_p`` filter."""
+        while True:
+            path = _find_tag(root, 'br')
+            if not path:
+                break
+            parent = path[-2]
+            contents = []
+            paragraph = None
+            for node in parent.contents:
+                if isinstance(node, _Tag) and node.name in self.wrap_blocks:
+                    paragraph = None
+                    if node.name != 'br':
+                        contents.append(node)
+                else:
+                    if paragraph is None:
+                        paragraph = _Tag(u'p')
+                        contents.append(paragraph)
+                    paragraph.contents.append(node)
+            parent.contents = contents
+            if parent.name == 'p':
+                _disgorge(path[-3], parent)
+
+    def _escape_and_link(self, tag, in_link):
+        """Apply the Cleaner's ``encode_xml_specials``, ``make_links``,
+        ``rename_tags``, ``strip_attrs`` and ``strip_schemes`` filters."""
+        in_link = in_link or tag.name == 'a'
+        if tag.name in self.elem_map:
+            tag.name = self.elem_map[tag.name]
+        if tag.attrs:
+            tag.attrs = [(key, value) for key, value in tag.attrs
+                         if key in self.valid_attrs]
+            self._strip_schemes(tag)
+        contents = []
+        for node in tag.contents:
+            if isinstance(node, _Tag):
+                self._escape_and_link(node, in_link)
+                contents.append(node)
+                continue
+            if isinstance(node, _Raw):
+                contents.append(node)
+                continue
+            node = _escape(node)
+            if in_link:
+                contents.append(node)
+                continue
+            pos = 0
+            for match in URL_RE.finditer(node):
+                start, end = match.span()
+                if end < len(node) and not _word_end.match(node[end]):
+                    continue
+                if pos < start:
+                    contents.append(node[pos:start])
+                url = match.group()
+                link = _Tag(u'a', [(u'href', url)], [url])
+                self._strip_schemes(link)
+                contents.append(link)
+                pos = end
+            if pos == 0:
+                contents.append(node)
+            elif pos < len(node):
+                contents.append(node[pos:])
+        tag.contents = contents
+
+    def _strip_schemes(self, tag):
+        for key in ('src', 'href'):
+            for name, value in tag.attrs:
+                if name == key:
+                    scheme = value.split(u':', 1)
+                    if len(scheme) > 1 \
+                            and scheme[0] not in self.valid_schemes:
+                        tag.attrs = [(name, value)
+                                     for name, value in tag.attrs
+                                     if name != key]
+                    break
+
+    def _strip_tags(self, tag):
+        """Apply the Cleaner's ``strip_empty_tags`` and ``strip_tags``
+        filters, in one walk."""
+        contents = []
+        for node in tag.contents:
+            if not isinstance(node, _Tag):
+                if node:
+                    contents.append(node)
+                continue
+            self._strip_tags(node)
+            if not node.contents:
+                continue
+            if node.name not in self.valid_tags:
+                contents.extend(node.contents)
+                continue
+            for child in node.contents:
+                if isinstance(child, _Tag) or child.strip():
+                    contents.append(node)
+                    break
+            else:
+                contents.extend(node.contents)
+        tag.contents = contents
+
+    def _render(self, root, p_wrap):
+        """Return the XHTML and plain text versions of the final tree,
+        as :func:`mediacore.lib.helpers.clean_xhtml` and
+        :func:`mediacore.lib.helpers.xhtml_to_plain` would."""
+        if p_wrap and len(root.contents) == 1 \
+                and not isinstance(root.contents[0], _Tag):
+            tokens = [(_OPEN, u'p', []), (_TEXT, root.contents[0].strip()),
+                      (_CLOSE, u'p')]
+        else:
+            tokens = []
+            _tokenize(root, tokens)
+
+        # Strip the whitespace before and after block tags, then around
+        # the whole thing.
+        last = len(tokens) - 1
+        for i, token in enumerate(tokens):
+            if token[0] != _TEXT:
+                continue
+            text = token[1]
+            if i > 0 and _is_bare_block(tokens[i - 1]):
+                text = text.lstrip(_ascii_space_chars)
+            if i < last and _is_bare_block(tokens[i + 1]):
+                text = text.rstrip(_ascii_space_chars)
+            if i == 0:
+                text = text.lstrip()
+            if i == last:
+                text = text.rstrip()
+            tokens[i] = (_TEXT, text)
+        tokens = [token for token in tokens
+                  if token[0] != _TEXT or token[1]]
+        last = len(tokens) - 1
+
+        xhtml = []
+        plain = []
+        chunk = []
+        in_pre = 0
+        for i, token in enumerate(tokens):
+            kind = token[0]
+            if kind == _TEXT:
+                xhtml.append(token[1])
+                chunk.append(_unescape(token[1]))
+                continue
+            if kind == _RAW:
+                # Too rare to be worth working out how BeautifulSoup
+                # would read it, leave it to xhtml_to_plain.
+                xhtml.append(token[1])
+                plain = None
+                continue
+            if plain is not None:
+                _flush_chunk(chunk, plain, in_pre)
+            name = token[1]
+            if kind == _OPEN:
+                xhtml.append(u'<%s%s>' % (name, _render_attrs(token[2])))
+                if name in _preserve_whitespace_tags:
+                    in_pre += 1
+            elif kind == _CLOSE:
+                xhtml.append(u'</%s>' % name)
+                if name in _preserve_whitespace_tags:
+                    in_pre -= 1
+                if name in _block_tags and i < last:
+                    chunk.append(u'\n\n')
+            else:
+                xhtml.append(u'<%s%s />' % (name, _render_attrs(token[2])))
+        if plain is None:
+            return u''.join(xhtml), None
+        _flush_chunk(chunk, plain, 0)
+        plain = u''.join(plain)
+        if plain and not plain.translate(_ascii_spaces):
+            plain = u'\n' in plain and u'\n' or u' '
+        return u''.join(xhtml), plain
+
+def _digest(string):
+    if isinstance(string, unicode):
+        string = string.encode('utf-8')
+    return hashlib.sha1(string).digest()
+
+def _find_tag(tag, name):
+    """Return the path to the first tag with this name, or None."""
+    for node in tag.contents:
+        if isinstance(node, _Tag):
+            if node.name == name:
+                return [tag, node]
+            path = _find_tag(node, name)
+            if path:
+                path.insert(0, tag)
+                return path
+    return None
+
+def _disgorge(parent, tag):
+    """Replace a tag with its contents."""
+    for i, node in enumerate(parent.contents):
+        if node is tag:
+            parent.contents[i:i+1] = tag.contents
+            return
+
+def _clean_whitespace(root):
+    """Apply the Cleaner's ``clean_whitespace`` filter.
+
+    Whitespace is condensed, adjacent text nodes are merged, and leading
+    whitespace is moved to the end of the text node before it.
+    """
+    _separate_strings(root)
+
+    # Add any text that's only whitespace onto the text before it
+    texts = []
+    _find_texts(root, texts)
+    prev = None
+    for ref in texts:
+        tag, i = ref
+        text = tag.contents[i]
+        if prev is not None and not text.strip():
+            prev_tag, prev_i = prev
+            prev_tag.contents[prev_i] += text
+            tag.contents[i] = None
+        else:
+            prev = ref
+    _condense_texts(root)
+
+def _separate_strings(tag):
+    contents = []
+    texts = []
+    for node in tag.contents:
+        if isinstance(node, _Tag):
+            _separate_strings(node)
+            _append_separated(contents, texts)
+            contents.append(node)
+        else:
+            texts.append(node)
+    _append_separated(contents, texts)
+    tag.contents = contents
+
+def _append_separated(contents, texts):
+    if not texts:
+        return
+    if len(texts) == 1 and isinstance(texts[0], _Raw):
+        contents.append(texts[0])
+        del texts[:]
+        return
+    text = u''.join([isinstance(text, _Raw) and text
+                     or _any_space.sub(u' ', text) for text in texts])
+    del texts[:]
+    split = _start_space.split(text)
+    if len(split) > 1 and split[1]:
+        contents.append(u' ')
+        contents.append(split[1])
+    else:
+        contents.append(text)
+
+def _find_texts(tag, texts):
+    for i, node in enumerate(tag.contents):
+        if isinstance(node, _Tag):
+            _find_texts(node, texts)
+        elif not isinstance(node, _Raw):
+            texts.append((tag, i))
+
+def _condense_texts(tag):
+    contents = []
+    for node in tag.contents:
+        if node is None:
+            continue
+        if isinstance(node, _Tag):
+            _condense_texts(node)
+        elif not isinstance(node, _Raw):
+            node = _any_space.sub(u' ', node)
+        contents.append(node)
+    tag.contents = contents
+
+def _tokenize(tag, tokens):
+    for node in tag.contents:
+        if isinstance(node, _Tag):
+            if node.self_closing:
+                tokens.append((_EMPTY, node.name, node.attrs))
+            else:
+                tokens.append((_OPEN, node.name, node.attrs))
+                _tokenize(node, tokens)
+                tokens.append((_CLOSE, node.name))
+        elif isinstance(node, _Raw):
+            tokens.append((_RAW, node))
+        elif tokens and tokens[-1][0] == _TEXT:
+            tokens[-1] = (_TEXT, tokens[-1][1] + node)
+        else:
+            tokens.append((_TEXT, node))
+
+def _is_bare_block(token):
+    kind = token[0]
+    if kind == _CLOSE:
+        return token[1] in _block_tags
+    return kind == _OPEN and token[1] in _block_tags and not token[2]
+
+def _flush_chunk(chunk, plain, in_pre):
+    if not chunk:
+        return
+    text = u''.join(chunk)
+    del chunk[:]
+    if not in_pre and not text.translate(_ascii_spaces):
+        text = u'\n' in text and u'\n' or u' '
+    plain.append(text)
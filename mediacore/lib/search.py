@@ -0,0 +1,701 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Media Search Backends
+
+:meth:`mediacore.model.media.MediaQuery.search` and
+:meth:`~mediacore.model.media.MediaQuery.admin_search` hand off to the
+backend named by the ``search_backend`` config option:
+
+    mysql
+        The default. Uses the MyISAM ``media_fulltext`` table, which is kept
+        up to date by the triggers in ``setup_triggers.sql``, and MySQL's
+        ``MATCH ... AGAINST`` in boolean mode.
+    index
+        :class:`IndexSearchBackend`, a pure Python inverted index stored in
+        ``search_index`` within the ``cache_dir``. It works with any
+        database, and is updated by :class:`SearchIndexExtension` whenever
+        media is saved.
+
+Any other value is taken to be a ``package.module:ClassName`` to import.
+Backends implement :class:`SearchBackend`.
+
+Both built in backends accept the common parts of MySQL's boolean syntax:
+``+word`` must match, ``-word`` must not, and ``word*`` matches any word
+with that prefix.
+
+"""
+import bisect
+import cPickle as pickle
+import fcntl
+import math
+import os
+import re
+import struct
+import threading
+import time
+
+from pylons import config
+from sqlalchemy import sql
+from sqlalchemy.orm import attributes
+from sqlalchemy.orm.interfaces import SessionExtension
+
+from mediacore.lib.storage import write_atomic
+from mediacore.lib.unidecode import unidecode
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['IndexSearchBackend', 'InvertedIndex', 'MySQLSearchBackend',
+           'SearchBackend', 'SearchIndexExtension', 'get_backend',
+           'parse_query', 'tokenize']
+
+_word = re.compile(r'[a-z0-9]+')
+
+#: The length prefix of each record in a search index journal.
+_record_header = struct.Struct('!I')
+
+def tokenize(text):
+    """Split the given text into lowercase ASCII words.
+
+    Accented and non-latin characters are transliterated with
+    :func:`mediacore.lib.unidecode.unidecode`, so that ``cafe`` matches
+    ``caf\xe9``. Single letters are dropped, single digits are not.
+
+    :param text: Any text, or ``None``.
+    :rtype: list of str
+    """
+    if not text:
+        return []
+    text = unidecode(unicode(text).lower())
+    return [str(word) for word in _word.findall(text)
+            if len(word) > 1 or word.isdigit()]
+
+def parse_query(search):
+    """Parse a search string into a list of ``(operator, terms, prefix)``.
+
+    The operator is ``'+'`` if a match is required, ``'-'`` if a match is
+    forbidden, or ``''``. If ``prefix`` is True, the last of the terms
+    should match any word that it is the beginning of. Other boolean mode
+    operators, such as ``>``, ``<`` and parentheses, are ignored.
+
+    :param search: The search string.
+    :rtype: list
+    """
+    clauses = []
+    for chunk in search.split():
+        operator = ''
+        if chunk[0] in '+-':
+            operator, chunk = chunk[0], chunk[1:]
+        terms = tokenize(chunk)
+        if not terms:
+            continue
+        prefix = chunk.endswith('*')
+        if operator:
+            # All the words of a required or forbidden chunk are treated
+            # alike, as MySQL does with +hyphenated-words.
+            for term in terms[:-1]:
+                clauses.append((operator, [term], False))
+            clauses.append((operator, [terms[-1]], prefix))
+        else:
+            clauses.extend([('', [term], False) for term in terms[:-1]])
+            clauses.append(('', [terms[-1]], prefix))
+    return clauses
+
+
+class InvertedIndex(object):
+    """An in-memory inverted index with BM25F ranking.
+
+    Each document is made up of the named ``fields``, whose term
+    frequencies are stored separately so that matches can be weighted by
+    ``boosts`` and searches can be limited to a subset of the fields.
+
+    :param fields: The names of the fields, in order.
+    :param boosts: A dict of field weights, 1.0 by default.
+    :param k1: BM25 term frequency saturation.
+    :param b: BM25 document length normalization.
+
+    """
+    def __init__(self, fields, boosts=None, k1=1.2, b=0.75):
+        self.fields = tuple(fields)
+        self.boosts = tuple([(boosts or {}).get(f, 1.0) for f in self.fields])
+        self.k1 = k1
+        self.b = b
+        #: Document ID -> (field lengths, distinct terms)
+        self.docs = {}
+        #: Term -> {document ID: field term frequencies}
+        self.postings = {}
+        #: The total length of each field over all documents
+        self.totals = [0] * len(self.fields)
+        self._vocabulary = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_vocabulary'] = None
+        return state
+
+    def __len__(self):
+        return len(self.docs)
+
+    def __contains__(self, doc_id):
+        return doc_id in self.docs
+
+    def add(self, doc_id, values):
+        """Index a document, replacing any previous version of it.
+
+        :param doc_id: The document's unique ID.
+        :param values: A dict of text for some or all of the fields.
+        """
+        self.remove(doc_id)
+        frequencies = {}
+        lengths = []
+        for i, field in enumerate(self.fields):
+            words = tokenize(values.get(field, None))
+            lengths.append(len(words))
+            self.totals[i] += len(words)
+            for word in words:
+                freq = frequencies.get(word, None)
+                if freq is None:
+                    freq = frequencies[word] = [0] * len(self.fields)
+                freq[i] += 1
+        for word, freq in frequencies.iteritems():
+            postings = self.postings.get(word, None)
+            if postings is None:
+                postings = self.postings[word] = {}
+                self._vocabulary = None
+            postings[doc_id] = tuple(freq)
+        self.docs[doc_id] = (tuple(lengths), tuple(frequencies))
+
+    def remove(self, doc_id):
+        """Remove a document from the index, if it's there."""
+        doc = self.docs.pop(doc_id, None)
+        if doc is None:
+            return
+        lengths, words = doc
+        for i, length in enumerate(lengths):
+            self.totals[i] -= length
+        for word in words:
+            postings = self.postings[word]
+            del postings[doc_id]
+            if not postings:
+                del self.postings[word]
+                self._vocabulary = None
+
+    def expand(self, prefix):
+        """Return all indexed terms beginning with the given prefix."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self.postings)
+        vocabulary = self._vocabulary
+        i = bisect.bisect_left(vocabulary, prefix)
+        terms = []
+        while i < len(vocabulary) and vocabulary[i].startswith(prefix):
+            terms.append(vocabulary[i])
+            i += 1
+        return terms
+
+    def search(self, search, fields=None, limit=None):
+        """Return the documents matching the given search, best first.
+
+        :param search: A search string, see :func:`parse_query`.
+        :param fields: Only search these fields. Defaults to all.
+        :param limit: The maximum number of results to return.
+        :rtype: list of ``(doc_id, score)`` tuples
+        """
+        if fields is None:
+            fields = self.fields
+        searched = [i for i, f in enumerate(self.fields) if f in fields]
+        count = len(self.docs)
+        if not count or not searched:
+            return []
+        averages = {}
+        for i in searched:
+            averages[i] = float(self.totals[i]) / count or 1.0
+
+        k1, b = self.k1, self.b
+        scores = {}
+        required = []
+        forbidden = set()
+        for operator, terms, prefix in parse_query(search):
+            if prefix:
+                terms = terms[:-1] + self.expand(terms[-1])
+            matched = set()
+            for term in terms:
+                postings = self.postings.get(term, None)
+                if not postings:
+                    continue
+                idf = math.log(1 + (count - len(postings) + 0.5)
+                                   / (len(postings) + 0.5))
+                for doc_id, freq in postings.iteritems():
+                    lengths = self.docs[doc_id][0]
+                    weight = 0.0
+                    for i in searched:
+                        if freq[i]:
+                            norm = 1 - b + b * lengths[i] / averages[i]
+                            weight += self.boosts[i] * freq[i] / norm
+                    if not weight:
+                        continue
+                    matched.add(doc_id)
+                    if operator != '-':
+                        scores[doc_id] = scores.get(doc_id, 0.0) \
+                            + idf * weight * (k1 + 1) / (weight + k1)
+            if operator == '+':
+                required.append(matched)
+            elif operator == '-':
+                forbidden.update(matched)
+
+        results = [(doc_id, score) for doc_id, score in scores.iteritems()
+                   if doc_id not in forbidden
+                   and not [r for r in required if doc_id not in r]]
+        results.sort(key=lambda result: (-result[1], result[0]))
+        if limit is not None:
+            results = results[:limit]
+        return results
+
+
+class SearchBackend(object):
+    """The common defaults of media search backends.
+
+    Each backend implements ``search`` itself, as documented on
+    :class:`MySQLSearchBackend`.
+    """
+
+    #: True if :meth:`update` must be called when media is saved.
+    incremental = False
+
+    def update(self, media_ids):
+        """Reindex the given media, which may have been deleted."""
+        pass
+
+    def rebuild(self):
+        """Reindex all media from scratch."""
+        pass
+
+
+class MySQLSearchBackend(SearchBackend):
+    """Search with MySQL FULLTEXT indexes on the ``media_fulltext`` table."""
+
+    def search(self, query, search, admin=False):
+        """Filter and order a media query by relevance to a search.
+
+        :param query: A :class:`~mediacore.model.media.MediaQuery`.
+        :param search: The search string.
+        :param admin: If True, also search fields only admins may see.
+        :returns: The filtered query.
+        """
+        from mediacore.model.media import (MediaFullText, _search_cols,
+            _search_param)
+        from mediacore.model import _MatchAgainstClause
+        if admin:
+            cols, relevance = _search_cols['admin'], MediaFullText.admin_relevance
+        else:
+            cols, relevance = _search_cols['public'], MediaFullText.relevance
+        return query.join(MediaFullText)\
+                    .filter(_MatchAgainstClause(cols, _search_param, True))\
+                    .order_by(relevance.desc())\
+                    .params({_search_param.key: search})
+
+
+class IndexSearchBackend(SearchBackend):
+    """Search with an :class:`InvertedIndex` stored on disk.
+
+    The index is stored as a pickle, ``media.idx``, plus a journal of the
+    media which have been reindexed since, so that saving media only
+    appends a few records rather than rewriting the whole index. Each
+    process loads the index into memory and then replays any journal
+    records which other processes have added, which is checked at most
+    once every ``check_interval`` seconds. Once the journal grows past
+    ``compact_size`` bytes, it is merged into a new index file.
+
+    Writers are serialized with a lock file. Within a process, the index
+    is only read or changed while holding a thread lock.
+
+    Until the index is built with ``paster rebuild-search-index``, only
+    media titles are searched.
+
+    :param index_dir: Defaults to ``search_index`` in the ``cache_dir``.
+    :param boosts: Field weights for the :class:`InvertedIndex`.
+    :param max_results: The most results that any search will return.
+    :param check_interval: Seconds between checks for a newer index.
+    :param compact_size: The journal size which triggers a new index file.
+    :param bind: The engine to read media with. Defaults to the engine
+        the :data:`~mediacore.model.meta.DBSession` is bound to.
+
+    """
+    incremental = True
+
+    fields = ('title', 'subtitle', 'description', 'notes', 'tags',
+              'categories')
+    public_fields = ('title', 'subtitle', 'description', 'tags',
+                     'categories')
+    default_boosts = {'title': 4.0, 'subtitle': 2.0, 'tags': 3.0,
+                      'categories': 2.0}
+
+    def __init__(self, index_dir=None, boosts=None, max_results=1000,
+                 check_interval=1.0, compact_size=1048576, bind=None):
+        self._index_dir = index_dir
+        self.boosts = boosts or self.default_boosts
+        self.max_results = max_results
+        self.check_interval = check_interval
+        self.compact_size = compact_size
+        self.bind = bind
+        self._lock = threading.RLock()
+        self._index = None
+        self._generation = None
+        self._offset = 0
+        self._stat = None
+        self._checked = 0
+
+    @property
+    def index_dir(self):
+        if self._index_dir is None:
+            self._index_dir = os.path.join(config['cache_dir'], 'search_index')
+        return self._index_dir
+
+    @property
+    def index_file(self):
+        return os.path.join(self.index_dir, 'media.idx')
+
+    def journal_file(self, generation):
+        """Return the path of the journal for the given index file."""
+        return os.path.join(self.index_dir, 'media.%d.log' % generation)
+
+    def search(self, query, search, admin=False):
+        from mediacore.model.media import Media
+        fields = admin and self.fields or self.public_fields
+        self._lock.acquire()
+        try:
+            index = self.load()
+            if index is not None:
+                results = index.search(search, fields, self.max_results)
+        finally:
+            self._lock.release()
+        if index is None:
+            return query.filter(Media.title.like('%' + search + '%'))
+        if not results:
+            # An impossible condition, as media IDs are never NULL
+            return query.filter(Media.id == None)
+        ids = [doc_id for doc_id, score in results]
+        rank = sql.case([(Media.id == doc_id, i)
+                         for i, doc_id in enumerate(ids)])
+        return query.filter(Media.id.in_(ids)).order_by(rank)
+
+    def load(self):
+        """Return the current :class:`InvertedIndex`, or ``None`` if it
+        hasn't been built.
+
+        The index is updated in place, so only use it while holding
+        :attr:`_lock`.
+        """
+        self._lock.acquire()
+        try:
+            now = time.time()
+            if now - self._checked >= self.check_interval:
+                self._checked = now
+                self._reload()
+            return self._index
+        finally:
+            self._lock.release()
+
+    def _reload(self):
+        """Load a new index file if there is one, then replay the journal."""
+        try:
+            stat = os.stat(self.index_file)
+        except OSError:
+            self._index = self._stat = None
+            return
+        stat = (stat.st_ino, stat.st_mtime, stat.st_size)
+        if stat != self._stat:
+            index_file = open(self.index_file, 'rb')
+            try:
+                index = pickle.load(index_file)
+            finally:
+                index_file.close()
+            if isinstance(index, InvertedIndex):
+                # Written before there were journals
+                self._generation, self._index = 0, index
+            else:
+                self._generation, self._index = index
+            self._offset = 0
+            self._stat = stat
+        self._replay()
+
+    def _replay(self):
+        try:
+            journal = open(self.journal_file(self._generation), 'rb')
+        except IOError:
+            # Nothing has been reindexed yet, or the journal was just
+            # merged into a new index file, which the next check will load.
+            return
+        try:
+            journal.seek(self._offset)
+            data = journal.read()
+        finally:
+            journal.close()
+        pos = 0
+        while pos + _record_header.size <= len(data):
+            length, = _record_header.unpack_from(data, pos)
+            end = pos + _record_header.size + length
+            if end > len(data):
+                # Still being written
+                break
+            media_id, values = pickle.loads(data[pos + _record_header.size:end])
+            if values is None:
+                self._index.remove(media_id)
+            else:
+                self._index.add(media_id, values)
+            pos = end
+        self._offset += pos
+
+    def update(self, media_ids):
+        """Reindex the given media, removing any that no longer exist."""
+        media_ids = list(media_ids)
+        if not media_ids:
+            return
+        self._locked(self._update, media_ids)
+
+    def _update(self, media_ids):
+        if not os.path.exists(self.index_file):
+            log.warning('The search index has not been built yet. '
+                        'Run paster rebuild-search-index.')
+            return
+        conn = (self.bind or self._default_bind()).connect()
+        try:
+            documents = self._fetch_documents(conn, media_ids)
+        finally:
+            conn.close()
+        records = []
+        for media_id in media_ids:
+            record = pickle.dumps((media_id, documents.get(media_id, None)),
+                                  pickle.HIGHEST_PROTOCOL)
+            records.append(_record_header.pack(len(record)) + record)
+
+        self._lock.acquire()
+        try:
+            self._checked = time.time()
+            self._reload()
+            if self._index is None:
+                return
+            journal_path = self.journal_file(self._generation)
+            journal = open(journal_path, 'ab')
+            try:
+                journal.write(''.join(records))
+            finally:
+                journal.close()
+            self._replay()
+            if self._offset >= self.compact_size:
+                self._save(self._index)
+        finally:
+            self._lock.release()
+
+    def rebuild(self):
+        """Rebuild the whole index from the database."""
+        self._locked(self._rebuild)
+
+    def _rebuild(self):
+        conn = (self.bind or self._default_bind()).connect()
+        try:
+            index = self._build(conn)
+        finally:
+            conn.close()
+        self._lock.acquire()
+        try:
+            self._checked = time.time()
+            self._reload()
+            self._save(index)
+        finally:
+            self._lock.release()
+
+    def _build(self, conn):
+        index = InvertedIndex(self.fields, self.boosts)
+        for media_id, values in self._fetch_documents(conn).iteritems():
+            index.add(media_id, values)
+        return index
+
+    def _default_bind(self):
+        from mediacore.model.meta import DBSession
+        return DBSession.bind
+
+    def _fetch_documents(self, conn, media_ids=None):
+        """Return a dict of field values for each of the given media IDs,
+        or for all media if no IDs are given.
+        """
+        from mediacore.model.media import (media, media_tags,
+            media_categories)
+        from mediacore.model.tags import tags
+        from mediacore.model.categories import categories
+
+        def restrict(select, column):
+            if media_ids is not None:
+                select = select.where(column.in_(media_ids))
+            return select
+
+        documents = {}
+        rows = conn.execute(restrict(sql.select([
+            media.c.id, media.c.title, media.c.subtitle,
+            media.c.description_plain, media.c.notes,
+        ]), media.c.id))
+        for id, title, subtitle, description, notes in rows:
+            documents[id] = {'title': title, 'subtitle': subtitle,
+                             'description': description, 'notes': notes}
+
+        for field, assoc, table, fk in (
+                ('tags', media_tags, tags, media_tags.c.tag_id),
+                ('categories', media_categories, categories,
+                 media_categories.c.category_id)):
+            rows = conn.execute(restrict(sql.select(
+                [assoc.c.media_id, table.c.name],
+                fk == table.c.id,
+            ), assoc.c.media_id))
+            names = {}
+            for media_id, name in rows:
+                names.setdefault(media_id, []).append(name)
+            for media_id, values in names.iteritems():
+                if media_id in documents:
+                    documents[media_id][field] = u' '.join(values)
+        return documents
+
+    def _locked(self, func, *args):
+        if not os.path.isdir(self.index_dir):
+            try:
+                os.makedirs(self.index_dir)
+            except OSError:
+                if not os.path.isdir(self.index_dir):
+                    raise
+        lock_file = open(os.path.join(self.index_dir, 'media.lock'), 'w')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                return func(*args)
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+    def _save(self, index):
+        """Write a new index file with an empty journal.
+
+        Call with both locks held, after :meth:`_reload`.
+        """
+        old_generation = self._generation
+        generation = (old_generation or 0) + 1
+        write_atomic(self.index_file, pickle.dumps((generation, index),
+                                                   pickle.HIGHEST_PROTOCOL))
+        if old_generation is not None:
+            try:
+                os.remove(self.journal_file(old_generation))
+            except OSError:
+                pass
+        stat = os.stat(self.index_file)
+        self._index = index
+        self._generation = generation
+        self._offset = 0
+        self._stat = (stat.st_ino, stat.st_mtime, stat.st_size)
+
+
+backends = {
+    'mysql': MySQLSearchBackend,
+    'index': IndexSearchBackend,
+}
+
+_instances = {}
+
+def get_backend():
+    """Return the :class:`SearchBackend` named in the config."""
+    name = config.get('search_backend', 'mysql')
+    backend = _instances.get(name, None)
+    if backend is None:
+        if name in backends:
+            cls = backends[name]
+        else:
+            module_name, _, class_name = name.partition(':')
+            module = __import__(module_name, {}, {}, [class_name])
+            cls = getattr(module, class_name)
+        backend = _instances[name] = cls()
+    return backend
+
+
+class SearchIndexExtension(SessionExtension):
+    """Update incremental search backends when media is saved.
+
+    Media is reindexed when it is added or deleted, when any of the
+    attributes that are indexed are changed, and when any of its tags or
+    categories are renamed or deleted. The IDs are collected during each
+    flush and reindexed once the transaction commits.
+    """
+    _key = '_search_index_ids'
+
+    #: Media attributes which are indexed.
+    attrs = ('title', 'subtitle', 'description', 'description_plain',
+             'notes', 'tags', 'categories')
+
+    def before_flush(self, session, flush_context, instances):
+        # Deleted tags and categories lose their media_tags/media_categories
+        # rows during the flush, so look up their media beforehand.
+        if not get_backend().incremental:
+            return
+        from mediacore.model import Tag, Category
+        from mediacore.model.media import media_tags, media_categories
+        tag_ids, category_ids = [], []
+        renamed = [obj for obj in session.dirty
+                   if isinstance(obj, (Tag, Category))
+                   and _changed(obj, ('name',))]
+        for obj in renamed + list(session.deleted):
+            if isinstance(obj, Tag) and obj.id is not None:
+                tag_ids.append(obj.id)
+            elif isinstance(obj, Category) and obj.id is not None:
+                category_ids.append(obj.id)
+        pending = session.__dict__.setdefault(self._key, set())
+        for ids, assoc, fk in (
+                (tag_ids, media_tags, media_tags.c.tag_id),
+                (category_ids, media_categories, media_categories.c.category_id)):
+            if ids:
+                rows = session.execute(sql.select([assoc.c.media_id],
+                                                  fk.in_(ids)))
+                pending.update([row[0] for row in rows])
+
+    def after_flush(self, session, flush_context):
+        if not get_backend().incremental:
+            return
+        from mediacore.model import Media
+        pending = session.__dict__.setdefault(self._key, set())
+        for obj in list(session.new) + list(session.deleted):
+            if isinstance(obj, Media) and obj.id is not None:
+                pending.add(obj.id)
+        for obj in session.dirty:
+            if isinstance(obj, Media) and _changed(obj, self.attrs):
+                pending.add(obj.id)
+
+    def after_commit(self, session):
+        pending = session.__dict__.pop(self._key, None)
+        if pending:
+            try:
+                get_backend().update(pending)
+            except Exception, e:
+                # The media is saved; a stale search result is no reason
+                # to report an error.
+                log.exception('Failed to update the search index: %s', e)
+
+    def after_rollback(self, session):
+        session.__dict__.pop(self._key, None)
+
+
+def _changed(obj, attrs):
+    """Return True if any of the given attributes of ``obj`` have changed."""
+    for attr in attrs:
+        added, unchanged, deleted = \
+            attributes.get_history(obj, attr, passive=True)
+        if added or deleted:
+            return True
+    return False
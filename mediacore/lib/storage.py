@@ -0,0 +1,571 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Media Storage Backends
+
+Uploaded media files are always stored in the ``media_dir`` first. If the
+``ftp_storage`` setting is on, they are then copied to an FTP server by
+the ``media.store_ftp`` job (see :mod:`mediacore.lib.tasks`) and served
+from its ``ftp_download_url`` once they've been verified.
+
+Backends extend :class:`StorageBackend`:
+
+    :class:`LocalStorage`
+        A directory on the local filesystem.
+    :class:`FTPStorage`
+        An FTP server, plus the HTTP URL it serves the files from. FTP
+        connections are kept open between files in a :class:`FTPPool`.
+    :class:`FakeStorage`
+        Keeps files in memory, for tests.
+
+Files are hashed as they're sent, so they are read only once. Remote
+copies are checked by size, and then by downloading a few small ranges of
+the file over HTTP, rather than the whole thing.
+
+Uploaded files are stored in the ``media_dir`` under the SHA-1 of their
+contents by :func:`store_blob`, so the same file uploaded twice is only
+stored once. Each :class:`~mediacore.model.media.MediaFile` with that
+``file_name`` is a reference to it, and the file is only deleted once
+the last one has been gone for :data:`blob_grace_period` seconds, see
+:func:`mediacore.lib.helpers.delete_files`.
+
+"""
+import ftplib
+import hashlib
+import os
+import tempfile
+import threading
+import time
+import urllib2
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['FakeStorage', 'FTPPool', 'FTPStorage', 'LocalStorage',
+           'StorageBackend', 'blob_grace_period', 'blob_name', 'ftp_pool',
+           'get_remote_storage', 'store_blob', 'store_many', 'write_atomic']
+
+#: Seconds that an unreferenced blob is kept after it was last stored, so
+#: that uploads of the same contents have time to commit their reference.
+blob_grace_period = 3600
+
+class StorageBackend(object):
+    """The common defaults of media storage backends.
+
+    Each backend implements ``store``, ``verify`` and ``delete`` itself,
+    as documented on :class:`LocalStorage`.
+    """
+
+    #: The number of bytes to read and send at a time.
+    block_size = 65536
+
+    def is_current(self, file_name, path):
+        """Return True if the stored file is already an up to date copy of
+        the local file, so storing it again can be skipped."""
+        return False
+
+    def url(self, file_name):
+        """Return the URL the stored file is served from, or None."""
+        return None
+
+    def close(self):
+        """Release any resources held between calls."""
+        pass
+
+    def _copy(self, src, write):
+        return _copy(src, write, self.block_size)
+
+
+class LocalStorage(StorageBackend):
+    """Store files in a directory on the local filesystem.
+
+    :param base_dir: The directory to store files in.
+    :param base_url: The URL that the directory is served from, if any.
+    """
+    def __init__(self, base_dir, base_url=None):
+        self.base_dir = base_dir
+        self.base_url = base_url
+
+    def store(self, file_name, path):
+        """Copy a local file into storage.
+
+        :param file_name: The name to store the file under.
+        :param path: The path of the local file.
+        :returns: The SHA-1 hex digest of the file, worked out as it was
+            sent.
+        """
+        dest_path = os.path.join(self.base_dir, file_name)
+        src = open(path, 'rb')
+        try:
+            dest = open(dest_path, 'wb')
+            try:
+                return self._copy(src, dest.write)
+            finally:
+                dest.close()
+        finally:
+            src.close()
+
+    def verify(self, file_name, size, path=None):
+        """Check that a stored file looks intact.
+
+        :param size: The size the file should be.
+        :param path: The path of the local original, for backends that
+            can compare parts of it cheaply.
+        :returns: True if it does.
+        """
+        try:
+            return os.path.getsize(os.path.join(self.base_dir, file_name)) == size
+        except OSError:
+            return False
+
+    def is_current(self, file_name, path):
+        try:
+            stored = os.stat(os.path.join(self.base_dir, file_name))
+            local = os.stat(path)
+        except OSError:
+            return False
+        return stored.st_size == local.st_size \
+            and stored.st_mtime >= local.st_mtime
+
+    def url(self, file_name):
+        if self.base_url is None:
+            return None
+        return self.base_url + file_name
+
+    def delete(self, file_name):
+        """Delete a stored file. Missing files are ignored."""
+        path = os.path.join(self.base_dir, file_name)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+class FakeStorage(StorageBackend):
+    """Keep stored files in memory. For tests.
+
+    :attr:`files` maps each stored file name to its contents.
+    """
+    def __init__(self, base_url='http://fake/'):
+        self.base_url = base_url
+        self.files = {}
+        self._lock = threading.Lock()
+
+    def store(self, file_name, path):
+        parts = []
+        src = open(path, 'rb')
+        try:
+            digest = self._copy(src, parts.append)
+        finally:
+            src.close()
+        self._lock.acquire()
+        try:
+            self.files[file_name] = ''.join(parts)
+        finally:
+            self._lock.release()
+        return digest
+
+    def verify(self, file_name, size, path=None):
+        return file_name in self.files and len(self.files[file_name]) == size
+
+    def url(self, file_name):
+        return self.base_url + file_name
+
+    def delete(self, file_name):
+        self.files.pop(file_name, None)
+
+
+class FTPPool(object):
+    """Keep FTP connections open for reuse, per process.
+
+    Logging in is usually slower than sending a small file, so connections
+    are returned to the pool when a transfer is done, and checked with a
+    ``NOOP`` before reuse if they've been idle for a while.
+
+    :param factory: A callable that takes the server, user and password
+        and returns a logged in :class:`ftplib.FTP`.
+    :param max_idle: The most connections to keep open per server.
+    :param check_after: Check connections that have been idle for longer
+        than this many seconds before reusing them.
+    """
+    def __init__(self, factory=ftplib.FTP, max_idle=4, check_after=30):
+        self.factory = factory
+        self.max_idle = max_idle
+        self.check_after = check_after
+        self._idle = {}
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def acquire(self, server, user, password):
+        """Return an open connection, logged in as the given user."""
+        key = (server, user, password)
+        while True:
+            self._lock.acquire()
+            try:
+                if self._pid != os.getpid():
+                    # Connections can't be shared with a parent process
+                    self._idle, self._pid = {}, os.getpid()
+                idle = self._idle.get(key, [])
+                if not idle:
+                    break
+                ftp, released = idle.pop()
+            finally:
+                self._lock.release()
+            if time.time() - released < self.check_after:
+                return ftp
+            try:
+                ftp.voidcmd('NOOP')
+                return ftp
+            except ftplib.all_errors:
+                self._close(ftp)
+        return self.factory(server, user, password)
+
+    def release(self, ftp, server, user, password):
+        """Return a connection to the pool for reuse."""
+        key = (server, user, password)
+        self._lock.acquire()
+        try:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.max_idle and self._pid == os.getpid():
+                idle.append((ftp, time.time()))
+                return
+        finally:
+            self._lock.release()
+        self._close(ftp)
+
+    def clear(self):
+        """Close all idle connections."""
+        self._lock.acquire()
+        try:
+            idle, self._idle = self._idle, {}
+        finally:
+            self._lock.release()
+        for conns in idle.itervalues():
+            for ftp, released in conns:
+                self._close(ftp)
+
+    def _close(self, ftp):
+        try:
+            ftp.quit()
+        except ftplib.all_errors:
+            ftp.close()
+
+ftp_pool = FTPPool()
+
+
+class FTPStorage(StorageBackend):
+    """Store files on an FTP server which also serves them over HTTP.
+
+    :param server: The FTP server hostname.
+    :param user: The FTP user name.
+    :param password: The FTP password.
+    :param directory: The directory on the server to store files in.
+    :param download_url: The HTTP URL the directory is served from.
+    :param pool: The :class:`FTPPool` to take connections from.
+    :param samples: How many ranges of each file to check over HTTP.
+    :param sample_size: How many bytes each of those ranges is.
+    """
+    def __init__(self, server, user, password, directory='', download_url='',
+                 pool=None, samples=4, sample_size=16384):
+        self.server = server
+        self.user = user
+        self.password = password
+        self.directory = directory
+        self.download_url = download_url
+        self.pool = pool or ftp_pool
+        self.samples = samples
+        self.sample_size = sample_size
+
+    @classmethod
+    def from_settings(cls, **kwargs):
+        """Create an instance from the ``ftp_*`` settings.
+
+        The settings are read once here, so callers should keep the
+        instance for the whole operation rather than make a new one per
+        file.
+        """
+        from mediacore.lib.helpers import fetch_setting
+        kwargs.setdefault('server', fetch_setting('ftp_server'))
+        kwargs.setdefault('user', fetch_setting('ftp_user'))
+        kwargs.setdefault('password', fetch_setting('ftp_password'))
+        kwargs.setdefault('directory', fetch_setting('ftp_upload_directory'))
+        kwargs.setdefault('download_url', fetch_setting('ftp_download_url'))
+        return cls(**kwargs)
+
+    def store(self, file_name, path):
+        src = open(path, 'rb')
+        try:
+            return self._call(self._store, file_name, src)
+        finally:
+            src.close()
+
+    def verify(self, file_name, size, path=None):
+        """Check the size of the stored file with the ``SIZE`` command,
+        and then, if ``path`` is given, sample it over HTTP.
+
+        :raises urllib2.URLError: If the file can't be downloaded yet.
+        """
+        try:
+            remote_size = self._call(self._size, file_name)
+        except ftplib.error_perm:
+            remote_size = None
+        if remote_size != size:
+            log.warn('%s is %s bytes on the FTP server, expected %d',
+                     file_name, remote_size, size)
+            return False
+        if path is None:
+            return True
+        return self.sample(file_name, path, size)
+
+    def is_current(self, file_name, path):
+        """Compare the ``SIZE`` and ``MDTM`` of the stored file with the
+        local one. Servers without ``MDTM`` are never up to date."""
+        try:
+            if self._call(self._size, file_name) != os.path.getsize(path):
+                return False
+        except ftplib.error_perm:
+            return False
+        modified = self.modified(file_name)
+        local = time.strftime('%Y%m%d%H%M%S',
+                              time.gmtime(os.path.getmtime(path)))
+        return modified is not None and modified[:14] >= local
+
+    def modified(self, file_name):
+        """Return the stored file's ``MDTM`` modification time in UTC, as
+        a ``YYYYMMDDHHMMSS`` string, or None if the server won't say."""
+        try:
+            return self._call(self._mdtm, file_name)
+        except ftplib.error_perm:
+            return None
+
+    def sample(self, file_name, path, size=None):
+        """Compare a few ranges of the file served over HTTP with the
+        local original.
+
+        The first and last bytes are always checked, since that's where a
+        truncated or padded transfer shows up. Servers that ignore the
+        ``Range`` header only have the start of the file checked.
+
+        :raises urllib2.URLError: If the file can't be downloaded yet.
+        """
+        if size is None:
+            size = os.path.getsize(path)
+        url = self.url(file_name)
+        local = open(path, 'rb')
+        try:
+            for start in self._sample_offsets(size):
+                length = min(self.sample_size, size - start)
+                local.seek(start)
+                expected = local.read(length)
+                request = urllib2.Request(url, headers={
+                    'Range': 'bytes=%d-%d' % (start, start + length - 1)})
+                response = urllib2.urlopen(request)
+                try:
+                    if response.code != 206 and start != 0:
+                        continue
+                    if response.read(length) != expected:
+                        return False
+                finally:
+                    response.close()
+        finally:
+            local.close()
+        return True
+
+    def url(self, file_name):
+        return self.download_url + file_name
+
+    def delete(self, file_name):
+        try:
+            self._call(self._delete, file_name)
+        except ftplib.error_perm:
+            pass
+
+    def _sample_offsets(self, size):
+        if size <= self.sample_size:
+            return [0]
+        last = size - self.sample_size
+        count = max(self.samples, 2)
+        return sorted(set([last * i // (count - 1) for i in range(count)]))
+
+    def _call(self, func, *args):
+        """Run ``func(ftp, *args)`` with a pooled connection.
+
+        The connection is only returned to the pool if the server replied,
+        since it may be left in the middle of a command otherwise.
+        """
+        ftp = self.pool.acquire(self.server, self.user, self.password)
+        try:
+            result = func(ftp, *args)
+        except ftplib.error_perm:
+            self.pool.release(ftp, self.server, self.user, self.password)
+            raise
+        except:
+            self.pool._close(ftp)
+            raise
+        self.pool.release(ftp, self.server, self.user, self.password)
+        return result
+
+    def _path(self, file_name):
+        if not self.directory:
+            return file_name
+        return self.directory.rstrip('/') + '/' + file_name
+
+    def _store(self, ftp, file_name, src):
+        # The same as ftp.storbinary, but hashing each block as it's sent
+        ftp.voidcmd('TYPE I')
+        conn = ftp.transfercmd('STOR ' + self._path(file_name))
+        try:
+            digest = self._copy(src, conn.sendall)
+        finally:
+            conn.close()
+        ftp.voidresp()
+        return digest
+
+    def _size(self, ftp, file_name):
+        ftp.voidcmd('TYPE I')
+        return ftp.size(self._path(file_name))
+
+    def _mdtm(self, ftp, file_name):
+        return ftp.sendcmd('MDTM ' + self._path(file_name))[4:].strip()
+
+    def _delete(self, ftp, file_name):
+        ftp.delete(self._path(file_name))
+
+
+def blob_name(digest, ext):
+    """Return the name a file with the given SHA-1 is stored under."""
+    if ext:
+        return '%s.%s' % (digest, ext)
+    return digest
+
+def store_blob(src, base_dir, ext):
+    """Copy a stream into a directory, named by the SHA-1 of its contents.
+
+    The stream is hashed as it's copied to a temp file, which is then
+    renamed into place. If the same contents were already stored, they're
+    atomically replaced with an identical copy.
+
+    :param src: A file-like object to read from.
+    :param base_dir: The directory to store the file in.
+    :param ext: The file extension to use, without the dot.
+    :returns: The file name and the SHA-1 hex digest.
+    """
+    fd, tmp_path = tempfile.mkstemp(prefix='.blob-', dir=base_dir)
+    try:
+        dest = os.fdopen(fd, 'wb')
+        try:
+            digest = _copy(src, dest.write)
+        finally:
+            dest.close()
+        os.chmod(tmp_path, 0644)
+        file_name = blob_name(digest, ext)
+        os.rename(tmp_path, os.path.join(base_dir, file_name))
+    except:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return file_name, digest
+
+def write_atomic(path, data, mode=0644):
+    """Write a file under a unique temporary name and rename it into place.
+
+    Readers see either the old file or the whole new one, and concurrent
+    writers in any thread or process never share a temp file.
+
+    :param path: The file to write.
+    :param data: The contents, a str.
+    :param mode: The permissions to give the file.
+    """
+    dir, name = os.path.split(path)
+    fd, tmp_path = tempfile.mkstemp(prefix='.' + name, dir=dir)
+    try:
+        tmp_file = os.fdopen(fd, 'wb')
+        try:
+            tmp_file.write(data)
+        finally:
+            tmp_file.close()
+        os.chmod(tmp_path, mode)
+        if os.name == 'nt' and os.path.exists(path):
+            # Windows won't rename over an existing file
+            os.remove(path)
+        os.rename(tmp_path, path)
+    except:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def get_remote_storage():
+    """Return the configured remote :class:`StorageBackend`, or None if
+    files are only stored in the ``media_dir``."""
+    from paste.deploy.converters import asbool
+    from mediacore.lib.helpers import fetch_setting
+    if asbool(fetch_setting('ftp_storage')):
+        return FTPStorage.from_settings()
+    return None
+
+def store_many(storage, files, workers=4):
+    """Copy several files into storage at once.
+
+    Each worker thread sends one file at a time, over its own connection
+    for backends that use them.
+
+    :param storage: A :class:`StorageBackend`.
+    :param files: A list of ``(file_name, path)`` pairs.
+    :param workers: The number of files to send at once.
+    :returns: A dict mapping each file name to the SHA-1 of the file, or
+        to the exception raised while storing it.
+    """
+    results = {}
+    pending = list(reversed(files))
+    lock = threading.Lock()
+
+    def work():
+        while True:
+            lock.acquire()
+            try:
+                if not pending:
+                    return
+                file_name, path = pending.pop()
+            finally:
+                lock.release()
+            try:
+                result = storage.store(file_name, path)
+            except Exception, e:
+                log.exception('Storing %s failed', file_name)
+                result = e
+            lock.acquire()
+            try:
+                results[file_name] = result
+            finally:
+                lock.release()
+
+    threads = [threading.Thread(target=work)
+               for i in range(max(1, min(workers, len(files))))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+def _copy(src, write, block_size=65536):
+    """Read a file in blocks, pass each to ``write`` and hash it.
+
+    :returns: The SHA-1 hex digest of the file.
+    """
+    sha1 = hashlib.sha1()
+    block = src.read(block_size)
+    while block:
+        sha1.update(block)
+        write(block)
+        block = src.read(block_size)
+    return sha1.hexdigest()
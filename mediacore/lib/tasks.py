@@ -0,0 +1,255 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Background Job Handlers
+
+The slow parts of handling uploads, comments, thumbnails and related
+media, run by
+:class:`mediacore.lib.jobs.JobWorker`. See :func:`mediacore.lib.jobs.enqueue`.
+
+Handlers run outside of any request, so anything that depends on the
+request, such as fully qualified URLs, is worked out when the job is
+queued and passed in as an argument.
+
+"""
+import os
+import time
+import urllib2
+
+from akismet import Akismet
+from pylons import config
+
+from mediacore import __version__ as MEDIACORE_VERSION
+from mediacore.lib import email
+from mediacore.lib.helpers import discard_files, fetch_setting
+from mediacore.lib.jobs import RetryLater, enqueue, handler, runs_inline
+from mediacore.lib.probe import ProbeError, probe
+from mediacore.lib.related import related_media
+from mediacore.lib.storage import FTPStorage, blob_grace_period
+from mediacore.lib.thumbnails import ThumbPipeline, thumb_manifest
+
+import logging
+log = logging.getLogger(__name__)
+
+class FTPUploadException(Exception):
+    pass
+
+@handler('email.send')
+def send_email(to_addr, from_addr, subject, body):
+    """Send an email with :func:`mediacore.lib.email.send`."""
+    email.send(to_addr, from_addr, subject, body)
+
+@handler('comments.check_spam')
+def check_comment_spam(comment_id, blog_url, data, publish, notify=None):
+    """Check a new comment with Akismet, and trash it if it's spam.
+
+    :param comment_id: The :class:`~mediacore.model.comments.Comment` ID.
+    :param blog_url: The site URL to give Akismet.
+    :param data: The commenter's details, for Akismet.
+    :param publish: Publish the comment if it isn't spam.
+    :param notify: Arguments for an ``email.send`` job to queue if the
+        comment isn't spam.
+    :returns: True if the comment is spam.
+    """
+    from mediacore.model import Comment
+    comment = Comment.query.get(comment_id)
+    if comment is None or comment.reviewed:
+        # Deleted or moderated since it was posted
+        return False
+
+    akismet = Akismet(agent='MediaCore/%s' % MEDIACORE_VERSION)
+    akismet.key = fetch_setting('akismet_key')
+    akismet.blog_url = blog_url
+    akismet.verify_key()
+    data = dict([(str(k), v and v.encode('utf-8')) for k, v in data.iteritems()])
+    if akismet.comment_check(comment.body.encode('utf-8'), data):
+        comment.reviewed = True
+        comment.publishable = False
+        return True
+
+    if publish:
+        comment.reviewed = True
+        comment.publishable = True
+    if notify:
+        enqueue('email.send', **notify)
+    return False
+
+@handler('media.store_ftp')
+def store_media_file_ftp(media_file_id, file_name, digest=None):
+    """Upload a stored media file to the configured FTP server.
+
+    The file is still served from the local ``media_dir`` until the
+    upload has been verified by :func:`verify_ftp_upload`.
+
+    :param digest: The SHA-1 hex digest of the file, if it was worked out
+        as the file was uploaded to us, to check it hasn't changed since.
+    """
+    file_path = os.path.join(config['media_dir'], file_name)
+    storage = FTPStorage.from_settings()
+    if not storage.is_current(file_name, file_path):
+        stored_digest = storage.store(file_name, file_path)
+        if digest is not None and stored_digest != digest:
+            raise FTPUploadException('%s has changed since it was uploaded'
+                                     % file_name)
+    if not storage.verify(file_name, os.path.getsize(file_path)):
+        raise FTPUploadException('%s is incomplete on the FTP server'
+                                 % file_name)
+
+    # The uploaded file may take a few seconds to become available via HTTP
+    enqueue('media.verify_ftp',
+            key='media.verify_ftp:%d' % media_file_id,
+            delay=3,
+            max_attempts=int(fetch_setting('ftp_upload_integrity_retries')),
+            media_file_id=media_file_id,
+            file_name=file_name)
+
+@handler('media.verify_ftp')
+def verify_ftp_upload(media_file_id, file_name, digest=None):
+    """Check that an uploaded file is served intact, and switch to it.
+
+    Media files with the same contents share the same ``file_name``, and
+    are all switched at once.
+
+    A few ranges of the file are downloaded and compared with the local
+    copy, see :meth:`mediacore.lib.storage.FTPStorage.sample`.
+
+    :param digest: Unused. Accepted so that jobs queued by older versions
+        can still run.
+    """
+    from mediacore.model import MediaFile
+    storage = FTPStorage.from_settings()
+    local_path = os.path.join(config['media_dir'], file_name)
+    file_url = storage.url(file_name)
+    try:
+        intact = storage.sample(file_name, local_path)
+    except urllib2.URLError, e:
+        raise RetryLater('%s is not available yet: %s' % (file_url, e), 3)
+    if not intact:
+        raise FTPUploadException(
+            'Uploaded File and Downloaded File did not match')
+
+    # Switch every media file that shares this stored file
+    media_files = MediaFile.query\
+        .filter(MediaFile.file_name == file_name)\
+        .filter(MediaFile.url == None)\
+        .all()
+    for media_file in media_files:
+        media_file.url = file_url
+    # Another upload of the same contents may be about to refer to it
+    enqueue('media.collect_blob',
+            delay=blob_grace_period,
+            file_name=file_name)
+
+@handler('media.collect_blob', max_attempts=10)
+def collect_media_blob(file_name, subdir=None):
+    """Delete a file from the media dir once nothing refers to it.
+
+    Uploads of the same contents store the same file again, and may not
+    have committed their :class:`~mediacore.model.media.MediaFile` yet.
+    So the file is kept until it hasn't been stored again for
+    :data:`~mediacore.lib.storage.blob_grace_period` seconds, and only
+    deleted if still no local media file refers to it by then. When jobs
+    are run inline, there's no worker to come back to a file that's too
+    new, so it's left for ``paster collect-blobs`` to delete.
+
+    :param file_name: The name of the file in the media dir.
+    :param subdir: The subdir of the ``deleted_files_dir`` to move it to.
+    """
+    from mediacore.model import MediaFile
+    path = os.path.join(config['media_dir'], file_name)
+    try:
+        age = time.time() - os.path.getmtime(path)
+    except OSError:
+        return
+    referenced = MediaFile.query\
+        .filter(MediaFile.file_name == file_name)\
+        .filter(MediaFile.url == None)\
+        .count()
+    if referenced:
+        return
+    if age < blob_grace_period:
+        if runs_inline():
+            # No worker will come back to it. Leave it to collect-blobs
+            # rather than pull the file out from under an upload.
+            log.info('Leaving %s, which was stored %ds ago, for '
+                     'collect-blobs', file_name, age)
+            return
+        raise RetryLater('%s was stored again recently' % file_name,
+                         blob_grace_period - age + 1)
+    discard_files([path], subdir)
+
+@handler('media.probe')
+def probe_media_file(media_file_id):
+    """Read a stored file's duration, codecs and dimensions from its headers.
+
+    The media's duration is filled in if it hasn't been entered by hand,
+    and its type and encoding status are updated now that the codecs are
+    known. See :mod:`mediacore.lib.probe`.
+    """
+    from mediacore.model import MediaFile
+    media_file = MediaFile.query.get(media_file_id)
+    if media_file is None:
+        return
+    file_path = media_file.file_path
+    if not file_path or not os.path.exists(file_path):
+        # Moved to remote storage already, or not a local file at all
+        return
+    try:
+        info = probe(file_path)
+    except ProbeError, e:
+        log.warn('Could not probe %s: %s', file_path, e)
+        return
+    if info is None:
+        return
+
+    if info['duration']:
+        media_file.duration = int(round(info['duration']))
+    for key in ('bitrate', 'width', 'height', 'video_codec', 'audio_codec'):
+        setattr(media_file, key, info[key])
+    if not media_file.container:
+        media_file.container = info['container']
+    if media_file.type in ('audio', 'video'):
+        if info['video_codec']:
+            media_file.type = 'video'
+        elif info['audio_codec']:
+            media_file.type = 'audio'
+
+    media = media_file.media
+    if not media.duration and media_file.duration:
+        media.duration = media_file.duration
+    media.update_type()
+    media.update_status()
+
+@handler('thumbs.resize')
+def resize_thumbs(image_dir, item_id, orig_path):
+    """Create every configured thumbnail size from an original image.
+
+    :param image_dir: The thumb subdir, such as ``'media'``.
+    :param item_id: The ID of the media or podcast.
+    :param orig_path: The path of the original image.
+    """
+    pipeline = ThumbPipeline.from_config(config)
+    thumbs = pipeline.generate(orig_path,
+                               os.path.join(config['image_dir'], image_dir),
+                               item_id, config['thumb_sizes'][image_dir])
+    thumb_manifest.update(image_dir, item_id, thumbs)
+
+@handler('media.refresh_related')
+def refresh_related_media(media_ids, stale_ids=()):
+    """Update the related media lists after media was saved.
+
+    See :meth:`mediacore.lib.related.RelatedMedia.refresh`.
+    """
+    related_media.refresh(media_ids, stale_ids)
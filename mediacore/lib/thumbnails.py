@@ -0,0 +1,500 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Thumbnail Generation
+
+:class:`ThumbPipeline` makes every configured size of thumbnail from an
+uploaded image, doing as little work as it can:
+
+* JPEG sources are decoded at a reduced scale with :meth:`Image.draft`,
+  just large enough for the biggest thumb, which skips most of the work
+  of decoding a photo straight from a camera.
+* Sizes with the same aspect ratio are cascaded: each is resized from the
+  next larger thumb rather than from the full source.
+* Sizes with different aspect ratios, and different items, can be made in
+  a pool of worker processes, see :meth:`ThumbPipeline.generate_many`.
+* Files are written to a temporary name and renamed into place, so a
+  thumb is never served half written.
+
+Besides the usual ``<id><size>.jpg`` files, which may be progressive, it
+can write copies named by a hash of their contents, such as
+``12m-0beec7b5ea.jpg`` and ``12m-62cdb7020f.webp``. Their URLs change
+whenever the image does, so they can be cached forever.
+
+The thumbs that have been made are recorded in the :class:`ThumbManifest`.
+Media and podcasts without thumbs of their own share the default thumbs.
+
+"""
+import cPickle as pickle
+import fcntl
+import glob
+import hashlib
+import os
+import re
+import time
+from cStringIO import StringIO
+
+from PIL import Image, ImageFile
+from paste.deploy.converters import asbool
+from pylons import config
+
+from mediacore.lib.storage import write_atomic
+
+try:
+    import multiprocessing
+except ImportError:
+    # Python 2.5
+    multiprocessing = None
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['ThumbManifest', 'ThumbPipeline', 'resize_thumb', 'thumb_manifest',
+           'webp_supported']
+
+def resize_thumb(img, size, filter=Image.ANTIALIAS):
+    """Resize an image without any stretching by cropping when necessary.
+
+    If the given image has a different aspect ratio than the requested
+    size, the tops or sides will be cropped off before resizing.
+
+    Note that stretching will still occur if the target size is larger
+    than the given image.
+
+    :param img: Any open image
+    :type img: :class:`PIL.Image`
+    :param size: The desired width and height
+    :type size: tuple
+    :param filter: The downsampling filter to use when resizing.
+        Defaults to PIL.Image.ANTIALIAS, the highest possible quality.
+    :returns: A new, resized image instance
+
+    """
+    X, Y, X2, Y2 = 0, 1, 2, 3 # aliases for readability
+
+    src_ratio = float(img.size[X]) / img.size[Y]
+    dst_ratio = float(size[X]) / size[Y]
+
+    if dst_ratio != src_ratio and (img.size[X] >= size[X] and
+                                   img.size[Y] >= size[Y]):
+        crop_size = list(img.size)
+        crop_rect = [0, 0, 0, 0] # X, Y, X2, Y2
+
+        if dst_ratio < src_ratio:
+            crop_size[X] = int(crop_size[Y] * dst_ratio)
+            crop_rect[X] = int(float(img.size[X] - crop_size[X]) / 2)
+        else:
+            crop_size[Y] = int(crop_size[X] / dst_ratio)
+            crop_rect[Y] = int(float(img.size[Y] - crop_size[Y]) / 2)
+
+        crop_rect[X2] = crop_rect[X] + crop_size[X]
+        crop_rect[Y2] = crop_rect[Y] + crop_size[Y]
+
+        img = img.crop(crop_rect)
+
+    return img.resize(size, filter)
+
+def webp_supported():
+    """Return True if this PIL can write WebP images."""
+    Image.init()
+    return 'WEBP' in Image.SAVE
+
+def chains(sizes):
+    """Group thumb sizes into chains which can be cascaded.
+
+    :param sizes: A dict of size keys to ``(width, height)`` tuples.
+    :returns: A list of lists of ``(key, (width, height))`` tuples. The
+        sizes in each list have the same aspect ratio and are ordered from
+        largest to smallest.
+    """
+    groups = []
+    by_area = sorted(sizes.iteritems(),
+                     key=lambda s: (-s[1][0] * s[1][1], s[0]))
+    for key, xy in by_area:
+        ratio = float(xy[0]) / xy[1]
+        for group in groups:
+            w, h = group[0][1]
+            if abs(float(w) / h - ratio) < 0.01 * ratio:
+                group.append((key, xy))
+                break
+        else:
+            groups.append([(key, xy)])
+    return groups
+
+
+class ThumbPipeline(object):
+    """Make thumbnails from original images.
+
+    :param quality: The JPEG and WebP quality, 1 to 100.
+    :param progressive: Write progressive JPEGs.
+    :param webp: Also write content-hashed WebP copies, if PIL can.
+    :param versioned: Also write content-hashed JPEG copies.
+    :param processes: How many processes :meth:`generate_many` may use.
+
+    """
+    def __init__(self, quality=75, progressive=False, webp=False,
+                 versioned=False, processes=1):
+        self.quality = quality
+        self.progressive = progressive
+        self.webp = webp and webp_supported()
+        self.versioned = versioned
+        self.processes = processes
+        if webp and not self.webp:
+            log.warn('WebP thumbs are enabled but PIL cannot write WebP')
+
+    @classmethod
+    def from_config(cls, config, **kwargs):
+        """Create a pipeline with the ``thumb_*`` options in the config."""
+        options = dict(
+            quality=int(config.get('thumb_quality', 75)),
+            progressive=asbool(config.get('thumb_progressive', False)),
+            webp=asbool(config.get('thumb_webp', False)),
+            versioned=asbool(config.get('thumb_versioned', False)),
+        )
+        options.update(kwargs)
+        return cls(**options)
+
+    def _options(self):
+        return (self.quality, self.progressive, self.webp, self.versioned)
+
+    def generate(self, orig_path, dest_dir, item_id, sizes):
+        """Make every size of thumb for one item.
+
+        :param orig_path: The path of the original image.
+        :param dest_dir: The directory to write the thumbs to.
+        :param item_id: The ID of the media or podcast. Thumbs are named
+            ``<item_id><key>.jpg``.
+        :param sizes: A dict of size keys to ``(width, height)`` tuples.
+        :returns: A dict of size keys to dicts with the thumb's ``size``,
+            its ``files``, a dict of formats to file names, and a
+            ``version`` hash of its contents.
+        """
+        img = self._open(orig_path, sizes.values())
+        results = {}
+        for chain in chains(sizes):
+            results.update(self._run_chain(img, dest_dir, item_id, chain))
+        return results
+
+    def generate_many(self, items):
+        """Make thumbs for many items, in parallel if we can.
+
+        :param items: A list of ``(orig_path, dest_dir, item_id, sizes)``
+            tuples, as for :meth:`generate`.
+        :returns: A list of the results of :meth:`generate` for each item.
+        """
+        if self.processes < 2 or multiprocessing is None:
+            return [self.generate(*item) for item in items]
+
+        # Each chain of sizes is independent, so that's the unit of work
+        tasks, owners = [], []
+        for i, (orig_path, dest_dir, item_id, sizes) in enumerate(items):
+            for chain in chains(sizes):
+                tasks.append((self._options(), orig_path, dest_dir, item_id,
+                              chain))
+                owners.append(i)
+        pool = multiprocessing.Pool(self.processes)
+        try:
+            chain_results = pool.map(_generate_chain, tasks, chunksize=1)
+        finally:
+            pool.close()
+            pool.join()
+
+        results = [{} for item in items]
+        for i, result in zip(owners, chain_results):
+            results[i].update(result)
+        return results
+
+    def _open(self, orig_path, sizes):
+        img = Image.open(orig_path)
+        if img.format == 'JPEG':
+            # Decode at 1/2, 1/4 or 1/8 scale if that's still big enough
+            img.draft(img.mode, (max([xy[0] for xy in sizes]),
+                                 max([xy[1] for xy in sizes])))
+        if img.mode not in ('RGB', 'L'):
+            img = img.convert('RGB')
+        else:
+            img.load()
+        return img
+
+    def _run_chain(self, img, dest_dir, item_id, chain):
+        results = {}
+        src = img
+        for key, xy in chain:
+            thumb = resize_thumb(src, xy)
+            files, version = self._save(thumb, dest_dir,
+                                        '%s%s' % (item_id, key))
+            results[key] = {'size': thumb.size, 'files': files,
+                            'version': version}
+            # Cascade to the next size, unless this one was stretched
+            if img.size[0] >= xy[0] and img.size[1] >= xy[1]:
+                src = thumb
+        return results
+
+    def _save(self, thumb, dest_dir, name):
+        files = {}
+        data = self._encode(thumb, 'JPEG', optimize=True,
+                            progressive=self.progressive)
+        version = _digest(data)
+        write_atomic(os.path.join(dest_dir, name + '.jpg'), data)
+        files['jpg'] = name + '.jpg'
+        if self.versioned:
+            files['jpg'] = _write_versioned(dest_dir, name, 'jpg', data)
+        if self.webp:
+            data = self._encode(thumb, 'WEBP')
+            files['webp'] = _write_versioned(dest_dir, name, 'webp', data)
+        return files, version
+
+    def _encode(self, img, format, **options):
+        buf = StringIO()
+        # Optimized and progressive JPEGs are written in one block, which
+        # must be big enough to hold the whole image.
+        maxblock = ImageFile.MAXBLOCK
+        ImageFile.MAXBLOCK = max(maxblock, img.size[0] * img.size[1] * 3)
+        try:
+            img.save(buf, format, quality=self.quality, **options)
+        finally:
+            ImageFile.MAXBLOCK = maxblock
+        return buf.getvalue()
+
+
+def _generate_chain(task):
+    """Make one chain of thumbs in a pool process."""
+    options, orig_path, dest_dir, item_id, chain = task
+    pipeline = ThumbPipeline(*options)
+    img = pipeline._open(orig_path, [xy for key, xy in chain])
+    return pipeline._run_chain(img, dest_dir, item_id, chain)
+
+def _digest(data):
+    """Return the short hash that versioned file names use."""
+    return hashlib.sha1(data).hexdigest()[:10]
+
+def _write_versioned(dest_dir, name, ext, data):
+    """Write a file named by the hash of its contents, and remove the
+    copies of older versions.
+
+    :returns: The file name, such as ``12m-0beec7b5ea.jpg``.
+    """
+    file_name = '%s-%s.%s' % (name, _digest(data), ext)
+    path = os.path.join(dest_dir, file_name)
+    if not os.path.exists(path):
+        write_atomic(path, data)
+    for old_path in glob.glob(os.path.join(dest_dir, '%s-*.%s' % (name, ext))):
+        if old_path != path:
+            os.remove(old_path)
+    return file_name
+
+
+class ThumbManifest(object):
+    """Record which media and podcasts have thumbs of their own.
+
+    Items without an entry use the shared default thumbs, the ones named
+    with an ID of ``new``, so there's no need to copy those for every new
+    item. Each thumb's dimensions and a version, which changes whenever
+    the image does, are recorded too. :func:`mediacore.lib.helpers.thumb_url`
+    looks everything up here, so rendering a page never has to touch the
+    filesystem, and adds the version to the URL so that thumbs can be
+    cached for a long time.
+
+    The manifest is kept as a single pickle, like the search index. Each
+    process loads it into memory and reloads it once another process has
+    replaced it, which is checked at most once every ``check_interval``
+    seconds. Updates are serialized with a lock file and written
+    atomically. Everything in it can be found by scanning the image dirs,
+    which is what happens if the file doesn't exist.
+
+    :param manifest_file: Defaults to ``thumbs.manifest`` in the
+        ``cache_dir``.
+    :param image_dir: Defaults to the ``image_dir`` in the config.
+    :param thumb_sizes: Defaults to the ``thumb_sizes`` in the config.
+    :param check_interval: Seconds between checks for a newer manifest.
+
+    """
+    def __init__(self, manifest_file=None, image_dir=None, thumb_sizes=None,
+                 check_interval=1.0):
+        self._manifest_file = manifest_file
+        self._image_dir = image_dir
+        self._thumb_sizes = thumb_sizes
+        self.check_interval = check_interval
+        self._entries = None
+        self._stat = None
+        self._checked = 0
+
+    @property
+    def manifest_file(self):
+        if self._manifest_file is None:
+            self._manifest_file = os.path.join(config['cache_dir'],
+                                               'thumbs.manifest')
+        return self._manifest_file
+
+    @property
+    def image_dir(self):
+        return self._image_dir or config['image_dir']
+
+    @property
+    def thumb_sizes(self):
+        return self._thumb_sizes or config['thumb_sizes']
+
+    def load(self):
+        """Return the current dict of ``(image_dir, item_id)`` to entries.
+
+        Each entry is a dict of size keys to dicts of the thumb's ``size``,
+        ``files`` and ``version``, as returned by
+        :meth:`ThumbPipeline.generate`. The defaults have an ID of ``new``.
+        """
+        now = time.time()
+        if self._entries is not None and now - self._checked < self.check_interval:
+            return self._entries
+        self._checked = now
+        try:
+            stat = os.stat(self.manifest_file)
+        except OSError:
+            self.rebuild()
+            return self._entries
+        stat = (stat.st_ino, stat.st_mtime, stat.st_size)
+        if self._entries is None or stat != self._stat:
+            manifest_file = open(self.manifest_file, 'rb')
+            try:
+                self._entries = pickle.load(manifest_file)
+            finally:
+                manifest_file.close()
+            self._stat = stat
+        return self._entries
+
+    def get(self, image_dir, item_id):
+        """Return the entry for an item, or ``None`` if it has no thumbs."""
+        return self.load().get((image_dir, item_id), None)
+
+    def has(self, image_dir, item_id, size):
+        """Return True if the item has its own thumb of the given size."""
+        entry = self.get(image_dir, item_id)
+        return entry is not None and size in entry
+
+    def lookup(self, image_dir, item_id, size):
+        """Find the thumb to display for an item.
+
+        :returns: The ID the thumb is stored under, which is ``'new'`` if
+            the item uses the default thumb, and a dict of the thumb's
+            ``size``, ``files`` and ``version``, or ``None`` if there is
+            no such thumb at all.
+        """
+        entries = self.load()
+        entry = entries.get((image_dir, item_id), None)
+        if entry is None or size not in entry:
+            item_id = 'new'
+            entry = entries.get((image_dir, item_id), None)
+            if entry is None or size not in entry:
+                return item_id, None
+        return item_id, entry[size]
+
+    def update(self, image_dir, item_id, thumbs):
+        """Record the thumbs that were made for an item.
+
+        :param thumbs: The results of :meth:`ThumbPipeline.generate`.
+        """
+        self._locked(self._change, (image_dir, item_id), thumbs)
+
+    def remove(self, image_dir, item_id):
+        """Forget an item's thumbs, so that it uses the defaults."""
+        self._locked(self._change, (image_dir, item_id), None)
+
+    def _change(self, key, entry):
+        try:
+            manifest_file = open(self.manifest_file, 'rb')
+        except IOError:
+            entries = self._scan()
+        else:
+            try:
+                entries = pickle.load(manifest_file)
+            finally:
+                manifest_file.close()
+        if entry is None:
+            entries.pop(key, None)
+        else:
+            entries[key] = entry
+        self._save(entries)
+
+    def rebuild(self):
+        """Rebuild the manifest by scanning the image dirs."""
+        self._locked(lambda: self._save(self._scan()))
+
+    _file_name = re.compile(
+        r'^(\d+|new)([a-z]+)(?:-([0-9a-f]{10}))?\.(jpg|webp)$')
+
+    def _scan(self):
+        entries = {}
+        versions = {}
+        for image_dir, sizes in self.thumb_sizes.iteritems():
+            path = os.path.join(self.image_dir, image_dir)
+            if not os.path.isdir(path):
+                continue
+            for name in os.listdir(path):
+                match = self._file_name.match(name)
+                if not match or match.group(2) not in sizes:
+                    continue
+                item_id, key, digest, ext = match.groups()
+                if item_id != 'new':
+                    item_id = int(item_id)
+                item_key = (image_dir, item_id)
+                if digest is None:
+                    if ext != 'jpg':
+                        continue
+                    # Make up a version that changes with the file
+                    stat = os.stat(os.path.join(path, name))
+                    entries.setdefault(item_key, {})[key] = {
+                        'size': sizes[key], 'files': {'jpg': name},
+                        'version': '%x%x' % (int(stat.st_mtime), stat.st_size),
+                    }
+                else:
+                    versions.setdefault((item_key, key), []).append(
+                        (ext, name, digest))
+        # Content-hashed copies are only used alongside the usual file
+        for (item_key, key), files in versions.iteritems():
+            thumb = entries.get(item_key, {}).get(key, None)
+            if thumb is None:
+                continue
+            for ext, name, digest in files:
+                thumb['files'][ext] = name
+                if ext == 'jpg':
+                    thumb['version'] = digest
+        return entries
+
+    def _locked(self, func, *args):
+        cache_dir = os.path.dirname(self.manifest_file)
+        if not os.path.isdir(cache_dir):
+            try:
+                os.makedirs(cache_dir)
+            except OSError:
+                if not os.path.isdir(cache_dir):
+                    raise
+        lock_file = open(self.manifest_file + '.lock', 'w')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                return func(*args)
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+    def _save(self, entries):
+        write_atomic(self.manifest_file,
+                      pickle.dumps(entries, pickle.HIGHEST_PROTOCOL))
+        stat = os.stat(self.manifest_file)
+        self._entries = entries
+        self._stat = (stat.st_ino, stat.st_mtime, stat.st_size)
+        self._checked = time.time()
+
+
+thumb_manifest = ThumbManifest()
@@ -14,50 +14,95 @@ purpose.
 
 This library is free software; you can redistribute it and/or modify
 it under the same terms as Perl.
+
+TABLES
+    The transliterations are packed into ``tables.dat``, which is mapped
+    into memory the first time a non-ASCII character is transliterated.
+    It starts with 257 little-endian unsigned 32 bit offsets: the
+    transliterations of the 256 code points ``0xHH00`` to ``0xHHff`` are
+    found between offsets ``HH`` and ``HH + 1``, separated by ``\\xff``
+    bytes. Missing entries, and code points above ``0xffff``, are
+    transliterated to nothing.
 """
-Char = {}
+import codecs
+import mmap
+import os
+import struct
+
+__all__ = ['unidecode']
+
+_tables_path = os.path.join(os.path.dirname(__file__), 'tables.dat')
+_index_format = '<257I'
+_no_block = [''] * 0x100
+
+class _Tables(object):
+    """The packed tables in ``tables.dat``, mapped into memory when first
+    needed."""
+    def __init__(self, path):
+        self.path = path
+        self._data = None
+        self._index = None
+
+    def block(self, block):
+        """Return the 256 transliterations of a block of code points."""
+        if self._data is None:
+            self._load()
+        if block > 0xff:
+            return _no_block
+        start, end = self._index[block], self._index[block + 1]
+        if start == end:
+            return _no_block
+        values = self._data[start:end].split('\xff')
+        return values + _no_block[len(values):]
 
-NULLMAP = [ '' * 0x100 ]
+    def _load(self):
+        f = open(self.path, 'rb')
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        finally:
+            f.close()
+        self._index = struct.unpack(_index_format,
+                                    data[:struct.calcsize(_index_format)])
+        self._data = data
+
+_tables = _Tables(_tables_path)
+
+# Code points mapped to their transliterations, for codecs.charmap_encode.
+# It's a plain dict, which charmap_encode looks up quickly, so blocks are
+# added by the error handler below when a character isn't found.
+_charmap = dict([(code, chr(code)) for code in range(0x80)])
+
+def _add_blocks(error):
+    if not isinstance(error, UnicodeEncodeError):
+        raise error
+    missing = error.object[error.start:error.end]
+    for char in missing:
+        code = ord(char)
+        if code not in _charmap:
+            base = code & ~0xff
+            for low, value in enumerate(_tables.block(code >> 8)):
+                _charmap[base + low] = value
+            # Beyond the last block, or a lone surrogate in a narrow build
+            _charmap.setdefault(code, '')
+    replacement = ''.join([_charmap[ord(char)] for char in missing])
+    return unicode(replacement), error.end
+
+codecs.register_error('mediacore.unidecode', _add_blocks)
 
 def unidecode(string):
-	"""Transliterate an Unicode object into an ASCII string
-
-	>>> unidecode(u"\u5317\u4EB0")
-	"Bei Jing "
-	"""
-
-	retval = []
-
-	for char in string:
-		o = ord(char)
-
-		if o < 0x80:
-			retval.append(char)
-			continue
-
-		h = o >> 8
-		l = o & 0xff
-
-		c = Char.get(h, None)
-		
-		if c == None:
-			try:
-				mod = __import__('unidecode.x%02x'%(h), [], [], ['data'])
-			except ImportError:
-				Char[h] = NULLMAP
-				retval.append('')
-				continue
-
-			Char[h] = mod.data
-
-			try:
-				retval.append( mod.data[l] )
-			except IndexError:
-				retval.append( '' )
-		else:
-			try:
-				retval.append( c[l] )
-			except IndexError:
-				retval.append( '' )
-
-	return ''.join(retval)
+    """Transliterate an Unicode object into an ASCII string
+
+    >>> unidecode(u"\u5317\u4EB0")
+    'Bei Jing '
+    """
+    if isinstance(string, str):
+        try:
+            string.decode('ascii')
+            return string
+        except UnicodeDecodeError:
+            string = string.decode('latin-1')
+    # Most strings are ASCII, and this is much quicker than any lookups
+    ascii = string.encode('ascii', 'ignore')
+    if len(ascii) == len(string):
+        return ascii
+    return codecs.charmap_encode(string, 'mediacore.unidecode', _charmap)[0]
@@ -0,0 +1,366 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Resumable Chunked Uploads
+
+A file sent in one multipart POST is parsed into a temp file before
+MediaCore sees any of it, copied into the ``media_dir`` afterwards, and
+must be sent again from the start if the connection drops. Clients that
+can send the file in pieces use this protocol instead, which writes each
+chunk straight into the ``media_dir`` as it arrives and hashes it on the
+way through:
+
+``POST /upload/chunked`` with ``filename``, ``size`` and optionally the
+``sha1`` of the whole file
+    Start an upload. Returns the ``session`` ID to use from then on, the
+    ``offset`` to send from, which is 0, and a suggested ``chunk_size``.
+    Files over the ``max_upload_size`` setting get a 413 response, and
+    files without an accepted extension a 415.
+
+``PUT /upload/chunked/<session>?offset=<offset>&sha1=<chunk sha1>``
+    Append the raw request body at the given offset. ``POST`` works too,
+    as long as the body isn't form encoded. If the chunk's SHA-1 is given
+    and doesn't match, the chunk is discarded. Returns the new ``offset``.
+    A wrong offset gets a 409 response with the current one.
+
+``GET /upload/chunked/<session>``
+    Return the current ``offset``. After a dropped connection, the client
+    asks for this and carries on from there.
+
+``POST /upload/chunked/<session>/finalize``
+    Check that the whole file has arrived, and that it matches the
+    ``sha1`` given at the start, if any. Returns its ``sha1``.
+
+The session ID is then submitted in place of the file, as the
+``upload_session`` of the upload form or of the admin's add file action,
+and the file is renamed into place.
+
+Uploads which aren't finished within ``max_age`` seconds are deleted.
+
+"""
+import fcntl
+import hashlib
+import os
+import re
+import time
+
+import simplejson
+from pylons import config
+
+from mediacore.lib.storage import write_atomic
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['ChunkedUpload', 'ChunkedUploads', 'UploadError',
+           'chunked_uploads']
+
+class UploadError(Exception):
+    """Raised when a chunked upload request can't be carried out.
+
+    :param status: The HTTP status code to respond with.
+    :param offset: The upload's current offset, if the client should
+        carry on from there.
+    """
+    def __init__(self, message, status=400, offset=None):
+        Exception.__init__(self, message)
+        self.status = status
+        self.offset = offset
+
+
+class ChunkedUploads(object):
+    """Start, find and expire :class:`ChunkedUpload` sessions.
+
+    :param upload_dir: Where to keep unfinished uploads. Defaults to
+        ``partial`` in the ``media_dir``, so that finished files can be
+        renamed into place rather than copied.
+    :param chunk_size: The chunk size to suggest to clients.
+    :param max_age: Delete uploads which haven't been written to for this
+        many seconds.
+
+    """
+    session_pattern = re.compile(r'^[0-9a-f]{32}$')
+
+    def __init__(self, upload_dir=None, chunk_size=4 * 1024 * 1024,
+                 max_age=86400):
+        self._upload_dir = upload_dir
+        self.chunk_size = chunk_size
+        self.max_age = max_age
+        self._last_purge = 0
+        #: Session ID -> (offset, running SHA-1) for the uploads that
+        #: this process wrote the last chunk of.
+        self._hashes = {}
+
+    @property
+    def upload_dir(self):
+        if self._upload_dir is None:
+            self._upload_dir = os.path.join(config['media_dir'], 'partial')
+        return self._upload_dir
+
+    def create(self, filename, size, sha1=None, max_size=None,
+               extensions=None):
+        """Start a new upload.
+
+        :param filename: The original file name.
+        :param size: The size of the whole file, in bytes.
+        :param sha1: The SHA-1 hex digest of the whole file, if known.
+        :param max_size: The largest file size to accept, if limited.
+        :param extensions: The file extensions to accept, if limited.
+        :rtype: :class:`ChunkedUpload`
+        :raises UploadError: If the file is too large or of the wrong type.
+        """
+        if size < 0:
+            raise UploadError('Invalid size: %d' % size)
+        if max_size is not None and size > max_size:
+            raise UploadError('The file is larger than the limit of %d bytes'
+                              % max_size, 413)
+        if extensions is not None:
+            ext = os.path.splitext(filename or '')[1][1:].lower()
+            if ext not in extensions:
+                raise UploadError('Files of this type are not accepted', 415)
+        if not os.path.isdir(self.upload_dir):
+            try:
+                os.makedirs(self.upload_dir)
+            except OSError:
+                if not os.path.isdir(self.upload_dir):
+                    raise
+        if time.time() - self._last_purge > 3600:
+            self.purge()
+        upload = ChunkedUpload(self.upload_dir, os.urandom(16).encode('hex'),
+                               self._hashes)
+        upload.filename = filename
+        upload.size = size
+        upload.expected_sha1 = sha1 and sha1.lower() or None
+        open(upload.part_path, 'wb').close()
+        upload.save()
+        return upload
+
+    def get(self, session):
+        """Return the upload with the given session ID.
+
+        :raises UploadError: With a 404 status if there is no such upload.
+        """
+        if not session or not self.session_pattern.match(session):
+            raise UploadError('No such upload', 404)
+        upload = ChunkedUpload(self.upload_dir, session, self._hashes)
+        upload.load()
+        return upload
+
+    def purge(self):
+        """Delete uploads that were abandoned more than ``max_age`` ago."""
+        self._last_purge = time.time()
+        cutoff = self._last_purge - self.max_age
+        for name in os.listdir(self.upload_dir):
+            path = os.path.join(self.upload_dir, name)
+            try:
+                if os.path.getmtime(path) < cutoff:
+                    os.remove(path)
+            except OSError:
+                pass
+        # Forget the hashes of uploads which any process has purged
+        for session in self._hashes.keys():
+            part_path = os.path.join(self.upload_dir, session + '.part')
+            if not os.path.exists(part_path):
+                del self._hashes[session]
+
+
+class ChunkedUpload(object):
+    """A file being uploaded in chunks.
+
+    The file is written to ``<session>.part`` in the upload dir, and
+    everything else is kept in ``<session>.json`` beside it.
+
+    :param hashes: A dict which keeps the running hash of the whole file
+        between requests, so that it's only recalculated when a session
+        moves between processes. Shared by all the uploads that a
+        :class:`ChunkedUploads` manages, and dropped once the upload is
+        finished or discarded.
+
+    """
+    def __init__(self, upload_dir, session, hashes=None):
+        self.upload_dir = upload_dir
+        self.session = session
+        if hashes is None:
+            hashes = {}
+        self._hashes = hashes
+        self.filename = None
+        self.size = 0
+        self.offset = 0
+        self.expected_sha1 = None
+        self.sha1 = None
+        self.complete = False
+
+    @property
+    def part_path(self):
+        return os.path.join(self.upload_dir, self.session + '.part')
+
+    @property
+    def state_path(self):
+        return os.path.join(self.upload_dir, self.session + '.json')
+
+    def info(self):
+        """Return a JSON-ready dict of the upload's progress."""
+        return dict(session=self.session, offset=self.offset,
+                    size=self.size, complete=self.complete)
+
+    def load(self):
+        """Read the upload's state from disk."""
+        try:
+            state_file = open(self.state_path, 'rb')
+        except IOError:
+            raise UploadError('No such upload', 404)
+        try:
+            self.__dict__.update(simplejson.load(state_file))
+        finally:
+            state_file.close()
+
+    def save(self):
+        """Write the upload's state to disk, atomically."""
+        state = dict(filename=self.filename, size=self.size,
+                     offset=self.offset, expected_sha1=self.expected_sha1,
+                     sha1=self.sha1, complete=self.complete)
+        write_atomic(self.state_path, simplejson.dumps(state))
+
+    def append(self, offset, stream, length, sha1=None, block_size=65536):
+        """Write a chunk read from a stream at the given offset.
+
+        If the stream ends early, as it does when the connection drops,
+        whatever did arrive is kept, unless a checksum was given for the
+        chunk, in which case the whole chunk is discarded.
+
+        :param offset: Where the chunk goes, which must be the current
+            :attr:`offset`.
+        :param stream: A file-like object to read the chunk from.
+        :param length: The length of the chunk in bytes.
+        :param sha1: The SHA-1 hex digest of the chunk, if known.
+        :raises UploadError: If the chunk can't be accepted.
+        """
+        part_file = open(self.part_path, 'r+b')
+        try:
+            try:
+                fcntl.flock(part_file.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except IOError:
+                raise UploadError('Another chunk is being written', 409,
+                                  self.offset)
+            # Reread the state now that no one else can change it
+            self.load()
+            if self.complete:
+                raise UploadError('The upload is already finished', 409,
+                                  self.offset)
+            if offset != self.offset:
+                raise UploadError('Expected offset %d' % self.offset, 409,
+                                  self.offset)
+            if length < 0 or self.offset + length > self.size:
+                raise UploadError('The chunk runs past the end of the file',
+                                  400, self.offset)
+
+            file_hash = self._file_hash(part_file).copy()
+            chunk_hash = hashlib.sha1()
+            part_file.seek(self.offset)
+            remaining = length
+            while remaining:
+                block = stream.read(min(block_size, remaining))
+                if not block:
+                    break
+                part_file.write(block)
+                file_hash.update(block)
+                chunk_hash.update(block)
+                remaining -= len(block)
+            received = length - remaining
+
+            if sha1 and (remaining or chunk_hash.hexdigest() != sha1.lower()):
+                part_file.truncate(self.offset)
+                raise UploadError('The chunk was corrupted or incomplete',
+                                  400, self.offset)
+            part_file.truncate(self.offset + received)
+            part_file.flush()
+            os.fsync(part_file.fileno())
+            self.offset += received
+            self._hashes[self.session] = (self.offset, file_hash)
+            self.save()
+        finally:
+            part_file.close()
+        if remaining:
+            raise UploadError('Only %d of %d bytes arrived'
+                              % (received, length), 400, self.offset)
+
+    def finalize(self):
+        """Check that the whole file has arrived intact.
+
+        :returns: The SHA-1 hex digest of the file.
+        :raises UploadError: If it hasn't.
+        """
+        if self.complete:
+            return self.sha1
+        if self.offset != self.size:
+            raise UploadError('Only %d of %d bytes have arrived'
+                              % (self.offset, self.size), 400, self.offset)
+        part_file = open(self.part_path, 'rb')
+        try:
+            digest = self._file_hash(part_file).hexdigest()
+        finally:
+            part_file.close()
+        if self.expected_sha1 and digest != self.expected_sha1:
+            self.discard()
+            raise UploadError('The uploaded file was corrupted, '
+                              'please upload it again', 400)
+        self.sha1 = digest
+        self.complete = True
+        self.save()
+        self._hashes.pop(self.session, None)
+        return digest
+
+    def move_to(self, path):
+        """Move the finished file into place and end the session.
+
+        :param path: The file's permanent path, which should be on the same
+            filesystem as the upload dir.
+        :returns: The SHA-1 hex digest of the file.
+        """
+        if not self.complete:
+            raise UploadError('The upload is not finished yet', 400,
+                              self.offset)
+        os.rename(self.part_path, path)
+        os.remove(self.state_path)
+        self._hashes.pop(self.session, None)
+        return self.sha1
+
+    def discard(self):
+        """Delete the upload."""
+        for path in (self.part_path, self.state_path):
+            if os.path.exists(path):
+                os.remove(path)
+        self._hashes.pop(self.session, None)
+
+    def _file_hash(self, part_file, block_size=65536):
+        """Return the SHA-1 of the first :attr:`offset` bytes of the file,
+        from the cache if this process wrote the last chunk."""
+        cached = self._hashes.get(self.session, None)
+        if cached is not None and cached[0] == self.offset:
+            return cached[1]
+        file_hash = hashlib.sha1()
+        part_file.seek(0)
+        remaining = self.offset
+        while remaining:
+            block = part_file.read(min(block_size, remaining))
+            if not block:
+                break
+            file_hash.update(block)
+            remaining -= len(block)
+        self._hashes[self.session] = (self.offset, file_hash)
+        return file_hash
+
+
+chunked_uploads = ChunkedUploads()
@@ -0,0 +1,242 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Batched View Counting
+
+Incrementing :attr:`mediacore.model.media.Media.views` with an ``UPDATE``
+on every page view serializes concurrent requests on the row lock of a
+popular item, and bumps ``modified_on`` besides. Instead, each view is
+appended to a spool file shared by every process on this machine, and the
+spool is periodically coalesced into one multi-row ``UPDATE``.
+
+Crash safety
+------------
+
+* Every view is written to disk before the request finishes, so a process
+  dying (or being recycled by mod_wsgi/fcgi) loses nothing.
+* Writers hold a shared ``flock`` while appending. A flusher claims the
+  spool by taking an exclusive lock and renaming it, so a write is never
+  lost to a file that is being flushed: a writer that finds its file was
+  renamed out from under it simply reopens the spool and tries again.
+* Claimed batches are deleted only after the ``UPDATE`` has committed.
+  A batch left behind by a crashed flusher is picked up again once it is
+  older than ``orphan_age`` seconds. If the crash happened after the commit
+  but before the delete, that batch will be counted twice; view counts
+  are approximate anyway, and a lost batch would be worse.
+
+"""
+import fcntl
+import glob
+import itertools
+import os
+import time
+
+from pylons import config
+from sqlalchemy import sql
+
+from mediacore.model.meta import DBSession
+from mediacore.model.media import media
+
+import logging
+log = logging.getLogger(__name__)
+
+__all__ = ['ViewCounter', 'view_counter']
+
+# Numbers the batches claimed by this process, see ViewCounter._batch_name
+_batch_numbers = itertools.count(1)
+
+class ViewCounter(object):
+    """Buffer media views in a spool file and flush them in batches.
+
+    :param spool_file: Path to the spool. Defaults to ``views.spool``
+        in the ``cache_dir`` config directory.
+    :param flush_interval: Flush at least this often, in seconds,
+        provided views are being recorded.
+    :param flush_threshold: Flush as soon as the spool is this many bytes.
+    :param orphan_age: Reclaim batches abandoned by a crashed flusher
+        after this many seconds.
+    :param bind: The engine or connection to run the update with.
+        Defaults to the engine the :data:`DBSession` is bound to.
+
+    """
+    def __init__(self, spool_file=None, flush_interval=30,
+                 flush_threshold=4096, orphan_age=300, bind=None):
+        self._spool_file = spool_file
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self.orphan_age = orphan_age
+        self.bind = bind
+        self.last_flush = time.time()
+
+    @property
+    def spool_file(self):
+        if self._spool_file is None:
+            self._spool_file = os.path.join(config['cache_dir'], 'views.spool')
+        return self._spool_file
+
+    def increment(self, media_id):
+        """Record one view of the given media and flush if it's time.
+
+        :param media_id: A :attr:`~mediacore.model.media.Media.id`
+        :type media_id: int
+        """
+        size = self._append('%d\n' % media_id)
+        if size >= self.flush_threshold \
+        or time.time() - self.last_flush >= self.flush_interval:
+            try:
+                self.flush()
+            except Exception, e:
+                # Counting views must never break a page view. The batch
+                # stays on disk and will be retried as an orphan.
+                log.exception('Failed to flush the view spool: %s', e)
+
+    def _append(self, line):
+        """Append a line to the spool, returning the resulting spool size."""
+        path = self.spool_file
+        while True:
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_SH)
+                try:
+                    if not self._is_current(fd, path):
+                        # A flusher claimed this file before we got the lock
+                        continue
+                    os.write(fd, line)
+                    return os.fstat(fd).st_size
+                finally:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+            finally:
+                os.close(fd)
+
+    def _is_current(self, fd, path):
+        """Return True if the open ``fd`` is still the file at ``path``."""
+        try:
+            return os.fstat(fd).st_ino == os.stat(path).st_ino
+        except OSError:
+            return False
+
+    def _claim(self):
+        """Atomically take ownership of the current spool.
+
+        :returns: The path of the claimed batch, or ``None``.
+        """
+        path = self.spool_file
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            try:
+                if not self._is_current(fd, path) or os.fstat(fd).st_size == 0:
+                    return None
+                claimed = self._batch_name()
+                os.rename(path, claimed)
+                os.utime(claimed, None)
+                return claimed
+            finally:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    def _batch_name(self):
+        """Return a new, unique name to rename a claimed batch to.
+
+        Renaming replaces any existing file, so no two claims made by this
+        process, whichever counter made them, may share a name.
+        """
+        return '%s.%d.%d.%d' % (self.spool_file, os.getpid(),
+                                time.time() * 1000, _batch_numbers.next())
+
+    def _claim_orphans(self):
+        """Take ownership of batches whose flusher appears to have died."""
+        claimed = []
+        now = time.time()
+        for orphan in glob.glob(self.spool_file + '.*'):
+            try:
+                if now - os.stat(orphan).st_mtime < self.orphan_age:
+                    continue
+                reclaimed = self._batch_name()
+                os.rename(orphan, reclaimed)
+            except OSError:
+                # Another process got to it first
+                continue
+            # Touch it so that nobody else considers it an orphan
+            os.utime(reclaimed, None)
+            claimed.append(reclaimed)
+        return claimed
+
+    def flush(self):
+        """Apply all spooled views to the database.
+
+        :returns: A dict of the view counts that were added, keyed by ID.
+        """
+        self.last_flush = time.time()
+        batches = self._claim_orphans()
+        claimed = self._claim()
+        if claimed:
+            batches.append(claimed)
+        if not batches:
+            return {}
+
+        counts = {}
+        for batch in batches:
+            batch_file = open(batch, 'r')
+            try:
+                for line in batch_file:
+                    line = line.strip()
+                    if line.isdigit():
+                        media_id = int(line)
+                        counts[media_id] = counts.get(media_id, 0) + 1
+            finally:
+                batch_file.close()
+
+        if counts:
+            self._update(counts)
+        for batch in batches:
+            os.remove(batch)
+        return counts
+
+    def _update(self, counts):
+        """Add the given counts in a single UPDATE statement.
+
+        ``modified_on`` is explicitly set to itself so that its ``onupdate``
+        default isn't applied: a view is not a modification.
+        """
+        increment = sql.case(
+            [(media.c.id == media_id, count)
+             for media_id, count in counts.iteritems()],
+            else_=0,
+        )
+        update = media.update(media.c.id.in_(counts.keys()), values={
+            'views': media.c.views + increment,
+            'modified_on': media.c.modified_on,
+        })
+
+        bind = self.bind or DBSession.bind
+        conn = bind.connect()
+        try:
+            trans = conn.begin()
+            try:
+                conn.execute(update)
+                trans.commit()
+            except:
+                trans.rollback()
+                raise
+        finally:
+            conn.close()
+
+
+view_counter = ViewCounter()
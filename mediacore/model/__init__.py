@@ -16,8 +16,10 @@
 from mediacore.model.meta import DBSession, Base
 
 import re
+import transaction
 import webob.exc
 from sqlalchemy import sql, orm
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import class_mapper
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.sql.expression import ColumnClause as _ColumnClause
@@ -118,6 +120,9 @@ def slugify(string):
 
     return string[:slug_length]
 
+# Slugs with suffixes up to this long are found by get_available_slug's query
+_max_suffix_digits = 6
+
 def get_available_slug(mapped_class, string, ignore=None):
     """Return a unique slug based on the provided string.
 
@@ -127,6 +132,13 @@ def get_available_slug(mapped_class, string, ignore=None):
         2. awesome-stuff-2
         3. awesome-stuff-3
 
+    All the slugs that could collide are fetched with a single prefix
+    query, and the first one that's free is found in memory.
+
+    This only checks what has been saved: use
+    :func:`flush_with_available_slug` when another request might save the
+    same slug first.
+
     :param mapped_class: The ORM-controlled model that the slug is for
     :param string: A title, name, etc
     :type string: unicode
@@ -140,19 +152,72 @@ def get_available_slug(mapped_class, string, ignore=None):
     elif ignore is not None:
         ignore = int(ignore)
 
-    new_slug = slug = slugify(string)
+    slug = slugify(string)
+    # A long slug is cut short to make room for the suffix, so match the
+    # part that every suffixed version of it starts with. LIKE's _ wildcard
+    # may match extra slugs, but only exact matches are counted below.
+    prefix = slug[:slug_length - len('-') - _max_suffix_digits]
+    if prefix == slug:
+        similar = sql.or_(mapped_class.slug == slug,
+                          mapped_class.slug.like(slug + '-%'))
+    else:
+        similar = mapped_class.slug.like(prefix + '%')
+    taken = DBSession.query(mapped_class.slug)\
+        .filter(similar)\
+        .filter(mapped_class.id != ignore)\
+        .all()
+    return _first_available_slug(slug, set([row[0] for row in taken]))
+
+def _first_available_slug(slug, taken):
+    new_slug = slug
     appendix = 2
-    while DBSession.query(mapped_class.id)\
-            .filter(mapped_class.slug == new_slug)\
-            .filter(mapped_class.id != ignore)\
-            .first():
+    while new_slug in taken:
         str_appendix = '-%s' % appendix
         max_substr_len = slug_length - len(str_appendix)
         new_slug = slug[:max_substr_len] + str_appendix
         appendix += 1
-
     return new_slug
 
+def flush_with_available_slug(obj, string, attempts=5):
+    """Flush the session, choosing another slug for ``obj`` if the one it
+    has was saved by someone else in the meantime.
+
+    The flush is done within a savepoint. If it breaks a unique constraint
+    and the next available slug based on ``string`` has changed, the
+    savepoint is rolled back and the flush is tried again with that slug.
+
+    The session must already be joined to the transaction, by having run
+    a query such as :func:`get_available_slug`. Rolling back a savepoint
+    expires everything in the session and expunges everything pending, so
+    other changes should be flushed before ``obj`` and the objects it
+    cascades to are added. When changing the slug of an existing row,
+    call this right after setting the slug and before making any other
+    changes to it; a new instance keeps its attributes and can be flushed
+    once it's filled in.
+
+    :param obj: An instance of a mapped class with a slug
+    :param string: The title, name, etc that the slug is based on
+    :type string: unicode
+    :param attempts: The number of slugs to try
+    :returns: The slug that was saved
+    :rtype: string
+    :raises sqlalchemy.exc.IntegrityError: If the flush fails for another
+        reason, or every attempt collides
+    """
+    mapped_class = obj.__class__
+    for attempt in range(attempts):
+        savepoint = transaction.savepoint()
+        try:
+            DBSession.add(obj)
+            DBSession.flush()
+            return obj.slug
+        except IntegrityError, e:
+            savepoint.rollback()
+            slug = get_available_slug(mapped_class, string, obj)
+            if slug == obj.slug or attempt == attempts - 1:
+                raise e
+            obj.slug = slug
+
 def _properties_dict_from_labels(*args):
     """Produce a dictionary of mapper properties from the given args list.
 
@@ -259,3 +324,4 @@ from mediacore.model.tags import Tag
 from mediacore.model.categories import Category
 from mediacore.model.media import Media, MediaFile
 from mediacore.model.podcasts import Podcast
+from mediacore.model.jobs import Job
@@ -28,6 +28,8 @@ categories = Table('categories', Base.metadata,
     Column('name', Unicode(50), unique=True, nullable=False),
     Column('slug', String(50), unique=True, nullable=False),
     Column('parent_id', Integer, ForeignKey('categories.id', onupdate='CASCADE', ondelete='CASCADE')),
+    Column('media_count_published', Integer, default=0, nullable=False),
+    Column('media_count_published_total', Integer, default=0, nullable=False),
     mysql_engine='InnoDB',
     mysql_charset='utf8'
 )
@@ -123,6 +125,19 @@ class CategoryList(list):
 class Category(object):
     """
     Category Mapped Class
+
+    .. attribute:: media_count_published
+
+        A stored count of the published media in this category.
+
+    .. attribute:: media_count_published_total
+
+        The sum of :attr:`media_count_published` for this category and
+        all of its descendants, for displaying the category tree.
+
+    Both counts are kept up to date by
+    :data:`mediacore.model.counts.published_counts`.
+
     """
     query = DBSession.query_property(CategoryQuery)
 
@@ -0,0 +1,258 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Published Media Counts
+
+The number of published media for each tag, category and podcast is stored
+in a ``media_count_published`` column on each of those tables, so that tag
+clouds and the category tree can be displayed from a single query.
+Categories also store a ``media_count_published_total`` which includes all
+their descendants.
+
+Whether media is published depends on the current time, so the counts
+can't simply be incremented and decremented. Instead,
+:func:`refresh_published_counts` recalculates them all with a handful of
+``UPDATE`` statements, and :data:`published_counts` decides when this is
+necessary: whenever media is published, unpublished, moved or re-tagged
+(as noted by :class:`mediacore.lib.responsecache.ResponseCacheExtension`
+with the ``media_status`` tag), and whenever a scheduled ``publish_on`` or
+``publish_until`` date passes.
+
+"""
+import fcntl
+import os
+import time
+from datetime import datetime
+
+from pylons import config
+from sqlalchemy import sql
+
+from mediacore.lib.responsecache import next_publish_boundary, response_cache
+from mediacore.lib.storage import write_atomic
+from mediacore.model.meta import DBSession
+from mediacore.model.media import media, media_tags, media_categories
+from mediacore.model.tags import tags
+from mediacore.model.categories import categories
+from mediacore.model.podcasts import podcasts
+
+__all__ = ['PublishedCounts', 'published_counts', 'refresh_published_counts']
+
+def _count_published(now, *where):
+    """Return a correlated scalar subquery counting published media."""
+    return sql.select([sql.func.count(media.c.id)], sql.and_(
+        media.c.publishable == True,
+        media.c.publish_on <= now,
+        sql.or_(media.c.publish_until == None,
+                media.c.publish_until >= now),
+        *where
+    ))
+
+def refresh_published_counts(conn, now=None):
+    """Recalculate all the stored published media counts.
+
+    :param conn: The connection to execute the updates with.
+    :param now: The moment in time to count published media for.
+    :type now: :class:`datetime.datetime`
+
+    """
+    if now is None:
+        now = datetime.now()
+
+    conn.execute(tags.update(values={
+        'media_count_published': _count_published(now,
+            media_tags.c.media_id == media.c.id,
+            media_tags.c.tag_id == tags.c.id,
+        ).correlate(tags).as_scalar(),
+    }))
+
+    conn.execute(podcasts.update(values={
+        'media_count_published': _count_published(now,
+            media.c.podcast_id == podcasts.c.id,
+        ).correlate(podcasts).as_scalar(),
+        'modified_on': podcasts.c.modified_on,
+    }))
+
+    conn.execute(categories.update(values={
+        'media_count_published': _count_published(now,
+            media_categories.c.media_id == media.c.id,
+            media_categories.c.category_id == categories.c.id,
+        ).correlate(categories).as_scalar(),
+    }))
+
+    # Roll the category counts up to their ancestors. The tree is small,
+    # so this is done here rather than with one query per level.
+    rows = conn.execute(sql.select([
+        categories.c.id,
+        categories.c.parent_id,
+        categories.c.media_count_published,
+        categories.c.media_count_published_total,
+    ])).fetchall()
+    totals = _category_totals(rows)
+
+    changed = [{'cat_id': row[0], 'total': totals[row[0]]}
+               for row in rows if totals[row[0]] != row[3]]
+    if changed:
+        conn.execute(categories.update(
+            categories.c.id == sql.bindparam('cat_id'),
+            values={'media_count_published_total': sql.bindparam('total')},
+        ), changed)
+
+def _category_totals(rows):
+    """Add each category's count to its own total and all its ancestors'.
+
+    :param rows: ``(id, parent_id, count, ...)`` rows for every category.
+    :returns: A dict of category IDs to their totals.
+
+    """
+    parents = dict((row[0], row[1]) for row in rows)
+    totals = dict((row[0], 0) for row in rows)
+    for row in rows:
+        id, count = row[0], row[2]
+        visited = set()
+        while id is not None and id not in visited:
+            visited.add(id)
+            totals[id] += count
+            id = parents.get(id)
+    return totals
+
+
+class PublishedCounts(object):
+    """Refresh the published media counts whenever they may be out of date.
+
+    A stamp file records which version of the ``media_status`` tag the
+    stored counts reflect and when the next scheduled media will be
+    published or unpublished. When it is out of date, the process which
+    takes an exclusive lock on the ``.lock`` file beside it checks the
+    stamp again and recalculates the counts if still necessary. Other
+    processes don't wait for the lock; they serve the previous counts
+    until the new ones are ready.
+
+    :param stamp_file: Defaults to ``published_counts.stamp`` in the
+        ``cache_dir`` config directory.
+    :param tag_versions: A :class:`mediacore.lib.responsecache.TagVersions`
+        instance. Defaults to the one used by the response cache.
+    :param check_interval: Only check the stamp this often, in seconds.
+    :param max_age: Recalculate at least this often, in seconds.
+    :param bind: The engine to run the updates with. Defaults to the
+        engine the :data:`DBSession` is bound to.
+
+    """
+    def __init__(self, stamp_file=None, tag_versions=None,
+                 check_interval=1.0, max_age=3600, bind=None):
+        self._stamp_file = stamp_file
+        self.tag_versions = tag_versions or response_cache.tag_versions
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self.bind = bind
+        self._checked = 0
+
+    @property
+    def stamp_file(self):
+        if self._stamp_file is None:
+            self._stamp_file = os.path.join(config['cache_dir'],
+                                            'published_counts.stamp')
+        return self._stamp_file
+
+    def ensure_fresh(self):
+        """Refresh the counts if anything has changed since they were.
+
+        Returns without waiting if another process is refreshing them.
+        """
+        now = time.time()
+        if now - self._checked < self.check_interval:
+            return
+        self._checked = now
+        version = self.tag_versions.get('media_status')
+        if not self._stale(version):
+            return
+        self._locked(False, self._refresh_if_stale, version)
+
+    def refresh(self, version=None):
+        """Recalculate the counts now, in their own transaction.
+
+        Waits for any other process which is refreshing them to finish.
+        """
+        if version is None:
+            version = self.tag_versions.get('media_status')
+        self._locked(True, self._refresh, version)
+
+    def _stale(self, version):
+        try:
+            stamp = open(self.stamp_file)
+            try:
+                valid_until, stamp_version = stamp.read().split('\n', 1)
+            finally:
+                stamp.close()
+            return float(valid_until) <= time.time() \
+                or stamp_version != version
+        except (IOError, ValueError):
+            return True
+
+    def _locked(self, wait, func, *args):
+        stamp_dir = os.path.dirname(self.stamp_file)
+        if not os.path.isdir(stamp_dir):
+            try:
+                os.makedirs(stamp_dir)
+            except OSError:
+                if not os.path.isdir(stamp_dir):
+                    raise
+        lock_file = open(self.stamp_file + '.lock', 'w')
+        try:
+            flags = fcntl.LOCK_EX
+            if not wait:
+                flags |= fcntl.LOCK_NB
+            try:
+                fcntl.flock(lock_file.fileno(), flags)
+            except IOError:
+                # Someone else is already refreshing the counts
+                return
+            try:
+                func(*args)
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+        finally:
+            lock_file.close()
+
+    def _refresh_if_stale(self, version):
+        # The process which held the lock before may have just done it
+        if self._stale(version):
+            self._refresh(version)
+
+    def _refresh(self, version):
+        now = datetime.now()
+        self._recount(now)
+
+        valid_until = time.time() + self.max_age
+        boundary = next_publish_boundary(now)
+        if boundary is not None:
+            valid_until = min(valid_until, time.mktime(boundary.timetuple()))
+        write_atomic(self.stamp_file, '%f\n%s' % (valid_until, version))
+
+    def _recount(self, now):
+        bind = self.bind or DBSession.bind
+        conn = bind.connect()
+        try:
+            trans = conn.begin()
+            try:
+                refresh_published_counts(conn, now)
+                trans.commit()
+            except:
+                trans.rollback()
+                raise
+        finally:
+            conn.close()
+
+
+published_counts = PublishedCounts()
@@ -0,0 +1,103 @@
+# This file is a part of MediaCore, Copyright 2009 Simple Station Inc.
+#
+# MediaCore is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# MediaCore is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+"""
+Job Model
+
+Background jobs which are queued by requests and run by worker processes,
+see :mod:`mediacore.lib.jobs`.
+
+A job's status is one of:
+
+    queued
+        Waiting for its ``run_after`` time and a free worker.
+    running
+        Claimed by a worker until ``locked_until``. If the worker dies,
+        the job is claimed again once that time has passed.
+    done
+        Finished successfully. Kept for a while so that its ``job_key``
+        still prevents duplicates.
+    dead
+        Failed ``max_attempts`` times. Dead jobs are listed in the admin
+        so that they can be retried or discarded.
+
+"""
+from datetime import datetime
+
+import simplejson
+from sqlalchemy import Table, Column, Index
+from sqlalchemy.types import String, UnicodeText, Integer, DateTime
+from sqlalchemy.orm import mapper, Query
+
+from mediacore.model.meta import Base, DBSession
+
+jobs = Table('jobs', Base.metadata,
+    Column('id', Integer, autoincrement=True, primary_key=True),
+    Column('name', String(50), nullable=False),
+    Column('job_key', String(255), unique=True),
+    Column('args', UnicodeText, nullable=False),
+    Column('status', String(10), default='queued', nullable=False),
+    Column('attempts', Integer, default=0, nullable=False),
+    Column('max_attempts', Integer, default=5, nullable=False),
+    Column('run_after', DateTime, default=datetime.now, nullable=False),
+    Column('locked_until', DateTime),
+    Column('last_error', UnicodeText),
+    Column('created_on', DateTime, default=datetime.now, nullable=False),
+    Column('modified_on', DateTime, default=datetime.now, onupdate=datetime.now, nullable=False),
+    mysql_engine='InnoDB',
+    mysql_charset='utf8'
+)
+Index('jobs_status_run_after', jobs.c.status, jobs.c.run_after)
+
+
+class JobQuery(Query):
+    def dead(self, flag=True):
+        if flag:
+            return self.filter(Job.status == 'dead')
+        return self.filter(Job.status != 'dead')
+
+
+class Job(object):
+    """A Background Job
+
+    .. attribute:: name
+
+        The name of the handler to run, see
+        :func:`mediacore.lib.jobs.handler`.
+
+    .. attribute:: job_key
+
+        An optional unique key. A job is not queued if another with the
+        same key already exists.
+
+    .. attribute:: args
+
+        A dict of keyword arguments for the handler, stored as JSON.
+
+    """
+    query = DBSession.query_property(JobQuery)
+
+    def __repr__(self):
+        return '<Job: %s %s %s>' % (self.id, self.name, self.status)
+
+    def _get_args(self):
+        return simplejson.loads(self._args or '{}')
+    def _set_args(self, args):
+        self._args = unicode(simplejson.dumps(args))
+    args = property(_get_args, _set_args)
+
+
+mapper(Job, jobs, properties={
+    '_args': jobs.c.args,
+})
@@ -33,19 +33,21 @@ import os.path
 from datetime import datetime
 from urlparse import urlparse
 
-from sqlalchemy import Table, ForeignKey, Column, sql, func
+from sqlalchemy import Table, ForeignKey, Column, Index, sql, func
 from sqlalchemy.types import String, Unicode, UnicodeText, Integer, DateTime, Boolean, Float
 from sqlalchemy.orm import mapper, class_mapper, relation, backref, synonym, composite, column_property, comparable_property, dynamic_loader, validates, collections, Query
 from pylons import config, request
 
-from mediacore.model import get_available_slug, _mtm_count_property, _properties_dict_from_labels, _MatchAgainstClause
+from mediacore.model import flush_with_available_slug, get_available_slug, _mtm_count_property, _properties_dict_from_labels, _MatchAgainstClause
 from mediacore.model.meta import Base, DBSession
 from mediacore.model.authors import Author
 from mediacore.model.comments import Comment, CommentQuery, comments
 from mediacore.model.tags import Tag, TagList, tags, extract_tags, fetch_and_create_tags
 from mediacore.model.categories import Category, CategoryList, categories, fetch_categories
-from mediacore.lib import helpers
-from mediacore.lib.filetypes import default_media_mimetype, external_embedded_containers, mimetype_lookup, playable_containers
+from mediacore.lib import excerpts, helpers
+from mediacore.lib.paginate import SeekOrder
+from mediacore.lib.search import get_backend as search_backend
+from mediacore.lib.filetypes import default_media_mimetype, external_embedded_containers, is_playable, mimetype_lookup
 
 class MediaException(Exception): pass
 class MediaFileException(MediaException): pass
@@ -70,16 +72,22 @@ media = Table('media', Base.metadata,
     Column('subtitle', Unicode(255)),
     Column('description', UnicodeText),
     Column('description_plain', UnicodeText),
+    Column('description_excerpts', UnicodeText),
     Column('notes', UnicodeText),
 
     Column('duration', Integer, default=0, nullable=False),
     Column('views', Integer, default=0, nullable=False),
     Column('likes', Integer, default=0, nullable=False),
     Column('popularity_points', Integer, default=0, nullable=False),
+    Column('comment_count', Integer, default=0, nullable=False),
+    Column('comment_count_published', Integer, default=0, nullable=False),
 
     Column('author_name', Unicode(50), nullable=False),
     Column('author_email', Unicode(255), nullable=False),
 )
+# For paging through listings by cursor, see seek_orders below
+Index('media_publish_on', media.c.publish_on, media.c.id)
+Index('media_popularity_points', media.c.popularity_points, media.c.id)
 
 media_files = Table('media_files', Base.metadata,
     Column('id', Integer, autoincrement=True, primary_key=True),
@@ -93,6 +101,14 @@ media_files = Table('media_files', Base.metadata,
     Column('embed', String(50), nullable=False),
     Column('size', Integer),
 
+    # Read from the file's headers by mediacore.lib.probe
+    Column('duration', Integer),
+    Column('bitrate', Integer),
+    Column('width', Integer),
+    Column('height', Integer),
+    Column('video_codec', String(10)),
+    Column('audio_codec', String(10)),
+
     Column('created_on', DateTime, default=datetime.now, nullable=False),
     Column('modified_on', DateTime, default=datetime.now, onupdate=datetime.now, nullable=False),
 )
@@ -123,17 +139,44 @@ media_fulltext = Table('media_fulltext', Base.metadata,
     mysql_engine='MyISAM',
 )
 
+media_related = Table('media_related', Base.metadata,
+    Column('media_id', Integer, ForeignKey('media.id', onupdate='CASCADE', ondelete='CASCADE'),
+        primary_key=True),
+    Column('related_id', Integer, ForeignKey('media.id', onupdate='CASCADE', ondelete='CASCADE'),
+        primary_key=True),
+    Column('score', Float, nullable=False),
+    mysql_engine='InnoDB',
+)
+Index('media_related_score', media_related.c.media_id, media_related.c.score)
+
+# The words in each media item's title and subtitle, and how many media
+# each word is used by, which :mod:`mediacore.lib.related` keeps up to date
+# so that it can score an item without reading the whole library.
+media_title_words = Table('media_title_words', Base.metadata,
+    Column('media_id', Integer, primary_key=True, autoincrement=False),
+    Column('word', String(50), primary_key=True),
+    Column('count', Integer, nullable=False),
+    mysql_engine='InnoDB',
+)
+Index('media_title_words_word', media_title_words.c.word)
+
+title_word_counts = Table('title_word_counts', Base.metadata,
+    Column('word', String(50), primary_key=True),
+    Column('media_count', Integer, nullable=False),
+    mysql_engine='InnoDB',
+)
+
 # Columns grouped by their FULLTEXT index
 _search_cols = {
     'public': [
         media_fulltext.c.title, media_fulltext.c.subtitle,
         media_fulltext.c.tags, media_fulltext.c.categories,
-        media_fulltext.c.description_plain, media_fulltext.c.notes,
+        media_fulltext.c.description_plain,
     ],
     'admin': [
         media_fulltext.c.title, media_fulltext.c.subtitle,
         media_fulltext.c.tags, media_fulltext.c.categories,
-        media_fulltext.c.description_plain,
+        media_fulltext.c.description_plain, media_fulltext.c.notes,
     ],
 }
 _search_param = sql.bindparam('search')
@@ -164,16 +207,24 @@ class MediaQuery(Query):
                              Media.publishable.asc())
 
     def search(self, search):
-        return self.join(MediaFullText)\
-                   .filter(_MatchAgainstClause(_search_cols['public'], _search_param, True))\
-                   .order_by(MediaFullText.relevance.desc())\
-                   .params({_search_param.key: search})
+        """Filter and order by relevance using the configured backend.
+
+        See :mod:`mediacore.lib.search`.
+        """
+        return search_backend().search(self, search)
 
     def admin_search(self, search):
-        return self.join(MediaFullText)\
-                   .filter(_MatchAgainstClause(_search_cols['admin'], _search_param, True))\
-                   .order_by(MediaFullText.admin_relevance.desc())\
-                   .params({_search_param.key: search})
+        """Search as :meth:`search` does, including admin-only fields."""
+        return search_backend().search(self, search, admin=True)
+
+    def related(self, media):
+        """Return the media most related to the given item, best first.
+
+        The neighbours are precomputed by :mod:`mediacore.lib.related`.
+        """
+        return self.join((media_related, media_related.c.related_id == Media.id))\
+                   .filter(media_related.c.media_id == media.id)\
+                   .order_by(media_related.c.score.desc())
 
     def in_category(self, cat):
         all_cats = [cat]
@@ -269,6 +320,8 @@ class Media(object):
 
         A public-facing plaintext description. Should be a paragraph or more.
 
+        Excerpts of both descriptions are stored too, see :meth:`excerpt`.
+
     .. attribute:: duration
 
         Play time in seconds
@@ -325,6 +378,11 @@ class Media(object):
     .. attribute:: comment_count
     .. attribute:: comment_count_published
 
+        Counts of all comments and of published comments. These columns
+        are recalculated whenever comments are saved, by
+        :class:`mediacore.lib.commentcounts.CommentCountExtension`, and
+        can be repaired with :func:`rebuild_comment_counts`.
+
     """
 
     query = DBSession.query_property(MediaQuery)
@@ -376,7 +434,8 @@ class Media(object):
 
         * ``unreviewed`` is added if no files exist.
         * ``unencoded`` is added if there isn't any file to play with the
-          Flash player. YouTube and other embeddable files qualify.
+          Flash player. YouTube and other embeddable files qualify. Files
+          which have been probed must use codecs that Flash can play.
         * ``unencoded`` is added if this is a podcast episode, and there
           is no iTunes-compatible file. Embeddable file types don't qualify.
         * ``publish`` is removed and ``draft`` is added if any of
@@ -396,7 +455,7 @@ class Media(object):
             if not self.type:    # Sanity check
                 self.update_type()
             for file in self.files:
-                if file.container in playable_containers[self.type]:
+                if is_playable(file, self.type):
                     self.encoded = True
                     return True
             if self.podcast_id is None:
@@ -442,6 +501,9 @@ class Media(object):
            and (self.publish_until is None or self.publish_until >= datetime.now())
 
     def increment_views(self):
+        # NOTE: Public page views are counted in batches by
+        #       mediacore.lib.viewcounter instead. This issues an UPDATE
+        #       within the current transaction.
         # update the number of views with an expression, to avoid concurrency
         # issues associated with simultaneous writes.
         views = self.views + 1
@@ -474,20 +536,39 @@ class Media(object):
         else:
             self.popularity_points = 0
 
+    def excerpt(self, size, xhtml=False):
+        """Return the description truncated to roughly a given size.
+
+        The sizes used by the templates are stored when the description is
+        set, see :mod:`mediacore.lib.excerpts`, others are cut as needed.
+
+        :param size: Max length
+        :param xhtml: Truncate :attr:`description` instead of
+            :attr:`description_plain`
+        :rtype: unicode
+        """
+        stored = excerpts.get_excerpt(excerpts.decoded_excerpts(self),
+                                     size, xhtml)
+        if stored is not None:
+            return stored
+        if xhtml:
+            return excerpts.truncate_xhtml(self.description, size)
+        return excerpts.truncate_plain(self.description_plain, size)
+
     @validates('description')
     def _validate_description(self, key, value):
-        self.description_plain = helpers.line_break_xhtml(
-            helpers.line_break_xhtml(value)
-        )
+        self.description_plain = value
+        self._description_excerpts = excerpts.make_excerpts(
+            value, self.description_plain)
         return value
 
     @validates('description_plain')
     def _validate_description_plain(self, key, value):
-        return helpers.strip_xhtml(value, True)
+        return helpers.xhtml_to_plain(value)
 
 
 def create_media_stub():
-    """Return a new :class:`Media` instance with helpful defaults.
+    """Save and return a new :class:`Media` instance with helpful defaults.
 
     This is used any time we need a placeholder db record, such as when:
 
@@ -501,6 +582,7 @@ def create_media_stub():
     m.slug = get_available_slug(Media, 'stub-%s' % timestamp)
     m.title = '(Stub %s created by %s)' % (timestamp, user.display_name)
     m.author = Author(user.display_name, user.email_address)
+    flush_with_available_slug(m, 'stub-%s' % timestamp)
     return m
 
 
@@ -586,37 +668,74 @@ _media_mapper = mapper(Media, media, properties={
     'categories': relation(Category, secondary=media_categories, backref=backref('media', lazy='dynamic', query_class=MediaQuery), collection_class=CategoryList, passive_deletes=True),
 
     'comments': dynamic_loader(Comment, backref='media', query_class=CommentQuery, passive_deletes=True),
-    'comment_count': column_property(
-        sql.select([sql.func.count(comments.c.id)],
-                   media.c.id == comments.c.media_id).label('comment_count'),
-        deferred=True),
-    'comment_count_published': column_property(
-        sql.select([sql.func.count(comments.c.id)],
-                   sql.and_(comments.c.media_id == media.c.id,
-                            comments.c.publishable == True)).label('comment_count_published'),
-        deferred=True),
+    '_description_excerpts': media.c.description_excerpts,
 })
 
+#: The orders that published media listings can be paged through by cursor,
+#: keyed by the ``show`` value of the library controls.
+seek_orders = {
+    'latest': SeekOrder('latest', Media.publish_on, Media.id),
+    'popular': SeekOrder('popular', Media.popularity_points, Media.id),
+}
+
+def update_comment_counts(conn, media_ids=None):
+    """Recalculate :attr:`Media.comment_count` and
+    :attr:`Media.comment_count_published` by counting the comments.
+
+    :param conn: The connection or session to execute the update with.
+    :param media_ids: The IDs of the media to update, or ``None`` for all.
+
+    """
+    def count(*where):
+        return sql.select([sql.func.count(comments.c.id)],
+                          sql.and_(comments.c.media_id == media.c.id, *where))\
+            .correlate(media).as_scalar()
+
+    update = media.update(values={
+        'comment_count': count(),
+        'comment_count_published': count(comments.c.publishable == True),
+        'modified_on': media.c.modified_on,
+    })
+    if media_ids is not None:
+        if not media_ids:
+            return
+        update = update.where(media.c.id.in_(list(media_ids)))
+    conn.execute(update)
+
+def rebuild_comment_counts():
+    """Recalculate the comment counts of all media in one statement.
+
+    :class:`mediacore.lib.commentcounts.CommentCountExtension` keeps the
+    counters accurate for comments saved through the ORM. This is for
+    repairing them after comments were imported or edited with plain SQL,
+    which is required on any database without the MySQL triggers.
+    Run it with ``paster --plugin=MediaCore rebuild-counts <config file>``.
+    """
+    update_comment_counts(DBSession)
+
+def rebuild_excerpts():
+    """Store the description excerpts of every media item, at the lengths
+    currently set in :mod:`mediacore.lib.excerpts`.
+
+    Run it with ``paster --plugin=MediaCore rebuild-excerpts <config file>``.
+    """
+    rows = DBSession.execute(sql.select([media.c.id, media.c.description,
+                                         media.c.description_plain])).fetchall()
+    for id, description, description_plain in rows:
+        DBSession.execute(media.update(media.c.id == id, values={
+            'description_excerpts': excerpts.make_excerpts(description,
+                                                           description_plain),
+            'modified_on': media.c.modified_on,
+        }))
+
 # Add properties for counting how many media items have a given Tag
 _tags_mapper = class_mapper(Tag, compile=False)
 _tags_mapper.add_properties(_properties_dict_from_labels(
     _mtm_count_property('media_count', media_tags),
-    _mtm_count_property('media_count_published', media_tags, [
-        media.c.publishable,
-        media.c.publish_on <= datetime.now(),
-        sql.or_(media.c.publish_until == None,
-                media.c.publish_until >= datetime.now()),
-    ]),
 ))
 
 # Add properties for counting how many media items have a given Category
 _categories_mapper = class_mapper(Category, compile=False)
 _categories_mapper.add_properties(_properties_dict_from_labels(
     _mtm_count_property('media_count', media_categories),
-    _mtm_count_property('media_count_published', media_categories, [
-        media.c.publishable,
-        media.c.publish_on <= datetime.now(),
-        sql.or_(media.c.publish_until == None,
-                media.c.publish_until >= datetime.now()),
-    ]),
 ))
@@ -3,11 +3,22 @@ from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import scoped_session, sessionmaker
 from zope.sqlalchemy import ZopeTransactionExtension
 
+from mediacore.lib.commentcounts import CommentCountExtension
+from mediacore.lib.responsecache import ResponseCacheExtension
+from mediacore.lib.related import RelatedMediaExtension
+from mediacore.lib.search import SearchIndexExtension
+
 __all__ = ['Base', 'DBSession']
 
 # SQLAlchemy session manager. Updated by model.init_model()
 # DBSession() returns the session object appropriate for the current request.
-maker = sessionmaker(extension=ZopeTransactionExtension())
+maker = sessionmaker(extension=[
+    ZopeTransactionExtension(),
+    CommentCountExtension(),
+    ResponseCacheExtension(),
+    SearchIndexExtension(),
+    RelatedMediaExtension(),
+])
 DBSession = scoped_session(maker)
 
 # The declarative Base
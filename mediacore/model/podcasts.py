@@ -29,9 +29,10 @@ from sqlalchemy.types import String, Unicode, UnicodeText, Integer, DateTime, Bo
 from sqlalchemy.orm import mapper, relation, backref, synonym, composite, validates, dynamic_loader, column_property
 from pylons import request
 
-from mediacore.model import Author, slugify, get_available_slug
+from mediacore.model import Author, slugify, flush_with_available_slug, get_available_slug
 from mediacore.model.meta import Base, DBSession
 from mediacore.model.media import Media, MediaQuery, media
+from mediacore.lib import excerpts, helpers
 
 
 podcasts = Table('podcasts', Base.metadata,
@@ -42,6 +43,7 @@ podcasts = Table('podcasts', Base.metadata,
     Column('title', Unicode(50), nullable=False),
     Column('subtitle', Unicode(255)),
     Column('description', UnicodeText),
+    Column('description_excerpts', UnicodeText),
     Column('category', Unicode(50)),
     Column('author_name', Unicode(50), nullable=False),
     Column('author_email', Unicode(50), nullable=False),
@@ -49,6 +51,7 @@ podcasts = Table('podcasts', Base.metadata,
     Column('copyright', Unicode(50)),
     Column('itunes_url', String(80)),
     Column('feedburner_url', String(80)),
+    Column('media_count_published', Integer, default=0, nullable=False),
 )
 
 
@@ -68,6 +71,9 @@ class Podcast(object):
     .. attribute:: subtitle
     .. attribute:: description
 
+        An XHTML description. Excerpts of it are stored too, see
+        :meth:`excerpt`.
+
     .. attribute:: category
 
         The `iTunes category <http://www.apple.com/itunes/podcasts/specs.html#categories>`_
@@ -116,7 +122,8 @@ class Podcast(object):
     .. attribute:: media_count_published
 
         The number of :class:`mediacore.model.media.Media` episodes that are
-        currently published.
+        currently published. This is a stored count which is kept up to date
+        by :data:`mediacore.model.counts.published_counts`.
 
     """
 
@@ -127,10 +134,34 @@ class Podcast(object):
     def __repr__(self):
         return '<Podcast: %s>' % self.slug
 
+    def excerpt(self, size, xhtml=False):
+        """Return the description truncated to roughly a given size.
+
+        The sizes used by the templates are stored when the description is
+        set, see :mod:`mediacore.lib.excerpts`, others are cut as needed.
+
+        :param size: Max length
+        :param xhtml: Truncate the XHTML instead of its plain text
+        :rtype: unicode
+        """
+        stored = excerpts.get_excerpt(excerpts.decoded_excerpts(self),
+                                     size, xhtml)
+        if stored is not None:
+            return stored
+        if xhtml:
+            return excerpts.truncate_xhtml(self.description, size)
+        return excerpts.truncate_plain(helpers.xhtml_to_plain(self.description), size)
+
     @validates('slug')
     def validate_slug(self, key, slug):
         return slugify(slug)
 
+    @validates('description')
+    def _validate_description(self, key, value):
+        self._description_excerpts = excerpts.make_excerpts(
+            value, helpers.xhtml_to_plain(value))
+        return value
+
 
 mapper(Podcast, podcasts, properties={
     'author': composite(Author,
@@ -145,27 +176,27 @@ mapper(Podcast, podcasts, properties={
             ).label('media_count'),
             deferred=True
         ),
-    'media_count_published':
-        column_property(
-            sql.select(
-                [sql.func.count(media.c.id)],
-                sql.and_(
-                    media.c.podcast_id == podcasts.c.id,
-                    media.c.publishable == True,
-                    media.c.publish_on <= datetime.now(),
-                    sql.or_(
-                        media.c.publish_until == None,
-                        media.c.publish_until >= datetime.now()
-                    ),
-                )
-            ).label('media_count_published'),
-            deferred=True
-        )
+    '_description_excerpts': podcasts.c.description_excerpts,
 })
 
+def rebuild_excerpts():
+    """Store the description excerpts of every podcast, at the lengths
+    currently set in :mod:`mediacore.lib.excerpts`.
+
+    Run it with ``paster --plugin=MediaCore rebuild-excerpts <config file>``.
+    """
+    rows = DBSession.execute(sql.select([podcasts.c.id,
+                                         podcasts.c.description])).fetchall()
+    for id, description in rows:
+        DBSession.execute(podcasts.update(podcasts.c.id == id, values={
+            'description_excerpts': excerpts.make_excerpts(description,
+                helpers.xhtml_to_plain(description)),
+            'modified_on': podcasts.c.modified_on,
+        }))
+
 
 def create_podcast_stub():
-    """Return a new :class:`Podcast` instance with helpful defaults.
+    """Save and return a new :class:`Podcast` instance with helpful defaults.
 
     This is used any time we need a placeholder db record, such as when:
 
@@ -178,4 +209,5 @@ def create_podcast_stub():
     podcast.slug = get_available_slug(Podcast, 'stub-%s' % timestamp)
     podcast.title = '(Stub %s created by %s)' % (timestamp, user.display_name)
     podcast.author = Author(user.display_name, user.email_address)
+    flush_with_available_slug(podcast, 'stub-%s' % timestamp)
     return podcast
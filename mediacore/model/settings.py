@@ -19,17 +19,25 @@ Settings Model
 A very rudimentary settings implementation which is intended to store our
 non-mission-critical options which can be edited via the admin UI.
 
-.. todo:
-
-    Rather than fetch one option at a time, load all settings into an object
-    with attribute-style access.
+Settings are read far more often than they are written, so the whole table
+is loaded into an immutable :class:`SettingsSnapshot` which is kept in
+memory by :data:`settings_cache`. Whenever settings are saved,
+:meth:`SettingsCache.invalidate` must be called. It replaces a small stamp
+file in the ``cache_dir`` so that every other process serving MediaCore
+notices the change and reloads its snapshot too.
 
 """
+import os
+import threading
+import time
+
+from pylons import config
 from webob.exc import HTTPNotFound
-from sqlalchemy import Table, ForeignKey, Column
+from sqlalchemy import Table, ForeignKey, Column, sql
 from sqlalchemy.types import String, Unicode, UnicodeText, Integer, Boolean, Float
 from sqlalchemy.orm import mapper, relation, backref, synonym, interfaces, validates
 
+from mediacore.lib.storage import write_atomic
 from mediacore.model import fetch_row
 from mediacore.model.meta import Base, DBSession
 
@@ -62,3 +70,152 @@ class Setting(object):
 
 
 mapper(Setting, settings)
+
+
+class SettingsSnapshot(dict):
+    """An immutable copy of every setting, keyed by name.
+
+    Values are also available as attributes::
+
+        >>> snapshot = SettingsSnapshot({u'player_type': u'best'})
+        >>> snapshot.player_type
+        u'best'
+
+    """
+    def __getattr__(self, name):
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name)
+
+    def _immutable(self, *args, **kwargs):
+        raise TypeError('SettingsSnapshot is immutable. Modify the Setting '
+                        'rows and invalidate the settings_cache instead.')
+
+    __setitem__ = __delitem__ = __setattr__ = __delattr__ = _immutable
+    clear = pop = popitem = setdefault = update = _immutable
+
+
+class SettingsCache(object):
+    """Hold the current :class:`SettingsSnapshot` for this process.
+
+    The snapshot is loaded with a single query the first time it is
+    needed, then served from memory until it is invalidated. A version
+    counter invalidates the snapshot within this process, while the
+    identity of a stamp file (its inode and modification time) is used
+    to notice invalidations made by other processes. The stamp file is
+    only stat'ed, and at most once per ``check_interval`` seconds.
+
+    Snapshots are loaded over a connection of their own, rather than in
+    the request's transaction, which may have started before the changes
+    that the stamp announces were committed.
+
+    :param stamp_file: The stamp path. Defaults to ``settings.stamp`` in
+        the ``cache_dir`` config directory.
+    :param check_interval: Minimum number of seconds between stat calls.
+    :param bind: The engine to load the settings with. Defaults to the
+        engine the :data:`DBSession` is bound to.
+
+    """
+    def __init__(self, stamp_file=None, check_interval=1.0, bind=None):
+        self._stamp_file = stamp_file
+        self.check_interval = check_interval
+        self.bind = bind
+        self.version = 0
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._snapshot_version = None
+        self._stamp = None
+        self._stamp_checked = 0
+
+    @property
+    def stamp_file(self):
+        if self._stamp_file is None:
+            cache_dir = config.get('cache_dir', None)
+            if not cache_dir:
+                return None
+            self._stamp_file = os.path.join(cache_dir, 'settings.stamp')
+        return self._stamp_file
+
+    def _read_stamp(self):
+        path = self.stamp_file
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_mtime, stat.st_size
+
+    def _stale(self):
+        if self._snapshot is None or self._snapshot_version != self.version:
+            return True
+        now = time.time()
+        if now - self._stamp_checked < self.check_interval:
+            return False
+        if self._read_stamp() != self._stamp:
+            # Left unchecked, so that the check under the lock sees it too
+            return True
+        self._stamp_checked = now
+        return False
+
+    def snapshot(self):
+        """Return the current :class:`SettingsSnapshot`, loading it if needed."""
+        if self._stale():
+            self._lock.acquire()
+            try:
+                if self._stale():
+                    self._load()
+            finally:
+                self._lock.release()
+        return self._snapshot
+
+    def _load(self):
+        version = self.version
+        # Read the stamp first: any change committed before it was
+        # written is then visible to the new connection below.
+        stamp = self._read_stamp()
+        conn = (self.bind or DBSession.bind).connect()
+        try:
+            rows = conn.execute(
+                sql.select([settings.c.key, settings.c.value])).fetchall()
+        finally:
+            conn.close()
+        self._snapshot = SettingsSnapshot([tuple(row) for row in rows])
+        self._snapshot_version = version
+        self._stamp = stamp
+        self._stamp_checked = time.time()
+
+    def get(self, key):
+        """Return the value for the given setting key.
+
+        :raises SettingNotFound: If the key does not exist.
+        """
+        try:
+            return self.snapshot()[key]
+        except KeyError:
+            raise SettingNotFound, 'Key not found: %s' % key
+
+    def invalidate(self):
+        """Discard the snapshot in this and every other process.
+
+        This should be called *after* the changes have been committed,
+        otherwise another process may reload the old values before the
+        new ones become visible to it.
+        """
+        self._lock.acquire()
+        try:
+            self.version += 1
+            self._snapshot = None
+        finally:
+            self._lock.release()
+
+        path = self.stamp_file
+        if path is None:
+            return
+        # Write a new file and rename it over the old one: the new inode
+        # guarantees the stamp changes even within the mtime resolution.
+        write_atomic(path, '%d %f\n' % (self.version, time.time()))
+
+
+settings_cache = SettingsCache()
@@ -36,6 +36,7 @@ tags = Table('tags', Base.metadata,
     Column('id', Integer, autoincrement=True, primary_key=True),
     Column('name', Unicode(50), unique=True, nullable=False),
     Column('slug', String(50), unique=True, nullable=False),
+    Column('media_count_published', Integer, default=0, nullable=False, index=True),
     mysql_engine='InnoDB',
     mysql_charset='utf8'
 )
@@ -55,10 +56,14 @@ class Tag(object):
 
         A unique URL-friendly permalink string for looking up this object.
 
-    .. attribute:: media_content
+    .. attribute:: media_count
 
     .. attribute:: media_count_published
 
+        A stored count of the published media with this tag, kept up to
+        date by :data:`mediacore.model.counts.published_counts`. It is
+        indexed, so the most used tags can be found cheaply for tag clouds.
+
     """
     query = DBSession.query_property()
 
@@ -0,0 +1,58 @@
+from unittest import TestCase
+
+from sqlalchemy.orm import attributes
+
+from mediacore.lib.commentcounts import CommentCountExtension
+from mediacore.model import Comment, Tag
+
+class FakeSession(object):
+    def __init__(self, new=(), dirty=(), deleted=()):
+        self.new = list(new)
+        self.dirty = list(dirty)
+        self.deleted = list(deleted)
+        self.statements = []
+
+    def execute(self, statement):
+        self.statements.append(statement)
+
+def make_comment(media_id, publishable=False):
+    comment = Comment()
+    comment.media_id = media_id
+    comment.publishable = publishable
+    state = attributes.instance_state(comment)
+    state.commit_all(state.dict)
+    return comment
+
+class TestCommentCountExtension(TestCase):
+
+    def setUp(self):
+        self.ext = CommentCountExtension()
+
+    def test_new_and_deleted_comments(self):
+        session = FakeSession(new=[make_comment(1), Tag()],
+                              deleted=[make_comment(2)])
+        self.assertEqual(self.ext.changed_media_ids(session), set([1, 2]))
+
+    def test_unchanged_comments_are_ignored(self):
+        session = FakeSession(dirty=[make_comment(1)])
+        self.assertEqual(self.ext.changed_media_ids(session), set())
+        self.ext.after_flush(session, None)
+        self.assertEqual(session.statements, [])
+
+    def test_publishing_a_comment(self):
+        comment = make_comment(3)
+        comment.publishable = True
+        session = FakeSession(dirty=[comment])
+        self.assertEqual(self.ext.changed_media_ids(session), set([3]))
+
+    def test_moving_a_comment_updates_both_media(self):
+        comment = make_comment(4)
+        comment.media_id = 5
+        session = FakeSession(dirty=[comment])
+        self.assertEqual(self.ext.changed_media_ids(session), set([4, 5]))
+
+    def test_counts_are_updated_in_the_flush(self):
+        session = FakeSession(new=[make_comment(6)])
+        self.ext.after_flush(session, None)
+        self.assertEqual(len(session.statements), 1)
+        self.assert_('media.id IN' in str(session.statements[0]))
@@ -0,0 +1,138 @@
+import fcntl
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from mediacore.model import counts
+from mediacore.model.counts import PublishedCounts, _category_totals
+
+class FakeTagVersions(object):
+    def __init__(self):
+        self.versions = {}
+
+    def get(self, tag):
+        return self.versions.get(tag, '0')
+
+    def invalidate(self, tag):
+        self.versions[tag] = str(int(self.get(tag)) + 1)
+
+class RecordingCounts(PublishedCounts):
+    """Records each recount instead of updating a database."""
+    def __init__(self, *args, **kwargs):
+        PublishedCounts.__init__(self, *args, **kwargs)
+        self.recounts = []
+        self.delay = 0
+
+    def _recount(self, now):
+        time.sleep(self.delay)
+        self.recounts.append(now)
+
+class TestCategoryTotals(TestCase):
+
+    def test_counts_roll_up_to_ancestors(self):
+        rows = [(1, None, 2, 0), (2, 1, 3, 0), (3, 2, 1, 0), (4, None, 5, 0)]
+        self.assertEqual(_category_totals(rows), {1: 6, 2: 4, 3: 1, 4: 5})
+
+    def test_cycles_are_counted_once(self):
+        rows = [(1, 2, 1, 0), (2, 1, 2, 0)]
+        self.assertEqual(_category_totals(rows), {1: 3, 2: 3})
+
+class TestPublishedCounts(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.stamp_file = os.path.join(self.dir, 'counts', 'counts.stamp')
+        self.tag_versions = FakeTagVersions()
+        self._next_publish_boundary = counts.next_publish_boundary
+        self.boundary = None
+        counts.next_publish_boundary = lambda now: self.boundary
+
+    def tearDown(self):
+        counts.next_publish_boundary = self._next_publish_boundary
+        shutil.rmtree(self.dir)
+
+    def counts(self, max_age=3600):
+        return RecordingCounts(self.stamp_file, self.tag_versions,
+                               check_interval=0, max_age=max_age)
+
+    def test_recounted_once(self):
+        published = self.counts()
+        published.ensure_fresh()
+        published.ensure_fresh()
+        self.assertEqual(len(published.recounts), 1)
+        # Another process sees the stamp and doesn't repeat the work
+        other = self.counts()
+        other.ensure_fresh()
+        self.assertEqual(other.recounts, [])
+
+    def test_invalidated_by_media_status(self):
+        published = self.counts()
+        published.ensure_fresh()
+        self.tag_versions.invalidate('media')
+        published.ensure_fresh()
+        self.assertEqual(len(published.recounts), 1)
+        self.tag_versions.invalidate('media_status')
+        published.ensure_fresh()
+        self.assertEqual(len(published.recounts), 2)
+
+    def test_invalidated_by_publish_boundary(self):
+        published = self.counts()
+        self.boundary = datetime.now() + timedelta(seconds=1)
+        published.ensure_fresh()
+        published.ensure_fresh()
+        self.assertEqual(len(published.recounts), 1)
+        time.sleep(1.1)
+        self.boundary = None
+        published.ensure_fresh()
+        self.assertEqual(len(published.recounts), 2)
+
+    def test_invalidated_by_max_age(self):
+        published = self.counts(max_age=0)
+        published.ensure_fresh()
+        published.ensure_fresh()
+        self.assertEqual(len(published.recounts), 2)
+
+    def test_check_interval(self):
+        published = self.counts()
+        published.check_interval = 60
+        published.ensure_fresh()
+        self.tag_versions.invalidate('media_status')
+        published.ensure_fresh()
+        self.assertEqual(len(published.recounts), 1)
+
+    def test_locked_refresh_is_skipped(self):
+        published = self.counts()
+        published.ensure_fresh()
+        lock_file = open(self.stamp_file + '.lock', 'w')
+        try:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            self.tag_versions.invalidate('media_status')
+            published.ensure_fresh()
+        finally:
+            lock_file.close()
+        self.assertEqual(len(published.recounts), 1)
+        published.ensure_fresh()
+        self.assertEqual(len(published.recounts), 2)
+
+    def test_concurrent_refreshes(self):
+        processes = [self.counts() for i in range(4)]
+        for published in processes:
+            published.delay = 0.2
+        self.tag_versions.invalidate('media_status')
+        threads = [threading.Thread(target=p.ensure_fresh)
+                   for p in processes]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(sum([len(p.recounts) for p in processes]), 1)
+
+    def test_refresh_waits_and_always_recounts(self):
+        published = self.counts()
+        published.ensure_fresh()
+        published.refresh()
+        self.assertEqual(len(published.recounts), 2)
@@ -0,0 +1,97 @@
+from unittest import TestCase
+
+from mediacore.lib import excerpts
+
+class TestTruncateXHTML(TestCase):
+
+    def test_short_strings_are_unchanged(self):
+        xhtml = u'<p>A <em>short</em> description</p>'
+        self.assertEqual(excerpts.truncate_xhtml(xhtml, 100), xhtml)
+        # Only the text is counted
+        self.assertEqual(excerpts.truncate_xhtml(xhtml, 21), xhtml)
+        self.assertEqual(excerpts.truncate_xhtml(None, 10), u'')
+
+    def test_cuts_at_word_end(self):
+        self.assertEqual(
+            excerpts.truncate_xhtml(u'<p>one two three four</p>', 15),
+            u'<p>one two...</p>')
+        self.assertEqual(
+            excerpts.truncate_xhtml(u'<p>one <em>two three</em> four</p>', 15),
+            u'<p>one <em>two...</em></p>')
+        self.assertEqual(
+            excerpts.truncate_xhtml(u'<p>one <em>two three</em> four</p>', 16),
+            u'<p>one <em>two three</em>...</p>')
+
+    def test_closes_open_tags(self):
+        xhtml = (u'<p>First paragraph.</p><ul><li>An item with '
+                 u'<a href="http://example.com/?a=1&amp;b=2">a link</a> '
+                 u'in it</li></ul>')
+        self.assertEqual(excerpts.truncate_xhtml(xhtml, 38),
+                         u'<p>First paragraph.</p><ul><li>An item with '
+                         u'<a href="http://example.com/?a=1&amp;b=2">a...'
+                         u'</a></li></ul>')
+
+    def test_block_boundaries_end_words(self):
+        self.assertEqual(
+            excerpts.truncate_xhtml(u'<p>first</p><p>second third</p>', 14),
+            u'<p>first...</p>')
+        self.assertEqual(
+            excerpts.truncate_xhtml(u'<p>first<br />second third</p>', 14),
+            u'<p>first...</p>')
+
+    def test_entities_count_as_one_character(self):
+        xhtml = u'<p>caf&eacute; &amp; cr&egrave;me br&ucirc;l&eacute;e</p>'
+        self.assertEqual(excerpts.truncate_xhtml(xhtml, 21), xhtml)
+        self.assertEqual(excerpts.truncate_xhtml(xhtml, 14),
+                         u'<p>caf&eacute; &amp;...</p>')
+        self.assertEqual(excerpts.truncate_xhtml(xhtml, 15),
+                         u'<p>caf&eacute; &amp; cr&egrave;me...</p>')
+
+    def test_long_words_are_cut(self):
+        self.assertEqual(
+            excerpts.truncate_xhtml(u'<p><strong>abcdefghijklmnop</strong></p>', 10),
+            u'<p><strong>abcdefg...</strong></p>')
+        self.assertEqual(
+            excerpts.truncate_xhtml(u'<p>&amp;&amp;&amp;&amp;&amp;</p>', 4),
+            u'<p>&amp;...</p>')
+
+    def test_matches_plain_text_truncation(self):
+        plain = u'Lorem ipsum dolor sit amet, consectetur adipisicing elit'
+        xhtml = u'<p>%s</p>' % plain.replace(u'dolor', u'<em>dolor</em>')
+        for size in range(4, len(plain) + 2):
+            self.assertEqual(
+                excerpts.truncate_xhtml(xhtml, size)
+                    .replace(u'<p>', u'').replace(u'</p>', u'')
+                    .replace(u'<em>', u'').replace(u'</em>', u''),
+                excerpts.truncate_plain(plain, size))
+
+class TestStoredExcerpts(TestCase):
+
+    def test_make_and_get(self):
+        xhtml = u'<p>%s</p>' % (u'word ' * 100).strip()
+        plain = (u'word ' * 100).strip()
+        stored = excerpts.make_excerpts(xhtml, plain)
+        for size in excerpts.plain_lengths:
+            self.assertEqual(excerpts.get_excerpt(stored, size),
+                             excerpts.truncate_plain(plain, size))
+        for size in excerpts.xhtml_lengths:
+            self.assertEqual(excerpts.get_excerpt(stored, size, True),
+                             excerpts.truncate_xhtml(xhtml, size))
+        self.assertEqual(excerpts.get_excerpt(stored, 7), None)
+        self.assertEqual(excerpts.get_excerpt(None, 60), None)
+        self.assertEqual(excerpts.make_excerpts(u'', u''), None)
+
+    def test_decoded_once_per_instance(self):
+        class Item(object):
+            _description_excerpts = excerpts.make_excerpts(u'<p>a b</p>',
+                                                           u'a b')
+        item = Item()
+        decoded = excerpts.decoded_excerpts(item)
+        self.assertEqual(excerpts.get_excerpt(decoded, 60), u'a b')
+        self.assert_(excerpts.decoded_excerpts(item) is decoded)
+
+        item._description_excerpts = excerpts.make_excerpts(u'<p>c</p>', u'c')
+        self.assertEqual(excerpts.get_excerpt(
+            excerpts.decoded_excerpts(item), 60), u'c')
+        item._description_excerpts = None
+        self.assertEqual(excerpts.decoded_excerpts(item), None)
@@ -0,0 +1,127 @@
+import gzip
+import os
+import shutil
+import tempfile
+from datetime import datetime, timedelta
+from unittest import TestCase
+
+from mediacore.lib import feedcache
+from mediacore.lib.feedcache import FeedCache, accepts_gzip
+from mediacore.lib.fileserve import MediaFileApp
+from mediacore.lib.responsecache import TagVersions
+
+class TestAcceptsGzip(TestCase):
+
+    def accepts(self, header):
+        return accepts_gzip({'HTTP_ACCEPT_ENCODING': header})
+
+    def test_accepted(self):
+        self.assert_(self.accepts('gzip'))
+        self.assert_(self.accepts('deflate, gzip;q=0.5'))
+        self.assert_(self.accepts('x-gzip'))
+        self.assert_(self.accepts('*'))
+
+    def test_refused(self):
+        self.failIf(accepts_gzip({}))
+        self.failIf(self.accepts(''))
+        self.failIf(self.accepts('deflate'))
+        self.failIf(self.accepts('gzip;q=0'))
+        self.failIf(self.accepts('gzip; q=0.0, deflate'))
+
+
+class Request(object):
+    host_url = 'http://example.com'
+    script_name = ''
+
+class Podcast(object):
+    id = 7
+
+class TestFeedCache(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.tag_versions = TagVersions(os.path.join(self.dir, 'tags'))
+        self.cache = FeedCache(os.path.join(self.dir, 'feeds'),
+                               self.tag_versions)
+        self.boundary = None
+        self._request = feedcache.request
+        self._boundary = feedcache.next_publish_boundary
+        feedcache.request = Request()
+        feedcache.next_publish_boundary = lambda now, id: self.boundary
+        self.renders = []
+
+    def tearDown(self):
+        feedcache.request = self._request
+        feedcache.next_publish_boundary = self._boundary
+        shutil.rmtree(self.dir)
+
+    def render(self, document=u'<rss>caf\xe9</rss>'):
+        def render():
+            self.renders.append(document)
+            return document
+        return render
+
+    def serve(self, path, etag, **environ):
+        environ.setdefault('REQUEST_METHOD', 'GET')
+        result = {}
+        def start_response(status, headers):
+            result['status'] = status
+            result['headers'] = dict(headers)
+        app = MediaFileApp(path, 'application/rss+xml', etag=etag)
+        body = ''.join(app(environ, start_response))
+        return result['status'], result['headers'], body
+
+    def test_hit_and_miss(self):
+        feed = self.cache.get(Podcast(), self.render())
+        again = self.cache.get(Podcast(), self.render())
+        self.assertEqual(len(self.renders), 1)
+        self.assertEqual((again.path, again.digest), (feed.path, feed.digest))
+
+        feedcache.request.host_url = 'http://other.example.com'
+        other = self.cache.get(Podcast(), self.render())
+        feedcache.request.host_url = Request.host_url
+        self.assertEqual(len(self.renders), 2)
+        self.assertNotEqual(other.path, feed.path)
+
+    def test_invalidated_when_media_is_published(self):
+        feed = self.cache.get(Podcast(), self.render())
+        mtime = os.stat(feed.path).st_mtime
+        self.tag_versions.invalidate('media')
+        same = self.cache.get(Podcast(), self.render())
+        self.assertEqual(len(self.renders), 2)
+        # The content didn't change, so neither do the file and ETag
+        self.assertEqual(same.etag, feed.etag)
+        self.assertEqual(os.stat(same.path).st_mtime, mtime)
+
+        self.tag_versions.invalidate('media')
+        changed = self.cache.get(Podcast(), self.render(u'<rss>new</rss>'))
+        self.assertNotEqual(changed.etag, feed.etag)
+        self.assertEqual(open(changed.path).read(), '<rss>new</rss>')
+
+    def test_expires_at_publish_boundary(self):
+        self.boundary = datetime.now() - timedelta(seconds=1)
+        self.cache.get(Podcast(), self.render())
+        self.cache.get(Podcast(), self.render())
+        self.assertEqual(len(self.renders), 2)
+
+    def test_gzip_and_identity(self):
+        feed = self.cache.get(Podcast(), self.render())
+        self.assertEqual(open(feed.path, 'rb').read(), '<rss>caf\xc3\xa9</rss>')
+        self.assertEqual(gzip.open(feed.gzip_path).read(),
+                         '<rss>caf\xc3\xa9</rss>')
+        self.assertNotEqual(feed.etag, feed.gzip_etag)
+
+    def test_etag_not_modified(self):
+        feed = self.cache.get(Podcast(), self.render())
+        status, headers, body = self.serve(feed.gzip_path, feed.gzip_etag)
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['ETag'], feed.gzip_etag)
+
+        status, headers, body = self.serve(feed.gzip_path, feed.gzip_etag,
+            HTTP_IF_NONE_MATCH=feed.gzip_etag)
+        self.assertEqual(status, '304 Not Modified')
+        self.assertEqual(body, '')
+        # The identity ETag doesn't match the gzipped body
+        status, headers, body = self.serve(feed.gzip_path, feed.gzip_etag,
+            HTTP_IF_NONE_MATCH=feed.etag)
+        self.assertEqual(status, '200 OK')
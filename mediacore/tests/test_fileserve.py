@@ -0,0 +1,138 @@
+import os
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+
+from mediacore.lib.fileserve import (MediaFileApp, OffloadFileApp,
+    accel_redirect_uri, parse_range_header)
+
+class TestParseRangeHeader(TestCase):
+
+    def test_ranges(self):
+        self.assertEqual(parse_range_header('bytes=0-99', 1000), [(0, 99)])
+        self.assertEqual(parse_range_header('bytes=900-', 1000), [(900, 999)])
+        self.assertEqual(parse_range_header('bytes=-100', 1000), [(900, 999)])
+        self.assertEqual(parse_range_header('bytes=0-0,-1', 1000),
+                         [(0, 0), (999, 999)])
+        self.assertEqual(parse_range_header('bytes=500-5000', 1000), [(500, 999)])
+
+    def test_unsatisfiable(self):
+        self.assertEqual(parse_range_header('bytes=1000-', 1000), [])
+
+    def test_invalid(self):
+        self.assertEqual(parse_range_header('items=0-1', 1000), None)
+        self.assertEqual(parse_range_header('bytes=5-1', 1000), None)
+        self.assertEqual(parse_range_header('bytes=abc', 1000), None)
+
+
+class TestMediaFileApp(TestCase):
+
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.write(fd, '0123456789' * 100)
+        os.close(fd)
+        self.app = MediaFileApp(self.path, 'video/mp4',
+                                datetime(2010, 5, 1, 12, 0, 0))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def request(self, **environ):
+        environ.setdefault('REQUEST_METHOD', 'GET')
+        result = {}
+        def start_response(status, headers):
+            result['status'] = status
+            result['headers'] = dict(headers)
+        body = ''.join(self.app(environ, start_response))
+        return result['status'], result['headers'], body
+
+    def test_full(self):
+        status, headers, body = self.request()
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['Content-Length'], '1000')
+        self.assertEqual(len(body), 1000)
+
+    def test_head(self):
+        status, headers, body = self.request(REQUEST_METHOD='HEAD')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['Content-Length'], '1000')
+        self.assertEqual(body, '')
+
+    def test_single_range(self):
+        status, headers, body = self.request(HTTP_RANGE='bytes=10-19')
+        self.assertEqual(status, '206 Partial Content')
+        self.assertEqual(headers['Content-Range'], 'bytes 10-19/1000')
+        self.assertEqual(body, '0123456789')
+
+    def test_multiple_ranges(self):
+        status, headers, body = self.request(HTTP_RANGE='bytes=0-1,5-6')
+        self.assertEqual(status, '206 Partial Content')
+        self.assert_(headers['Content-Type'].startswith('multipart/byteranges'))
+        self.assertEqual(int(headers['Content-Length']), len(body))
+
+    def test_unsatisfiable_range(self):
+        status, headers, body = self.request(HTTP_RANGE='bytes=2000-')
+        self.assertEqual(status, '416 Requested Range Not Satisfiable')
+        self.assertEqual(headers['Content-Range'], 'bytes */1000')
+
+    def test_not_modified(self):
+        etag = self.request()[1]['ETag']
+        status, headers, body = self.request(HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(status, '304 Not Modified')
+        self.assertEqual(body, '')
+
+    def test_if_range_mismatch(self):
+        status, headers, body = self.request(HTTP_RANGE='bytes=0-9',
+                                             HTTP_IF_RANGE='"stale"')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(len(body), 1000)
+
+
+class TestOffloadFileApp(TestCase):
+
+    def request(self, app, **environ):
+        environ.setdefault('REQUEST_METHOD', 'GET')
+        result = {}
+        def start_response(status, headers):
+            result['status'] = status
+            result['headers'] = dict(headers)
+        body = ''.join(app(environ, start_response))
+        return result['status'], result['headers'], body
+
+    def test_x_sendfile(self):
+        app = OffloadFileApp(
+            '/srv/media/1_2_clip.mp4', 'video/mp4', 'x-sendfile',
+            headers=[('Content-Disposition', 'attachment;filename="clip.mp4"')])
+        status, headers, body = self.request(app)
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['X-Sendfile'], '/srv/media/1_2_clip.mp4')
+        self.assertEqual(headers['Content-Type'], 'video/mp4')
+        self.assertEqual(headers['Content-Disposition'],
+                         'attachment;filename="clip.mp4"')
+        self.assertEqual(body, '')
+
+    def test_x_accel_redirect(self):
+        app = OffloadFileApp('/srv/media/1_2_my clip.mp4', 'video/mp4',
+                             'x-accel-redirect', root_dir='/srv/media/',
+                             location='/__mediacore_files/')
+        status, headers, body = self.request(app, REQUEST_METHOD='HEAD')
+        self.assertEqual(status, '200 OK')
+        self.assertEqual(headers['X-Accel-Redirect'],
+                         '/__mediacore_files/1_2_my%20clip.mp4')
+        self.assert_('X-Sendfile' not in headers)
+        self.assertEqual(body, '')
+
+    def test_accel_redirect_uri(self):
+        self.assertEqual(
+            accel_redirect_uri('/srv/media/sub/a.flv', '/srv/media', '/files'),
+            '/files/sub/a.flv')
+        self.assertRaises(ValueError, accel_redirect_uri,
+                          '/etc/passwd', '/srv/media', '/files')
+        self.assertRaises(ValueError, accel_redirect_uri,
+                          '/srv/media2/a.flv', '/srv/media', '/files')
+
+    def test_misconfigured(self):
+        self.assertRaises(ValueError, OffloadFileApp, '/srv/media/a.flv',
+                          'video/x-flv', 'x-accel-redirect')
+        self.assertRaises(ValueError, OffloadFileApp, '/srv/media/a.flv',
+                          'video/x-flv', 'bogus')
@@ -0,0 +1,154 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mediacore.lib import helpers, jobs
+
+class FakeURLGenerator(object):
+    def __init__(self, environ):
+        self.environ = environ
+        self.calls = 0
+
+    def current(self, *args, **kwargs):
+        self.calls += 1
+        routes = dict(self.environ['pylons.routes_dict'])
+        routes.update(kwargs)
+        if args:
+            return self.environ['SCRIPT_NAME'] + args[0]
+        return '%s/%s/%s' % (self.environ['SCRIPT_NAME'],
+                             routes['controller'], routes['action'])
+
+class FakeRequest(object):
+    def __init__(self, environ):
+        self.environ = environ
+
+class FakeMapper(object):
+    _routenames = {}
+
+class TestURLCache(TestCase):
+
+    def setUp(self):
+        self.environ = {
+            'SCRIPT_NAME': '',
+            'QUERY_STRING': '',
+            'pylons.routes_dict': {'controller': 'media', 'action': 'index'},
+        }
+        self.url = FakeURLGenerator(self.environ)
+        self.saved = helpers.pylons_url, helpers.request, helpers.config
+        helpers.pylons_url = self.url
+        helpers.request = FakeRequest(self.environ)
+        helpers.config = {'routes.map': FakeMapper()}
+        helpers._url_cache.clear()
+
+    def tearDown(self):
+        helpers.pylons_url, helpers.request, helpers.config = self.saved
+        helpers._url_cache.clear()
+
+    def test_cached(self):
+        for i in range(3):
+            self.assertEqual(helpers.url_for(action='view', slug='a'),
+                             '/media/view')
+            self.assertEqual(helpers.url_for('/images/'), '/images/')
+        self.assertEqual(self.url.calls, 2)
+
+    def test_current_route_is_part_of_key(self):
+        helpers.url_for(action='view')
+        self.environ['pylons.routes_dict'] = {'controller': 'podcasts',
+                                              'action': 'index'}
+        self.assertEqual(helpers.url_for(action='view'), '/podcasts/view')
+        # Static paths don't depend on the current route
+        helpers.url_for('/images/')
+        self.environ['pylons.routes_dict'] = {'controller': 'media',
+                                              'action': 'index'}
+        helpers.url_for('/images/')
+        self.assertEqual(self.url.calls, 3)
+
+    def test_script_name_is_part_of_key(self):
+        helpers.url_for('/images/')
+        self.environ['SCRIPT_NAME'] = '/mediacore'
+        self.assertEqual(helpers.url_for('/images/'), '/mediacore/images/')
+
+    def test_uncacheable_arguments(self):
+        helpers.url_for(action='view', id=[1, 2])
+        helpers.url_for(action='view', id=[1, 2])
+        self.assertEqual(self.url.calls, 2)
+
+    def test_non_string_first_argument(self):
+        for arg in (5, None):
+            self.assertEqual(helpers._url_cache_key((arg,), {}, self.environ),
+                             None)
+
+class FakeManifest(object):
+    def __init__(self, thumb):
+        self.thumb = thumb
+
+    def lookup(self, image_dir, item_id, size):
+        return item_id, self.thumb
+
+class TestFindThumb(TestCase):
+
+    def setUp(self):
+        self.saved = helpers.thumb_manifest
+
+    def tearDown(self):
+        helpers.thumb_manifest = self.saved
+
+    def find(self, thumb):
+        helpers.thumb_manifest = FakeManifest(thumb)
+        return helpers._find_thumb(('media', 5), 's')
+
+    def test_versioned(self):
+        thumb = {'size': (128, 72), 'files': {'jpg': '5s.jpg'},
+                 'version': 'abc'}
+        self.assertEqual(self.find(thumb), ('media/5s.jpg?v=abc', (128, 72)))
+        thumb['files']['jpg'] = '5s.abc.jpg'
+        self.assertEqual(self.find(thumb), ('media/5s.abc.jpg', (128, 72)))
+
+    def test_old_manifest_without_version(self):
+        thumb = {'size': (128, 72), 'files': {'jpg': '5s.jpg'}}
+        self.assertEqual(self.find(thumb), ('media/5s.jpg', (128, 72)))
+
+class TestDeleteFiles(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.media_dir = os.path.join(self.dir, 'media')
+        self.image_dir = os.path.join(self.dir, 'images')
+        os.mkdir(self.media_dir)
+        os.mkdir(self.image_dir)
+        self.queued = []
+        self.saved = helpers.config, jobs.enqueue
+        helpers.config = {'media_dir': self.media_dir}
+        jobs.enqueue = lambda name, **kwargs: self.queued.append((name, kwargs))
+
+    def tearDown(self):
+        helpers.config, jobs.enqueue = self.saved
+        shutil.rmtree(self.dir)
+
+    def touch(self, *parts):
+        path = os.path.join(self.dir, *parts)
+        open(path, 'w').close()
+        return path
+
+    def test_blobs_are_collected_later(self):
+        blob = self.touch('media', 'abc.mp4')
+        thumb = self.touch('images', '5s.jpg')
+        helpers.delete_files([blob, thumb, None], 'media')
+        self.assert_(os.path.exists(blob))
+        self.failIf(os.path.exists(thumb))
+        self.assertEqual(len(self.queued), 1)
+        name, kwargs = self.queued[0]
+        self.assertEqual(name, 'media.collect_blob')
+        self.assertEqual(kwargs['file_name'], 'abc.mp4')
+        self.assertEqual(kwargs['subdir'], 'media')
+        self.assert_(kwargs['delay'] > 0)
+
+    def test_discard_to_deleted_files_dir(self):
+        deleted_dir = os.path.join(self.dir, 'deleted')
+        os.mkdir(deleted_dir)
+        helpers.config['deleted_files_dir'] = deleted_dir
+        blob = self.touch('media', 'abc.mp4')
+        helpers.discard_files([blob], 'media')
+        self.assertEqual(os.listdir(os.path.join(deleted_dir, 'media')),
+                         ['abc.mp4'])
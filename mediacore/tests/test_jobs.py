@@ -0,0 +1,45 @@
+from unittest import TestCase
+
+from mediacore.lib import jobs
+from mediacore.lib.jobs import RetryLater, backoff, enqueue, handler
+
+class TestBackoff(TestCase):
+
+    def test_doubles_up_to_limit(self):
+        self.assertEqual([backoff(n) for n in range(1, 5)], [30, 60, 120, 240])
+        self.assertEqual(backoff(20), 3600)
+        self.assertEqual(backoff(20, limit=60), 60)
+
+
+class TestInlineJobs(TestCase):
+
+    def setUp(self):
+        self.calls = []
+        self.sleeps = []
+        self._config, self._sleep = jobs.config, jobs.time.sleep
+        jobs.config = {'jobs_inline': True}
+        jobs.time.sleep = self.sleeps.append
+
+        @handler('test.flaky', max_attempts=3)
+        def flaky(fails, value):
+            self.calls.append(value)
+            if len(self.calls) <= fails:
+                raise RetryLater('not yet', 2)
+            return value
+
+    def tearDown(self):
+        jobs.config, jobs.time.sleep = self._config, self._sleep
+        del jobs.handlers['test.flaky']
+
+    def test_retries_until_success(self):
+        self.assertEqual(enqueue('test.flaky', fails=2, value=1), 1)
+        self.assertEqual(self.calls, [1, 1, 1])
+        self.assertEqual(self.sleeps, [2, 2])
+
+    def test_gives_up_after_max_attempts(self):
+        self.assertRaises(RetryLater, enqueue, 'test.flaky', fails=5, value=1)
+        self.assertEqual(len(self.calls), 3)
+        self.calls[:] = []
+        self.assertRaises(RetryLater, enqueue, 'test.flaky', max_attempts=1,
+                          fails=5, value=1)
+        self.assertEqual(len(self.calls), 1)
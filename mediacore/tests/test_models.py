@@ -0,0 +1,21 @@
+from unittest import TestCase
+
+from mediacore.model import _first_available_slug, slug_length
+
+class TestFirstAvailableSlug(TestCase):
+
+    def test_unused_slug_is_kept(self):
+        self.assertEqual(_first_available_slug('episode', set()), 'episode')
+        self.assertEqual(
+            _first_available_slug('episode', set(['episode-2'])), 'episode')
+
+    def test_first_free_suffix(self):
+        taken = set(['episode', 'episode-2', 'episode-3', 'episode-5'])
+        self.assertEqual(_first_available_slug('episode', taken), 'episode-4')
+
+    def test_long_slugs_are_cut_for_the_suffix(self):
+        slug = 'a' * slug_length
+        taken = set([slug] + ['a' * (slug_length - 2) + '-%d' % n
+                              for n in range(2, 10)])
+        self.assertEqual(_first_available_slug(slug, taken),
+                         'a' * (slug_length - 3) + '-10')
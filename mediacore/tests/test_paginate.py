@@ -0,0 +1,154 @@
+import base64
+from datetime import datetime
+from unittest import TestCase
+
+import simplejson
+from sqlalchemy.types import DateTime, Integer
+
+from mediacore.lib.paginate import InvalidCursor, SeekOrder, SeekPage
+
+class Column(object):
+    """Stands in for an ORM attribute in the filters built by SeekOrder."""
+    def __init__(self, key, type):
+        self.key = key
+        self.type = type
+
+    def __clause_element__(self):
+        return self
+
+    def asc(self):
+        return (self.key, False)
+
+    def desc(self):
+        return (self.key, True)
+
+    def __lt__(self, value):
+        return lambda item: getattr(item, self.key) < value
+
+    def __gt__(self, value):
+        return lambda item: getattr(item, self.key) > value
+
+    def __eq__(self, value):
+        return lambda item: getattr(item, self.key) == value
+
+class Item(object):
+    def __init__(self, id, publish_on):
+        self.id = id
+        self.publish_on = publish_on
+
+    def __repr__(self):
+        return '<Item %d>' % self.id
+
+class Query(object):
+    """Just enough of a Query to page through a list with."""
+    def __init__(self, items, ordering=(), filters=()):
+        self.items = items
+        self.ordering = ordering
+        self.filters = filters
+
+    def order_by(self, *ordering):
+        if ordering == (None,):
+            ordering = ()
+        return Query(self.items, self.ordering + ordering, self.filters)
+
+    def filter(self, test):
+        return Query(self.items, self.ordering, self.filters + (test,))
+
+    def __getitem__(self, slice):
+        items = [item for item in self.items
+                 if not [test for test in self.filters if not test(item)]]
+        for key, descending in reversed(self.ordering):
+            items.sort(key=lambda item: getattr(item, key), reverse=descending)
+        return items[slice]
+
+class FakeSql(object):
+    def or_(self, *tests):
+        return lambda item: bool([test for test in tests if test(item)])
+
+    def and_(self, *tests):
+        return lambda item: not [test for test in tests if not test(item)]
+
+class TestSeekPage(TestCase):
+
+    def setUp(self):
+        from mediacore.lib import paginate
+        self.paginate = paginate
+        self.sql = paginate.sql
+        paginate.sql = FakeSql()
+        # Pairs share a date, so the ID decides the order within them
+        self.items = [Item(id, datetime(2010, 5, 1 + id / 2, 12))
+                      for id in range(1, 24)]
+        self.query = Query(self.items)
+        self.order = SeekOrder('latest', Column('publish_on', DateTime()),
+                               Column('id', Integer()))
+        self.expected = sorted(self.items, key=lambda item:
+                               (item.publish_on, item.id), reverse=True)
+
+    def tearDown(self):
+        self.paginate.sql = self.sql
+
+    def test_pages_forwards_and_backwards(self):
+        pages = [SeekPage(self.query, self.order, items_per_page=5)]
+        while pages[-1].next_cursor:
+            pages.append(SeekPage(self.query, self.order,
+                                  pages[-1].next_cursor, items_per_page=5))
+        self.assertEqual(len(pages), 5)
+        self.assertEqual(pages[0].previous_cursor, None)
+        seen = []
+        for page in pages:
+            seen.extend(page.items)
+        self.assertEqual(seen, self.expected)
+
+        for i in range(len(pages) - 1, 0, -1):
+            previous = SeekPage(self.query, self.order,
+                                pages[i].previous_cursor, items_per_page=5)
+            self.assertEqual(previous.items, pages[i - 1].items)
+
+    def test_going_back_to_a_short_first_page(self):
+        page = SeekPage(self.query, self.order,
+                        self.order.cursor(self.expected[2], backwards=True),
+                        items_per_page=5)
+        self.assertEqual(page.items, self.expected[:5])
+        self.assertEqual(page.previous_cursor, None)
+
+    def test_page_count(self):
+        page = SeekPage(self.query, self.order, items_per_page=5,
+                        item_count=23)
+        self.assertEqual(page.page_count, 5)
+
+    def test_invalid_cursors(self):
+        popular = SeekOrder('popular',
+                            Column('popularity_points', Integer()),
+                            Column('id', Integer()))
+        cursor = self.order.cursor(self.items[0])
+        self.assertRaises(InvalidCursor, popular.decode, cursor)
+        for cursor in ('junk', u'\xe9', cursor[:-3]):
+            self.assertRaises(InvalidCursor, self.order.decode, cursor)
+        self.assertEqual(self.order.decode(None), (False, None))
+
+    def test_tampered_cursors(self):
+        def cursor(*data):
+            return base64.urlsafe_b64encode(simplejson.dumps(data))
+        date = [2010, 5, 1, 12, 0, 0, 0]
+        self.assertEqual(self.order.decode(cursor('latest', True, date, 3)),
+                         (True, (datetime(2010, 5, 1, 12), 3)))
+        for data in [('latest', 'yes', date, 3),
+                     ('latest', False, '2010-05-01', 3),
+                     ('latest', False, [2010, 5, 1], 3),
+                     ('latest', False, [2010, 5, 1, 12, 0, 0, 0.5], 3),
+                     ('latest', False, [2010, 13, 1, 12, 0, 0, 0], 3),
+                     ('latest', False, [10 ** 20, 5, 1, 12, 0, 0, 0], 3),
+                     ('latest', False, date, '3'),
+                     ('latest', False, date, True),
+                     ('latest', False, date, 2 ** 64),
+                     ('latest', False, {}, 3)]:
+            self.assertRaises(InvalidCursor, self.order.decode,
+                              cursor(*data))
+        popular = SeekOrder('popular',
+                            Column('popularity_points', Integer()),
+                            Column('id', Integer()))
+        self.assertEqual(popular.decode(cursor('popular', False, 10, 3)),
+                         (False, (10, 3)))
+        for value in (date, 1.5, '10', None):
+            self.assertRaises(InvalidCursor, popular.decode,
+                              cursor('popular', False, value, 3))
@@ -0,0 +1,121 @@
+import struct
+from StringIO import StringIO
+from unittest import TestCase
+
+from mediacore.lib.probe import ProbeError, probe_file
+
+def box(box_type, *children):
+    payload = ''.join(children)
+    return struct.pack('>I4s', 8 + len(payload), box_type) + payload
+
+def probe_data(data):
+    return probe_file(StringIO(data), len(data))
+
+class TestMP4(TestCase):
+
+    def mp4(self, video=True):
+        avc1 = struct.pack('>I4s', 86 + 15, 'avc1') + '\0' * 78 \
+            + box('avcC', '\x01\x42\x00\x1e')
+        esds = box('esds', '\0\0\0\0',
+                   '\x03\x19\x00\x01\x00',
+                   '\x04\x11\x40\x15' + '\0' * 11,
+                   '\x05\x02\x12\x10')
+        mp4a = struct.pack('>I4s', 36 + len(esds), 'mp4a') + '\0' * 28 + esds
+        def trak(handler, entry, width=0, height=0):
+            tkhd = '\0' * 76 + struct.pack('>II', width << 16, height << 16)
+            stsd = '\0' * 4 + struct.pack('>I', 1) + entry
+            return box('trak', box('tkhd', tkhd), box('mdia',
+                box('hdlr', '\0' * 8 + handler + '\0' * 12),
+                box('minf', box('stbl', box('stsd', stsd)))))
+        mvhd = '\0' * 12 + struct.pack('>II', 1000, 12500) + '\0' * 80
+        tracks = [trak('soun', mp4a)]
+        if video:
+            tracks.insert(0, trak('vide', avc1, 640, 360))
+        return box('ftyp', 'isom\0\0\0\0') + box('mdat', '\0' * 50000) \
+            + box('moov', box('mvhd', mvhd), *tracks)
+
+    def test_video(self):
+        info = probe_data(self.mp4())
+        self.assertEqual(info['container'], 'mp4')
+        self.assertEqual(info['duration'], 12.5)
+        self.assertEqual((info['width'], info['height']), (640, 360))
+        self.assertEqual(info['video_codec'], 'h264b')
+        self.assertEqual(info['audio_codec'], 'aacl')
+        self.assert_(info['bitrate'] > 0)
+
+    def test_audio_only(self):
+        info = probe_data(self.mp4(video=False))
+        self.assertEqual(info['container'], 'm4a')
+        self.assertEqual(info['video_codec'], None)
+
+    def test_truncated(self):
+        data = self.mp4()
+        self.assertRaises(ProbeError, probe_data, data[:data.index('mvhd') + 20])
+
+
+class TestFLV(TestCase):
+
+    def tag(self, tag_type, data, ms=0):
+        ts = struct.pack('>I', ms)
+        return struct.pack('>B', tag_type) + struct.pack('>I', len(data))[1:] \
+            + ts[1:] + ts[0] + '\0\0\0' + data \
+            + struct.pack('>I', 11 + len(data))
+
+    def test_flv(self):
+        def amf_number(key, value):
+            return struct.pack('>H', len(key)) + key + '\x00' \
+                + struct.pack('>d', value)
+        meta = '\x02' + struct.pack('>H', 10) + 'onMetaData' + '\x08' \
+            + struct.pack('>I', 3) + amf_number('duration', 10.0) \
+            + amf_number('width', 320) + amf_number('height', 240) \
+            + '\0\0\x09'
+        data = 'FLV\x01\x05' + struct.pack('>I', 9) + '\0\0\0\0' \
+            + self.tag(18, meta) + self.tag(9, '\x17' + '\0' * 100) \
+            + self.tag(8, '\xaf' + '\0' * 100) \
+            + self.tag(9, '\x27' + '\0' * 100, 9960)
+        info = probe_data(data)
+        self.assertEqual(info['container'], 'flv')
+        self.assertEqual(info['duration'], 9.96)
+        self.assertEqual((info['width'], info['height']), (320, 240))
+        self.assertEqual(info['video_codec'], 'h264')
+        self.assertEqual(info['audio_codec'], 'aac')
+
+
+class TestMP3(TestCase):
+
+    frame = '\xff\xfb\x90\x00' + '\0' * 413 # 128 kbit/s, 44.1 kHz
+
+    def test_cbr(self):
+        data = 'ID3\x03\x00\x00\x00\x00\x00\x0a' + '\0' * 10 + self.frame * 100
+        info = probe_data(data)
+        self.assertEqual(info['container'], 'mp3')
+        self.assertEqual(info['bitrate'], 128)
+        self.assertAlmostEqual(info['duration'], 100 * 417 * 8 / 128000.0)
+
+    def test_xing(self):
+        xing = self.frame[:36] + 'Xing' + struct.pack('>II', 1, 1000)
+        data = xing + self.frame[len(xing):] + self.frame * 10
+        info = probe_data(data)
+        self.assertAlmostEqual(info['duration'], 1000 * 1152 / 44100.0)
+
+
+class TestOgg(TestCase):
+
+    def page(self, header_type, granule, packet):
+        return 'OggS\x00' + struct.pack('<BqIII', header_type, granule, 1, 0, 0) \
+            + chr(1) + chr(len(packet)) + packet
+
+    def test_vorbis(self):
+        ident = '\x01vorbis' + struct.pack('<IBIiii', 0, 2, 44100, 0, 128000, 0) + '\x01'
+        data = self.page(2, 0, ident) + self.page(0, 0, '\0' * 200) \
+            + self.page(4, 441000, '\0' * 200)
+        info = probe_data(data)
+        self.assertEqual(info['container'], 'ogg')
+        self.assertEqual(info['audio_codec'], 'vorbis')
+        self.assertEqual(info['duration'], 10.0)
+
+
+class TestUnknown(TestCase):
+
+    def test_unknown(self):
+        self.assertEqual(probe_data('RIFF' + '\0' * 100), None)
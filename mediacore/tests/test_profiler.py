@@ -0,0 +1,101 @@
+import os
+import shutil
+import tempfile
+import time
+from unittest import TestCase
+
+from mediacore.lib import profiler
+from mediacore.lib.profiler import (ProfileStats, ProfilerMiddleware,
+    RequestProfile, SQLTimingProxy, count_url_for, timed_render)
+
+class TestRequestProfile(TestCase):
+
+    def test_keeps_slowest_statements(self):
+        profile = RequestProfile(keep_slowest=2)
+        for i, seconds in enumerate([0.1, 0.3, 0.2, 0.05]):
+            profile.add_sql('SELECT %d' % i, seconds)
+        self.assertEqual(profile.sql_count, 4)
+        self.assertAlmostEqual(profile.sql_time, 0.65)
+        self.assertEqual(profile.slowest, [(0.3, 'SELECT 1'), (0.2, 'SELECT 2')])
+
+class TestProfilerMiddleware(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.stats = ProfileStats(self.dir, max_samples=3)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def app(self, environ, start_response):
+        environ['pylons.routes_dict'] = {'controller': 'media',
+                                         'action': 'view'}
+        count_url_for()
+        count_url_for()
+        timed_render(lambda tmpl: tmpl, 'media/view.html')
+        proxy = SQLTimingProxy()
+        proxy.cursor_execute(lambda *args: None, None, 'SELECT 1', (),
+                             None, False)
+        start_response('200 OK', [('Content-Type', 'text/html')])
+        return ['ok']
+
+    def test_profiles_request(self):
+        headers = []
+        def start_response(status, response_headers, exc_info=None):
+            headers.extend(response_headers)
+        app = ProfilerMiddleware(self.app, self.stats, header=True)
+        self.assertEqual(app({}, start_response), ['ok'])
+        self.assertEqual(profiler.current(), None)
+
+        header = dict(headers)['X-MediaCore-Profile']
+        self.assert_('sql=1/' in header, header)
+        self.assert_('url_for=2' in header, header)
+
+        routes, slowest = self.stats.summary()
+        self.assertEqual(len(routes), 1)
+        self.assertEqual(routes[0]['route'], 'media/view')
+        self.assertEqual(routes[0]['url_for_calls'], 2)
+        self.assertEqual(slowest[0][1:], ('SELECT 1', 'media/view'))
+
+    def test_merges_processes(self):
+        app = ProfilerMiddleware(self.app, self.stats)
+        for i in range(5):
+            app({}, lambda *args: None)
+        # Timings saved by another process
+        other = ProfileStats(self.dir)
+        other.record('media/view', RequestProfile())
+        os.rename(os.path.join(self.dir, '%d.pickle' % os.getpid()),
+                  os.path.join(self.dir, 'other.pickle'))
+
+        routes, slowest = self.stats.summary()
+        self.assertEqual(routes[0]['count'], 4)
+
+        self.stats.clear()
+        self.assertEqual(self.stats.summary(), ([], []))
+
+    def test_stale_processes_are_pruned(self):
+        stale = os.path.join(self.dir, '1.pickle')
+        other = ProfileStats(self.dir)
+        other.record('media/view', RequestProfile())
+        os.rename(os.path.join(self.dir, '%d.pickle' % os.getpid()), stale)
+        old = time.time() - 2 * self.stats.max_age
+        os.utime(stale, (old, old))
+        self.stats.record('media/index', RequestProfile())
+
+        routes, slowest = self.stats.summary()
+        self.assertEqual([r['route'] for r in routes], ['media/index'])
+        self.failIf(os.path.exists(stale))
+
+    def test_missing_stats_dir(self):
+        stats = ProfileStats(os.path.join(self.dir, 'file', 'profile'))
+        open(os.path.join(self.dir, 'file'), 'w').close()
+        self.assertEqual(stats.summary(), ([], []))
+
+class TestPercentile(TestCase):
+
+    def test_nearest_rank(self):
+        values = range(1, 101)
+        self.assertEqual(profiler._percentile(values, 50), 50)
+        self.assertEqual(profiler._percentile(values, 90), 90)
+        self.assertEqual(profiler._percentile(values, 99), 99)
+        self.assertEqual(profiler._percentile([7], 99), 7)
@@ -0,0 +1,167 @@
+import os
+import shutil
+import tempfile
+from datetime import datetime
+from unittest import TestCase
+
+from sqlalchemy import create_engine, sql
+
+from mediacore.lib.related import RelatedMedia, _Features, _Library
+
+def make_library(items):
+    features = {}
+    for media_id, (podcast_id, tags, title) in items.iteritems():
+        f = features[media_id] = _Features(podcast_id)
+        f.tags.update(tags)
+        for word in title.split():
+            f.words[word] = f.words.get(word, 0) + 1
+    return _Library(features)
+
+class TestRelatedMedia(TestCase):
+
+    items = {
+        1: (None, [1, 2], 'cats and dogs'),
+        2: (None, [1], 'more cats'),
+        3: (7, [2, 3], 'dogs'),
+        4: (7, [3], 'birds'),
+        5: (None, [4], 'fish'),
+        6: (None, [1, 4], 'cats and fish'),
+    }
+
+    def setUp(self):
+        self.related = RelatedMedia(size=2)
+
+    def full(self, library):
+        return dict((media_id, self.related.top(
+                        self.related.scores(library, media_id)))
+                    for media_id in library.features)
+
+    def test_scores(self):
+        library = make_library(self.items)
+        scores = self.related.scores(library, 1)
+        self.failIf(1 in scores)
+        self.failIf(4 in scores)
+        self.assertEqual(scores[3], self.related.scores(library, 3)[1])
+
+    def test_refresh_matches_rebuild(self):
+        lists = self.full(make_library(self.items))
+        items = dict(self.items)
+        # Only the podcast changes, so no tag or word becomes any rarer
+        items[5] = (7, [4], 'fish')
+        library = make_library(items)
+
+        changed, stale = set(), set()
+        self.related._refresh_one(lists, 5, self.related.scores(library, 5),
+                                  changed, stale)
+        for media_id in stale:
+            lists[media_id] = self.related.top(
+                self.related.scores(library, media_id))
+        expected = self.full(library)
+        for media_id in expected:
+            self.assertEqual(sorted(lists[media_id]),
+                             sorted(expected[media_id]))
+
+    def test_refresh_reads_only_affected_lists(self):
+        stored = self.full(make_library(self.items))
+        items = dict(self.items)
+        items[5] = (7, [4], 'fish')
+        library = make_library(items)
+        scores = self.related.scores(library, 5)
+        affected = set(scores) | set([5])
+        affected.update([id for id, l in stored.iteritems() if 5 in l])
+        lists = dict([(id, stored[id]) for id in affected])
+
+        changed, stale = set(), set()
+        self.related._refresh_one(lists, 5, scores, changed, stale)
+        self.failIf(changed - affected)
+        for media_id in stale:
+            lists[media_id] = self.related.top(
+                self.related.scores(library, media_id))
+        expected = self.full(library)
+        for media_id in changed | stale:
+            self.assertEqual(sorted(lists[media_id]),
+                             sorted(expected[media_id]))
+
+class TestRefresh(TestCase):
+    """Refresh an in-memory database and compare it with a rebuild."""
+
+    def setUp(self):
+        from mediacore.model.media import (media, media_tags,
+            media_categories, media_related, media_title_words,
+            title_word_counts)
+        self.tables = dict(media=media, media_tags=media_tags,
+            media_categories=media_categories, media_related=media_related,
+            media_title_words=media_title_words,
+            title_word_counts=title_word_counts)
+        self.engine = create_engine('sqlite://')
+        media.metadata.create_all(self.engine, tables=self.tables.values())
+        self.dir = tempfile.mkdtemp()
+        self.related = RelatedMedia(size=2, bind=self.engine,
+            lock_file=os.path.join(self.dir, 'related.lock'))
+        for media_id, (podcast_id, tags, title) in \
+                TestRelatedMedia.items.iteritems():
+            self.add(media_id, podcast_id, tags, title)
+        self.related.rebuild()
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def add(self, media_id, podcast_id, tags, title):
+        now = datetime.now()
+        self.engine.execute(self.tables['media'].insert(), id=media_id,
+            podcast_id=podcast_id, title=unicode(title), slug='media-%d' % media_id,
+            type='video', author_name=u'', author_email=u'',
+            created_on=now, modified_on=now)
+        for tag_id in tags:
+            self.engine.execute(self.tables['media_tags'].insert(),
+                                media_id=media_id, tag_id=tag_id)
+
+    def stored(self):
+        rows = {}
+        for name in ('media_related', 'media_title_words',
+                     'title_word_counts'):
+            table = self.tables[name]
+            rows[name] = sorted([tuple(row) for row in self.engine.execute(
+                sql.select([c for c in table.c if c.name != 'score']))])
+        return rows
+
+    def assertMatchesRebuild(self):
+        refreshed = self.stored()
+        self.related.rebuild()
+        self.assertEqual(refreshed, self.stored())
+
+    def test_only_neighbours_are_loaded(self):
+        conn = self.engine.connect()
+        try:
+            library = self.related._load_neighbours(conn, [4])
+        finally:
+            conn.close()
+        self.assertEqual(sorted(library.features), [3, 4])
+        full = make_library(TestRelatedMedia.items)
+        self.assertEqual(self.related.scores(library, 4),
+                         self.related.scores(full, 4))
+
+    def test_added(self):
+        self.add(7, 7, [3], u'more birds')
+        self.related.refresh([7])
+        self.assertMatchesRebuild()
+
+    def test_retitled(self):
+        self.engine.execute(self.tables['media'].update(
+            self.tables['media'].c.id == 2), title=u'fish')
+        self.related.refresh([2])
+        self.assertMatchesRebuild()
+
+    def test_deleted(self):
+        media_related = self.tables['media_related']
+        stale = [row[0] for row in self.engine.execute(sql.select(
+            [media_related.c.media_id], media_related.c.related_id == 6))]
+        for name in ('media_related', 'media_tags'):
+            table = self.tables[name]
+            self.engine.execute(table.delete(table.c.media_id == 6))
+        self.engine.execute(media_related.delete(
+            media_related.c.related_id == 6))
+        self.engine.execute(self.tables['media'].delete(
+            self.tables['media'].c.id == 6))
+        self.related.refresh([6], stale)
+        self.assertMatchesRebuild()
@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+from mediacore.lib.responsecache import (ResponseCacheExtension, TagVersions,
+    response_cache)
+
+class TestTagVersions(TestCase):
+
+    def setUp(self):
+        self.stamp_dir = os.path.join(tempfile.mkdtemp(), 'response_tags')
+
+    def tearDown(self):
+        shutil.rmtree(os.path.dirname(self.stamp_dir))
+
+    def test_invalidate(self):
+        versions = TagVersions(self.stamp_dir)
+        media, comments = versions.get('media'), versions.get('comments')
+        versions.invalidate('media')
+        self.assertNotEqual(versions.get('media'), media)
+        self.assertEqual(versions.get('comments'), comments)
+
+    def test_versions_are_never_reused(self):
+        versions = TagVersions(self.stamp_dir)
+        seen = set([versions.get('media')])
+        for i in range(20):
+            versions.invalidate('media')
+            seen.add(versions.get('media'))
+        self.assertEqual(len(seen), 21)
+
+    def test_shared_between_processes(self):
+        ours = TagVersions(self.stamp_dir, check_interval=0)
+        theirs = TagVersions(self.stamp_dir, check_interval=0)
+        theirs.invalidate('podcasts')
+        self.assertEqual(ours.get('podcasts'), theirs.get('podcasts'))
+
+    def test_check_interval(self):
+        ours = TagVersions(self.stamp_dir, check_interval=3600)
+        theirs = TagVersions(self.stamp_dir)
+        before = ours.get('media')
+        theirs.invalidate('media')
+        self.assertEqual(ours.get('media'), before)
+
+    def test_concurrent_invalidation(self):
+        versions = TagVersions(self.stamp_dir)
+        versions.invalidate('media')
+        errors = []
+        def invalidate():
+            try:
+                for i in range(50):
+                    versions.invalidate('media')
+            except Exception, e:
+                errors.append(e)
+        threads = [threading.Thread(target=invalidate) for i in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(os.listdir(self.stamp_dir), ['media.stamp'])
+        self.assertEqual(TagVersions(self.stamp_dir).get('media'),
+                         versions.get('media'))
+
+class Session(object):
+    pass
+
+class TestResponseCacheExtension(TestCase):
+
+    def setUp(self):
+        # A file where the stamp dir should be, so invalidation fails
+        fd, self.not_a_dir = tempfile.mkstemp()
+        os.close(fd)
+        self.tag_versions = response_cache.tag_versions
+        response_cache.tag_versions = TagVersions(self.not_a_dir)
+
+    def tearDown(self):
+        response_cache.tag_versions = self.tag_versions
+        os.remove(self.not_a_dir)
+
+    def test_after_commit_survives_failures(self):
+        session = Session()
+        session._response_cache_tags = set(['media'])
+        ResponseCacheExtension().after_commit(session)
+        self.failIf('_response_cache_tags' in session.__dict__)
@@ -0,0 +1,72 @@
+import os
+from unittest import TestCase
+
+from mediacore.lib import helpers
+from mediacore.lib.sanitizer import Sanitizer
+
+corpus_path = os.path.join(os.path.dirname(__file__), 'sanitizer_corpus.txt')
+
+def load_corpus():
+    """Return the sample inputs, which are separated by ``%%`` lines."""
+    f = open(corpus_path)
+    try:
+        return f.read().decode('utf-8').rstrip(u'\n').split(u'\n%%\n')
+    finally:
+        f.close()
+
+class TestSanitizer(TestCase):
+
+    def setUp(self):
+        self.sanitizer = Sanitizer(helpers.valid_tags, helpers.valid_attrs,
+                                   helpers.elem_map, cache_size=3)
+
+    def test_corpus_matches_cleaner(self):
+        for string in load_corpus():
+            for p_wrap in (True, False):
+                expected = helpers.clean_xhtml(string, p_wrap,
+                                               helpers.cleaner_settings)
+                xhtml = self.sanitizer.clean(string, p_wrap)
+                self.assertEqual(xhtml, expected,
+                                 '%r gave %r' % (string, xhtml))
+                plain = self.sanitizer.cached_plain_text(xhtml)
+                if plain is not None:
+                    self.assertEqual(plain, helpers.strip_xhtml(
+                        helpers.line_break_xhtml(
+                            helpers.line_break_xhtml(xhtml)), True))
+
+    def test_results_are_cached(self):
+        calls = []
+        clean = self.sanitizer._clean
+        def counting_clean(string, p_wrap):
+            calls.append(string)
+            return clean(string, p_wrap)
+        self.sanitizer._clean = counting_clean
+
+        for i in range(2):
+            self.assertEqual(self.sanitizer.clean(u'<b>a</b>'),
+                             u'<strong>a</strong>')
+            self.assertEqual(self.sanitizer.clean(u'a'), u'<p>a</p>')
+            self.assertEqual(self.sanitizer.clean(u'a', False), u'a')
+        self.assertEqual(len(calls), 3)
+
+        # The cache is cleared when full
+        self.sanitizer.clean(u'b')
+        self.sanitizer.clean(u'a')
+        self.assertEqual(len(calls), 5)
+
+    def test_plain_text(self):
+        xhtml = self.sanitizer.clean(u'<h2>Title</h2>'
+                                     u'<p>1 &lt; 2 &amp; caf&eacute;</p>')
+        self.assertEqual(xhtml,
+                         u'<p>Title</p><p>1 &lt; 2 &amp; caf\xe9</p>')
+        self.assertEqual(self.sanitizer.cached_plain_text(xhtml),
+                         u'Title\n1 < 2 & caf\xe9')
+        self.assertEqual(self.sanitizer.cached_plain_text(u'<p>new</p>'),
+                         None)
+        self.assertEqual(helpers.xhtml_to_plain(u'<p>a</p><p>b</p>'),
+                         u'a\nb')
+
+    def test_whitespace_only(self):
+        self.assertEqual(self.sanitizer.clean(u'  \n'), u'')
+        self.assertEqual(self.sanitizer.clean(u'<p>&nbsp;</p><img />'),
+                         u'')
@@ -0,0 +1,199 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+from sqlalchemy.orm import attributes
+
+from mediacore.lib import search
+from mediacore.lib.search import (IndexSearchBackend, InvertedIndex,
+    SearchIndexExtension, parse_query, tokenize)
+from mediacore.model import Media, Tag
+
+class TestTokenize(TestCase):
+
+    def test_words(self):
+        self.assertEqual(tokenize(u'Hello, World! A 2 b-52s'),
+                         ['hello', 'world', '2', '52s'])
+        self.assertEqual(tokenize(None), [])
+
+    def test_parse_query(self):
+        self.assertEqual(parse_query('+cat -dog bird* >(fish)'), [
+            ('+', ['cat'], False),
+            ('-', ['dog'], False),
+            ('', ['bird'], True),
+            ('', ['fish'], False),
+        ])
+
+
+class TestInvertedIndex(TestCase):
+
+    def setUp(self):
+        self.index = InvertedIndex(('title', 'notes'), {'title': 3.0})
+        self.index.add(1, {'title': u'Cats and dogs', 'notes': u'secret'})
+        self.index.add(2, {'title': u'Dogs', 'notes': u'cats cats cats'})
+        self.index.add(3, {'title': u'Birds', 'notes': u'birdwatching'})
+
+    def ids(self, search, fields=None):
+        return [doc_id for doc_id, score in self.index.search(search, fields)]
+
+    def test_ranking(self):
+        self.assertEqual(self.ids('cats'), [1, 2])
+        self.assertEqual(self.ids('dogs'), [2, 1])
+
+    def test_operators(self):
+        self.assertEqual(sorted(self.ids('+cats +dogs')), [1, 2])
+        self.assertEqual(self.ids('dogs -secret'), [2])
+        self.assertEqual(self.ids('bird*'), [3])
+        self.assertEqual(self.ids('-dogs'), [])
+
+    def test_fields(self):
+        self.assertEqual(self.ids('secret', ('title',)), [])
+        self.assertEqual(self.ids('cats', ('title',)), [1])
+
+    def test_update(self):
+        self.index.add(1, {'title': u'Fish'})
+        self.assertEqual(self.ids('cats'), [2])
+        self.index.remove(2)
+        self.assertEqual(self.ids('cats dogs'), [])
+        self.assertEqual(self.index.totals, [2, 1])
+        self.failIf('cats' in self.index.postings)
+
+
+class FakeBind(object):
+    def connect(self):
+        return self
+
+    def close(self):
+        pass
+
+class FakeIndexBackend(IndexSearchBackend):
+    """Reads media from a dict instead of the database."""
+    def __init__(self, documents, **kwargs):
+        IndexSearchBackend.__init__(self, bind=FakeBind(), **kwargs)
+        self.documents = documents
+
+    def _fetch_documents(self, conn, media_ids=None):
+        if media_ids is None:
+            media_ids = self.documents.keys()
+        return dict([(id, self.documents[id]) for id in media_ids
+                     if id in self.documents])
+
+class TestIndexSearchBackend(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.documents = {1: {'title': u'Cats'}, 2: {'title': u'Dogs'}}
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def backend(self, **kwargs):
+        kwargs.setdefault('check_interval', 0)
+        return FakeIndexBackend(self.documents, index_dir=self.dir, **kwargs)
+
+    def ids(self, backend, search):
+        index = backend.load()
+        return [doc_id for doc_id, score in index.search(search)]
+
+    def test_not_built(self):
+        backend = self.backend()
+        self.assertEqual(backend.load(), None)
+        backend.update([1])
+        self.failIf(os.path.exists(backend.index_file))
+
+    def test_updates_are_journaled(self):
+        backend = self.backend()
+        backend.rebuild()
+        stat = os.stat(backend.index_file)
+        other = self.backend()
+        self.assertEqual(self.ids(other, 'cats'), [1])
+
+        self.documents[3] = {'title': u'More cats'}
+        del self.documents[1]
+        backend.update([1, 3])
+        self.assertEqual(os.stat(backend.index_file).st_ino, stat.st_ino)
+        self.assertEqual(self.ids(backend, 'cats'), [3])
+        self.assertEqual(self.ids(other, 'cats'), [3])
+        self.assertEqual(self.ids(self.backend(), 'cats'), [3])
+
+    def test_journal_is_compacted(self):
+        backend = self.backend(compact_size=1)
+        backend.rebuild()
+        other = self.backend()
+        self.assertEqual(self.ids(other, 'dogs'), [2])
+        self.documents[2] = {'title': u'Birds'}
+        backend.update([2])
+        self.failIf('media.1.log' in os.listdir(self.dir))
+        self.assertEqual(self.ids(other, 'dogs'), [])
+        self.assertEqual(self.ids(other, 'birds'), [2])
+
+    def test_search_during_updates(self):
+        backend = self.backend(compact_size=4096)
+        backend.rebuild()
+        errors = []
+        def update():
+            try:
+                for i in range(3, 200):
+                    self.documents[i] = {'title': u'Cats %d' % i}
+                    backend.update([i])
+            except Exception, e:
+                errors.append(e)
+        def search():
+            try:
+                for i in range(200):
+                    backend._lock.acquire()
+                    try:
+                        backend.load().search('cats')
+                    finally:
+                        backend._lock.release()
+            except Exception, e:
+                errors.append(e)
+        threads = [threading.Thread(target=update)] \
+            + [threading.Thread(target=search) for i in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertEqual(len(self.ids(self.backend(), 'cats')), 198)
+
+class FakeSession(object):
+    def __init__(self, new=(), dirty=(), deleted=()):
+        self.new = list(new)
+        self.dirty = list(dirty)
+        self.deleted = list(deleted)
+
+def saved(obj, **values):
+    for key, value in values.iteritems():
+        setattr(obj, key, value)
+    state = attributes.instance_state(obj)
+    state.commit_all(state.dict)
+    return obj
+
+class TestSearchIndexExtension(TestCase):
+
+    def setUp(self):
+        self.get_backend = search.get_backend
+        search.get_backend = lambda: IndexSearchBackend()
+        self.ext = SearchIndexExtension()
+
+    def tearDown(self):
+        search.get_backend = self.get_backend
+
+    def test_only_indexed_changes_are_reindexed(self):
+        liked = saved(Media(), id=1, title=u'Cats', likes=0)
+        liked.likes = 1
+        renamed = saved(Media(), id=2, title=u'Cats', likes=0)
+        renamed.title = u'Dogs'
+        session = FakeSession(new=[saved(Media(), id=3)],
+                              dirty=[liked, renamed])
+        self.ext.after_flush(session, None)
+        self.assertEqual(session.__dict__[self.ext._key], set([2, 3]))
+
+    def test_unchanged_tags_are_ignored(self):
+        tag = saved(Tag(), id=1, name=u'cats')
+        session = FakeSession(dirty=[tag])
+        self.ext.before_flush(session, None, None)
+        self.assertEqual(session.__dict__[self.ext._key], set())
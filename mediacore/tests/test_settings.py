@@ -0,0 +1,79 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from mediacore.model.settings import SettingNotFound, SettingsCache
+
+class Result(object):
+    def __init__(self, rows):
+        self.rows = rows
+
+    def fetchall(self):
+        return self.rows
+
+class Connection(object):
+    def __init__(self, bind):
+        self.bind = bind
+
+    def execute(self, query):
+        self.bind.loads += 1
+        return Result(sorted(self.bind.rows.items()))
+
+    def close(self):
+        pass
+
+class Bind(object):
+    """Stands in for the engine, serving the settings table from a dict."""
+    def __init__(self, rows):
+        self.rows = rows
+        self.loads = 0
+
+    def connect(self):
+        return Connection(self)
+
+class TestSettingsCache(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.stamp_file = os.path.join(self.dir, 'settings.stamp')
+        self.bind = Bind({u'player_type': u'best', u'email_send_from': u'a'})
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def cache(self, check_interval=0):
+        return SettingsCache(self.stamp_file, check_interval, self.bind)
+
+    def test_loaded_once(self):
+        cache = self.cache()
+        self.assertEqual(cache.get(u'player_type'), u'best')
+        self.assertEqual(cache.snapshot().email_send_from, u'a')
+        self.assertEqual(self.bind.loads, 1)
+        self.assertRaises(SettingNotFound, cache.get, u'missing')
+        self.assertRaises(TypeError, cache.snapshot().__setitem__, u'a', u'b')
+
+    def test_invalidate(self):
+        cache = self.cache()
+        cache.get(u'player_type')
+        self.bind.rows[u'player_type'] = u'html5'
+        self.assertEqual(cache.get(u'player_type'), u'best')
+        cache.invalidate()
+        self.assertEqual(cache.get(u'player_type'), u'html5')
+        self.assertEqual(self.bind.loads, 2)
+
+    def test_invalidated_by_another_process(self):
+        ours, theirs = self.cache(), self.cache()
+        ours.get(u'player_type')
+        self.bind.rows[u'player_type'] = u'html5'
+        theirs.invalidate()
+        self.assertEqual(ours.get(u'player_type'), u'html5')
+
+    def test_check_interval(self):
+        ours, theirs = self.cache(check_interval=3600), self.cache()
+        ours.get(u'player_type')
+        self.bind.rows[u'player_type'] = u'html5'
+        theirs.invalidate()
+        self.assertEqual(ours.get(u'player_type'), u'best')
+        ours._stamp_checked = 0
+        self.assertEqual(ours.get(u'player_type'), u'html5')
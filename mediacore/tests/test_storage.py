@@ -0,0 +1,107 @@
+import ftplib
+import hashlib
+import os
+import shutil
+import tempfile
+from StringIO import StringIO
+from unittest import TestCase
+
+from mediacore.lib.storage import (FakeStorage, FTPPool, FTPStorage,
+    LocalStorage, store_blob, store_many)
+
+DATA = ''.join([chr(i % 251) for i in range(300000)])
+
+class FakeConn(object):
+    def __init__(self, files, name):
+        self.files, self.name, self.parts = files, name, []
+    def sendall(self, data):
+        self.parts.append(data)
+    def close(self):
+        self.files[self.name] = ''.join(self.parts)
+
+class FakeFTP(object):
+    """Just enough of :class:`ftplib.FTP` for :class:`FTPStorage`."""
+    logins = 0
+
+    def __init__(self, server, user, password):
+        FakeFTP.logins += 1
+        self.files = FakeFTP.files
+        self.closed = False
+    def voidcmd(self, cmd):
+        return '200 OK'
+    def voidresp(self):
+        return '226 OK'
+    def transfercmd(self, cmd):
+        return FakeConn(self.files, cmd.split(' ', 1)[1])
+    def size(self, name):
+        if name not in self.files:
+            raise ftplib.error_perm('550 No such file')
+        return len(self.files[name])
+    def sendcmd(self, cmd):
+        return '213 20100510120000'
+    def delete(self, name):
+        del self.files[name]
+    def quit(self):
+        self.closed = True
+    close = quit
+
+
+class TestStorage(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'clip.mp4')
+        f = open(self.path, 'wb')
+        f.write(DATA)
+        f.close()
+        FakeFTP.files = {}
+        FakeFTP.logins = 0
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_local(self):
+        os.mkdir(os.path.join(self.dir, 'store'))
+        storage = LocalStorage(os.path.join(self.dir, 'store'))
+        self.assertEqual(storage.store('a.mp4', self.path),
+                         hashlib.sha1(DATA).hexdigest())
+        self.assert_(storage.verify('a.mp4', len(DATA)))
+        self.assert_(storage.is_current('a.mp4', self.path))
+        storage.delete('a.mp4')
+        self.failIf(storage.verify('a.mp4', len(DATA)))
+
+    def test_ftp_reuses_connections(self):
+        storage = FTPStorage('host', 'user', 'pass', 'media',
+                             'http://host/media/', pool=FTPPool(FakeFTP))
+        self.assertEqual(storage.store('a.mp4', self.path),
+                         hashlib.sha1(DATA).hexdigest())
+        self.assertEqual(FakeFTP.files['media/a.mp4'], DATA)
+        self.assert_(storage.verify('a.mp4', len(DATA)))
+        self.failIf(storage.verify('b.mp4', len(DATA)))
+        self.assertEqual(storage.url('a.mp4'), 'http://host/media/a.mp4')
+        self.assertEqual(FakeFTP.logins, 1)
+
+    def test_sample_offsets(self):
+        storage = FTPStorage('host', 'user', 'pass', samples=4,
+                             sample_size=1000)
+        self.assertEqual(storage._sample_offsets(500), [0])
+        self.assertEqual(storage._sample_offsets(10000), [0, 3000, 6000, 9000])
+
+    def test_store_many(self):
+        storage = FakeStorage()
+        files = [('%d.mp4' % i, self.path) for i in range(10)]
+        results = store_many(storage, files + [('x.mp4', '/no/such/file')], 3)
+        self.assertEqual(len(results), 11)
+        self.assert_(isinstance(results['x.mp4'], IOError))
+        for name, path in files:
+            self.assertEqual(results[name], hashlib.sha1(DATA).hexdigest())
+            self.assertEqual(storage.files[name], DATA)
+
+    def test_store_blob_dedupes(self):
+        digest = hashlib.sha1(DATA).hexdigest()
+        first = store_blob(StringIO(DATA), self.dir, 'mp4')
+        second = store_blob(StringIO(DATA), self.dir, 'mp4')
+        self.assertEqual(first, ('%s.mp4' % digest, digest))
+        self.assertEqual(second, first)
+        self.assertEqual(sorted(os.listdir(self.dir)),
+                         sorted(['clip.mp4', first[0]]))
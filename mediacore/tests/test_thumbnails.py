@@ -0,0 +1,100 @@
+import os
+import shutil
+import tempfile
+from unittest import TestCase
+
+from PIL import Image
+
+from mediacore.lib.thumbnails import ThumbManifest, ThumbPipeline, chains
+
+SIZES = {'s': (128, 72), 'm': (160, 90), 'l': (560, 315), 'sq': (100, 100)}
+
+class TestChains(TestCase):
+
+    def test_grouped_by_ratio_largest_first(self):
+        self.assertEqual(chains(SIZES), [
+            [('l', (560, 315)), ('m', (160, 90)), ('s', (128, 72))],
+            [('sq', (100, 100))],
+        ])
+
+
+class TestThumbPipeline(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.orig_path = os.path.join(self.dir, '1orig.jpg')
+        Image.new('RGB', (1600, 1200), (200, 40, 40)).save(self.orig_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_generate(self):
+        results = ThumbPipeline().generate(self.orig_path, self.dir, 1, SIZES)
+        for key, xy in SIZES.iteritems():
+            self.assertEqual(results[key]['size'], xy)
+            self.assertEqual(results[key]['files'], {'jpg': '1%s.jpg' % key})
+            self.assertEqual(len(results[key]['version']), 10)
+            img = Image.open(os.path.join(self.dir, '1%s.jpg' % key))
+            self.assertEqual(img.size, xy)
+
+    def test_versioned(self):
+        pipeline = ThumbPipeline(versioned=True)
+        first = pipeline.generate(self.orig_path, self.dir, 1, SIZES)
+        name = first['m']['files']['jpg']
+        self.assertEqual(name, '1m-%s.jpg' % first['m']['version'])
+        self.assert_(os.path.exists(os.path.join(self.dir, name)))
+        self.assert_(os.path.exists(os.path.join(self.dir, '1m.jpg')))
+
+        Image.new('RGB', (800, 600), (40, 40, 200)).save(self.orig_path)
+        second = pipeline.generate(self.orig_path, self.dir, 1, SIZES)
+        self.assertNotEqual(second['m']['files']['jpg'], name)
+        # The old version is removed
+        self.failIf(os.path.exists(os.path.join(self.dir, name)))
+
+
+class TestThumbManifest(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        os.mkdir(os.path.join(self.dir, 'media'))
+        for name in ('news.jpg', '1s.jpg', '1s-0123456789.webp', '2m.jpg',
+                     '3s-0123456789.webp', '4x.jpg', '1orig.png'):
+            open(os.path.join(self.dir, 'media', name), 'w').close()
+        self.manifest = ThumbManifest(
+            manifest_file=os.path.join(self.dir, 'cache', 'thumbs.manifest'),
+            image_dir=self.dir,
+            thumb_sizes={'media': {'s': (128, 72), 'm': (160, 90)}},
+            check_interval=0)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def test_scanned_when_missing(self):
+        entries = self.manifest.load()
+        self.assertEqual(sorted(entries.keys()),
+                         [('media', 1), ('media', 2), ('media', 'new')])
+        self.assertEqual(entries[('media', 1)]['s']['files'],
+                         {'jpg': '1s.jpg', 'webp': '1s-0123456789.webp'})
+        self.assertEqual(entries[('media', 2)]['m']['size'], (160, 90))
+        self.assert_(entries[('media', 2)]['m']['version'])
+        self.assert_(self.manifest.has('media', 1, 's'))
+        self.failIf(self.manifest.has('media', 1, 'm'))
+        self.failIf(self.manifest.has('media', 3, 's'))
+
+    def test_lookup_falls_back_to_default(self):
+        self.assertEqual(self.manifest.lookup('media', 1, 's')[0], 1)
+        item_id, thumb = self.manifest.lookup('media', 3, 's')
+        self.assertEqual(item_id, 'new')
+        self.assertEqual(thumb['files'], {'jpg': 'news.jpg'})
+        self.assertEqual(self.manifest.lookup('media', 3, 'm'), ('new', None))
+
+    def test_update_and_remove(self):
+        thumbs = {'s': {'size': (128, 72), 'files': {'jpg': '5s.jpg'},
+                        'version': '0123456789'}}
+        self.manifest.update('media', 5, thumbs)
+        self.manifest.remove('media', 1)
+        # A fresh instance sees the changes on disk
+        manifest = ThumbManifest(manifest_file=self.manifest.manifest_file)
+        self.assertEqual(manifest.get('media', 5), thumbs)
+        self.assertEqual(manifest.get('media', 1), None)
+        self.assert_(manifest.has('media', 2, 'm'))
@@ -0,0 +1,27 @@
+from unittest import TestCase
+
+from mediacore.lib.unidecode import unidecode
+
+class TestUnidecode(TestCase):
+
+    def test_ascii_is_unchanged(self):
+        self.assertEqual(unidecode(u'Hello [world]!'), 'Hello [world]!')
+        self.assertEqual(unidecode('Hello'), 'Hello')
+        self.assertEqual(type(unidecode(u'Hello')), str)
+
+    def test_transliteration(self):
+        self.assertEqual(unidecode(u'Caf\xe9 [cr\xe8me]'), 'Cafe [creme]')
+        self.assertEqual(unidecode(u'\u5317\u4eb0'), 'Bei Jing ')
+        self.assertEqual(unidecode(u'\u041c\u043e\u0441\u043a\u0432\u0430'), 'Moskva')
+        self.assertEqual(unidecode(u'\u0391\u03b8\u03ae\u03bd\u03b1'), 'Athena')
+        self.assertEqual(type(unidecode(u'\xe9')), str)
+
+    def test_byte_strings_are_latin_1(self):
+        self.assertEqual(unidecode('caf\xe9'), 'cafe')
+
+    def test_unknown_characters_are_dropped(self):
+        # Missing from a table, a missing table, and outside the basic
+        # multilingual plane
+        self.assertEqual(unidecode(u'a\ud7ffb'), 'ab')
+        self.assertEqual(unidecode(u'a\u0800b'), 'ab')
+        self.assertEqual(unidecode(u'a\U0001d11eb'), 'ab')
@@ -0,0 +1,123 @@
+import hashlib
+import os
+import shutil
+import tempfile
+from StringIO import StringIO
+from unittest import TestCase
+
+from mediacore.lib.uploads import ChunkedUploads, UploadError
+
+DATA = ''.join([chr(i % 256) for i in range(200000)])
+
+def sha1(data):
+    return hashlib.sha1(data).hexdigest()
+
+class TestChunkedUploads(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.uploads = ChunkedUploads(os.path.join(self.dir, 'partial'))
+        self.upload = self.uploads.create('clip.mp4', len(DATA), sha1(DATA))
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def append(self, start, end, **kwargs):
+        upload = self.uploads.get(self.upload.session)
+        chunk = DATA[start:end]
+        upload.append(start, StringIO(chunk), len(chunk), **kwargs)
+        return upload
+
+    def test_append_and_finalize(self):
+        self.append(0, 70000, sha1=sha1(DATA[:70000]))
+        self.append(70000, 140000)
+        upload = self.append(140000, len(DATA))
+        self.assertEqual(upload.offset, len(DATA))
+        self.assertEqual(upload.finalize(), sha1(DATA))
+
+        dest = os.path.join(self.dir, 'clip.mp4')
+        self.assertEqual(upload.move_to(dest), sha1(DATA))
+        self.assertEqual(open(dest, 'rb').read(), DATA)
+        self.assertRaises(UploadError, self.uploads.get, upload.session)
+
+    def test_resume_after_dropped_connection(self):
+        upload = self.uploads.get(self.upload.session)
+        # The client meant to send 100000 bytes but only 30000 arrived
+        try:
+            upload.append(0, StringIO(DATA[:30000]), 100000)
+        except UploadError, e:
+            self.assertEqual(e.offset, 30000)
+        else:
+            self.fail('Expected UploadError')
+
+        # Retrying the same chunk is rejected with the offset to resume from
+        try:
+            self.append(0, 100000)
+        except UploadError, e:
+            self.assertEqual((e.status, e.offset), (409, 30000))
+        else:
+            self.fail('Expected UploadError')
+
+        # A new process, with no cached hash, carries on from there
+        self.uploads._hashes.clear()
+        self.append(30000, len(DATA))
+        upload = self.uploads.get(self.upload.session)
+        self.assertEqual(upload.finalize(), sha1(DATA))
+
+    def test_corrupt_chunk_is_discarded(self):
+        self.append(0, 50000)
+        self.assertRaises(UploadError, self.append, 50000, 100000,
+                          sha1=sha1('nope'))
+        upload = self.uploads.get(self.upload.session)
+        self.assertEqual(upload.offset, 50000)
+        self.assertEqual(os.path.getsize(upload.part_path), 50000)
+
+    def test_finalize_incomplete_or_wrong_file(self):
+        upload = self.append(0, 50000)
+        self.assertRaises(UploadError, upload.finalize)
+
+        upload = self.uploads.create('clip.mp4', 10, sha1('0123456789'))
+        upload.append(0, StringIO('9876543210'), 10)
+        self.assertRaises(UploadError, upload.finalize)
+        self.failIf(os.path.exists(upload.part_path))
+
+    def test_invalid_session(self):
+        self.assertRaises(UploadError, self.uploads.get, '../../etc/passwd')
+        self.assertRaises(UploadError, self.uploads.get, '0' * 32)
+
+    def test_size_and_type_limits(self):
+        self.assertRaises(UploadError, self.uploads.create, 'clip.mp4',
+                          len(DATA), max_size=len(DATA) - 1)
+        self.assertRaises(UploadError, self.uploads.create, 'clip.exe',
+                          len(DATA), extensions=['mp4', 'flv'])
+        self.assertRaises(UploadError, self.uploads.create, 'clip',
+                          len(DATA), extensions=['mp4', 'flv'])
+        upload = self.uploads.create('CLIP.MP4', len(DATA),
+                                     max_size=len(DATA),
+                                     extensions=['mp4', 'flv'])
+        self.assertEqual(upload.size, len(DATA))
+
+    def test_chunk_past_the_declared_size(self):
+        upload = self.uploads.get(self.upload.session)
+        data = DATA + 'extra'
+        try:
+            upload.append(0, StringIO(data), len(data))
+        except UploadError, e:
+            self.assertEqual(e.offset, 0)
+        else:
+            self.fail('The chunk was accepted')
+        self.assertEqual(os.path.getsize(upload.part_path), 0)
+
+    def test_hashes_are_dropped(self):
+        self.append(0, 70000)
+        self.assertEqual(self.uploads._hashes.keys(), [self.upload.session])
+        upload = self.append(70000, len(DATA))
+        upload.finalize()
+        self.assertEqual(self.uploads._hashes, {})
+
+        other = self.uploads.create('other.mp4', len(DATA))
+        self.uploads.get(other.session).append(0, StringIO(DATA[:10]), 10)
+        self.assertEqual(self.uploads._hashes.keys(), [other.session])
+        self.uploads.max_age = -1
+        self.uploads.purge()
+        self.assertEqual(self.uploads._hashes, {})
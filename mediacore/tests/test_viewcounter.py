@@ -0,0 +1,120 @@
+import os
+import shutil
+import tempfile
+import threading
+from unittest import TestCase
+
+from mediacore.lib.viewcounter import ViewCounter
+
+class RecordingViewCounter(ViewCounter):
+    """Records the counts each flush would apply instead of updating the
+    database, or fails as if the update did."""
+    def __init__(self, applied, fail=False, **kwargs):
+        ViewCounter.__init__(self, **kwargs)
+        self.applied = applied
+        self.fail = fail
+        self.lock = threading.Lock()
+
+    def _update(self, counts):
+        if self.fail:
+            raise IOError('Lost the database connection')
+        self.lock.acquire()
+        try:
+            self.applied.append(counts)
+        finally:
+            self.lock.release()
+
+def total(applied):
+    counts = {}
+    for batch in applied:
+        for media_id, count in batch.iteritems():
+            counts[media_id] = counts.get(media_id, 0) + count
+    return counts
+
+class TestViewCounter(TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.spool_file = os.path.join(self.dir, 'views.spool')
+        self.applied = []
+
+    def tearDown(self):
+        shutil.rmtree(self.dir)
+
+    def counter(self, **kwargs):
+        kwargs.setdefault('flush_interval', 3600)
+        kwargs.setdefault('flush_threshold', 1 << 30)
+        return RecordingViewCounter(self.applied, spool_file=self.spool_file,
+                                    **kwargs)
+
+    def test_flush(self):
+        counter = self.counter()
+        for media_id in (1, 2, 1, 3, 1):
+            counter.increment(media_id)
+        self.assertEqual(counter.flush(), {1: 3, 2: 1, 3: 1})
+        self.assertEqual(self.applied, [{1: 3, 2: 1, 3: 1}])
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_empty_spool(self):
+        counter = self.counter()
+        self.assertEqual(counter.flush(), {})
+        open(self.spool_file, 'w').close()
+        self.assertEqual(counter.flush(), {})
+        self.assertEqual(self.applied, [])
+        # An empty spool isn't claimed, so writers keep using it
+        self.assertEqual(os.listdir(self.dir), ['views.spool'])
+
+    def test_concurrent_claims(self):
+        views = 2000
+        counters = [self.counter() for i in range(4)]
+        def write(counter, start):
+            for media_id in range(start, views, 2):
+                counter.increment(media_id % 7)
+        def flush(counter):
+            for i in range(50):
+                counter.flush()
+        threads = [threading.Thread(target=write, args=(counters[0], 0)),
+                   threading.Thread(target=write, args=(counters[1], 1))]
+        threads += [threading.Thread(target=flush, args=(counter,))
+                    for counter in counters]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        counters[0].flush()
+
+        expected = {}
+        for media_id in range(views):
+            expected[media_id % 7] = expected.get(media_id % 7, 0) + 1
+        self.assertEqual(total(self.applied), expected)
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_crashed_flush_is_retried_once(self):
+        crashing = self.counter(fail=True, orphan_age=0)
+        for media_id in (1, 1, 2):
+            crashing.increment(media_id)
+        self.assertRaises(IOError, crashing.flush)
+        self.assertEqual(self.applied, [])
+        # The batch is still on disk, next to the fresh spool
+        self.assertEqual(len(os.listdir(self.dir)), 1)
+
+        counter = self.counter(orphan_age=0)
+        counter.increment(2)
+        self.assertEqual(counter.flush(), {1: 2, 2: 2})
+        self.assertEqual(counter.flush(), {})
+        self.assertEqual(total(self.applied), {1: 2, 2: 2})
+        self.assertEqual(os.listdir(self.dir), [])
+
+    def test_recent_batches_are_not_orphans(self):
+        crashing = self.counter(fail=True)
+        crashing.increment(1)
+        self.assertRaises(IOError, crashing.flush)
+        # Another flusher may still be working on it
+        self.assertEqual(self.counter().flush(), {})
+        self.assertEqual(self.counter(orphan_age=0).flush(), {1: 1})
+
+    def test_increment_survives_failed_flush(self):
+        counter = self.counter(fail=True, flush_threshold=1)
+        counter.increment(1)
+        counter.increment(1)
+        self.assertEqual(self.counter(orphan_age=0).flush(), {1: 2})
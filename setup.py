@@ -72,7 +72,8 @@ setup(
 
     packages=find_packages(exclude=['ez_setup']),
     include_package_data=True,
-    package_data={'mediacore': ['i18n/*/LC_MESSAGES/*.mo']},
+    package_data={'mediacore': ['i18n/*/LC_MESSAGES/*.mo',
+                               'lib/unidecode/tables.dat']},
     # message_extractors = {'mediacore': [
     #    ('**.py', 'python', None),
     #    ('templates/**.html', 'genshi', None),
@@ -85,5 +86,17 @@ setup(
 
     [paste.app_install]
     main = pylons.util:PylonsInstaller
+
+    [paste.paster_command]
+    collect-blobs = mediacore.commands:CollectBlobsCommand
+    probe-media = mediacore.commands:ProbeMediaCommand
+    rebuild-counts = mediacore.commands:RebuildCountsCommand
+    rebuild-excerpts = mediacore.commands:RebuildExcerptsCommand
+    rebuild-search-index = mediacore.commands:RebuildSearchIndexCommand
+    rebuild-related-media = mediacore.commands:RebuildRelatedMediaCommand
+    rebuild-thumbs = mediacore.commands:RebuildThumbsCommand
+    reclaim-thumbs = mediacore.commands:ReclaimThumbsCommand
+    run-jobs = mediacore.commands:RunJobsCommand
+    store-ftp = mediacore.commands:StoreFTPCommand
     """,
 )
@@ -25,6 +25,8 @@ CREATE TABLE `categories` (
   `name` varchar(50) NOT NULL,
   `slug` varchar(50) CHARACTER SET ascii NOT NULL,
   `parent_id` int(10) unsigned DEFAULT NULL,
+  `media_count_published` int(10) NOT NULL DEFAULT '0',
+  `media_count_published_total` int(10) NOT NULL DEFAULT '0',
   PRIMARY KEY (`id`),
   UNIQUE KEY `name` (`name`),
   UNIQUE KEY `slug` (`slug`),
@@ -39,8 +41,8 @@ CREATE TABLE `categories` (
 
 LOCK TABLES `categories` WRITE;
 /*!40000 ALTER TABLE `categories` DISABLE KEYS */;
-INSERT INTO `categories` VALUES (1,'Example Topic','example-topic',NULL),
-(2,'Another Subject','another-subject',NULL);
+INSERT INTO `categories` VALUES (1,'Example Topic','example-topic',NULL,0,0),
+(2,'Another Subject','another-subject',NULL,0,0);
 /*!40000 ALTER TABLE `categories` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -133,6 +135,32 @@ INSERT INTO `groups_permissions` VALUES (1,1);
 /*!40000 ALTER TABLE `groups_permissions` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `jobs`
+--
+
+DROP TABLE IF EXISTS `jobs`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8 */;
+CREATE TABLE `jobs` (
+  `id` int(10) unsigned NOT NULL auto_increment,
+  `name` varchar(50) NOT NULL,
+  `job_key` varchar(255) default NULL,
+  `args` text NOT NULL,
+  `status` varchar(10) NOT NULL default 'queued',
+  `attempts` int(10) unsigned NOT NULL default '0',
+  `max_attempts` int(10) unsigned NOT NULL default '5',
+  `run_after` datetime NOT NULL,
+  `locked_until` datetime default NULL,
+  `last_error` text,
+  `created_on` datetime NOT NULL,
+  `modified_on` datetime NOT NULL,
+  PRIMARY KEY (`id`),
+  UNIQUE KEY `job_key` (`job_key`),
+  KEY `jobs_status_run_after` (`status`,`run_after`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `media`
 --
@@ -156,16 +184,21 @@ CREATE TABLE `media` (
   `subtitle` varchar(255) DEFAULT NULL,
   `description` text,
   `description_plain` text,
+  `description_excerpts` text,
   `notes` text,
   `duration` int(10) unsigned NOT NULL,
   `views` int(10) unsigned NOT NULL DEFAULT '0',
   `likes` int(10) unsigned NOT NULL DEFAULT '0',
   `popularity_points` int(10) unsigned NOT NULL DEFAULT '0',
+  `comment_count` int(10) NOT NULL DEFAULT '0',
+  `comment_count_published` int(10) NOT NULL DEFAULT '0',
   `author_name` varchar(50) NOT NULL,
   `author_email` varchar(255) NOT NULL,
   PRIMARY KEY (`id`),
   UNIQUE KEY `slug` (`slug`),
   KEY `media_ibfk_1` (`podcast_id`),
+  KEY `media_publish_on` (`publish_on`,`id`),
+  KEY `media_popularity_points` (`popularity_points`,`id`),
   CONSTRAINT `media_ibfk_1` FOREIGN KEY (`podcast_id`) REFERENCES `podcasts` (`id`) ON DELETE SET NULL ON UPDATE SET NULL
 ) ENGINE=InnoDB AUTO_INCREMENT=2 DEFAULT CHARSET=utf8;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -176,7 +209,7 @@ CREATE TABLE `media` (
 
 LOCK TABLES `media` WRITE;
 /*!40000 ALTER TABLE `media` DISABLE KEYS */;
-INSERT INTO `media` VALUES (1,NULL,'new-media',0,0,0,NULL,'2009-12-01 19:40:23','2009-12-01 19:43:34',NULL,NULL,'New Media',NULL,'<p>Lorem ipsum dolor sit amet, consectetur adipisicing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.</p>',NULL,'',0,1,0,0,'Admin','admin@localhost.com');
+INSERT INTO `media` VALUES (1,NULL,'new-media',0,0,0,NULL,'2009-12-01 19:40:23','2009-12-01 19:43:34',NULL,NULL,'New Media',NULL,'<p>Lorem ipsum dolor sit amet, consectetur adipisicing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.</p>',NULL,NULL,'',0,1,0,0,1,1,'Admin','admin@localhost.com');
 /*!40000 ALTER TABLE `media` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -224,10 +257,17 @@ CREATE TABLE `media_files` (
   `url` varchar(255) CHARACTER SET ascii DEFAULT NULL,
   `embed` varchar(50) DEFAULT NULL,
   `size` int(10) unsigned DEFAULT NULL,
+  `duration` int(10) unsigned DEFAULT NULL,
+  `bitrate` int(10) unsigned DEFAULT NULL,
+  `width` smallint(5) unsigned DEFAULT NULL,
+  `height` smallint(5) unsigned DEFAULT NULL,
+  `video_codec` varchar(10) CHARACTER SET ascii DEFAULT NULL,
+  `audio_codec` varchar(10) CHARACTER SET ascii DEFAULT NULL,
   `created_on` datetime NOT NULL,
   `modified_on` datetime NOT NULL,
   PRIMARY KEY (`id`),
   KEY `media_files_ibfk_1` (`media_id`),
+  KEY `media_files_file_name` (`file_name`),
   CONSTRAINT `media_files_ibfk_1` FOREIGN KEY (`media_id`) REFERENCES `media` (`id`) ON DELETE CASCADE ON UPDATE CASCADE
 ) ENGINE=InnoDB DEFAULT CHARSET=utf8;
 /*!40101 SET character_set_client = @saved_cs_client */;
@@ -273,6 +313,25 @@ INSERT INTO `media_fulltext` VALUES (1,'New Media',NULL,NULL,'','Admin','hello w
 /*!40000 ALTER TABLE `media_fulltext` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `media_related`
+--
+
+DROP TABLE IF EXISTS `media_related`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8 */;
+CREATE TABLE `media_related` (
+  `media_id` int(10) unsigned NOT NULL,
+  `related_id` int(10) unsigned NOT NULL,
+  `score` float NOT NULL,
+  PRIMARY KEY (`media_id`,`related_id`),
+  KEY `media_related_score` (`media_id`,`score`),
+  KEY `related_id` (`related_id`),
+  CONSTRAINT `media_related_ibfk_1` FOREIGN KEY (`media_id`) REFERENCES `media` (`id`) ON DELETE CASCADE ON UPDATE CASCADE,
+  CONSTRAINT `media_related_ibfk_2` FOREIGN KEY (`related_id`) REFERENCES `media` (`id`) ON DELETE CASCADE ON UPDATE CASCADE
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
 --
 -- Table structure for table `media_tags`
 --
@@ -300,6 +359,32 @@ INSERT INTO `media_tags` VALUES (1,1);
 /*!40000 ALTER TABLE `media_tags` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `media_title_words`
+--
+
+DROP TABLE IF EXISTS `media_title_words`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8 */;
+CREATE TABLE `media_title_words` (
+  `media_id` int(10) unsigned NOT NULL,
+  `word` varchar(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
+  `count` int(10) unsigned NOT NULL,
+  PRIMARY KEY (`media_id`,`word`),
+  KEY `media_title_words_word` (`word`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `media_title_words`
+--
+
+LOCK TABLES `media_title_words` WRITE;
+/*!40000 ALTER TABLE `media_title_words` DISABLE KEYS */;
+INSERT INTO `media_title_words` VALUES (1,'',0),(1,'media',1),(1,'new',1);
+/*!40000 ALTER TABLE `media_title_words` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `permissions`
 --
@@ -341,6 +426,7 @@ CREATE TABLE `podcasts` (
   `title` varchar(50) NOT NULL,
   `subtitle` varchar(255) DEFAULT NULL,
   `description` text,
+  `description_excerpts` text,
   `category` varchar(50) DEFAULT NULL,
   `author_name` varchar(50) NOT NULL,
   `author_email` varchar(50) NOT NULL,
@@ -348,6 +434,7 @@ CREATE TABLE `podcasts` (
   `copyright` varchar(50) DEFAULT NULL,
   `itunes_url` varchar(80) CHARACTER SET ascii DEFAULT NULL,
   `feedburner_url` varchar(80) CHARACTER SET ascii DEFAULT NULL,
+  `media_count_published` int(10) NOT NULL DEFAULT '0',
   PRIMARY KEY (`id`),
   UNIQUE KEY `slug` (`slug`)
 ) ENGINE=InnoDB AUTO_INCREMENT=2 DEFAULT CHARSET=utf8;
@@ -359,7 +446,7 @@ CREATE TABLE `podcasts` (
 
 LOCK TABLES `podcasts` WRITE;
 /*!40000 ALTER TABLE `podcasts` DISABLE KEYS */;
-INSERT INTO `podcasts` VALUES (1,'hello-world','2009-12-01 19:38:43','2009-12-01 19:38:43','Hello World','My very first podcast!','<p>Lorem ipsum dolor sit amet, consectetur adipisicing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.</p>','Technology','Admin','admin@localhost.com',NULL,'Copyright 2009 Xyz',NULL,NULL);
+INSERT INTO `podcasts` VALUES (1,'hello-world','2009-12-01 19:38:43','2009-12-01 19:38:43','Hello World','My very first podcast!','<p>Lorem ipsum dolor sit amet, consectetur adipisicing elit, sed do eiusmod tempor incididunt ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation ullamco laboris nisi ut aliquip ex ea commodo consequat. Duis aute irure dolor in reprehenderit in voluptate velit esse cillum dolore eu fugiat nulla pariatur. Excepteur sint occaecat cupidatat non proident, sunt in culpa qui officia deserunt mollit anim id est laborum.</p>',NULL,'Technology','Admin','admin@localhost.com',NULL,'Copyright 2009 Xyz',NULL,NULL,0);
 /*!40000 ALTER TABLE `podcasts` ENABLE KEYS */;
 UNLOCK TABLES;
 
@@ -425,9 +512,11 @@ CREATE TABLE `tags` (
   `id` int(10) unsigned NOT NULL AUTO_INCREMENT,
   `name` varchar(50) NOT NULL,
   `slug` varchar(50) CHARACTER SET ascii NOT NULL,
+  `media_count_published` int(10) NOT NULL DEFAULT '0',
   PRIMARY KEY (`id`),
   UNIQUE KEY `name` (`name`),
-  UNIQUE KEY `slug` (`slug`)
+  UNIQUE KEY `slug` (`slug`),
+  KEY `media_count_published` (`media_count_published`)
 ) ENGINE=InnoDB AUTO_INCREMENT=2 DEFAULT CHARSET=utf8;
 /*!40101 SET character_set_client = @saved_cs_client */;
 
@@ -437,10 +526,34 @@ CREATE TABLE `tags` (
 
 LOCK TABLES `tags` WRITE;
 /*!40000 ALTER TABLE `tags` DISABLE KEYS */;
-INSERT INTO `tags` VALUES (1,'hello world','hello-world');
+INSERT INTO `tags` VALUES (1,'hello world','hello-world',0);
 /*!40000 ALTER TABLE `tags` ENABLE KEYS */;
 UNLOCK TABLES;
 
+--
+-- Table structure for table `title_word_counts`
+--
+
+DROP TABLE IF EXISTS `title_word_counts`;
+/*!40101 SET @saved_cs_client     = @@character_set_client */;
+/*!40101 SET character_set_client = utf8 */;
+CREATE TABLE `title_word_counts` (
+  `word` varchar(50) CHARACTER SET ascii COLLATE ascii_bin NOT NULL,
+  `media_count` int(10) unsigned NOT NULL,
+  PRIMARY KEY (`word`)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8;
+/*!40101 SET character_set_client = @saved_cs_client */;
+
+--
+-- Dumping data for table `title_word_counts`
+--
+
+LOCK TABLES `title_word_counts` WRITE;
+/*!40000 ALTER TABLE `title_word_counts` DISABLE KEYS */;
+INSERT INTO `title_word_counts` VALUES ('',1),('media',1),('new',1);
+/*!40000 ALTER TABLE `title_word_counts` ENABLE KEYS */;
+UNLOCK TABLES;
+
 --
 -- Table structure for table `users`
 --
@@ -18,19 +18,27 @@ BEGIN
 END;//
 
 -- After Media is Updated
--- Copies changes to the corresponding Search row
+-- Copies changes to the corresponding Search row, but only when a searchable
+-- column has actually changed. Counter updates (views, likes) are skipped.
 DROP TRIGGER IF EXISTS media_au//
 CREATE TRIGGER media_au
 	AFTER UPDATE ON media FOR EACH ROW
 BEGIN
-	UPDATE media_fulltext
-		SET `media_id` = NEW.`id`,
-		    `title` = NEW.`title`,
-		    `subtitle` = NEW.`subtitle`,
-		    `description_plain` = NEW.`description_plain`,
-		    `notes` = NEW.`notes`,
-		    `author_name` = NEW.`author_name`
-		WHERE media_id = OLD.id;
+	IF NOT (NEW.`id` <=> OLD.`id`
+	    AND NEW.`title` <=> OLD.`title`
+	    AND NEW.`subtitle` <=> OLD.`subtitle`
+	    AND NEW.`description_plain` <=> OLD.`description_plain`
+	    AND NEW.`notes` <=> OLD.`notes`
+	    AND NEW.`author_name` <=> OLD.`author_name`) THEN
+		UPDATE media_fulltext
+			SET `media_id` = NEW.`id`,
+			    `title` = NEW.`title`,
+			    `subtitle` = NEW.`subtitle`,
+			    `description_plain` = NEW.`description_plain`,
+			    `notes` = NEW.`notes`,
+			    `author_name` = NEW.`author_name`
+			WHERE media_id = OLD.id;
+	END IF;
 END;//
 
 -- 
@@ -156,4 +164,47 @@ BEGIN
 			WHERE category_id = OLD.id);
 END;//
 
+-- After Comment is Inserted
+-- Increment the comment counters of its Media
+DROP TRIGGER IF EXISTS comments_ai//
+CREATE TRIGGER comments_ai
+	AFTER INSERT ON comments FOR EACH ROW
+BEGIN
+	UPDATE media
+		SET comment_count = comment_count + 1,
+		    comment_count_published = comment_count_published + NEW.publishable
+		WHERE id = NEW.media_id;
+END;//
+
+-- After Comment is Updated
+-- Move the comment between the counters when approved, trashed or moved
+DROP TRIGGER IF EXISTS comments_au//
+CREATE TRIGGER comments_au
+	AFTER UPDATE ON comments FOR EACH ROW
+BEGIN
+	IF NOT (NEW.media_id <=> OLD.media_id
+	    AND NEW.publishable <=> OLD.publishable) THEN
+		UPDATE media
+			SET comment_count = comment_count - 1,
+			    comment_count_published = comment_count_published - OLD.publishable
+			WHERE id = OLD.media_id;
+		UPDATE media
+			SET comment_count = comment_count + 1,
+			    comment_count_published = comment_count_published + NEW.publishable
+			WHERE id = NEW.media_id;
+	END IF;
+END;//
+
+-- After Comment is Deleted
+-- Decrement the comment counters of its Media
+DROP TRIGGER IF EXISTS comments_ad//
+CREATE TRIGGER comments_ad
+	AFTER DELETE ON comments FOR EACH ROW
+BEGIN
+	UPDATE media
+		SET comment_count = comment_count - 1,
+		    comment_count_published = comment_count_published - OLD.publishable
+		WHERE id = OLD.media_id;
+END;//
+
 DELIMITER ;